@@ -23,7 +23,13 @@
 """Core interface for Hikari's configuration dataclasses."""
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("CacheComponents", "CacheSettings", "HTTPSettings", "ProxySettings")
+__all__: typing.Sequence[str] = (
+    "CacheComponents",
+    "CacheEvictionPolicy",
+    "CacheSettings",
+    "HTTPSettings",
+    "ProxySettings",
+)
 
 import abc
 import typing
@@ -97,6 +103,30 @@ class CacheComponents(enums.Flag):
     """Fully enables the cache."""
 
 
+class CacheEvictionPolicy(int, enums.Enum):
+    """Policies for picking which entries a size-limited cache removes."""
+
+    FIFO = 0
+    """Remove the entries which were added least recently."""
+
+    LRU = 1
+    """Remove the entries which were looked up or set least recently."""
+
+    TTL = 2
+    """Remove entries once they've been cached for a set amount of time.
+
+    Once the cache is full, the entries which were set least recently are
+    removed first.
+    """
+
+    TINY_LFU = 3
+    """Remove the entries which are estimated to be used least often (W-TinyLFU).
+
+    This keeps frequently used entries cached through bursts of entries which
+    are only used once.
+    """
+
+
 class ProxySettings(abc.ABC):
     """Settings for configuring an HTTP-based proxy."""
 
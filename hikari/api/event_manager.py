@@ -188,6 +188,26 @@ def consume_raw_event(
             If there is no consumer for the event.
         """
 
+    @abc.abstractmethod
+    def is_raw_event_enabled(self, event_name: str) -> bool:
+        """Check whether consuming a raw event could have any effect.
+
+        Shards use this to skip decoding the payloads of events which would
+        be discarded by [`hikari.api.event_manager.EventManager.consume_raw_event`][].
+
+        Parameters
+        ----------
+        event_name
+            The case-insensitive name of the event.
+
+        Returns
+        -------
+        bool
+            [`False`][] if the event is not cached, listened to or waited for,
+            [`True`][] otherwise. Events without a consumer must return [`True`][],
+            so that they keep reaching `consume_raw_event`.
+        """
+
     @abc.abstractmethod
     def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
         """Dispatch an event.
@@ -23,7 +23,7 @@
 """Provides an interface for REST API implementations to follow."""
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("RESTClient", "TokenStrategy")
+__all__: typing.Sequence[str] = ("RequestPriority", "RESTClient", "TokenStrategy")
 
 import abc
 import datetime
@@ -32,6 +32,7 @@
 from hikari import scheduled_events
 from hikari import traits
 from hikari import undefined
+from hikari.internal import enums
 
 if typing.TYPE_CHECKING:
     from hikari import applications
@@ -62,6 +63,27 @@
     from hikari.internal import time
 
 
+class RequestPriority(int, enums.Enum):
+    """The priority of a REST request.
+
+    When requests are waiting on the same rate limit, the requests with a
+    higher priority are made first. Requests with the same priority are made
+    in the order they were made in.
+
+    The global rate limit is the exception, as every request waiting on it
+    is let through at once when it ends.
+    """
+
+    LOW = -1
+    """For bulk work which can wait, such as editing many members."""
+
+    NORMAL = 0
+    """The default priority."""
+
+    HIGH = 1
+    """For requests which must be made quickly, such as interaction follow-ups."""
+
+
 class TokenStrategy(abc.ABC):
     """Interface of an object used for managing OAuth2 access."""
 
@@ -934,6 +956,81 @@ def fetch_messages(
             If an internal error occurs on Discord while handling the request.
         """
 
+    @abc.abstractmethod
+    def fetch_messages_concurrently(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels_.TextableChannel],
+        *,
+        after: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
+        before: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
+        slices: int = 4,
+        max_buffered_pages: int = 16,
+    ) -> iterators.LazyIterator[messages_.Message]:
+        """Export the message history for a given text channel using several concurrent requests.
+
+        The range between `after` and `before` is split into `slices`
+        contiguous time slices which are fetched at the same time. Messages
+        are still yielded oldest first, in the same order as
+        [`hikari.api.rest.RESTClient.fetch_messages`][] with `after`.
+
+        !!! note
+            This call is not a coroutine function, it returns a special type of
+            lazy iterator that will perform API calls as you iterate across it,
+            thus any errors documented below will happen then.
+
+            See [`hikari.iterators`][] for the full API for this iterator type.
+
+        !!! note
+            All slices share the channel's rate limit bucket, so requests will
+            only run at the same time if
+            [`hikari.impl.config.HTTPSettings.concurrent_bucket_requests`][] is
+            enabled. If the client has an executor, pages will be deserialized
+            in it.
+
+        Parameters
+        ----------
+        channel
+            The channel to fetch messages in. This may be the object or
+            the ID of an existing channel.
+        after
+            If provided, fetch messages after this snowflake. If you provide
+            a datetime object, it will be transformed into a snowflake. This
+            may be any other Discord entity that has an ID. In this case, the
+            date the object was first created will be used. Defaults to the
+            creation date of the channel.
+        before
+            If provided, fetch messages before this snowflake. If you provide
+            a datetime object, it will be transformed into a snowflake. This
+            may be any other Discord entity that has an ID. In this case, the
+            date the object was first created will be used. Defaults to now.
+        slices
+            The number of time slices to fetch at the same time.
+        max_buffered_pages
+            The maximum number of pages to fetch ahead of the slice currently
+            being iterated over.
+
+        Returns
+        -------
+        hikari.iterators.LazyIterator[hikari.messages.Message]
+            An iterator to fetch the messages.
+
+        Raises
+        ------
+        ValueError
+            If `slices` or `max_buffered_pages` is less than 1.
+        hikari.errors.UnauthorizedError
+            If you are unauthorized to make the request (invalid/missing token).
+        hikari.errors.ForbiddenError
+            If you are missing the [`hikari.permissions.Permissions.READ_MESSAGE_HISTORY`][] in the channel.
+        hikari.errors.NotFoundError
+            If the channel is not found.
+        hikari.errors.RateLimitTooLongError
+            Raised in the event that a rate limit occurs that is
+            longer than `max_rate_limit` when making a request.
+        hikari.errors.InternalServerError
+            If an internal error occurs on Discord while handling the request.
+        """
+
     @abc.abstractmethod
     async def fetch_message(
         self,
@@ -1000,6 +1097,7 @@ async def create_message(
             typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
         ] = undefined.UNDEFINED,
         flags: typing.Union[undefined.UndefinedType, int, messages_.MessageFlag] = undefined.UNDEFINED,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> messages_.Message:
         """Create a message in the given channel.
 
@@ -1111,6 +1209,9 @@ async def create_message(
             Note that some flags may not be able to be set. Currently the only
             flags that can be set are [hikari.messages.MessageFlag.SUPPRESS_NOTIFICATIONS] and
             [hikari.messages.MessageFlag.SUPPRESS_EMBEDS].
+        priority
+            The priority of the request. When requests are waiting on the same
+            rate limits, requests with a higher priority are made first.
 
         Returns
         -------
@@ -1983,6 +2084,7 @@ async def execute_webhook(
             typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
         ] = undefined.UNDEFINED,
         flags: typing.Union[undefined.UndefinedType, int, messages_.MessageFlag] = undefined.UNDEFINED,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> messages_.Message:
         """Execute a webhook.
 
@@ -2094,6 +2196,9 @@ async def execute_webhook(
             specific roles.
         flags
             The flags to set for this webhook message.
+        priority
+            The priority of the request. When requests are waiting on the same
+            rate limits, requests with a higher priority are made first.
 
         Returns
         -------
@@ -2203,6 +2308,7 @@ async def edit_webhook_message(
         role_mentions: undefined.UndefinedOr[
             typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
         ] = undefined.UNDEFINED,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> messages_.Message:
         """Edit a message sent by a webhook.
 
@@ -2304,6 +2410,9 @@ async def edit_webhook_message(
             [`hikari.snowflakes.Snowflake`][], or
             [`hikari.guilds.PartialRole`][] derivatives to enforce mentioning
             specific roles.
+        priority
+            The priority of the request. When requests are waiting on the same
+            rate limits, requests with a higher priority are made first.
 
         Returns
         -------
@@ -5244,6 +5353,7 @@ async def edit_member(
         ] = undefined.UNDEFINED,
         communication_disabled_until: undefined.UndefinedNoneOr[datetime.datetime] = undefined.UNDEFINED,
         reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> guilds.Member:
         """Edit a guild member.
 
@@ -5293,6 +5403,9 @@ async def edit_member(
         reason
             If provided, the reason that will be recorded in the audit logs.
             Maximum of 512 characters.
+        priority
+            The priority of the request. When requests are waiting on the same
+            rate limits, requests with a higher priority are made first.
 
         Returns
         -------
@@ -5372,6 +5485,7 @@ async def add_role_to_member(
         role: snowflakes.SnowflakeishOr[guilds.PartialRole],
         *,
         reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> None:
         """Add a role to a member.
 
@@ -5389,6 +5503,9 @@ async def add_role_to_member(
         reason
             If provided, the reason that will be recorded in the audit logs.
             Maximum of 512 characters.
+        priority
+            The priority of the request. When requests are waiting on the same
+            rate limits, requests with a higher priority are made first.
 
         Raises
         ------
@@ -5413,6 +5530,7 @@ async def remove_role_from_member(
         role: snowflakes.SnowflakeishOr[guilds.PartialRole],
         *,
         reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> None:
         """Remove a role from a member.
 
@@ -5430,6 +5548,9 @@ async def remove_role_from_member(
         reason
             If provided, the reason that will be recorded in the audit logs.
             Maximum of 512 characters.
+        priority
+            The priority of the request. When requests are waiting on the same
+            rate limits, requests with a higher priority are made first.
 
         Raises
         ------
@@ -7344,6 +7465,7 @@ async def edit_interaction_response(
         role_mentions: undefined.UndefinedOr[
             typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
         ] = undefined.UNDEFINED,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> messages_.Message:
         """Edit the initial response to a command interaction.
 
@@ -7432,6 +7554,9 @@ async def edit_interaction_response(
             [`hikari.snowflakes.Snowflake`][], or
             [`hikari.guilds.PartialRole`][] derivatives to enforce mentioning
             specific roles.
+        priority
+            The priority of the request. When requests are waiting on the same
+            rate limits, requests with a higher priority are made first.
 
         Returns
         -------
@@ -7462,7 +7587,11 @@ async def edit_interaction_response(
 
     @abc.abstractmethod
     async def delete_interaction_response(
-        self, application: snowflakes.SnowflakeishOr[guilds.PartialApplication], token: str
+        self,
+        application: snowflakes.SnowflakeishOr[guilds.PartialApplication],
+        token: str,
+        *,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> None:
         """Delete the initial response of an interaction.
 
@@ -7472,6 +7601,9 @@ async def delete_interaction_response(
             Object or ID of the application to delete a command response for.
         token
             The interaction's token.
+        priority
+            The priority of the request. When requests are waiting on the same
+            rate limits, requests with a higher priority are made first.
 
         Raises
         ------
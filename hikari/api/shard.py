@@ -60,6 +60,11 @@ class GatewayCompression(str, enums.Enum):
     """Transport compression using ZLIB."""
     PAYLOAD_ZLIB_STREAM = "payload_zlib_stream"
     """Payload compression using ZLIB."""
+    TRANSPORT_ZSTD_STREAM = "transport_zstd_stream"
+    """Transport compression using ZSTD.
+
+    This requires the `zstandard` package to be installed.
+    """
 
 
 class GatewayShard(abc.ABC):
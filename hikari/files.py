@@ -50,6 +50,7 @@
 import inspect
 import io
 import mimetypes
+import mmap
 import os
 import pathlib
 import shutil
@@ -68,6 +69,7 @@
     import types
 
 _MAGIC: typing.Final[int] = 50 * 1024
+_MAPPED_CHUNK_SIZE: typing.Final[int] = 1024 * 1024
 SPOILER_TAG: typing.Final[str] = "SPOILER_"
 
 ReaderImplT = typing.TypeVar("ReaderImplT", bound="AsyncReader")
@@ -852,6 +854,100 @@ async def __aexit__(
         self.file = None
 
 
+@attrs.define(weakref_slot=False)
+class MemoryMappedFileReader(ThreadedFileReader):
+    """Asynchronous file reader that reads a resource from local storage by memory mapping it.
+
+    Rather than reading and copying each chunk in the executor, the file is
+    mapped into memory once and each chunk is a [`memoryview`][] of the
+    mapping, which can be written to the connection without being copied.
+    The executor is only used to open, map and close the file.
+    """
+
+    _mapping: typing.Optional[mmap.mmap] = attrs.field(alias="mapping")
+
+    async def __aiter__(self) -> typing.AsyncGenerator[typing.Any, bytes]:
+        if self._mapping is None:
+            # Empty files can't be mapped
+            return
+
+        view = memoryview(self._mapping)
+        for offset in range(0, len(view), _MAPPED_CHUNK_SIZE):
+            yield view[offset : offset + _MAPPED_CHUNK_SIZE]  # noqa: E203 - Whitespace before ":"
+
+    async def read(self) -> bytes:
+        return self._mapping[:] if self._mapping is not None else b""
+
+
+def _open_mapped_read_path(path: pathlib.Path) -> typing.Tuple[typing.BinaryIO, typing.Optional[mmap.mmap]]:
+    file = _open_read_path(path)
+
+    try:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except ValueError:
+        # The file is empty
+        return file, None
+
+    except BaseException:
+        file.close()
+        raise
+
+    # Ask the OS to start reading the file in ahead of it being sent, so that the
+    # event loop is less likely to block on page faults
+    for advice in (getattr(mmap, "MADV_SEQUENTIAL", None), getattr(mmap, "MADV_WILLNEED", None)):
+        if advice is not None:
+            mapping.madvise(advice)
+
+    return file, mapping
+
+
+def _close_mapped_file(file: typing.BinaryIO, mapping: typing.Optional[mmap.mmap]) -> None:
+    file.close()
+
+    if mapping is not None:
+        try:
+            mapping.close()
+
+        except BufferError:
+            # The transport is still holding onto a chunk, the mapping will be
+            # closed once it is garbage collected instead
+            pass
+
+
+@attrs.define(weakref_slot=False)
+@typing.final
+class _MemoryMappedFileReaderContextManagerImpl(AsyncReaderContextManager[ThreadedFileReader]):
+    executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = attrs.field()
+    file: typing.Optional[typing.BinaryIO] = attrs.field(default=None, init=False)
+    mapping: typing.Optional[mmap.mmap] = attrs.field(default=None, init=False)
+    filename: str = attrs.field()
+    path: pathlib.Path = attrs.field()
+
+    async def __aenter__(self) -> MemoryMappedFileReader:
+        if self.file:
+            raise RuntimeError("File is already open")
+
+        loop = asyncio.get_running_loop()
+        file, mapping = await loop.run_in_executor(self.executor, _open_mapped_read_path, self.path)
+        self.file, self.mapping = file, mapping
+        return MemoryMappedFileReader(self.filename, None, self.executor, file, mapping)
+
+    async def __aexit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc: typing.Optional[BaseException],
+        exc_tb: typing.Optional[types.TracebackType],
+    ) -> None:
+        if not self.file:
+            raise RuntimeError("File isn't open")
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.executor, _close_mapped_file, self.file, self.mapping)
+        self.file = None
+        self.mapping = None
+
+
 def _copy_to_path(current_path: pathlib.Path, copy_to_path: Pathish, default_filename: str, force: bool) -> None:
     copy_to_path = _to_write_path(copy_to_path, default_filename, force)
     shutil.copy2(current_path, copy_to_path)
@@ -876,9 +972,17 @@ class File(Resource[ThreadedFileReader]):
         from the path instead.
     spoiler
         Whether to mark the file as a spoiler in Discord.
+    memory_map
+        Whether to memory map the file when streaming it instead of reading it
+        chunk by chunk in an executor.
+
+        This avoids copying the file's contents and hopping to the executor
+        for each chunk, which makes uploading large files faster, but should
+        only be used for files on local storage which won't be modified while
+        they are being uploaded.
     """
 
-    __slots__: typing.Sequence[str] = ("path", "_filename", "is_spoiler")
+    __slots__: typing.Sequence[str] = ("path", "_filename", "is_spoiler", "memory_map")
 
     path: pathlib.Path
     """The path to the file."""
@@ -886,11 +990,23 @@ class File(Resource[ThreadedFileReader]):
     is_spoiler: bool
     """Whether the file will be marked as a spoiler."""
 
+    memory_map: bool
+    """Whether the file will be memory mapped when streaming it."""
+
     _filename: typing.Optional[str]
 
-    def __init__(self, path: Pathish, /, filename: typing.Optional[str] = None, *, spoiler: bool = False) -> None:
+    def __init__(
+        self,
+        path: Pathish,
+        /,
+        filename: typing.Optional[str] = None,
+        *,
+        spoiler: bool = False,
+        memory_map: bool = False,
+    ) -> None:
         self.path = ensure_path(path)
         self.is_spoiler = spoiler
+        self.memory_map = memory_map
         self._filename = filename
 
     @property
@@ -912,6 +1028,9 @@ def stream(
     ) -> AsyncReaderContextManager[ThreadedFileReader]:
         """Start streaming the resource using a thread pool executor.
 
+        If [`hikari.files.File.memory_map`][] is [`True`][], the file will be
+        memory mapped and the executor will only be used to open and close it.
+
         Parameters
         ----------
         executor
@@ -939,6 +1058,9 @@ def stream(
         if executor is None or isinstance(executor, concurrent.futures.ThreadPoolExecutor):
             # asyncio forces the default executor when this is None to always be a thread pool executor anyway,
             # so this is safe enough to do:
+            if self.memory_map:
+                return _MemoryMappedFileReaderContextManagerImpl(executor, self.filename, self.path)
+
             return _ThreadedFileReaderContextManagerImpl(executor, self.filename, self.path)
 
         raise TypeError("The executor must be a ThreadPoolExecutor or None")
@@ -38,9 +38,14 @@
 from hikari.impl.event_manager_base import *
 from hikari.impl.gateway_bot import *
 from hikari.impl.interaction_server import *
+from hikari.impl.rate_limit_broker import *
 from hikari.impl.rate_limits import *
 from hikari.impl.rest import *
 from hikari.impl.rest_bot import *
+from hikari.impl.rest_cache import *
+from hikari.impl.rest_metrics import *
+from hikari.impl.session_store import *
 from hikari.impl.shard import *
+from hikari.impl.shared_cache import *
 from hikari.impl.special_endpoints import *
 from hikari.impl.voice import *
@@ -189,17 +189,46 @@
 
 These ratelimits should not be "properly" handled and instead be avoided
 completely by the end developer (similar to Cloudflare 429s).
+
+Sharing rate limits between processes
+-------------------------------------
+
+All of the above state lives in the memory of a single process, so several
+processes making requests with the same token will not know about each
+other's requests and will run into 429s. To avoid this, a
+[`hikari.impl.buckets.RESTRateLimitBackend`][] can be passed to the
+[`hikari.impl.buckets.RESTBucketManager`][]. Each request then also has to
+reserve a request on the backend's shared state before being made, and the
+rate limit headers of each response are published to it. Unknown buckets
+are also shared, so only one request is made on an unknown bucket across
+all the processes until it has been resolved.
+
+[`hikari.impl.rate_limit_broker`][] provides a backend which shares the
+state through a broker listening on a Unix socket.
 """
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("UNKNOWN_HASH", "RESTBucket", "RESTBucketManager")
+__all__: typing.Sequence[str] = (
+    "UNKNOWN_HASH",
+    "RESTBucket",
+    "RESTBucketManager",
+    "QueueWaitStatistics",
+    "RESTRateLimitBackend",
+)
 
+import abc
 import asyncio
+import hashlib
+import heapq
+import itertools
 import logging
 import typing
 
+import attrs
+
 from hikari import errors
+from hikari.api import rest as rest_api
 from hikari.impl import rate_limits
 from hikari.internal import routes
 from hikari.internal import time
@@ -214,6 +243,157 @@
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.ratelimits")
 
 
+@attrs.define(kw_only=True, weakref_slot=False)
+class QueueWaitStatistics:
+    """Statistics for how long requests waited on their rate limits before being made."""
+
+    count: int = attrs.field(default=0)
+    """The number of requests which have been made."""
+
+    total_wait: float = attrs.field(default=0.0)
+    """The total number of seconds the requests waited for."""
+
+    max_wait: float = attrs.field(default=0.0)
+    """The longest number of seconds a request waited for."""
+
+    @property
+    def mean_wait(self) -> float:
+        """The mean number of seconds the requests waited for."""
+        return self.total_wait / self.count if self.count else 0.0
+
+    def record(self, wait: float) -> None:
+        """Record a request which waited `wait` seconds."""
+        self.count += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+class _PriorityLock:
+    # An asyncio.Lock which is handed to the waiter with the highest priority first,
+    # and otherwise to the waiters in the order they started waiting.
+
+    __slots__: typing.Sequence[str] = ("_counter", "_locked", "_waiters")
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+        self._locked = False
+        self._waiters: typing.List[typing.Tuple[int, int, asyncio.Future[None]]] = []
+
+    def locked(self) -> bool:
+        return self._locked
+
+    async def acquire(self, priority: int = 0) -> None:
+        if not self._locked:
+            self._locked = True
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._counter), future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The lock was handed to us just as we were cancelled
+                self.release()
+
+            raise
+
+    def release(self) -> None:
+        if not self._locked:
+            raise RuntimeError("Lock is not acquired")
+
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            # Hand the lock straight to the waiter, leaving it locked
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self._locked = False
+
+
+class RESTRateLimitBackend(abc.ABC):
+    """Base for rate limit state which is shared between bucket managers.
+
+    Bucket managers still enforce the rate limits they know about
+    themselves, and additionally reserve each request on the backend, which
+    is expected to share the reservations and the rate limits between all
+    of its users (e.g. across processes).
+
+    Buckets are identified by their full bucket hash, which is the same for
+    the same route and token in every process.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def acquire(self, key: str, /, *, exclusive: bool) -> typing.Tuple[float, bool]:
+        """Reserve a request on a bucket.
+
+        Parameters
+        ----------
+        key
+            The hash of the bucket.
+        exclusive
+            Whether the bucket is unknown. Only one request may hold an
+            exclusive reservation for a key at a time, and this should wait
+            until the current holder releases it. If the key has since been
+            released with the hash of the bucket it resolved to, a request
+            should instead be reserved on that bucket.
+
+        Returns
+        -------
+        typing.Tuple[float, bool]
+            How long to wait for in seconds before trying again, or `0` if the
+            request was reserved, and whether the wait is caused by the global
+            rate limit.
+        """
+
+    @abc.abstractmethod
+    def release(self, key: str, resolved_key: typing.Optional[str], /) -> None:
+        """Release an exclusive reservation.
+
+        Parameters
+        ----------
+        key
+            The hash of the unknown bucket.
+        resolved_key
+            The hash of the bucket the unknown bucket resolved to, if it was
+            resolved.
+        """
+
+    @abc.abstractmethod
+    def update(self, key: str, remaining: int, limit: int, reset_after: float, /) -> None:
+        """Publish the rate limit headers of a response.
+
+        Parameters
+        ----------
+        key
+            The hash of the bucket.
+        remaining
+            The `X-RateLimit-Remaining` header.
+        limit
+            The `X-RateLimit-Limit` header.
+        reset_after
+            The `X-RateLimit-Reset-After` header.
+        """
+
+    @abc.abstractmethod
+    def throttle(self, retry_after: float, /) -> None:
+        """Throttle the global rate limit.
+
+        Parameters
+        ----------
+        retry_after
+            How long to throttle for in seconds.
+        """
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        """Close the backend."""
+
+
 class RESTBucket(rate_limits.WindowedBurstRateLimiter):
     """Represents a rate limit for an HTTP endpoint.
 
@@ -234,9 +414,33 @@ class RESTBucket(rate_limits.WindowedBurstRateLimiter):
 
     Additional logic is provided by the [`hikari.impl.buckets.RESTBucket.update_rate_limit`][] call
     which allows dynamically changing the enforced rate limits at any time.
+
+    By default, only one request may be made on a bucket at a time. If
+    `concurrent` is [`True`][], known buckets instead let as many requests run
+    at once as there are remaining in the current window, while unknown buckets
+    still only allow one request at a time until they are resolved.
+
+    If a `backend` is passed, each request is also reserved on it. While the
+    bucket is unknown, requests are reserved on the backend using
+    `unknown_backend_hash` if passed, or the bucket's name otherwise.
+
+    Requests waiting on the bucket are let through by priority, with requests
+    of a higher priority first. If `wait_statistics` is passed, the time each
+    request waited is recorded in the statistics for its priority.
     """
 
-    __slots__: typing.Sequence[str] = ("_compiled_route", "_max_rate_limit", "_global_ratelimit", "_lock")
+    __slots__: typing.Sequence[str] = (
+        "_backend",
+        "_backend_lease",
+        "_unknown_backend_hash",
+        "_compiled_route",
+        "_concurrent",
+        "_in_flight",
+        "_max_rate_limit",
+        "_global_ratelimit",
+        "_lock",
+        "_wait_statistics",
+    )
 
     def __init__(
         self,
@@ -244,15 +448,26 @@ def __init__(
         compiled_route: routes.CompiledRoute,
         global_ratelimit: rate_limits.ManualRateLimiter,
         max_rate_limit: float,
+        *,
+        backend: typing.Optional[RESTRateLimitBackend] = None,
+        concurrent: bool = False,
+        unknown_backend_hash: typing.Optional[str] = None,
+        wait_statistics: typing.Optional[typing.Mapping[int, QueueWaitStatistics]] = None,
     ) -> None:
         super().__init__(name, 1, 1)
+        self._backend = backend
+        self._backend_lease: typing.Optional[str] = None
+        self._unknown_backend_hash = unknown_backend_hash or name
         self._compiled_route = compiled_route
+        self._concurrent = concurrent
+        self._in_flight = 0
         self._max_rate_limit = max_rate_limit
         self._global_ratelimit = global_ratelimit
-        self._lock = asyncio.Lock()
+        self._lock = _PriorityLock()
+        self._wait_statistics = wait_statistics
 
-    async def __aenter__(self) -> None:
-        await self.acquire()
+    async def __aenter__(self) -> float:
+        return await self.acquire_timed()
 
     async def __aexit__(
         self,
@@ -267,11 +482,30 @@ def is_unknown(self) -> bool:
         """Whether it represents an UNKNOWN bucket."""
         return self.name.startswith(UNKNOWN_HASH)
 
+    @property
+    def in_flight(self) -> int:
+        """The number of concurrent requests currently being made on this bucket.
+
+        This is always `0` unless the bucket allows concurrent requests.
+        """
+        return self._in_flight
+
     def release(self) -> None:
         """Release the lock on the bucket."""
+        if self._in_flight:
+            # Concurrent requests on a known bucket don't hold the lock, and can't
+            # overlap with a request holding it, as buckets can't become unknown again.
+            self._in_flight -= 1
+            return
+
+        if self._backend_lease is not None:
+            assert self._backend is not None
+            self._backend.release(self._backend_lease, None if self.is_unknown else self.name)
+            self._backend_lease = None
+
         self._lock.release()
 
-    async def acquire(self) -> None:
+    async def acquire(self, priority: int = rest_api.RequestPriority.NORMAL) -> None:
         """Acquire time and the lock on this bucket.
 
         !!! note
@@ -279,22 +513,71 @@ async def acquire(self) -> None:
             update any rate limit information you are made aware of and
             [`hikari.impl.buckets.RESTBucket.release`][] to release the lock.
 
+        Parameters
+        ----------
+        priority
+            The priority of the request. Requests with a higher priority are
+            let through first.
+
+        Raises
+        ------
+        hikari.errors.RateLimitTooLongError
+            If the rate limit is longer than `max_rate_limit`.
+        """
+        await self.acquire_timed(priority)
+
+    async def acquire_timed(self, priority: int = rest_api.RequestPriority.NORMAL) -> float:
+        """Acquire time and the lock on this bucket, timing the global rate limit.
+
+        This is the same as [`hikari.impl.buckets.RESTBucket.acquire`][], but
+        also returns how long was spent waiting on the global rate limit.
+
+        Parameters
+        ----------
+        priority
+            The priority of the request. Requests with a higher priority are
+            let through first.
+
+        Returns
+        -------
+        float
+            The time spent waiting on the global rate limit, in seconds.
+
         Raises
         ------
         hikari.errors.RateLimitTooLongError
             If the rate limit is longer than `max_rate_limit`.
         """
-        await self._lock.acquire()
+        start = time.monotonic()
+        global_wait = await self._acquire(priority)
+
+        # Any int is a valid priority, even if it isn't one of the RequestPriority members with statistics
+        if self._wait_statistics is not None and (statistics := self._wait_statistics.get(priority)):
+            statistics.record(time.monotonic() - start)
+
+        return global_wait
+
+    async def _acquire(self, priority: int) -> float:
+        await self._lock.acquire(priority)
 
         if self.is_unknown:
-            return
+            if self._backend:
+                await self._acquire_backend(self._unknown_backend_hash, exclusive=True)
+                self._backend_lease = self._unknown_backend_hash
+
+            return 0.0
+
+        if self._concurrent:
+            # The lock is only needed to wait for any request on the unknown bucket to finish;
+            # from here on, the number of concurrent requests is limited by the remaining permits.
+            self._lock.release()
 
         now = time.monotonic()
         retry_after = self.reset_at - now
 
         if self.is_rate_limited(now) and retry_after > self._max_rate_limit:
             # Release lock before we error
-            self._lock.release()
+            self._release_lock()
             raise errors.RateLimitTooLongError(
                 route=self._compiled_route,
                 is_global=False,
@@ -305,12 +588,12 @@ async def acquire(self) -> None:
                 period=self.period,
             )
 
-        await super().acquire()
+        await super().acquire(priority)
 
         global_ratelimit = self._global_ratelimit
         if global_ratelimit.reset_at and (global_ratelimit.reset_at - now) > self._max_rate_limit:
             # Release lock before we error
-            self._lock.release()
+            self._release_lock()
             raise errors.RateLimitTooLongError(
                 route=self._compiled_route,
                 is_global=True,
@@ -321,7 +604,47 @@ async def acquire(self) -> None:
                 period=None,
             )
 
-        await global_ratelimit.acquire()
+        global_start = time.monotonic()
+        await global_ratelimit.acquire(priority)
+        global_wait = time.monotonic() - global_start
+
+        if self._backend:
+            await self._acquire_backend(self.name, exclusive=False)
+
+        if self._concurrent:
+            self._in_flight += 1
+
+        return global_wait
+
+    async def _acquire_backend(self, key: str, *, exclusive: bool) -> None:
+        assert self._backend is not None
+        while True:
+            retry_after, is_global = await self._backend.acquire(key, exclusive=exclusive)
+            if retry_after <= 0:
+                return
+
+            if retry_after > self._max_rate_limit:
+                if exclusive:
+                    self._lock.release()
+                else:
+                    self._release_lock()
+
+                raise errors.RateLimitTooLongError(
+                    route=self._compiled_route,
+                    is_global=is_global,
+                    retry_after=retry_after,
+                    max_retry_after=self._max_rate_limit,
+                    reset_at=time.monotonic() + retry_after,
+                    limit=None,
+                    period=None,
+                )
+
+            _LOGGER.debug("shared rate limit on bucket %s, backing off for %ss", key, retry_after)
+            await asyncio.sleep(retry_after)
+
+    def _release_lock(self) -> None:
+        if not self._concurrent:
+            self._lock.release()
 
     def update_rate_limit(self, remaining: int, limit: int, reset_at: float) -> None:
         """Update the rate limit information.
@@ -339,6 +662,11 @@ def update_rate_limit(self, remaining: int, limit: int, reset_at: float) -> None
         reset_at
             The epoch at which to reset the limit.
         """
+        if self._in_flight > 1:
+            # The other requests in flight have already reserved their permits, but may not
+            # have been counted in the remaining requests Discord reported yet.
+            remaining = max(0, remaining - (self._in_flight - 1))
+
         self.remaining: int = remaining
         self.limit: int = limit
         self.reset_at: float = reset_at
@@ -363,12 +691,41 @@ def resolve(self, real_bucket_hash: str) -> None:
         self.name: str = real_bucket_hash
 
 
+class _PrioritizedBucket:
+    __slots__: typing.Sequence[str] = ("_bucket", "_priority")
+
+    def __init__(self, bucket: RESTBucket, priority: int) -> None:
+        self._bucket = bucket
+        self._priority = priority
+
+    async def __aenter__(self) -> float:
+        return await self._bucket.acquire_timed(self._priority)
+
+    async def __aexit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc: typing.Optional[BaseException],
+        exc_tb: typing.Optional[types.TracebackType],
+    ) -> None:
+        self._bucket.release()
+
+
 def _create_authentication_hash(authentication: typing.Optional[str]) -> str:
-    return str(hash(authentication))
+    # This must be the same in every process, so rate limit backends can share buckets.
+    if authentication is None:
+        return "-"
+
+    return hashlib.blake2b(authentication.encode(), digest_size=8).hexdigest()
 
 
 def _create_unknown_hash(route: routes.CompiledRoute, authentication_hash: str) -> str:
-    return f"{UNKNOWN_HASH}{routes.HASH_SEPARATOR}{authentication_hash}{routes.HASH_SEPARATOR}{str(hash(route))}"
+    return f"{UNKNOWN_HASH}{routes.HASH_SEPARATOR}{authentication_hash}{routes.HASH_SEPARATOR}{route}"
+
+
+def _create_unknown_backend_hash(route: routes.CompiledRoute, authentication_hash: str) -> str:
+    # Discord's buckets are shared by every compiled route with the same major parameters,
+    # so the requests on them are grouped together on the backend until the bucket is known.
+    return route.create_real_bucket_hash(f"{UNKNOWN_HASH} {route.route}", authentication_hash)
 
 
 class RESTBucketManager:
@@ -383,9 +740,18 @@ class RESTBucketManager:
     max_rate_limit
         The max number of seconds to backoff for when rate limited. Anything
         greater than this will instead raise an error.
+    backend
+        The backend to share the rate limits with, if any. This will be
+        closed when the bucket manager is closed.
+    concurrent
+        Whether to allow multiple requests to be made at once on known buckets.
+        See [`hikari.impl.buckets.RESTBucket`][].
     """
 
     __slots__: typing.Sequence[str] = (
+        "_backend",
+        "_concurrent",
+        "_queue_wait_statistics",
         "_routes_to_hashes",
         "_real_hashes_to_buckets",
         "_global_ratelimit",
@@ -393,17 +759,32 @@ class RESTBucketManager:
         "_max_rate_limit",
     )
 
-    def __init__(self, max_rate_limit: float) -> None:
+    def __init__(
+        self, max_rate_limit: float, *, backend: typing.Optional[RESTRateLimitBackend] = None, concurrent: bool = False
+    ) -> None:
+        self._backend = backend
+        self._concurrent = concurrent
         self._routes_to_hashes: typing.Dict[routes.Route, str] = {}
         self._real_hashes_to_buckets: typing.Dict[str, RESTBucket] = {}
         self._gc_task: typing.Optional[asyncio.Task[None]] = None
         self._max_rate_limit = max_rate_limit
         self._global_ratelimit = rate_limits.ManualRateLimiter()
+        self._queue_wait_statistics: typing.Dict[int, QueueWaitStatistics] = {
+            priority: QueueWaitStatistics() for priority in rest_api.RequestPriority
+        }
 
     @property
     def max_rate_limit(self) -> float:
         return self._max_rate_limit
 
+    @property
+    def queue_wait_statistics(self) -> typing.Mapping[int, QueueWaitStatistics]:
+        """Statistics for how long requests of each priority waited on their rate limits.
+
+        This is keyed by the [`hikari.api.rest.RequestPriority`][] members.
+        """
+        return self._queue_wait_statistics
+
     @property
     def is_alive(self) -> bool:
         """Whether the component is alive."""
@@ -456,6 +837,9 @@ async def close(self) -> None:
 
         self._gc_task = None
 
+        if self._backend:
+            await self._backend.close()
+
     async def _gc(self, poll_period: float, expire_after: float) -> None:
         # Prevent filling memory increasingly until we run out by removing dead buckets every 20s
         # Allocations are somewhat cheap if we only do them every so-many seconds, after all.
@@ -503,8 +887,11 @@ def _purge_stale_buckets(self, expire_after: float) -> None:
             _LOGGER.log(ux.TRACE, "no buckets purged, %s remain in survival, %s active", survival, active)
 
     def acquire_bucket(
-        self, compiled_route: routes.CompiledRoute, authentication: typing.Optional[str]
-    ) -> typing.AsyncContextManager[None]:
+        self,
+        compiled_route: routes.CompiledRoute,
+        authentication: typing.Optional[str],
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
+    ) -> typing.AsyncContextManager[float]:
         """Acquire a bucket for the given route.
 
         !!! note
@@ -517,30 +904,50 @@ def acquire_bucket(
             The route to get the bucket for.
         authentication
             The authentication that will be used in the request.
+        priority
+            The priority of the request. When requests are waiting on the
+            same rate limits, requests with a higher priority are made first.
 
         Returns
         -------
-        typing.AsyncContextManager
+        typing.AsyncContextManager[float]
             The context manager to use during the duration of the request.
+            Entering it gives the time spent waiting on the global rate limit,
+            in seconds.
         """
         if not self._gc_task:
             raise errors.ComponentStateConflictError("Cannot interact with an inactive bucket manager")
 
         authentication_hash = _create_authentication_hash(authentication)
 
+        unknown_backend_hash = None
         if bucket_hash := self._routes_to_hashes.get(compiled_route.route):
             real_bucket_hash = compiled_route.create_real_bucket_hash(bucket_hash, authentication_hash)
         else:
             real_bucket_hash = _create_unknown_hash(compiled_route, authentication_hash)
+            if self._backend:
+                unknown_backend_hash = _create_unknown_backend_hash(compiled_route, authentication_hash)
 
         if bucket := self._real_hashes_to_buckets.get(real_bucket_hash):
             _LOGGER.debug("%s is being mapped to existing bucket %s", compiled_route, real_bucket_hash)
         else:
             _LOGGER.debug("%s is being mapped to new bucket %s", compiled_route, real_bucket_hash)
-            bucket = RESTBucket(real_bucket_hash, compiled_route, self._global_ratelimit, self._max_rate_limit)
+            bucket = RESTBucket(
+                real_bucket_hash,
+                compiled_route,
+                self._global_ratelimit,
+                self._max_rate_limit,
+                backend=self._backend,
+                concurrent=self._concurrent,
+                unknown_backend_hash=unknown_backend_hash,
+                wait_statistics=self._queue_wait_statistics,
+            )
             self._real_hashes_to_buckets[real_bucket_hash] = bucket
 
-        return bucket
+        if priority == rest_api.RequestPriority.NORMAL:
+            return bucket
+
+        return _PrioritizedBucket(bucket, priority)
 
     def update_rate_limits(
         self,
@@ -607,13 +1014,23 @@ def update_rate_limits(
                     remaining_header,
                 )
 
-                bucket = RESTBucket(real_bucket_hash, compiled_route, self._global_ratelimit, self._max_rate_limit)
+                bucket = RESTBucket(
+                    real_bucket_hash,
+                    compiled_route,
+                    self._global_ratelimit,
+                    self._max_rate_limit,
+                    backend=self._backend,
+                    concurrent=self._concurrent,
+                )
 
             self._real_hashes_to_buckets[real_bucket_hash] = bucket
 
         reset_at_monotonic = time.monotonic() + reset_after
         bucket.update_rate_limit(remaining_header, limit_header, reset_at_monotonic)
 
+        if self._backend:
+            self._backend.update(real_bucket_hash, remaining_header, limit_header, reset_after)
+
     def throttle(self, retry_after: float) -> None:
         """Throttle the global ratelimit for the buckets.
 
@@ -623,3 +1040,6 @@ def throttle(self, retry_after: float) -> None:
             How long to throttle for.
         """
         self._global_ratelimit.throttle(retry_after)
+
+        if self._backend:
+            self._backend.throttle(retry_after)
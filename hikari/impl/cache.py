@@ -26,10 +26,14 @@
 
 __all__: typing.Sequence[str] = ("CacheImpl",)
 
+import asyncio
 import copy
 import logging
+import os
 import typing
 
+import attrs
+
 from hikari import channels as channels_
 from hikari import emojis
 from hikari import messages
@@ -39,6 +43,7 @@
 from hikari.api import config as config_api
 from hikari.impl import config as config_impl
 from hikari.internal import cache as cache_utility
+from hikari.internal import cache_snapshot
 from hikari.internal import collections
 
 if typing.TYPE_CHECKING:
@@ -51,6 +56,7 @@
     from hikari import voices
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.cache")
+_ValueT = typing.TypeVar("_ValueT")
 
 
 # TODO: do we want to hide entities that are marked as "deleted" and being kept alive by references?
@@ -116,7 +122,7 @@ def settings(self) -> config_impl.CacheSettings:
 
     def _create_cache(self) -> None:
         self._me = None
-        self._dm_channel_entries = collections.LimitedCapacityCacheMap(limit=self._settings.max_dm_channel_ids)
+        self._dm_channel_entries = self._create_limited_map(self._settings.max_dm_channel_ids)
         self._emoji_entries = collections.FreezableDict()
         self._guild_channel_entries = collections.FreezableDict()
         self._guild_thread_entries = collections.FreezableDict()
@@ -128,11 +134,24 @@ def _create_cache(self) -> None:
         # found attached to cached presence activities.
         self._unknown_custom_emoji_entries = collections.FreezableDict()
         self._user_entries = collections.FreezableDict()
-        self._message_entries = collections.LimitedCapacityCacheMap(
-            limit=self._settings.max_messages, on_expire=self._on_message_expire
-        )
+        self._message_entries = self._create_limited_map(self._settings.max_messages, self._on_message_expire)
         self._referenced_messages = collections.FreezableDict()
 
+    def _create_limited_map(
+        self, limit: int, on_expire: typing.Optional[typing.Callable[[_ValueT], None]] = None, /
+    ) -> collections.LimitedCapacityCacheMap[typing.Any, _ValueT]:
+        policy = self._settings.eviction_policy
+        if policy is config_api.CacheEvictionPolicy.LRU:
+            return collections.LRUCacheMap(limit=limit, on_expire=on_expire)
+
+        if policy is config_api.CacheEvictionPolicy.TTL:
+            return collections.TTLCacheMap(limit=limit, ttl=self._settings.eviction_ttl, on_expire=on_expire)
+
+        if policy is config_api.CacheEvictionPolicy.TINY_LFU:
+            return collections.TinyLFUCacheMap(limit=limit, on_expire=on_expire)
+
+        return collections.LimitedCapacityCacheMap(limit=limit, on_expire=on_expire)
+
     def _is_cache_enabled_for(self, required_flag: config_api.CacheComponents) -> bool:
         return (self._settings.components & required_flag) == required_flag
 
@@ -140,18 +159,226 @@ def _is_cache_enabled_for(self, required_flag: config_api.CacheComponents) -> bo
     def _increment_ref_count(obj: cache_utility.RefCell[typing.Any], increment: int = 1) -> None:
         obj.ref_count += increment
 
+    def _copy(self, entity: _ValueT, /) -> _ValueT:
+        return entity if self._settings.borrow_entities else copy.copy(entity)
+
+    @property
+    def _view_type(self) -> typing.Type[cache_utility.CacheMappingView[typing.Any, typing.Any]]:
+        if self._settings.borrow_entities:
+            return cache_utility.BorrowedCacheMappingView
+
+        return cache_utility.CacheMappingView
+
     def clear(self) -> None:
         if self._settings.components == config_api.CacheComponents.NONE:
             return None
 
         self._create_cache()
 
+    async def dump(self, path: typing.Union[str, os.PathLike[str]], /) -> None:
+        """Write a snapshot of the cached state to a file.
+
+        The snapshot holds the bot's user, the DM channel IDs and everything
+        cached for each guild (the guild, its channels, threads, roles,
+        emojis, stickers, invites, members, presences and voice states),
+        alongside the users these refer to. Messages are not included.
+
+        The snapshot is pickled in small frames (a guild, or a few hundred of
+        its members or presences) which the default executor encodes and
+        writes, so the cache can keep being used while this runs. The
+        collections which may change in the meantime are copied beforehand.
+        The file is only replaced once the snapshot is complete.
+
+        Parameters
+        ----------
+        path
+            Path of the file to write the snapshot to.
+        """
+        path = os.fspath(path)
+        temporary_path = path + ".tmp"
+        loop = asyncio.get_running_loop()
+
+        with open(temporary_path, "wb") as fp:
+            encoder = cache_snapshot.SnapshotEncoder(self._app, fp)
+            try:
+                await loop.run_in_executor(None, fp.write, cache_snapshot.HEADER)
+                await loop.run_in_executor(None, encoder.write, cache_snapshot.ME, self._me)
+                await loop.run_in_executor(
+                    None, encoder.write, cache_snapshot.DM_CHANNEL_IDS, dict(self._dm_channel_entries.items())
+                )
+
+                for guild_id in tuple(self._guild_entries.keys()):
+                    if (guild_record := self._guild_entries.get(guild_id)) is None:
+                        continue
+
+                    members = self._snapshot_members(guild_record)
+                    presences = tuple(guild_record.presences.values()) if guild_record.presences else ()
+                    await loop.run_in_executor(
+                        None, encoder.write, cache_snapshot.GUILD, self._snapshot_guild(guild_id, guild_record)
+                    )
+                    await loop.run_in_executor(None, encoder.write_members, guild_id, members)
+                    await loop.run_in_executor(None, encoder.write_presences, guild_id, presences)
+
+                await loop.run_in_executor(None, encoder.write_references)
+
+            except BaseException:
+                fp.close()
+                os.remove(temporary_path)
+                raise
+
+        os.replace(temporary_path, path)
+        _LOGGER.debug("dumped cache snapshot of %s guilds to %s", len(self._guild_entries), path)
+
+    def _snapshot_guild(
+        self, guild_id: snowflakes.Snowflake, guild_record: cache_utility.GuildRecord
+    ) -> typing.Tuple[typing.Any, ...]:
+        return (
+            guild_id,
+            # The members and presences are written in their own frames, and the collections are
+            # copied as the frame is pickled by the executor while the cache may be changing.
+            attrs.evolve(
+                guild_record,
+                compact_members=None,
+                channels=set(guild_record.channels) if guild_record.channels is not None else None,
+                threads=set(guild_record.threads) if guild_record.threads is not None else None,
+                emojis=set(guild_record.emojis) if guild_record.emojis is not None else None,
+                stickers=set(guild_record.stickers) if guild_record.stickers is not None else None,
+                invites=list(guild_record.invites) if guild_record.invites is not None else None,
+                members=None,
+                presences=None,
+                roles=set(guild_record.roles) if guild_record.roles is not None else None,
+                voice_states=guild_record.voice_states.copy() if guild_record.voice_states is not None else None,
+            ),
+            [self._guild_channel_entries[i] for i in guild_record.channels or () if i in self._guild_channel_entries],
+            [self._guild_thread_entries[i] for i in guild_record.threads or () if i in self._guild_thread_entries],
+            [self._role_entries[i] for i in guild_record.roles or () if i in self._role_entries],
+            [self._emoji_entries[i] for i in guild_record.emojis or () if i in self._emoji_entries],
+            [self._sticker_entries[i] for i in guild_record.stickers or () if i in self._sticker_entries],
+            [self._invite_entries[i] for i in guild_record.invites or () if i in self._invite_entries],
+        )
+
+    @staticmethod
+    def _snapshot_members(
+        guild_record: cache_utility.GuildRecord,
+    ) -> typing.Iterator[typing.Tuple[snowflakes.Snowflake, cache_utility.MemberData]]:
+        # The members are copied here and only built lazily by the executor while it writes their frames
+        if guild_record.compact_members:
+            store = guild_record.compact_members.copy()
+            return ((user_id, store.build_member_data(user_id)) for user_id in store)
+
+        cells = tuple(guild_record.members.items()) if guild_record.members else ()
+        return ((user_id, cell.object) for user_id, cell in cells)
+
+    async def load(self, path: typing.Union[str, os.PathLike[str]], /) -> None:
+        """Replace the cached state with a snapshot written by [`hikari.impl.cache.CacheImpl.dump`][].
+
+        The file is read and decoded by the default executor frame by frame,
+        and each frame is then added to the cache. The snapshot should be
+        loaded before the cache is used, as it is replaced as a whole.
+
+        Only snapshots written by the same version of hikari can be loaded.
+
+        !!! warning
+            Snapshots are loaded with [`pickle`][]. While only hikari's
+            entity classes can be unpickled, they should still only be loaded
+            from trusted files.
+
+        Parameters
+        ----------
+        path
+            Path of the file to load the snapshot from.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a complete snapshot or was written by another
+            version of hikari. The cache is left empty.
+        """
+        loop = asyncio.get_running_loop()
+        decoder = cache_snapshot.SnapshotDecoder(self._app)
+        self._create_cache()
+
+        with open(path, "rb") as fp:
+            try:
+                await loop.run_in_executor(None, cache_snapshot.read_header, fp)
+
+                while not decoder.is_complete:
+                    kind, value = await loop.run_in_executor(None, decoder.read, fp)
+
+                    if kind == cache_snapshot.ME:
+                        self._me = value
+
+                    elif kind == cache_snapshot.DM_CHANNEL_IDS:
+                        self._dm_channel_entries.update(value)
+
+                    elif kind == cache_snapshot.GUILD:
+                        self._load_guild(*value)
+
+                    elif kind == cache_snapshot.MEMBERS:
+                        self._load_members(*value)
+
+                    elif kind == cache_snapshot.PRESENCES:
+                        guild_id, presences = value
+                        guild_record = self._guild_entries[guild_id]
+                        if guild_record.presences is None:
+                            guild_record.presences = collections.FreezableDict()
+
+                        guild_record.presences.update((presence.user_id, presence) for presence in presences)
+
+            except BaseException:
+                self._create_cache()
+                raise
+
+        self._user_entries.update(decoder.users)
+        self._unknown_custom_emoji_entries.update(decoder.unknown_emojis)
+        _LOGGER.debug("loaded cache snapshot of %s guilds from %s", len(self._guild_entries), path)
+
+    def _load_members(
+        self,
+        guild_id: snowflakes.Snowflake,
+        members: typing.Sequence[typing.Tuple[snowflakes.Snowflake, cache_utility.RefCell[cache_utility.MemberData]]],
+    ) -> None:
+        guild_record = self._guild_entries[guild_id]
+        if self._settings.compact_members:
+            if guild_record.compact_members is None:
+                guild_record.compact_members = cache_utility.CompactMemberStore(guild_id)
+
+            # The user cells are only filled in once their frames are decoded at the end of the snapshot
+            for user_id, cell in members:
+                guild_record.compact_members.set(cell.object, cell.object.user, user_id=user_id)
+
+            return
+
+        if guild_record.members is None:
+            guild_record.members = collections.FreezableDict()
+
+        guild_record.members.update(members)
+
+    def _load_guild(
+        self,
+        guild_id: snowflakes.Snowflake,
+        guild_record: cache_utility.GuildRecord,
+        channels: typing.Sequence[channels_.PermissibleGuildChannel],
+        threads: typing.Sequence[channels_.GuildThreadChannel],
+        roles: typing.Sequence[guilds.Role],
+        known_emojis: typing.Sequence[cache_utility.KnownCustomEmojiData],
+        stickers: typing.Sequence[cache_utility.GuildStickerData],
+        invites: typing.Sequence[cache_utility.InviteData],
+    ) -> None:
+        self._guild_entries[guild_id] = guild_record
+        self._guild_channel_entries.update((channel.id, channel) for channel in channels)
+        self._guild_thread_entries.update((thread.id, thread) for thread in threads)
+        self._role_entries.update((role.id, role) for role in roles)
+        self._emoji_entries.update((emoji.id, emoji) for emoji in known_emojis)
+        self._sticker_entries.update((sticker.id, sticker) for sticker in stickers)
+        self._invite_entries.update((invite.code, invite) for invite in invites)
+
     def clear_dm_channel_ids(self) -> cache.CacheView[snowflakes.Snowflake, snowflakes.Snowflake]:
         if not self._is_cache_enabled_for(config_api.CacheComponents.DM_CHANNEL_IDS):
             return cache_utility.EmptyCacheView()
 
         result = self._dm_channel_entries
-        self._dm_channel_entries = collections.LimitedCapacityCacheMap(limit=self._settings.max_dm_channel_ids)
+        self._dm_channel_entries = self._create_limited_map(self._settings.max_dm_channel_ids)
         return cache_utility.CacheMappingView(result)
 
     def delete_dm_channel_id(
@@ -474,7 +701,7 @@ def _get_guild(
         if not guild_record or not guild_record.guild or guild_record.is_available is not availability:
             return None
 
-        return copy.copy(guild_record.guild)
+        return self._copy(guild_record.guild)
 
     def get_guild(
         self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
@@ -483,7 +710,7 @@ def get_guild(
             return None
 
         guild_record = self._guild_entries.get(snowflakes.Snowflake(guild))
-        return copy.copy(guild_record.guild) if guild_record and guild_record.guild else None
+        return self._copy(guild_record.guild) if guild_record and guild_record.guild else None
 
     def get_available_guild(
         self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
@@ -509,10 +736,10 @@ def _get_guilds_view(self, *, availability: bool) -> cache.CacheView[snowflakes.
             for sf, guild_record in self._guild_entries.items()
             if guild_record.guild and guild_record.is_available is availability
         }
-        return cache_utility.CacheMappingView(results) if results else cache_utility.EmptyCacheView()
+        return self._view_type(results) if results else cache_utility.EmptyCacheView()
 
     def get_guilds_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
-        return cache_utility.CacheMappingView(
+        return self._view_type(
             {guild_id: record.guild for guild_id, record in self._guild_entries.items() if record.guild}
         )
 
@@ -649,10 +876,10 @@ def get_thread(
             return None
 
         thread = self._guild_thread_entries.get(snowflakes.Snowflake(thread))
-        return copy.copy(thread) if thread else None
+        return self._copy(thread) if thread else None
 
     def get_threads_view(self) -> cache.CacheView[snowflakes.Snowflake, channels_.GuildThreadChannel]:
-        return cache_utility.CacheMappingView(self._guild_thread_entries.freeze())
+        return self._view_type(self._guild_thread_entries.freeze())
 
     def get_threads_view_for_guild(
         self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
@@ -664,7 +891,7 @@ def get_threads_view_for_guild(
         if not guild_record or not guild_record.threads:
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView({sf: self._guild_thread_entries[sf] for sf in guild_record.threads})
+        return self._view_type({sf: self._guild_thread_entries[sf] for sf in guild_record.threads})
 
     def get_threads_view_for_channel(
         self,
@@ -681,7 +908,7 @@ def get_threads_view_for_channel(
 
         threads = map(self._guild_thread_entries.__getitem__, record.threads)
         channel = snowflakes.Snowflake(channel)
-        return cache_utility.CacheMappingView({thread.id: thread for thread in threads if thread.parent_id == channel})
+        return self._view_type({thread.id: thread for thread in threads if thread.parent_id == channel})
 
     def set_thread(self, thread: channels_.GuildThreadChannel, /) -> None:
         if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_THREADS):
@@ -763,15 +990,16 @@ def get_guild_channel(
             return None
 
         channel = self._guild_channel_entries.get(snowflakes.Snowflake(channel))
-        return cache_utility.copy_guild_channel(channel) if channel else None
+        if not channel:
+            return None
+
+        return channel if self._settings.borrow_entities else cache_utility.copy_guild_channel(channel)
 
     def get_guild_channels_view(self) -> cache.CacheView[snowflakes.Snowflake, channels_.PermissibleGuildChannel]:
         if not self._is_cache_enabled_for(config_api.CacheComponents.GUILD_CHANNELS):
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView(
-            self._guild_channel_entries.freeze(), builder=cache_utility.copy_guild_channel  # type: ignore[type-var]
-        )
+        return self._build_guild_channels_view(self._guild_channel_entries.freeze())
 
     def get_guild_channels_view_for_guild(
         self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
@@ -784,22 +1012,14 @@ def get_guild_channels_view_for_guild(
             return cache_utility.EmptyCacheView()
 
         cached_channels = {sf: self._guild_channel_entries[sf] for sf in guild_record.channels}
+        return self._build_guild_channels_view(cache_utility.sort_guild_channels(cached_channels))
 
-        def sorter(
-            args: typing.Tuple[snowflakes.Snowflake, channels_.PermissibleGuildChannel]
-        ) -> typing.Tuple[int, int, int]:
-            channel = args[1]
-            if isinstance(channel, channels_.GuildCategory):
-                return channel.position, -1, 0
-
-            parent_position = -1 if channel.parent_id is None else cached_channels[channel.parent_id].position
-
-            if not isinstance(channel, channels_.GuildVoiceChannel):
-                return parent_position, 0, channel.position
-
-            return parent_position, 1, channel.position
+    def _build_guild_channels_view(
+        self, cached_channels: typing.Mapping[snowflakes.Snowflake, channels_.PermissibleGuildChannel]
+    ) -> cache.CacheView[snowflakes.Snowflake, channels_.PermissibleGuildChannel]:
+        if self._settings.borrow_entities:
+            return cache_utility.BorrowedCacheMappingView(cached_channels)
 
-        cached_channels = dict(sorted(cached_channels.items(), key=sorter))
         return cache_utility.CacheMappingView(
             cached_channels, builder=cache_utility.copy_guild_channel  # type: ignore[type-var]
         )
@@ -1026,7 +1246,7 @@ def delete_me(self) -> typing.Optional[users.OwnUser]:
         return cached_user
 
     def get_me(self) -> typing.Optional[users.OwnUser]:
-        return copy.copy(self._me)
+        return self._copy(self._me)
 
     def set_me(self, user: users.OwnUser, /) -> None:
         if self._is_cache_enabled_for(config_api.CacheComponents.ME):
@@ -1044,6 +1264,9 @@ def update_me(
         return cached_user, self.get_me()
 
     def _build_member(self, member_data: cache_utility.RefCell[cache_utility.MemberData]) -> guilds.Member:
+        if self._settings.borrow_entities:
+            return member_data.object.build_borrowed_entity(self._app)
+
         return member_data.object.build_entity(self._app)
 
     @staticmethod
@@ -1064,6 +1287,10 @@ def _garbage_collect_member(
         if decrement is not None:
             self._increment_ref_count(member, -decrement)
 
+        if self._settings.compact_members:
+            # Referenced members are detached snapshots when members are stored compactly.
+            return None
+
         user_id = member.object.user.object.id
         if not guild_record.members or user_id not in guild_record.members:
             return None
@@ -1097,6 +1324,23 @@ def clear_members_for_guild(
 
         guild_id = snowflakes.Snowflake(guild)
         guild_record = self._guild_entries.get(guild_id)
+
+        if self._settings.compact_members:
+            if not guild_record or not guild_record.compact_members:
+                return cache_utility.EmptyCacheView()
+
+            store = guild_record.compact_members
+            guild_record.compact_members = None
+            built_members = {user_id: store.build_member(user_id) for user_id in store}
+
+            for user_id in built_members:
+                user = store.get_user(user_id)
+                assert user is not None
+                self._garbage_collect_user(user, decrement=1)
+
+            self._remove_guild_record_if_empty(guild_id, guild_record)
+            return cache_utility.CacheMappingView(built_members)
+
         if not guild_record or not guild_record.members:
             return cache_utility.EmptyCacheView()
 
@@ -1119,6 +1363,22 @@ def delete_member(
         guild_id = snowflakes.Snowflake(guild)
         user_id = snowflakes.Snowflake(user)
         guild_record = self._guild_entries.get(guild_id)
+
+        if self._settings.compact_members:
+            if not guild_record or not guild_record.compact_members or user_id not in guild_record.compact_members:
+                return None
+
+            member = guild_record.compact_members.build_member(user_id)
+            user_cell = guild_record.compact_members.delete(user_id)
+            assert user_cell is not None
+            self._garbage_collect_user(user_cell, decrement=1)
+
+            if not guild_record.compact_members:
+                guild_record.compact_members = None
+                self._remove_guild_record_if_empty(guild_id, guild_record)
+
+            return member
+
         if not guild_record or not guild_record.members:
             return None
 
@@ -1146,6 +1406,13 @@ def get_member(
         guild_id = snowflakes.Snowflake(guild)
         user_id = snowflakes.Snowflake(user)
         guild_record = self._guild_entries.get(guild_id)
+
+        if self._settings.compact_members:
+            if not guild_record or not guild_record.compact_members or user_id not in guild_record.compact_members:
+                return None
+
+            return guild_record.compact_members.build_member(user_id)
+
         if not guild_record or not guild_record.members:
             return None
 
@@ -1158,6 +1425,15 @@ def get_members_view(
         if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
             return cache_utility.EmptyCacheView()
 
+        if self._settings.compact_members:
+            return cache_utility.Cache3DMappingView(
+                {
+                    guild_id: self._build_compact_members_view(record.compact_members)
+                    for guild_id, record in self._guild_entries.items()
+                    if record.compact_members
+                }
+            )
+
         views: typing.Mapping[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, guilds.Member]] = {
             guild_id: cache_utility.CacheMappingView(view.members.freeze(), builder=self._build_member)  # type: ignore[type-var]
             for guild_id, view in self._guild_entries.items()
@@ -1173,6 +1449,13 @@ def get_members_view_for_guild(
 
         guild_id = snowflakes.Snowflake(guild_id)
         guild_record = self._guild_entries.get(guild_id)
+
+        if self._settings.compact_members:
+            if not guild_record or not guild_record.compact_members:
+                return cache_utility.EmptyCacheView()
+
+            return self._build_compact_members_view(guild_record.compact_members)
+
         if not guild_record or not guild_record.members:
             return cache_utility.EmptyCacheView()
 
@@ -1186,11 +1469,45 @@ def set_member(self, member: guilds.Member, /) -> None:
         if not self._is_cache_enabled_for(config_api.CacheComponents.MEMBERS):
             return None
 
+        if self._settings.compact_members:
+            self._set_compact_member(member)
+            return None
+
         self._set_member(member, is_reference=False)
 
+    @staticmethod
+    def _build_compact_members_view(
+        store: cache_utility.CompactMemberStore,
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Member]:
+        # Members are only built when accessed, so ones removed after the view was made will raise a KeyError.
+        return cache_utility.CacheMappingView(
+            {user_id: user_id for user_id in store}, builder=store.build_member  # type: ignore[type-var]
+        )
+
+    def _set_compact_member(self, member: guilds.Member, /) -> None:
+        guild_record = self._get_or_create_guild_record(member.guild_id)
+        user = self._set_user(member.user)
+
+        if guild_record.compact_members is None:
+            guild_record.compact_members = cache_utility.CompactMemberStore(member.guild_id)
+
+        if member.user.id not in guild_record.compact_members:
+            self._increment_ref_count(user)
+
+        guild_record.compact_members.set(member, user)
+
     def _set_member(
         self, member: guilds.Member, /, *, is_reference: bool = True
     ) -> cache_utility.RefCell[cache_utility.MemberData]:
+        if self._settings.compact_members:
+            # The compact store can't hand out references, so referencing entities keep their own snapshot
+            # and only refresh the stored member if it is already cached.
+            guild_record = self._guild_entries.get(member.guild_id)
+            if guild_record and guild_record.compact_members and member.user.id in guild_record.compact_members:
+                self._set_compact_member(member)
+
+            return cache_utility.RefCell(cache_utility.MemberData.build_from_entity(member))
+
         guild_record = self._get_or_create_guild_record(member.guild_id)
         user = self._set_user(member.user)
         member_data = cache_utility.MemberData.build_from_entity(member, user=user)
@@ -1435,13 +1752,13 @@ def get_role(self, role: snowflakes.SnowflakeishOr[guilds.PartialRole], /) -> ty
             return None
 
         role = self._role_entries.get(snowflakes.Snowflake(role))
-        return copy.copy(role) if role else None
+        return self._copy(role) if role else None
 
     def get_roles_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
         if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView(self._role_entries.freeze())
+        return self._view_type(self._role_entries.freeze())
 
     def get_roles_view_for_guild(
         self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
@@ -1453,7 +1770,7 @@ def get_roles_view_for_guild(
         if not guild_record or not guild_record.roles:
             return cache_utility.EmptyCacheView()
 
-        return cache_utility.CacheMappingView({role_id: self._role_entries[role_id] for role_id in guild_record.roles})
+        return self._view_type({role_id: self._role_entries[role_id] for role_id in guild_record.roles})
 
     def set_role(self, role: guilds.Role, /) -> None:
         if not self._is_cache_enabled_for(config_api.CacheComponents.ROLES):
@@ -1493,7 +1810,7 @@ def _garbage_collect_user(
 
     def get_user(self, user: snowflakes.SnowflakeishOr[users.PartialUser], /) -> typing.Optional[users.User]:
         user = self._user_entries.get(snowflakes.Snowflake(user))
-        return user.copy() if user else None
+        return self._copy(user.object) if user else None
 
     def get_users_view(self) -> cache.CacheView[snowflakes.Snowflake, users.User]:
         if not self._user_entries:
@@ -1501,7 +1818,8 @@ def get_users_view(self) -> cache.CacheView[snowflakes.Snowflake, users.User]:
 
         cached_users = self._user_entries.freeze()
         unwrapper = typing.cast(
-            "typing.Callable[[cache_utility.RefCell[users.User]], users.User]", cache_utility.unwrap_ref_cell
+            "typing.Callable[[cache_utility.RefCell[users.User]], users.User]",
+            cache_utility.borrow_ref_cell if self._settings.borrow_entities else cache_utility.unwrap_ref_cell,
         )
         return cache_utility.CacheMappingView(cached_users, builder=unwrapper)  # type: ignore[type-var]
 
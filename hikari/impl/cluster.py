@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Utilities used to run a gateway bot across multiple processes."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("IdentifyCoordinator", "IdentifyGate", "split_shard_ids")
+
+import asyncio
+import itertools
+import logging
+import typing
+
+from hikari.impl import rate_limits
+from hikari.internal import aio
+from hikari.internal import ux
+
+if typing.TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.cluster")
+
+
+def split_shard_ids(shard_ids: typing.Sequence[int], processes: int) -> typing.List[typing.Tuple[int, ...]]:
+    """Split shard IDs into contiguous chunks of as even a size as possible.
+
+    Parameters
+    ----------
+    shard_ids
+        The shard IDs to split.
+    processes
+        The maximum number of chunks to split the shard IDs into.
+
+    Returns
+    -------
+    typing.List[typing.Tuple[int, ...]]
+        The chunks. Empty chunks are never returned, so this may contain less
+        than `processes` elements.
+
+    Raises
+    ------
+    ValueError
+        If `processes` is less than 1.
+    """
+    if processes < 1:
+        raise ValueError("'processes' must be greater than or equal to 1")
+
+    size, extra = divmod(len(shard_ids), processes)
+    chunks: typing.List[typing.Tuple[int, ...]] = []
+    start = 0
+
+    for i in range(processes):
+        end = start + size + (i < extra)
+        if start == end:
+            break
+
+        chunks.append(tuple(shard_ids[start:end]))
+        start = end
+
+    return chunks
+
+
+class IdentifyCoordinator:
+    """Grants identify permits to the worker processes of a cluster.
+
+    Permits are granted through an [`hikari.impl.rate_limits.IdentifyRateLimiter`][],
+    so a request is only ever held back by earlier requests that share its rate
+    limit key, no matter which process the shards live in. The pending requests
+    of a worker are dropped once its pipe is closed.
+
+    Parameters
+    ----------
+    connections
+        The coordinator ends of the pipes shared with each worker process.
+    max_concurrency
+        The number of rate limit keys available.
+    """
+
+    __slots__: typing.Sequence[str] = ("_closed", "_limiter", "_pending")
+
+    def __init__(self, connections: typing.Sequence[Connection], max_concurrency: int) -> None:
+        self._closed: typing.Optional[asyncio.Future[None]] = None
+        self._limiter = rate_limits.IdentifyRateLimiter(max_concurrency)
+        self._pending: typing.Dict[Connection, typing.Set[asyncio.Task[None]]] = {
+            connection: set() for connection in connections
+        }
+
+    def serve(self) -> None:
+        """Serve permit requests until every worker has closed its pipe.
+
+        This blocks the calling thread while running its own event loop.
+        """
+        loop = asyncio.new_event_loop()
+
+        try:
+            loop.run_until_complete(self._serve())
+        finally:
+            aio.destroy_loop(loop, _LOGGER)
+
+    async def _serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._closed = loop.create_future()
+
+        for connection in self._pending:
+            loop.add_reader(connection.fileno(), self._read_requests, connection)
+
+        try:
+            if self._pending:
+                await self._closed
+
+        finally:
+            for connection in tuple(self._pending):
+                self._drop(connection)
+
+            self._limiter.close()
+
+    def _read_requests(self, connection: Connection) -> None:
+        try:
+            while connection.poll():
+                request_id, shard_id = connection.recv()
+                task = asyncio.get_running_loop().create_task(self._grant(connection, request_id, shard_id))
+                pending = self._pending[connection]
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+        except (EOFError, OSError):
+            self._drop(connection)
+
+    async def _grant(self, connection: Connection, request_id: int, shard_id: int) -> None:
+        await self._limiter.acquire(shard_id)
+        _LOGGER.log(ux.TRACE, "granting identify permit to shard %s", shard_id)
+
+        try:
+            connection.send(request_id)
+        except OSError:
+            # The worker has gone away, its pipe will be dropped once we hit EOF.
+            pass
+
+    def _drop(self, connection: Connection) -> None:
+        asyncio.get_running_loop().remove_reader(connection.fileno())
+
+        # Cancelled requests are skipped by the rate limiter, so they don't use up a permit for a dead worker
+        for task in self._pending.pop(connection):
+            task.cancel()
+
+        if not self._pending and self._closed is not None and not self._closed.done():
+            self._closed.set_result(None)
+
+
+class IdentifyGate(rate_limits.BaseIdentifyRateLimiter):
+    """Identify rate limiter backed by an [`hikari.impl.cluster.IdentifyCoordinator`][].
+
+    Parameters
+    ----------
+    connection
+        The worker end of the pipe shared with the coordinator.
+    """
+
+    __slots__: typing.Sequence[str] = ("_connection", "_loop", "_request_ids", "_waiters")
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+        self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self._request_ids = itertools.count()
+        self._waiters: typing.Dict[int, asyncio.Future[None]] = {}
+
+    async def acquire(self, shard_id: int) -> None:
+        if self._connection.closed:
+            raise RuntimeError("The cluster coordinator is no longer running")
+
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            # Permits are read from a single reader, as they can arrive in any order
+            loop.add_reader(self._connection.fileno(), self._read_permits)
+            self._loop = loop
+
+        request_id = next(self._request_ids)
+        future = self._waiters[request_id] = loop.create_future()
+
+        try:
+            self._connection.send((request_id, shard_id))
+            await future
+        except OSError as ex:
+            raise RuntimeError("The cluster coordinator is no longer running") from ex
+        finally:
+            self._waiters.pop(request_id, None)
+
+    def close(self) -> None:
+        self._disconnect(None)
+
+    def _read_permits(self) -> None:
+        try:
+            while self._connection.poll():
+                future = self._waiters.pop(self._connection.recv(), None)
+
+                # Permits for cancelled requests are dropped
+                if future is not None and not future.done():
+                    future.set_result(None)
+
+        except (EOFError, OSError):
+            self._disconnect(RuntimeError("The cluster coordinator is no longer running"))
+
+    def _disconnect(self, exception: typing.Optional[Exception]) -> None:
+        if self._loop is not None:
+            self._loop.remove_reader(self._connection.fileno())
+            self._loop = None
+
+        for future in self._waiters.values():
+            if future.done():
+                continue
+
+            if exception is None:
+                future.cancel()
+            else:
+                future.set_exception(exception)
+
+        self._waiters.clear()
+        self._connection.close()
@@ -30,6 +30,7 @@
     "HTTPTimeoutSettings",
     "HTTPSettings",
     "CacheComponents",
+    "CacheEvictionPolicy",
     "CacheSettings",
 )
 
@@ -43,6 +44,11 @@
 from hikari.internal import attrs_extensions
 from hikari.internal import data_binding
 
+if typing.TYPE_CHECKING:
+    from hikari.impl import buckets
+    from hikari.impl import rest_cache
+    from hikari.impl import rest_metrics
+
 _BASICAUTH_TOKEN_PREFIX: typing.Final[str] = "Basic"  # nosec
 _PROXY_AUTHENTICATION_HEADER: typing.Final[str] = "Proxy-Authentication"
 
@@ -201,6 +207,33 @@ def _(self, attrsib: attrs.Attribute[typing.Optional[float]], value: typing.Any)
 class HTTPSettings(config.HTTPSettings):
     """Settings to control HTTP clients."""
 
+    coalesce_get_requests: bool = attrs.field(default=False, validator=attrs.validators.instance_of(bool))
+    """Toggle whether to share identical GET requests which are made at the same time.
+
+    When enabled, a GET request made while an identical request (same route,
+    query and authorization) is already in flight will wait for and return
+    the response of the request in flight, rather than making another one.
+    This can greatly reduce the number of requests made when many events
+    fetch the same resource at once, such as during a mass join.
+
+    Defaults to [`False`][].
+    """
+
+    concurrent_bucket_requests: bool = attrs.field(default=False, validator=attrs.validators.instance_of(bool))
+    """Toggle whether to allow multiple requests to be in flight on a rate limit bucket at once.
+
+    By default, each REST rate limit bucket only allows one request to be made
+    at a time. When enabled, known buckets will instead allow as many requests
+    to run at once as the bucket has remaining in its current window, while
+    buckets which haven't been resolved yet still make one request at a time.
+
+    This can greatly reduce the latency of making many requests on the same
+    bucket (e.g. adding reactions or roles), at the cost of being more likely
+    to run into the occasional rate limit if the limits change.
+
+    Defaults to [`False`][].
+    """
+
     enable_cleanup_closed: bool = attrs.field(default=False, validator=attrs.validators.instance_of(bool))
     """Toggle whether to clean up closed transports.
 
@@ -246,6 +279,61 @@ def _(self, _: attrs.Attribute[typing.Optional[int]], value: typing.Any) -> None
         if value is not None and (not isinstance(value, int) or value <= 0):
             raise ValueError("http_settings.max_redirects must be None or a POSITIVE integer")
 
+    metrics_hook: typing.Optional[rest_metrics.RESTMetricsHook] = attrs.field(default=None)
+    """Hook to report the metrics of each REST request to.
+
+    If set, the hook is told how long each request spent waiting on rate
+    limits, on the network and decoding the response, along with its status
+    and how many times it was retried or rate limited. See
+    [`hikari.impl.rest_metrics.RESTMetricsAggregator`][] for a hook which
+    aggregates these per route and can export them for Prometheus.
+
+    Defaults to [`None`][].
+    """
+
+    rate_limit_backend: typing.Optional[buckets.RESTRateLimitBackend] = attrs.field(default=None)
+    """Backend to share the REST rate limits with.
+
+    This should be set when multiple processes make requests with the same
+    token, so they don't run into each other's rate limits. See
+    [`hikari.impl.rate_limit_broker`][] for a backend which shares them
+    between the processes on a host.
+
+    Defaults to [`None`][].
+    """
+
+    response_cache: typing.Optional[rest_cache.RESTResponseCache] = attrs.field(default=None)
+    """Cache to keep the responses of REST GET requests in.
+
+    If set, GET requests for routes which the cache keeps the responses of
+    return the cached response while it's valid instead of making a request.
+    See [`hikari.impl.rest_cache.RESTResponseCacheImpl`][] for a cache which
+    keeps the responses for resources which rarely change.
+
+    Defaults to [`None`][].
+    """
+
+    stream_json_arrays: bool = attrs.field(default=False, validator=attrs.validators.instance_of(bool))
+    """Toggle whether to decode large JSON array responses while they are being received.
+
+    When enabled, responses to endpoints which return large arrays, such as
+    [`hikari.api.rest.RESTClient.fetch_members`][] and
+    [`hikari.api.rest.RESTClient.fetch_application_commands`][], are decoded
+    and deserialized one element at a time as they are received, rather than
+    only once the whole body has been read. This avoids holding the raw
+    JSON page (the body and its decoded objects) in memory.
+
+    The deserialized entities of a page are still collected before the
+    page is returned, as the request must complete before the next page
+    can be requested, so peak memory is still proportional to the page of
+    entities rather than to a single entity.
+
+    Streamed responses are never shared between requests or kept in the
+    [`hikari.impl.config.HTTPSettings.response_cache`][].
+
+    Defaults to [`False`][].
+    """
+
     ssl: ssl_.SSLContext = attrs.field(
         factory=lambda: _ssl_factory(True),
         converter=_ssl_factory,
@@ -295,6 +383,7 @@ class that will **NOT** enforce SSL verification. This is then stored
 
 # Re-export
 CacheComponents = config.CacheComponents
+CacheEvictionPolicy = config.CacheEvictionPolicy
 
 
 @attrs_extensions.with_copy
@@ -326,6 +415,23 @@ class CacheSettings(config.CacheSettings):
     Defaults to `50`.
     """
 
+    eviction_policy: config.CacheEvictionPolicy = attrs.field(
+        converter=config.CacheEvictionPolicy, default=config.CacheEvictionPolicy.FIFO
+    )
+    """The policy used to pick which entries the size-limited caches remove.
+
+    This applies to the message and DM channel ID caches.
+
+    Defaults to [`hikari.api.config.CacheEvictionPolicy.FIFO`][].
+    """
+
+    eviction_ttl: float = attrs.field(default=600.0)
+    """How long entries are kept for in seconds when using
+    [`hikari.api.config.CacheEvictionPolicy.TTL`][].
+
+    Defaults to `600`.
+    """
+
     only_my_member: bool = attrs.field(default=False)
     """Reduce the members cache to only the bot itself.
 
@@ -334,3 +440,65 @@ class CacheSettings(config.CacheSettings):
 
     Defaults to [`False`][].
     """
+
+    borrow_entities: bool = attrs.field(default=False)
+    """Return the cached entity objects themselves rather than copies of them.
+
+    When enabled, the guilds, channels, threads, roles, users and members
+    returned by the cache are the objects held by the cache, shared with
+    every other caller. The cache replaces these objects when the entities
+    change rather than modifying them, so a borrowed object keeps the state
+    it had when it was returned. Cached members are only rebuilt when their
+    data changes (unless `compact_members` is also enabled), so repeated
+    lookups don't allocate. Other entities are still built on every access.
+
+    !!! warning
+        Borrowed objects are not frozen. Modifying one (for example, setting
+        `member.user.username`) modifies the cached entity for every caller
+        until the cache next replaces it, so use [`copy.copy`][] to get an
+        object which is safe to modify.
+
+    Defaults to [`False`][].
+    """
+
+    shared_store_path: typing.Optional[str] = attrs.field(default=None)
+    """Path of a memory-mapped file to publish the cached guild state to.
+
+    When set, the gateway bot uses a [`hikari.impl.shared_cache.SharedCacheImpl`][]
+    which writes the cached guilds, guild channels and roles to this file, so
+    other processes on the same host can read them with a
+    [`hikari.impl.shared_cache.SharedCacheReader`][]. Only one process may
+    write to a file, so this can't be used when running multiple processes.
+
+    Defaults to [`None`][].
+    """
+
+    snapshot_path: typing.Optional[str] = attrs.field(default=None)
+    """Path of a file to keep a snapshot of the cache in between restarts.
+
+    When set, the gateway bot writes a snapshot of the cache to this file
+    with [`hikari.impl.cache.CacheImpl.dump`][] when it is closed, and loads
+    it with [`hikari.impl.cache.CacheImpl.load`][] (then deletes it) when it
+    is next started. Combined with a `session_store` on the bot, resumed
+    shards have a warm cache straight away.
+
+    A snapshot written by another version of hikari is ignored. The
+    snapshot is loaded with [`pickle`][], and while only hikari's entity
+    classes can be unpickled, this file must not be writable by anyone else.
+
+    Defaults to [`None`][].
+    """
+
+    compact_members: bool = attrs.field(default=False)
+    """Store cached members in compact per-guild columns.
+
+    This greatly reduces the memory used per cached member, at the cost of
+    building member objects whenever they are retrieved. Members attached to
+    cached voice states and messages are kept as separate snapshots, and
+    members which are only known through those are not returned by the
+    member getters.
+
+    This will have no effect if the members cache is not enabled.
+
+    Defaults to [`False`][].
+    """
@@ -28,6 +28,8 @@
 
 import asyncio
 import base64
+import concurrent.futures
+import functools
 import logging
 import random
 import typing
@@ -67,6 +69,9 @@
 
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.event_manager")
+_T = typing.TypeVar("_T")
+_OFFLOADED_MERGE_BATCH_SIZE: typing.Final[int] = 1_000
+"""How many offloaded members or presences are merged into the cache before yielding to the event loop."""
 
 
 def _fixed_size_nonce() -> str:
@@ -92,9 +97,58 @@ async def _request_guild_members(
 
 
 class EventManagerImpl(event_manager_base.EventManagerBase):
-    """Provides event handling logic for Discord events."""
-
-    __slots__: typing.Sequence[str] = ("_cache", "_entity_factory", "_auto_chunk_members")
+    """Provides event handling logic for Discord events.
+
+    Parameters
+    ----------
+    entity_factory
+        The entity factory to deserialize entities with.
+    event_factory
+        The event factory to deserialize events with.
+    intents
+        The intents the shards are started with.
+    auto_chunk_members
+        Whether to request the members of guilds when they become available.
+    cache
+        The cache to keep up to date, if any.
+    dispatch_queue_size
+        The size of the queue of raw events for each shard, or [`None`][] to
+        create a task per event. This is a soft limit: raw events are never
+        dropped, as that would desync the cache, so events received while
+        the queue is full are still queued and counted as overflowed.
+    executor
+        The thread pool executor to deserialize large payloads in. Defaults
+        to the default executor of the event loop.
+
+        This can't be a [`concurrent.futures.ProcessPoolExecutor`][] when
+        `offload_threshold` is set, as the entities are bound to the
+        application, so neither they nor the deserializers can be pickled.
+    offload_threshold
+        The number of members from which the `GUILD_CREATE` and
+        `GUILD_MEMBERS_CHUNK` payloads are deserialized in `executor`, so the
+        event loop can keep heartbeating and handling events from other
+        shards in the meantime. The deserialized members and presences are
+        then merged into the cache in batches. This requires
+        `dispatch_queue_size`, as the events of a shard must be handled in
+        order, and an `executor` which runs in threads.
+
+        Defaults to [`None`][], which deserializes everything in the event
+        loop.
+
+    Raises
+    ------
+    ValueError
+        If `offload_threshold` is less than 1, or is passed without
+        `dispatch_queue_size` or with a process pool `executor`.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_auto_chunk_members",
+        "_cache",
+        "_entity_factory",
+        "_executor",
+        "_offload_threshold",
+    )
 
     def __init__(
         self,
@@ -105,16 +159,59 @@ def __init__(
         *,
         auto_chunk_members: bool = True,
         cache: typing.Optional[cache_.MutableCache] = None,
+        dispatch_queue_size: typing.Optional[int] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        offload_threshold: typing.Optional[int] = None,
     ) -> None:
+        if offload_threshold is not None:
+            if offload_threshold < 1:
+                raise ValueError("'offload_threshold' must be greater than 0")
+
+            if dispatch_queue_size is None:
+                raise ValueError("'offload_threshold' can only be used with 'dispatch_queue_size'")
+
+            if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+                raise ValueError("'offload_threshold' can't be used with a process pool 'executor'")
+
         self._cache = cache
         self._auto_chunk_members = auto_chunk_members
         self._entity_factory = entity_factory
+        self._executor = executor
+        self._offload_threshold = offload_threshold
         components = cache.settings.components if cache else config.CacheComponents.NONE
-        super().__init__(event_factory=event_factory, intents=intents, cache_components=components)
+        super().__init__(
+            event_factory=event_factory,
+            intents=intents,
+            cache_components=components,
+            dispatch_queue_size=dispatch_queue_size,
+        )
 
     def _cache_enabled_for(self, components: config.CacheComponents, /) -> bool:
         return self._cache is not None and (self._cache.settings.components & components) == components
 
+    def _should_offload(self, payload: data_binding.JSONObject) -> bool:
+        return self._offload_threshold is not None and len(payload.get("members", ())) >= self._offload_threshold
+
+    async def _deserialize(
+        self, offload: bool, deserializer: typing.Callable[..., _T], /, *args: typing.Any, **kwargs: typing.Any
+    ) -> _T:
+        if not offload:
+            return deserializer(*args, **kwargs)
+
+        # Deserializing only builds new entities from the payload, so it is safe to do in another thread
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(deserializer, *args, **kwargs))
+
+    @staticmethod
+    async def _merge_into_cache(
+        offloaded: bool, setter: typing.Callable[[_T], None], entities: typing.Iterable[_T], /
+    ) -> None:
+        for i, entity in enumerate(entities, start=1):
+            setter(entity)
+
+            if offloaded and i % _OFFLOADED_MERGE_BATCH_SIZE == 0:  # noqa: S001 - Modulo operator, not a format string
+                await asyncio.sleep(0)
+
     @event_manager_base.filtered(shard_events.ShardReadyEvent, config.CacheComponents.ME)
     async def on_ready(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway-events#ready for more info."""
@@ -266,10 +363,14 @@ async def on_guild_create(  # noqa: C901, CFQ001 - Function too complex and too
             # be resolved, where the correct guild visibility event will be dispatched
             return
 
+        offload = self._should_offload(payload)
+
         if unavailable is not None and self._enabled_for_event(guild_events.GuildAvailableEvent):
-            event = self._event_factory.deserialize_guild_available_event(shard, payload)
+            event = await self._deserialize(
+                offload, self._event_factory.deserialize_guild_available_event, shard, payload
+            )
         elif unavailable is None and self._enabled_for_event(guild_events.GuildJoinEvent):
-            event = self._event_factory.deserialize_guild_join_event(shard, payload)
+            event = await self._deserialize(offload, self._event_factory.deserialize_guild_join_event, shard, payload)
         else:
             event = None
 
@@ -295,8 +396,16 @@ async def on_guild_create(  # noqa: C901, CFQ001 - Function too complex and too
             stickers = gd.stickers() if self._cache_enabled_for(config.CacheComponents.GUILD_STICKERS) else None
             guild = gd.guild() if self._cache_enabled_for(config.CacheComponents.GUILDS) else None
             guild_id = gd.id
-            members = gd.members() if self._cache_enabled_for(config.CacheComponents.MEMBERS) else None
-            presences = gd.presences() if self._cache_enabled_for(config.CacheComponents.PRESENCES) else None
+            members = (
+                await self._deserialize(offload, gd.members)
+                if self._cache_enabled_for(config.CacheComponents.MEMBERS)
+                else None
+            )
+            presences = (
+                await self._deserialize(offload, gd.presences)
+                if self._cache_enabled_for(config.CacheComponents.PRESENCES)
+                else None
+            )
             roles = gd.roles() if self._cache_enabled_for(config.CacheComponents.ROLES) else None
             voice_states = gd.voice_states() if self._cache_enabled_for(config.CacheComponents.VOICE_STATES) else None
             threads = gd.threads() if self._cache_enabled_for(config.CacheComponents.GUILD_THREADS) else None
@@ -345,16 +454,14 @@ async def on_guild_create(  # noqa: C901, CFQ001 - Function too complex and too
                 # TODO: do we really want to invalidate these all after an outage.
                 self._cache.clear_members_for_guild(guild_id)
                 if not self._cache.settings.only_my_member:
-                    for member in members.values():
-                        self._cache.set_member(member)
+                    await self._merge_into_cache(offload, self._cache.set_member, members.values())
                 else:
                     my_member = members[shard.get_user_id()]
                     self._cache.set_member(my_member)
 
             if presences:
                 self._cache.clear_presences_for_guild(guild_id)
-                for presence in presences.values():
-                    self._cache.set_presence(presence)
+                await self._merge_into_cache(offload, self._cache.set_presence, presences.values())
 
             if voice_states:
                 self._cache.clear_voice_states_for_guild(guild_id)
@@ -607,14 +714,14 @@ async def on_guild_member_update(self, shard: gateway_shard.GatewayShard, payloa
     @event_manager_base.filtered(shard_events.MemberChunkEvent, config.CacheComponents.MEMBERS)
     async def on_guild_members_chunk(self, shard: gateway_shard.GatewayShard, payload: data_binding.JSONObject) -> None:
         """See https://discord.com/developers/docs/topics/gateway-events#guild-members-chunk for more info."""
-        event = self._event_factory.deserialize_guild_member_chunk_event(shard, payload)
+        offload = self._should_offload(payload)
+        event = await self._deserialize(
+            offload, self._event_factory.deserialize_guild_member_chunk_event, shard, payload
+        )
 
         if self._cache:
-            for member in event.members.values():
-                self._cache.set_member(member)
-
-            for presence in event.presences.values():
-                self._cache.set_presence(presence)
+            await self._merge_into_cache(offload, self._cache.set_member, event.members.values())
+            await self._merge_into_cache(offload, self._cache.set_presence, event.presences.values())
 
         await self.dispatch(event)
 
@@ -24,9 +24,11 @@
 
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("filtered", "EventManagerBase", "EventStream")
+__all__: typing.Sequence[str] = ("filtered", "DispatchQueueStats", "EventManagerBase", "EventStream")
 
 import asyncio
+import collections
+import contextvars
 import inspect
 import itertools
 import logging
@@ -67,6 +69,13 @@
         typing.Optional[event_manager_.PredicateT[base_events.EventT]], "asyncio.Future[base_events.EventT]"
     ]
     _WaiterMapT = typing.Dict[typing.Type[base_events.EventT], typing.Set[_WaiterT[base_events.EventT]]]
+    # The flattened listeners and the event types with waiters for a concrete event type, in dispatch order,
+    # as well as whether anything is registered for it at all.
+    _DispatchEntryT = typing.Tuple[
+        typing.Tuple[event_manager_.CallbackT[base_events.Event], ...],
+        typing.Tuple[typing.Type[base_events.Event], ...],
+        bool,
+    ]
 
     _EventManagerBaseT = typing.TypeVar("_EventManagerBaseT", bound="EventManagerBase")
     _UnboundMethodT = typing.Callable[
@@ -82,6 +91,11 @@
     _UNIONS = frozenset((typing.Union,))
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.event_manager")
+# How many queued raw events a dispatch worker will consume before yielding back to the event loop.
+_DISPATCH_BATCH_SIZE: typing.Final[int] = 64
+# Set inside dispatch workers so that consumers do not wait for the listeners of the events they dispatch.
+# Otherwise, one slow listener would hold up every other event for the shard.
+_DETACHED_DISPATCH: contextvars.ContextVar[bool] = contextvars.ContextVar("_DETACHED_DISPATCH", default=False)
 
 
 @typing.runtime_checkable
@@ -318,6 +332,146 @@ def is_enabled(self) -> bool:
         return self.is_caching or self.listener_group_count > 0 or self.waiter_group_count > 0
 
 
+@attrs.frozen(kw_only=True, weakref_slot=False)
+class DispatchQueueStats:
+    """Snapshot of the statistics of a shard's dispatch queue."""
+
+    shard_id: int = attrs.field()
+    """ID of the shard this queue is for."""
+
+    size: int = attrs.field()
+    """Number of raw events currently waiting in the queue."""
+
+    max_size: int = attrs.field()
+    """Configured size of the queue.
+
+    This is a soft limit, as raw events are never dropped (see `overflowed`).
+    """
+
+    high_watermark: int = attrs.field()
+    """Largest number of raw events that have been waiting in the queue at once."""
+
+    enqueued: int = attrs.field()
+    """Total number of raw events added to the queue."""
+
+    consumed: int = attrs.field()
+    """Total number of raw events consumed from the queue."""
+
+    overflowed: int = attrs.field()
+    """Total number of raw events added while the queue was already full.
+
+    Raw events are never dropped, as doing so would desync the cache. A
+    non-zero value means that events are being received faster than they
+    can be consumed.
+    """
+
+
+class _DispatchWorker:
+    """Consumes the raw events of a single shard in the order they were received.
+
+    The worker task is only alive while there are queued events, so an idle
+    shard does not keep a task around. The worker is removed from the event
+    manager once its shard closes.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_consumed",
+        "_enqueued",
+        "_event_manager",
+        "_high_watermark",
+        "_max_size",
+        "_overflowed",
+        "_queue",
+        "_shard",
+        "_task",
+        "_watcher",
+    )
+
+    def __init__(self, event_manager: EventManagerBase, shard: gateway_shard.GatewayShard, max_size: int) -> None:
+        self._consumed = 0
+        self._enqueued = 0
+        self._event_manager = event_manager
+        self._high_watermark = 0
+        self._max_size = max_size
+        self._overflowed = 0
+        self._queue: typing.Deque[typing.Tuple[_Consumer, data_binding.JSONObject]] = collections.deque()
+        self._shard = shard
+        self._task: typing.Optional[asyncio.Task[None]] = None
+        self._watcher: typing.Optional[asyncio.Task[None]] = None
+
+    def watch_shard(self) -> None:
+        """Remove this worker from the event manager once its shard closes.
+
+        Any events still in the queue are still consumed.
+        """
+        self._watcher = asyncio.create_task(
+            self._remove_on_close(), name=f"dispatch worker watcher (shard {self._shard.id})"
+        )
+
+    def put(self, consumer: _Consumer, payload: data_binding.JSONObject, /) -> None:
+        # Consuming raw events is synchronous, so we cannot wait for space to free up. Instead, the
+        # size acts as a soft limit, and going over it is reported through the stats and logs.
+        size = len(self._queue)
+        if size >= self._max_size:
+            if not self._overflowed:
+                _LOGGER.warning(
+                    "dispatch queue for shard %s is full (%s events), events are being received faster than "
+                    "they can be consumed",
+                    self._shard.id,
+                    size,
+                )
+
+            self._overflowed += 1
+
+        self._queue.append((consumer, payload))
+        self._enqueued += 1
+        self._high_watermark = max(self._high_watermark, size + 1)
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"dispatch worker (shard {self._shard.id})")
+
+    def stats(self) -> DispatchQueueStats:
+        return DispatchQueueStats(
+            shard_id=self._shard.id,
+            size=len(self._queue),
+            max_size=self._max_size,
+            high_watermark=self._high_watermark,
+            enqueued=self._enqueued,
+            consumed=self._consumed,
+            overflowed=self._overflowed,
+        )
+
+    async def _remove_on_close(self) -> None:
+        try:
+            await self._shard.join()
+
+        except Exception:
+            # The error the shard closed with is handled by whatever started it
+            _LOGGER.log(ux.TRACE, "shard %s closed with an error, removing its dispatch worker", self._shard.id)
+
+        workers = self._event_manager._dispatch_workers
+        if workers.get(self._shard.id) is self:
+            del workers[self._shard.id]
+
+    async def _run(self) -> None:
+        _DETACHED_DISPATCH.set(True)
+        queue = self._queue
+        handle_dispatch = self._event_manager._handle_dispatch
+
+        try:
+            while queue:
+                for _ in range(min(len(queue), _DISPATCH_BATCH_SIZE)):
+                    consumer, payload = queue.popleft()
+                    self._consumed += 1
+                    await handle_dispatch(consumer, self._shard, payload)
+
+                # Consumers rarely suspend, so make sure we give other tasks a chance to run
+                await asyncio.sleep(0)
+
+        finally:
+            self._task = None
+
+
 class EventManagerBase(event_manager_.EventManager):
     """Provides functionality to consume and dispatch events.
 
@@ -325,7 +479,16 @@ class EventManagerBase(event_manager_.EventManager):
     is the raw event name being dispatched in lower-case.
     """
 
-    __slots__: typing.Sequence[str] = ("_consumers", "_event_factory", "_intents", "_listeners", "_waiters")
+    __slots__: typing.Sequence[str] = (
+        "_consumers",
+        "_dispatch_table",
+        "_dispatch_queue_size",
+        "_dispatch_workers",
+        "_event_factory",
+        "_intents",
+        "_listeners",
+        "_waiters",
+    )
 
     def __init__(
         self,
@@ -333,8 +496,16 @@ def __init__(
         intents: intents_.Intents,
         *,
         cache_components: config.CacheComponents = config.CacheComponents.NONE,
+        dispatch_queue_size: typing.Optional[int] = None,
     ) -> None:
+        if dispatch_queue_size is not None and dispatch_queue_size < 1:
+            raise ValueError("'dispatch_queue_size' must be greater than 0")
+
         self._consumers: typing.Dict[str, _Consumer] = {}
+        # Compiled lazily from _listeners and _waiters, and cleared whenever either of their keys or listeners change
+        self._dispatch_table: typing.Dict[typing.Type[base_events.Event], _DispatchEntryT] = {}
+        self._dispatch_queue_size = dispatch_queue_size
+        self._dispatch_workers: typing.Dict[int, _DispatchWorker] = {}
         self._event_factory = event_factory
         self._intents = intents
         self._listeners: _ListenerMapT[base_events.Event] = {}
@@ -367,12 +538,29 @@ def _increment_waiter_group_count(
             if (consumer.events_bitmask & event_bitmask) == event_bitmask:
                 consumer.waiter_group_count += count
 
-    def _enabled_for_event(self, event_type: typing.Type[base_events.Event], /) -> bool:
+    def _get_dispatch_entry(self, event_type: typing.Type[base_events.Event], /) -> _DispatchEntryT:
+        try:
+            return self._dispatch_table[event_type]
+        except KeyError:
+            pass
+
+        listeners: typing.List[event_manager_.CallbackT[base_events.Event]] = []
+        waiter_types: typing.List[typing.Type[base_events.Event]] = []
+        enabled = False
         for cls in event_type.dispatches():
-            if cls in self._listeners or cls in self._waiters:
-                return True
+            if (subscribed_listeners := self._listeners.get(cls)) is not None:
+                listeners.extend(subscribed_listeners)
+                enabled = True
+
+            if cls in self._waiters:
+                waiter_types.append(cls)
+                enabled = True
 
-        return False
+        entry = self._dispatch_table[event_type] = (tuple(listeners), tuple(waiter_types), enabled)
+        return entry
+
+    def _enabled_for_event(self, event_type: typing.Type[base_events.Event], /) -> bool:
+        return self._get_dispatch_entry(event_type)[2]
 
     def _check_event(self, event_type: typing.Type[typing.Any], nested: int) -> None:
         # Extract the underlying type from generics
@@ -412,7 +600,49 @@ def consume_raw_event(
             payload_event = self._event_factory.deserialize_shard_payload_event(shard, payload, name=event_name)
             self.dispatch(payload_event)
         consumer = self._consumers[event_name.lower()]
-        asyncio.create_task(self._handle_dispatch(consumer, shard, payload), name=f"dispatch {event_name}")
+
+        if self._dispatch_queue_size is None:
+            asyncio.create_task(self._handle_dispatch(consumer, shard, payload), name=f"dispatch {event_name}")
+            return
+
+        if not consumer.is_enabled:
+            _LOGGER.log(
+                ux.TRACE,
+                "Skipping raw dispatch for %s due to lack of any registered listeners or cache need",
+                event_name,
+            )
+            return
+
+        try:
+            worker = self._dispatch_workers[shard.id]
+        except KeyError:
+            worker = self._dispatch_workers[shard.id] = _DispatchWorker(self, shard, self._dispatch_queue_size)
+            worker.watch_shard()
+
+        worker.put(consumer, payload)
+
+    def is_raw_event_enabled(self, event_name: str) -> bool:
+        if self._enabled_for_event(shard_events.ShardPayloadEvent):
+            return True
+
+        try:
+            return self._consumers[event_name.lower()].is_enabled
+        except KeyError:
+            # Let consume_raw_event raise for it instead
+            return True
+
+    def get_dispatch_queue_stats(self) -> typing.Sequence[DispatchQueueStats]:
+        """Get the statistics for the dispatch queue of each shard.
+
+        This will always be empty if `dispatch_queue_size` was not provided,
+        and only includes the shards which are running.
+
+        Returns
+        -------
+        typing.Sequence[DispatchQueueStats]
+            The statistics of each shard's dispatch queue.
+        """
+        return [worker.stats() for worker in self._dispatch_workers.values()]
 
     # Yes, this is not generic. The reason for this is MyPy complains about
     # using ABCs that are not concrete in generic types passed to functions.
@@ -444,6 +674,8 @@ def subscribe(
             self._listeners[event_type] = [callback]
             self._increment_listener_group_count(event_type, 1)
 
+        self._dispatch_table.clear()
+
     def get_listeners(
         self, event_type: typing.Type[base_events.EventT], /, *, polymorphic: bool = True
     ) -> typing.Collection[event_manager_.CallbackT[base_events.EventT]]:
@@ -474,6 +706,7 @@ def unsubscribe(self, event_type: typing.Type[typing.Any], callback: event_manag
                 event_type.__qualname__,
             )
             listeners.remove(callback)
+            self._dispatch_table.clear()
             if not listeners:
                 del self._listeners[event_type]
                 self._increment_listener_group_count(event_type, -1)
@@ -515,16 +748,17 @@ def decorator(
         return decorator
 
     def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
-        tasks: typing.List[typing.Coroutine[None, typing.Any, None]] = []
+        try:
+            listeners, waiter_types, enabled = self._dispatch_table[type(event)]
+        except KeyError:
+            listeners, waiter_types, enabled = self._get_dispatch_entry(type(event))
 
-        for cls in event.dispatches():
-            if listeners := self._listeners.get(cls):
-                for callback in listeners:
-                    tasks.append(self._invoke_callback(callback, event))
+        if not enabled:
+            return aio.completed_future()
 
-            if cls not in self._waiters:
-                continue
+        tasks = [self._invoke_callback(callback, event) for callback in listeners]
 
+        for cls in waiter_types:
             waiter_set = self._waiters[cls]
             for waiter in tuple(waiter_set):
                 predicate, future = waiter
@@ -541,10 +775,15 @@ def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
 
             if not waiter_set:
                 del self._waiters[cls]
+                self._dispatch_table.clear()
                 self._increment_waiter_group_count(cls, -1)
 
         if tasks:
-            return asyncio.gather(*tasks)
+            gathered = asyncio.gather(*tasks)
+            if _DETACHED_DISPATCH.get():
+                return aio.completed_future()
+
+            return gathered
 
         return aio.completed_future()
 
@@ -578,6 +817,7 @@ async def wait_for(
         except KeyError:
             waiter_set = set()
             self._waiters[event_type] = waiter_set
+            self._dispatch_table.clear()
             self._increment_waiter_group_count(event_type, 1)
 
         pair = (predicate, future)
@@ -589,6 +829,7 @@ async def wait_for(
             waiter_set.remove(pair)  # type: ignore[arg-type]
             if not waiter_set:
                 del self._waiters[event_type]
+                self._dispatch_table.clear()
                 self._increment_waiter_group_count(event_type, -1)
 
             raise
@@ -622,6 +863,9 @@ async def _handle_dispatch(
     async def _invoke_callback(
         self, callback: event_manager_.CallbackT[base_events.EventT], event: base_events.EventT
     ) -> None:
+        # Listeners inherit the context of whoever dispatched the event, which may be a dispatch worker
+        _DETACHED_DISPATCH.set(False)
+
         try:
             await callback(event)
         except Exception as ex:
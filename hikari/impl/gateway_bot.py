@@ -27,9 +27,12 @@
 __all__: typing.Sequence[str] = ("GatewayBot",)
 
 import asyncio
+import concurrent.futures
 import datetime
 import logging
 import math
+import multiprocessing
+import os
 import sys
 import types
 import typing
@@ -42,13 +45,19 @@
 from hikari import snowflakes
 from hikari import traits
 from hikari import undefined
+from hikari.api import shard as gateway_shard
 from hikari.impl import cache as cache_impl
+from hikari.impl import cluster
 from hikari.impl import config as config_impl
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
+from hikari.impl import rate_limits
 from hikari.impl import rest as rest_impl
+from hikari.impl import rest_cache as rest_cache_impl
+from hikari.impl import session_store as session_store_
 from hikari.impl import shard as shard_impl
+from hikari.impl import shared_cache as shared_cache_impl
 from hikari.impl import voice as voice_impl
 from hikari.internal import aio
 from hikari.internal import data_binding
@@ -57,18 +66,18 @@
 from hikari.internal import ux
 
 if typing.TYPE_CHECKING:
-    import concurrent.futures
-    import os
+    from multiprocessing import connection as mp_connection
+    from multiprocessing import process as mp_process
 
     from hikari import channels
     from hikari import guilds
+    from hikari import sessions
     from hikari import users as users_
     from hikari.api import cache as cache_
     from hikari.api import entity_factory as entity_factory_
     from hikari.api import event_factory as event_factory_
     from hikari.api import event_manager as event_manager_
     from hikari.api import rest as rest_
-    from hikari.api import shard as gateway_shard
     from hikari.api import voice as voice_
     from hikari.events import base_events
 
@@ -192,6 +201,52 @@ class GatewayBot(traits.GatewayBotAware):
                    payload).
                 2. The user is waiting for the member chunks (there is an event
                    listener for it).
+    dispatch_queue_size
+        If provided, raw gateway events are consumed in order by a single
+        worker per shard through a queue of this size, instead of creating
+        a task for each of them. Events which nothing is listening to (and
+        which the cache does not need) are discarded straight away.
+
+        The size is a soft limit. Raw events are never dropped, as that would
+        desync the cache, so events received while the queue is full are
+        still queued, and a warning is logged the first time this happens.
+
+        This greatly reduces the overhead of busy shards. Statistics for the
+        queues can be retrieved with
+        [`hikari.impl.event_manager_base.EventManagerBase.get_dispatch_queue_stats`][].
+
+        Defaults to [`None`][], which creates a task per event.
+    offload_threshold
+        If provided, the `GUILD_CREATE` and `GUILD_MEMBERS_CHUNK` payloads
+        with at least this many members are deserialized in `executor` (or
+        the default executor of the event loop), rather than blocking the
+        event loop (and so the heartbeats and events of every other shard)
+        while building the entities of large guilds.
+
+        This requires `dispatch_queue_size`, as the events of a shard must
+        be handled in order, and `executor` can't be a
+        [`concurrent.futures.ProcessPoolExecutor`][], as the entities are
+        bound to the bot and can't be pickled. A [`ValueError`][] is raised
+        when constructing the bot otherwise.
+
+        Defaults to [`None`][], which deserializes everything in the event
+        loop.
+    session_store
+        If provided, the sessions of the shards are kept open and saved to
+        this store when the bot is closed, and loaded from it when the bot
+        is started again, so that shards can resume them instead of
+        identifying new ones. Sessions which are no longer valid (or which
+        were created with a different shard count or intents) fall back to
+        identifying.
+
+        Note that resumed sessions do not replay the `GUILD_CREATE` events,
+        so the cache will only be filled with entities as they are received,
+        unless [`hikari.impl.config.CacheSettings.snapshot_path`][] is also
+        set.
+
+        This can't be used when running the bot across multiple processes.
+
+        Defaults to [`None`][], which always identifies new sessions.
     logs
         The flavour to set the logging to.
 
@@ -239,12 +294,32 @@ class GatewayBot(traits.GatewayBotAware):
         The JSON encoder this application should use.
     loads
         The JSON decoder this application should use.
+    gateway_compression
+        The transport compression the shards should use. Only supported
+        values are `"transport_zlib_stream"` (the default),
+        `"transport_zstd_stream"` or [`None`][] to disable it.
+
+        `"transport_zstd_stream"` requires the `zstandard` package to be
+        installed, but is considerably cheaper to decompress. If it isn't,
+        a [`RuntimeError`][] is raised when starting the bot, before any
+        shard connects.
+    gateway_data_format
+        The data format the shards should use. Supported formats are
+        `"json"` (the default) and `"etf"`.
+
+        When using `"etf"`, `dumps` and `loads` are not used by the shards.
     rest_url
         Defaults to the Discord REST API URL if [`None`][]. Can be
         overridden if you are attempting to point to an unofficial endpoint, or
         if you are attempting to mock/stub the Discord API for any reason.
         Generally you do not want to change this.
 
+    Raises
+    ------
+    ValueError
+        If `offload_threshold` is less than 1, or is passed without
+        `dispatch_queue_size` or with a process pool `executor`.
+
     Examples
     --------
     Simple logging setup:
@@ -297,10 +372,14 @@ class GatewayBot(traits.GatewayBotAware):
         "_event_manager",
         "_event_factory",
         "_executor",
+        "_gateway_compression",
+        "_gateway_data_format",
         "_http_settings",
+        "_identify_rate_limiter",
         "_intents",
         "_proxy_settings",
         "_rest",
+        "_session_store",
         "_shards",
         "_token",
         "_voice",
@@ -322,14 +401,30 @@ def __init__(
         http_settings: typing.Optional[config_impl.HTTPSettings] = None,
         dumps: data_binding.JSONEncoder = data_binding.default_json_dumps,
         loads: data_binding.JSONDecoder = data_binding.default_json_loads,
+        gateway_compression: typing.Optional[str] = gateway_shard.GatewayCompression.TRANSPORT_ZLIB_STREAM,
+        gateway_data_format: str = gateway_shard.GatewayDataFormat.JSON,
         intents: intents_.Intents = intents_.Intents.ALL_UNPRIVILEGED,
         auto_chunk_members: bool = True,
+        dispatch_queue_size: typing.Optional[int] = None,
         logs: typing.Union[None, str, int, typing.Dict[str, typing.Any], os.PathLike[str]] = "INFO",
         max_rate_limit: float = 300.0,
         max_retries: int = 3,
         proxy_settings: typing.Optional[config_impl.ProxySettings] = None,
         rest_url: typing.Optional[str] = None,
+        session_store: typing.Optional[session_store_.SessionStore] = None,
+        offload_threshold: typing.Optional[int] = None,
     ) -> None:
+        if offload_threshold is not None:
+            # Checked before anything is set up, rather than only once the event manager is created
+            if offload_threshold < 1:
+                raise ValueError("'offload_threshold' must be greater than 0")
+
+            if dispatch_queue_size is None:
+                raise ValueError("'offload_threshold' can only be used with 'dispatch_queue_size'")
+
+            if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+                raise ValueError("'offload_threshold' can't be used with a process pool 'executor'")
+
         # Beautification and logging
         ux.init_logging(logs, allow_color, force_color)
         self.print_banner(banner, allow_color, force_color)
@@ -339,16 +434,26 @@ def __init__(
         self._closed_event: typing.Optional[asyncio.Event] = None
         self._closing_event: typing.Optional[asyncio.Event] = None
         self._executor = executor
+        self._gateway_compression = gateway_compression
+        self._gateway_data_format = gateway_data_format
         self._http_settings = http_settings if http_settings is not None else config_impl.HTTPSettings()
+        self._identify_rate_limiter: typing.Optional[rate_limits.BaseIdentifyRateLimiter] = None
         self._intents = intents
         self._proxy_settings = proxy_settings if proxy_settings is not None else config_impl.ProxySettings()
+        self._session_store = session_store
         self._token = token.strip()
         self._dumps = dumps
         self._loads = loads
 
         # Caching
         cache_settings = cache_settings if cache_settings is not None else config_impl.CacheSettings()
-        self._cache = cache_impl.CacheImpl(self, cache_settings)
+        if cache_settings.shared_store_path is not None:
+            self._cache: cache_impl.CacheImpl = shared_cache_impl.SharedCacheImpl(
+                self, cache_settings, cache_settings.shared_store_path
+            )
+
+        else:
+            self._cache = cache_impl.CacheImpl(self, cache_settings)
 
         # Entity creation
         self._entity_factory = entity_factory_impl.EntityFactoryImpl(self)
@@ -363,6 +468,9 @@ def __init__(
             self._intents,
             auto_chunk_members=auto_chunk_members,
             cache=self._cache,
+            dispatch_queue_size=dispatch_queue_size,
+            executor=self._executor,
+            offload_threshold=offload_threshold,
         )
 
         # Voice subsystem
@@ -384,9 +492,14 @@ def __init__(
             token_type=applications.TokenType.BOT,
         )
 
+        if self._http_settings.response_cache is not None:
+            rest_cache_impl.subscribe_invalidation(
+                self._http_settings.response_cache, self._event_manager, self._intents
+            )
+
         # We populate these on startup instead, as we need to possibly make some
         # HTTP requests to determine what to put in this mapping.
-        self._shards: typing.Dict[int, gateway_shard.GatewayShard] = {}
+        self._shards: typing.Dict[int, shard_impl.GatewayShardImpl] = {}
         self.shards = types.MappingProxyType(self._shards)
 
     @property
@@ -469,13 +582,29 @@ async def close(self) -> None:
 
         await _close_resource("voice handler", self._voice.close())
 
-        shards = tuple(_close_resource(f"shard {s.id}", s.close()) for s in self._shards.values() if s.is_alive)
+        keep_sessions = self._session_store is not None
+        shards = tuple(
+            _close_resource(f"shard {s.id}", s.close(keep_session=keep_sessions))
+            for s in self._shards.values()
+            if s.is_alive
+        )
 
         for coro in asyncio.as_completed(shards):
             await coro
 
+        if self._session_store is not None:
+            shard_sessions = [session for s in self._shards.values() if (session := s.get_session()) is not None]
+            await _close_resource("session store", self._session_store.save(shard_sessions))
+
         await _close_resource("rest", self._rest.close())
 
+        if (snapshot_path := self._cache.settings.snapshot_path) is not None:
+            await _close_resource("cache snapshot", self._cache.dump(snapshot_path))
+
+        if self._identify_rate_limiter is not None:
+            self._identify_rate_limiter.close()
+            self._identify_rate_limiter = None
+
         # Clear out cache and shard map
         self._cache.clear()
         self._shards.clear()
@@ -688,6 +817,7 @@ def run(
         idle_since: typing.Optional[datetime.datetime] = None,
         ignore_session_start_limit: bool = False,
         large_threshold: int = 250,
+        processes: typing.Optional[int] = None,
         propagate_interrupts: bool = False,
         status: presences.Status = presences.Status.ONLINE,
         shard_ids: typing.Optional[typing.Sequence[int]] = None,
@@ -754,6 +884,20 @@ def run(
             Threshold for members in a guild before it is treated as being
             "large" and no longer sending member details in the [GUILD CREATE][]
             event.
+        processes
+            The number of processes to split the shards across.
+
+            Defaults to [`None`][], which runs every shard in this process.
+            When greater than 1, this process becomes a coordinator that
+            forks one worker per process, each running its own shards, event
+            manager, cache and REST client, while the coordinator schedules
+            when shards in every worker are allowed to identify.
+
+            Since each worker is a fork of this process, anything set up on
+            the bot before calling this (such as listeners) is available in
+            every worker, but state is not shared between them afterwards.
+            This requires the `fork` start method, which is not available on
+            Windows.
         propagate_interrupts
             If [`True`][], then any internal [`hikari.errors.HikariInterrupt`][]
             that is raises as a result of catching an OS level signal will
@@ -785,6 +929,15 @@ def run(
             If bot is already running.
         TypeError
             If `shard_ids` is passed without `shard_count`.
+        ValueError
+            If `processes` is less than 1, or if it is greater than 1 while
+            [`hikari.impl.config.CacheSettings.shared_store_path`][],
+            [`hikari.impl.config.CacheSettings.snapshot_path`][] or
+            `session_store` is set.
+        RuntimeError
+            If `processes` is greater than 1 and the platform does not
+            support forking processes, or if any of the worker processes
+            exited with an error.
         """
         if self._closed_event:
             raise errors.ComponentStateConflictError("bot is already running")
@@ -792,6 +945,43 @@ def run(
         if shard_ids is not None and shard_count is None:
             raise TypeError("'shard_ids' must be passed with 'shard_count'")
 
+        if processes is not None and processes < 1:
+            raise ValueError("'processes' must be greater than or equal to 1")
+
+        if processes is not None and processes > 1:
+            if isinstance(self._cache, shared_cache_impl.SharedCacheImpl):
+                raise ValueError("'processes' can't be greater than 1 when using a shared cache store")
+
+            if self._cache.settings.snapshot_path is not None:
+                raise ValueError("'processes' can't be greater than 1 when using a cache snapshot")
+
+            if self._session_store is not None:
+                # Every worker would overwrite the sessions saved by the others
+                raise ValueError("'processes' can't be greater than 1 when using a session store")
+
+            self._run_cluster(
+                processes,
+                ignore_session_start_limit=ignore_session_start_limit,
+                propagate_interrupts=propagate_interrupts,
+                shard_ids=shard_ids,
+                shard_count=shard_count,
+                run_kwargs={
+                    "activity": activity,
+                    "afk": afk,
+                    "asyncio_debug": asyncio_debug,
+                    "check_for_updates": check_for_updates,
+                    "close_passed_executor": close_passed_executor,
+                    "close_loop": close_loop,
+                    "coroutine_tracking_depth": coroutine_tracking_depth,
+                    "enable_signal_handlers": enable_signal_handlers,
+                    "idle_since": idle_since,
+                    "large_threshold": large_threshold,
+                    "propagate_interrupts": propagate_interrupts,
+                    "status": status,
+                },
+            )
+            return
+
         loop = aio.get_or_make_loop()
 
         if asyncio_debug:
@@ -928,8 +1118,122 @@ async def start(
         self._voice.start()
 
         await self._event_manager.dispatch(self._event_factory.deserialize_starting_event())
+
+        if (snapshot_path := self._cache.settings.snapshot_path) is not None:
+            await self._load_cache_snapshot(snapshot_path)
+
         requirements = await self._rest.fetch_gateway_bot_info()
+        shard_ids, shard_count = self._plan_shards(
+            requirements,
+            shard_ids=shard_ids,
+            shard_count=shard_count,
+            ignore_session_start_limit=ignore_session_start_limit,
+        )
+
+        if self._identify_rate_limiter is None:
+            self._identify_rate_limiter = rate_limits.IdentifyRateLimiter(
+                requirements.session_start_limit.max_concurrency
+            )
 
+        shard_sessions = await self._load_shard_sessions(shard_count)
+
+        # Each shard waits for its own rate limit key in the identify rate limiter, so they can all be
+        # started at once and will become ready as soon as their key allows them to.
+        gather = asyncio.gather(
+            *(
+                self._start_one_shard(
+                    activity=activity,
+                    afk=afk,
+                    idle_since=idle_since,
+                    status=status,
+                    large_threshold=large_threshold,
+                    shard_id=shard_id,
+                    shard_count=shard_count,
+                    url=requirements.url,
+                    session=shard_sessions.get(shard_id),
+                )
+                for shard_id in shard_ids
+            )
+        )
+
+        try:
+            while not gather.done():
+                try:
+                    # Shards which started while others wait on the identify rate limiter may close in the meantime
+                    await aio.first_completed(
+                        self._closing_event.wait(),
+                        asyncio.shield(gather),
+                        *(shard.join() for shard in self._shards.values()),
+                        timeout=5,
+                    )
+                except asyncio.TimeoutError:
+                    # Watch the shards which have started since
+                    continue
+
+                if self._closing_event.is_set():
+                    return
+
+                if not gather.done():
+                    _LOGGER.critical("one or more shards closed while starting; shutting down")
+                    raise RuntimeError("One or more shards closed while starting")
+
+        finally:
+            if not gather.done():
+                gather.cancel()
+
+                try:
+                    await gather
+                except asyncio.CancelledError:
+                    pass
+
+        await self._event_manager.dispatch(self._event_factory.deserialize_started_event())
+
+        _LOGGER.info("started successfully in approx %.2f seconds", time.monotonic() - start_time)
+
+    async def _load_cache_snapshot(self, path: str) -> None:
+        try:
+            await self._cache.load(path)
+
+        except FileNotFoundError:
+            return
+
+        except Exception as ex:
+            _LOGGER.warning("ignoring invalid cache snapshot %r", path, exc_info=ex)
+
+        else:
+            _LOGGER.info("loaded cache snapshot from %r", path)
+
+        # A snapshot goes stale as soon as the bot starts, so make sure that a crash cannot leave it behind
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    async def _load_shard_sessions(self, shard_count: int) -> typing.Dict[int, session_store_.ShardSession]:
+        if self._session_store is None:
+            return {}
+
+        shard_sessions = {
+            session.shard_id: session
+            for session in await self._session_store.load()
+            if session.shard_count == shard_count and session.intents == int(self._intents)
+        }
+        # A session can only be resumed once, so make sure that a crash cannot leave stale sessions behind
+        await self._session_store.save(())
+
+        if shard_sessions:
+            _LOGGER.info("loaded %s shard session(s) to resume", len(shard_sessions))
+
+        return shard_sessions
+
+    def _plan_shards(
+        self,
+        requirements: sessions.GatewayBotInfo,
+        *,
+        shard_ids: typing.Optional[typing.Sequence[int]],
+        shard_count: typing.Optional[int],
+        ignore_session_start_limit: bool,
+    ) -> typing.Tuple[typing.Tuple[int, ...], int]:
         if shard_count is None:
             shard_count = requirements.shard_count
         if shard_ids is None:
@@ -959,49 +1263,101 @@ async def start(
             "s" if len(shard_ids) != 1 else "",
         )
 
-        max_concurrency = requirements.session_start_limit.max_concurrency
-        while shard_ids:
-            window = shard_ids[:max_concurrency]
-            shard_ids = shard_ids[max_concurrency:]
+        return shard_ids, shard_count
 
-            if self._shards:
-                _LOGGER.info("the next startup window is in 5 seconds, please wait...")
+    def _run_cluster(
+        self,
+        processes: int,
+        *,
+        ignore_session_start_limit: bool,
+        propagate_interrupts: bool,
+        shard_ids: typing.Optional[typing.Sequence[int]],
+        shard_count: typing.Optional[int],
+        run_kwargs: typing.Dict[str, typing.Any],
+    ) -> None:
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Running a bot across multiple processes requires support for forking processes")
 
-                try:
-                    await aio.first_completed(
-                        self._closing_event.wait(), *(shard.join() for shard in self._shards.values()), timeout=5
-                    )
+        # The worker processes must not inherit a running loop or live connections, so the
+        # requirements are fetched in a short-lived loop that is torn down before forking.
+        loop = aio.get_or_make_loop()
+        try:
+            requirements = loop.run_until_complete(self._fetch_gateway_bot_info())
+        finally:
+            aio.destroy_loop(loop, _LOGGER)
 
-                    if self._closing_event.is_set():
-                        return
+        shard_ids, shard_count = self._plan_shards(
+            requirements,
+            shard_ids=shard_ids,
+            shard_count=shard_count,
+            ignore_session_start_limit=ignore_session_start_limit,
+        )
 
-                    _LOGGER.critical("one or more shards closed while starting; shutting down")
-                    raise RuntimeError("One or more shards closed while starting")
-                except asyncio.TimeoutError:
-                    # new window starts.
-                    pass
+        context = multiprocessing.get_context("fork")
+        connections: typing.List[mp_connection.Connection] = []
+        workers: typing.List[mp_process.BaseProcess] = []
 
-            gather = asyncio.gather(
-                *(
-                    self._start_one_shard(
-                        activity=activity,
-                        afk=afk,
-                        idle_since=idle_since,
-                        status=status,
-                        large_threshold=large_threshold,
-                        shard_id=shard_id,
-                        shard_count=shard_count,
-                        url=requirements.url,
-                    )
-                    for shard_id in window
+        try:
+            for i, chunk in enumerate(cluster.split_shard_ids(shard_ids, processes)):
+                coordinator_end, worker_end = context.Pipe()
+                kwargs = dict(run_kwargs, check_for_updates=run_kwargs["check_for_updates"] and i == 0)
+                new_worker = context.Process(
+                    target=self._run_cluster_worker,
+                    args=(worker_end, chunk, shard_count, kwargs),
+                    name=f"hikari cluster worker {i}",
                 )
-            )
+                new_worker.start()
+                worker_end.close()
+                connections.append(coordinator_end)
+                workers.append(new_worker)
+                _LOGGER.info("started cluster worker %s (pid %s) for shards %s", i, new_worker.pid, chunk)
 
-            await aio.first_completed(self._closing_event.wait(), gather)
+            cluster.IdentifyCoordinator(connections, requirements.session_start_limit.max_concurrency).serve()
 
-        await self._event_manager.dispatch(self._event_factory.deserialize_started_event())
+            for worker in workers:
+                worker.join()
 
-        _LOGGER.info("started successfully in approx %.2f seconds", time.monotonic() - start_time)
+        except BaseException as ex:
+            _LOGGER.info("shutting down cluster workers")
+
+            for worker in workers:
+                # Workers treat SIGTERM as a request to shut down gracefully.
+                if worker.is_alive():
+                    worker.terminate()
+
+                worker.join()
+
+            if propagate_interrupts or not isinstance(ex, KeyboardInterrupt):
+                raise
+
+        finally:
+            for coordinator_end in connections:
+                coordinator_end.close()
+
+        if failed := [worker.name for worker in workers if worker.exitcode]:
+            raise RuntimeError(f"Cluster worker(s) exited with an error: {', '.join(failed)}")
+
+        _LOGGER.info("all cluster workers terminated")
+
+    def _run_cluster_worker(
+        self,
+        connection: mp_connection.Connection,
+        shard_ids: typing.Sequence[int],
+        shard_count: int,
+        run_kwargs: typing.Dict[str, typing.Any],
+    ) -> None:
+        # Workers get their own process group so terminal interrupts only reach the coordinator,
+        # which then asks each worker to shut down exactly once.
+        os.setpgid(0, 0)
+        self._identify_rate_limiter = cluster.IdentifyGate(connection)
+        self.run(shard_ids=shard_ids, shard_count=shard_count, ignore_session_start_limit=True, **run_kwargs)
+
+    async def _fetch_gateway_bot_info(self) -> sessions.GatewayBotInfo:
+        self._rest.start()
+        try:
+            return await self._rest.fetch_gateway_bot_info()
+        finally:
+            await self._rest.close()
 
     def stream(
         self,
@@ -1266,8 +1622,11 @@ async def _start_one_shard(
         shard_id: int,
         shard_count: int,
         url: str,
+        session: typing.Optional[session_store_.ShardSession] = None,
     ) -> None:
         new_shard = shard_impl.GatewayShardImpl(
+            compression=self._gateway_compression,
+            data_format=self._gateway_data_format,
             http_settings=self._http_settings,
             proxy_settings=self._proxy_settings,
             event_manager=self._event_manager,
@@ -1280,10 +1639,12 @@ async def _start_one_shard(
             initial_idle_since=idle_since,
             initial_status=status,
             large_threshold=large_threshold,
+            identify_rate_limiter=self._identify_rate_limiter,
             shard_id=shard_id,
             shard_count=shard_count,
             token=self._token,
             url=url,
+            session=session,
         )
         try:
             start = time.monotonic()
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A broker which shares REST rate limits between processes on the same host.
+
+Run a [`hikari.impl.rate_limit_broker.RateLimitBroker`][] in one process
+and pass a [`hikari.impl.rate_limit_broker.BrokerRateLimitBackend`][] for
+the same socket path to the HTTP settings of each process making requests
+with the token:
+
+```py
+# In the broker process
+broker = RateLimitBroker("/run/my-bot/rate-limits.sock")
+await broker.start()
+
+# In each worker process
+http_settings = hikari.impl.HTTPSettings(
+    rate_limit_backend=BrokerRateLimitBackend("/run/my-bot/rate-limits.sock")
+)
+```
+
+The broker and backends communicate using newline delimited JSON over a
+Unix socket, so this is not available on Windows.
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("BrokerRateLimitBackend", "RateLimitBroker")
+
+import asyncio
+import logging
+import os
+import typing
+
+from hikari import errors
+from hikari.impl import buckets
+from hikari.internal import collections
+from hikari.internal import data_binding
+from hikari.internal import time
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.ratelimits")
+_MAX_RESOLVED_BUCKETS: typing.Final[int] = 10_000
+_Reservation = typing.Tuple[float, bool]
+
+
+class _SharedBucket:
+    __slots__: typing.Sequence[str] = ("limit", "period", "remaining", "reset_at")
+
+    def __init__(self, remaining: int, limit: int, reset_at: float, period: float) -> None:
+        self.limit = limit
+        self.period = period
+        self.remaining = remaining
+        self.reset_at = reset_at
+
+
+class _Connection:
+    __slots__: typing.Sequence[str] = ("leases", "task", "writer")
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.leases: typing.Set[str] = set()
+        self.task = asyncio.current_task()
+        self.writer = writer
+
+    def reply(self, request_id: int, reservation: _Reservation) -> None:
+        retry_after, is_global = reservation
+        self.writer.write(
+            data_binding.default_json_dumps({"id": request_id, "retry_after": retry_after, "global": is_global}) + b"\n"
+        )
+
+
+class RateLimitBroker:
+    """Broker which keeps the REST rate limit state shared by its backends.
+
+    Parameters
+    ----------
+    path
+        The path of the Unix socket to listen on. Any existing file at this
+        path will be replaced.
+    expire_after
+        How long to keep the state of a bucket for after its rate limit has
+        reset, in seconds.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_buckets",
+        "_connections",
+        "_expire_after",
+        "_global_reset_at",
+        "_leases",
+        "_path",
+        "_resolved",
+        "_server",
+        "_waiters",
+    )
+
+    def __init__(self, path: typing.Union[str, os.PathLike[str]], *, expire_after: float = 10.0) -> None:
+        self._buckets: typing.Dict[str, _SharedBucket] = {}
+        self._connections: typing.Set[_Connection] = set()
+        self._expire_after = expire_after
+        self._global_reset_at = 0.0
+        self._leases: typing.Dict[str, _Connection] = {}
+        self._path = os.fspath(path)
+        self._resolved: collections.LimitedCapacityCacheMap[str, str] = collections.LimitedCapacityCacheMap(
+            limit=_MAX_RESOLVED_BUCKETS
+        )
+        self._server: typing.Optional[asyncio.AbstractServer] = None
+        self._waiters: typing.Dict[str, typing.List[typing.Tuple[_Connection, int]]] = {}
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the broker is listening for connections."""
+        return self._server is not None
+
+    async def start(self) -> None:
+        """Start listening for connections.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the broker is already running.
+        """
+        if self._server:
+            raise errors.ComponentStateConflictError("Cannot start an active rate limit broker")
+
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+        self._server = await asyncio.start_unix_server(self._handle_connection, self._path)
+        os.chmod(self._path, 0o600)
+
+    async def close(self) -> None:
+        """Stop the broker and disconnect all of the backends.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the broker is not running.
+        """
+        if not self._server:
+            raise errors.ComponentStateConflictError("Cannot interact with an inactive rate limit broker")
+
+        self._server.close()
+        tasks = [connection.task for connection in self._connections if connection.task]
+        for connection in self._connections:
+            connection.writer.close()
+
+        await self._server.wait_closed()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._server = None
+        self._connections.clear()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = _Connection(writer)
+        self._connections.add(connection)
+
+        try:
+            while line := await reader.readline():
+                self._handle_message(connection, data_binding.default_json_loads(line))
+
+        except (ConnectionError, ValueError) as ex:
+            _LOGGER.warning("dropping rate limit broker connection due to an error", exc_info=ex)
+
+        finally:
+            self._connections.discard(connection)
+            for key in tuple(connection.leases):
+                self._release(key, None)
+
+            for waiters in self._waiters.values():
+                waiters[:] = [waiter for waiter in waiters if waiter[0] is not connection]
+
+            writer.close()
+
+    def _handle_message(self, connection: _Connection, message: typing.Any) -> None:
+        op = message["op"]
+        if op == "acquire":
+            self._acquire(connection, message["id"], message["key"], exclusive=message["exclusive"])
+
+        elif op == "release":
+            connection.leases.discard(message["key"])
+            self._release(message["key"], message["resolved_key"])
+
+        elif op == "update":
+            self._update(message["key"], message["remaining"], message["limit"], message["reset_after"])
+
+        elif op == "throttle":
+            self._global_reset_at = max(self._global_reset_at, time.monotonic() + message["retry_after"])
+
+        else:
+            raise ValueError(f"Unknown operation {op!r}")
+
+    def _acquire(self, connection: _Connection, request_id: int, key: str, *, exclusive: bool) -> None:
+        now = time.monotonic()
+        if self._global_reset_at > now:
+            connection.reply(request_id, (self._global_reset_at - now, True))
+            return
+
+        if exclusive:
+            if (resolved_key := self._resolved.get(key)) is None:
+                if key in self._leases:
+                    # Only one request may be made on an unknown bucket at once
+                    self._waiters.setdefault(key, []).append((connection, request_id))
+                    return
+
+                self._leases[key] = connection
+                connection.leases.add(key)
+                connection.reply(request_id, (0.0, False))
+                return
+
+            key = resolved_key
+
+        connection.reply(request_id, (self._reserve(key, now), False))
+
+    def _reserve(self, key: str, now: float) -> float:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return 0.0
+
+        if bucket.reset_at <= now:
+            bucket.remaining = bucket.limit
+            bucket.reset_at = now + bucket.period
+
+        if bucket.remaining <= 0:
+            return bucket.reset_at - now
+
+        bucket.remaining -= 1
+        return 0.0
+
+    def _release(self, key: str, resolved_key: typing.Optional[str]) -> None:
+        self._leases.pop(key, None)
+        if resolved_key is not None:
+            self._resolved[key] = resolved_key
+
+        waiters = self._waiters.get(key)
+        while waiters and key not in self._leases:
+            connection, request_id = waiters.pop(0)
+            self._acquire(connection, request_id, key, exclusive=True)
+
+        if not waiters:
+            self._waiters.pop(key, None)
+
+    def _update(self, key: str, remaining: int, limit: int, reset_after: float) -> None:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.reset_at <= now:
+            self._buckets[key] = _SharedBucket(remaining, limit, now + reset_after, reset_after)
+            self._purge_stale_buckets(now)
+            return
+
+        # Other requests may have been reserved in this window which Discord hasn't counted yet.
+        bucket.remaining = min(bucket.remaining, remaining)
+        bucket.limit = limit
+        bucket.reset_at = now + reset_after
+        bucket.period = reset_after
+
+    def _purge_stale_buckets(self, now: float) -> None:
+        stale = [key for key, bucket in self._buckets.items() if bucket.reset_at + self._expire_after < now]
+        for key in stale:
+            del self._buckets[key]
+
+
+class BrokerRateLimitBackend(buckets.RESTRateLimitBackend):
+    """Rate limit backend which shares the rate limits through a [`hikari.impl.rate_limit_broker.RateLimitBroker`][].
+
+    The backend connects to the broker when it is first used, and reconnects
+    if the connection is lost.
+
+    Parameters
+    ----------
+    path
+        The path of the broker's Unix socket.
+    """
+
+    __slots__: typing.Sequence[str] = ("_connect_task", "_next_id", "_path", "_reader_task", "_requests", "_writer")
+
+    def __init__(self, path: typing.Union[str, os.PathLike[str]]) -> None:
+        self._connect_task: typing.Optional[asyncio.Task[None]] = None
+        self._next_id = 0
+        self._path = os.fspath(path)
+        self._reader_task: typing.Optional[asyncio.Task[None]] = None
+        self._requests: typing.Dict[int, typing.Tuple[asyncio.Future[_Reservation], str, bool]] = {}
+        self._writer: typing.Optional[asyncio.StreamWriter] = None
+
+    async def acquire(self, key: str, /, *, exclusive: bool) -> _Reservation:
+        if self._writer is None:
+            if self._connect_task is None:
+                self._connect_task = asyncio.create_task(self._connect())
+
+            connect_task = self._connect_task
+            try:
+                await asyncio.shield(connect_task)
+            finally:
+                if connect_task.done() and self._connect_task is connect_task:
+                    self._connect_task = None
+
+        self._next_id += 1
+        future: asyncio.Future[_Reservation] = asyncio.get_running_loop().create_future()
+        self._requests[self._next_id] = (future, key, exclusive)
+        self._send({"op": "acquire", "id": self._next_id, "key": key, "exclusive": exclusive})
+        return await future
+
+    def release(self, key: str, resolved_key: typing.Optional[str], /) -> None:
+        self._send({"op": "release", "key": key, "resolved_key": resolved_key})
+
+    def update(self, key: str, remaining: int, limit: int, reset_after: float, /) -> None:
+        self._send({"op": "update", "key": key, "remaining": remaining, "limit": limit, "reset_after": reset_after})
+
+    def throttle(self, retry_after: float, /) -> None:
+        self._send({"op": "throttle", "retry_after": retry_after})
+
+    async def close(self) -> None:
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+
+        self._disconnect()
+
+    async def _connect(self) -> None:
+        reader, self._writer = await asyncio.open_unix_connection(self._path)
+        self._reader_task = asyncio.create_task(self._read(reader))
+
+    def _disconnect(self) -> None:
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+
+        self._reader_task = None
+        requests = self._requests
+        self._requests = {}
+        for future, _, _ in requests.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Lost connection to the rate limit broker"))
+
+    def _send(self, message: typing.Dict[str, typing.Any]) -> None:
+        # Messages which don't expect a reply are dropped while disconnected, as the broker
+        # will have released any reservations held by the lost connection.
+        if self._writer:
+            self._writer.write(data_binding.default_json_dumps(message) + b"\n")
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                message = typing.cast("data_binding.JSONObject", data_binding.default_json_loads(line))
+                future, key, exclusive = self._requests.pop(int(message["id"]))
+                reservation = (message["retry_after"], message["global"])
+
+                if not future.done():
+                    future.set_result(reservation)
+
+                elif exclusive and reservation[0] <= 0:
+                    # The request was cancelled while waiting for the reservation
+                    self.release(key, None)
+
+        finally:
+            self._disconnect()
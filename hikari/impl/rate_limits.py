@@ -32,6 +32,8 @@
     "BurstRateLimiter",
     "ManualRateLimiter",
     "WindowedBurstRateLimiter",
+    "BaseIdentifyRateLimiter",
+    "IdentifyRateLimiter",
     "ExponentialBackOff",
 )
 
@@ -49,6 +51,9 @@
 
 _LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.ratelimits")
 
+_IDENTIFY_PERIOD: typing.Final[float] = 5.0
+"""The period in seconds in which a rate limit key can identify once."""
+
 
 class BaseRateLimiter(abc.ABC):
     """Base for any asyncio-based rate limiter being used."""
@@ -84,9 +89,12 @@ class BurstRateLimiter(BaseRateLimiter, abc.ABC):
 
     This provides an internal queue and throttling placeholder, as well as
     complete logic for safely aborting any pending tasks when being shut down.
+
+    Futures on the queue are ordered by their priority, with futures of a
+    higher priority first, and are otherwise ordered by when they were queued.
     """
 
-    __slots__: typing.Sequence[str] = ("name", "throttle_task", "queue")
+    __slots__: typing.Sequence[str] = ("name", "throttle_task", "queue", "_queue_priorities")
 
     name: str
     """The name of the rate limiter."""
@@ -101,6 +109,7 @@ def __init__(self, name: str) -> None:
         self.name = name
         self.throttle_task = None
         self.queue = []
+        self._queue_priorities: typing.Dict[asyncio.Future[typing.Any], int] = {}
 
     @abc.abstractmethod
     async def acquire(self) -> None:
@@ -119,7 +128,7 @@ def close(self) -> None:
         failed_tasks = 0
         while self.queue:
             failed_tasks += 1
-            future = self.queue.pop(0)
+            future = self._dequeue()
             # Make the future complete with an exception
             future.cancel()
 
@@ -133,6 +142,21 @@ def is_empty(self) -> bool:
         """Return [`True`][] if no futures are on the queue being rate limited."""
         return len(self.queue) == 0
 
+    def _enqueue(self, future: asyncio.Future[typing.Any], priority: int) -> None:
+        index = len(self.queue)
+        while index and self._queue_priorities.get(self.queue[index - 1], 0) < priority:
+            index -= 1
+
+        if priority:
+            self._queue_priorities[future] = priority
+
+        self.queue.insert(index, future)
+
+    def _dequeue(self) -> asyncio.Future[typing.Any]:
+        future = self.queue.pop(0)
+        self._queue_priorities.pop(future, None)
+        return future
+
 
 @typing.final
 class ManualRateLimiter(BurstRateLimiter):
@@ -167,17 +191,24 @@ def __init__(self) -> None:
         super().__init__("global")
         self.reset_at = None
 
-    async def acquire(self) -> None:
+    async def acquire(self, priority: int = 0) -> None:
         """Acquire time on this rate limiter.
 
         Calling this function will cause it to block until you are not longer
         being rate limited.
+
+        Parameters
+        ----------
+        priority
+            The priority of the task. This only affects the order in which
+            the tasks waiting when the throttle ends are woken up, as they are
+            all released at once.
         """
         loop = asyncio.get_running_loop()
         future = loop.create_future()
 
         if self.throttle_task is not None:
-            self.queue.append(future)
+            self._enqueue(future, priority)
         else:
             future.set_result(None)
 
@@ -239,7 +270,7 @@ async def unlock_later(self, retry_after: float) -> None:
         self.reset_at = None
 
         while self.queue:
-            next_future = self.queue.pop(0)
+            next_future = self._dequeue()
             next_future.set_result(None)
         self.throttle_task = None
 
@@ -318,21 +349,27 @@ def __init__(self, name: str, period: float, limit: int) -> None:
         self.limit = limit
         self.period = period
 
-    async def acquire(self) -> None:
+    async def acquire(self, priority: int = 0) -> None:
         """Acquire time on this rate limiter.
 
         Calling this function will cause it to block until you are not longer
         being rate limited.
+
+        Parameters
+        ----------
+        priority
+            The priority of the task. When rate limited, tasks with a higher
+            priority are released first.
         """
         # If we are rate limited, delegate invoking this to the throttler and spin it up
         # if it hasn't started. Likewise, if the throttle task is still running, we should
         # delegate releasing the future to the throttler task so that we still process
-        # first-come-first-serve
+        # first-come-first-serve (within each priority)
         if self.throttle_task is not None or self.is_rate_limited(time.monotonic()):
             loop = asyncio.get_running_loop()
             future = loop.create_future()
 
-            self.queue.append(future)
+            self._enqueue(future, priority)
             if self.throttle_task is None:
                 self.throttle_task = loop.create_task(self.throttle())
 
@@ -421,12 +458,85 @@ async def throttle(self) -> None:
                 await asyncio.sleep(sleep_for)
 
             while self.remaining > 0 and self.queue:
+                future = self._dequeue()
+
+                # The waiter may have been cancelled while queued
+                if future.done():
+                    continue
+
                 self.drip()
-                self.queue.pop(0).set_result(None)
+                future.set_result(None)
 
         self.throttle_task = None
 
 
+class BaseIdentifyRateLimiter(abc.ABC):
+    """Base for any rate limiter deciding when shards are allowed to identify."""
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def acquire(self, shard_id: int) -> None:
+        """Acquire permission for a shard to send an IDENTIFY payload.
+
+        Calling this function will cause it to block until the shard is
+        no longer being rate limited.
+
+        Parameters
+        ----------
+        shard_id
+            The ID of the shard about to identify.
+        """
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Close the rate limiter, cancelling any pending acquires."""
+
+    def __enter__(self) -> BaseIdentifyRateLimiter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: typing.Optional[typing.Type[Exception]],
+        exc_val: typing.Optional[Exception],
+        exc_tb: typing.Optional[types.TracebackType],
+    ) -> None:
+        self.close()
+
+
+@typing.final
+class IdentifyRateLimiter(BaseIdentifyRateLimiter):
+    """Rate limiter for shards identifying with the gateway.
+
+    Discord groups identifies into rate limit keys of `shard_id % max_concurrency`,
+    each of which can be used once every 5 seconds. Every key is given its own
+    queue, so a shard only ever waits on shards that share its key.
+    """
+
+    __slots__: typing.Sequence[str] = ("_limiters", "max_concurrency")
+
+    max_concurrency: int
+    """The number of rate limit keys available."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        self._limiters: typing.Dict[int, WindowedBurstRateLimiter] = {}
+        self.max_concurrency = max_concurrency
+
+    async def acquire(self, shard_id: int) -> None:
+        key = shard_id % self.max_concurrency  # noqa: S001 - Modulo operator, not a format string
+
+        if (limiter := self._limiters.get(key)) is None:
+            limiter = self._limiters[key] = WindowedBurstRateLimiter(f"identify key {key}", _IDENTIFY_PERIOD, 1)
+
+        await limiter.acquire()
+
+    def close(self) -> None:
+        for limiter in self._limiters.values():
+            limiter.close()
+
+        self._limiters.clear()
+
+
 @typing.final
 class ExponentialBackOff:
     r"""Implementation of an asyncio-compatible exponential back-off algorithm with random jitter.
@@ -72,6 +72,7 @@
 from hikari.impl import config as config_impl
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import rate_limits
+from hikari.impl import rest_metrics
 from hikari.impl import special_endpoints as special_endpoints_impl
 from hikari.interactions import base_interactions
 from hikari.internal import aio
@@ -319,7 +320,11 @@ def __init__(
         self._executor = executor
         self._max_retries = max_retries
         self._url = url
-        self._bucket_manager = buckets_impl.RESTBucketManager(max_rate_limit)
+        self._bucket_manager = buckets_impl.RESTBucketManager(
+            max_rate_limit,
+            backend=self._http_settings.rate_limit_backend,
+            concurrent=self._http_settings.concurrent_bucket_requests,
+        )
         self._client_session: typing.Optional[aiohttp.ClientSession] = None
 
     @property
@@ -541,6 +546,8 @@ class RESTClientImpl(rest_api.RESTClient):
         "_client_session",
         "_client_session_owner",
         "_close_event",
+        "_coalesced_requests",
+        "_response_cache",
     )
 
     def __init__(
@@ -584,12 +591,22 @@ def __init__(
         self._dumps = dumps
         self._loads = loads
         self._bucket_manager = (
-            buckets_impl.RESTBucketManager(max_rate_limit) if bucket_manager is None else bucket_manager
+            buckets_impl.RESTBucketManager(
+                max_rate_limit,
+                backend=http_settings.rate_limit_backend,
+                concurrent=http_settings.concurrent_bucket_requests,
+            )
+            if bucket_manager is None
+            else bucket_manager
         )
         self._bucket_manager_owner = bucket_manager_owner
         self._client_session = client_session
         self._client_session_owner = client_session_owner
         self._close_event: typing.Optional[asyncio.Event] = None
+        self._response_cache = http_settings.response_cache
+        self._coalesced_requests: typing.Dict[
+            typing.Hashable, asyncio.Task[typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]]
+        ] = {}
 
         self._token: typing.Union[str, rest_api.TokenStrategy, None] = None
         self._token_type: typing.Optional[str] = None
@@ -639,6 +656,11 @@ async def close(self) -> None:
         self._close_event.set()
         self._close_event = None
 
+        for request_task in self._coalesced_requests.values():
+            request_task.cancel()
+
+        self._coalesced_requests.clear()
+
         if self._client_session_owner:
             await self._client_session.close()
             self._client_session = None
@@ -715,10 +737,93 @@ async def _request(
         json: typing.Union[data_binding.JSONObjectBuilder, data_binding.JSONArray, None] = None,
         reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
         auth: undefined.UndefinedNoneOr[str] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
+        deserialize_item: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
     ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]:
         if not self._close_event:
             raise errors.ComponentStateConflictError("Cannot use an inactive REST client")
 
+        if deserialize_item is not None and self._http_settings.stream_json_arrays:
+            # Streamed responses are deserialized as they are received, so they can't be shared or cached
+            return await self._run_request(
+                compiled_route,
+                query=query,
+                form_builder=form_builder,
+                json=json,
+                reason=reason,
+                auth=auth,
+                priority=priority,
+                deserialize_item=deserialize_item,
+            )
+
+        response_cache = self._response_cache
+        if compiled_route.method == "GET" and (response_cache or self._http_settings.coalesce_get_requests):
+            # Clients with different tokens can share the response cache through the HTTP settings,
+            # so the authorization actually used for the request must be part of the key.
+            authorization = await self._resolve_authorization(auth)
+            key = (
+                compiled_route,
+                tuple(query.items()) if query else (),
+                buckets_impl._create_authentication_hash(authorization),
+            )
+            response = response_cache.get(compiled_route, key) if response_cache else None
+            if response is None:
+                if self._http_settings.coalesce_get_requests:
+                    response = await self._coalesced_request(
+                        compiled_route, key, query=query, auth=auth, priority=priority
+                    )
+                else:
+                    response = await self._run_request(compiled_route, query=query, auth=auth, priority=priority)
+
+                if response_cache and response is not None:
+                    response_cache.put(compiled_route, key, response)
+
+        else:
+            response = await self._run_request(
+                compiled_route,
+                query=query,
+                form_builder=form_builder,
+                json=json,
+                reason=reason,
+                auth=auth,
+                priority=priority,
+            )
+
+            if response_cache:
+                # Changing a resource makes the cached responses for it and the collection it is in stale
+                path = compiled_route.compiled_path
+                response_cache.invalidate(path)
+                response_cache.invalidate(path.rsplit("/", 1)[0], descendants=False)
+
+        if deserialize_item is not None:
+            assert isinstance(response, list)
+            return [deserialize_item(item) for item in response]
+
+        return response
+
+    async def _resolve_authorization(self, auth: undefined.UndefinedNoneOr[str], /) -> typing.Optional[str]:
+        if auth is not undefined.UNDEFINED:
+            return auth
+
+        if isinstance(self._token, rest_api.TokenStrategy):
+            return await self._token.acquire(self)
+
+        return self._token
+
+    @typing.final
+    async def _run_request(
+        self,
+        compiled_route: routes.CompiledRoute,
+        *,
+        query: typing.Optional[data_binding.StringMapBuilder] = None,
+        form_builder: typing.Optional[data_binding.URLEncodedFormBuilder] = None,
+        json: typing.Union[data_binding.JSONObjectBuilder, data_binding.JSONArray, None] = None,
+        reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        auth: undefined.UndefinedNoneOr[str] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
+        deserialize_item: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+    ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]:
+        assert self._close_event is not None
         request_task = asyncio.create_task(
             self._perform_request(
                 compiled_route=compiled_route,
@@ -727,6 +832,8 @@ async def _request(
                 json=json,
                 reason=reason,
                 auth=auth,
+                priority=priority,
+                deserialize_item=deserialize_item,
             )
         )
 
@@ -737,10 +844,50 @@ async def _request(
 
         raise errors.ComponentStateConflictError("The REST client was closed mid-request")
 
-    # Ignore too long and too complex, respectively
-    # We rather keep everything we can here inline.
     @typing.final
-    async def _perform_request(  # noqa: CFQ001, C901
+    async def _coalesced_request(
+        self,
+        compiled_route: routes.CompiledRoute,
+        key: typing.Hashable,
+        *,
+        query: typing.Optional[data_binding.StringMapBuilder],
+        auth: undefined.UndefinedNoneOr[str],
+        priority: rest_api.RequestPriority,
+    ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]:
+        # Identical GET requests made at the same time share the same request task, which isn't
+        # cancelled when any one of the callers is, as the others are still waiting for it.
+        assert self._close_event is not None
+        if (request_task := self._coalesced_requests.get(key)) is None:
+            request_task = asyncio.create_task(
+                self._perform_request(compiled_route=compiled_route, query=query, auth=auth, priority=priority)
+            )
+            self._coalesced_requests[key] = request_task
+            request_task.add_done_callback(lambda task: self._coalesced_request_done(key, task))
+
+        else:
+            _LOGGER.log(ux.TRACE, "sharing in flight request to %s", compiled_route)
+
+        await aio.first_completed(asyncio.shield(request_task), self._close_event.wait())
+
+        if request_task.done() and not request_task.cancelled():
+            return request_task.result()
+
+        raise errors.ComponentStateConflictError("The REST client was closed mid-request")
+
+    def _coalesced_request_done(
+        self,
+        key: typing.Hashable,
+        request_task: asyncio.Task[typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]],
+    ) -> None:
+        if self._coalesced_requests.get(key) is request_task:
+            del self._coalesced_requests[key]
+
+        # Avoid "exception was never retrieved" warnings when every caller was cancelled
+        if not request_task.cancelled():
+            request_task.exception()
+
+    @typing.final
+    async def _perform_request(
         self,
         compiled_route: routes.CompiledRoute,
         *,
@@ -749,6 +896,46 @@ async def _perform_request(  # noqa: CFQ001, C901
         json: typing.Union[data_binding.JSONObject, data_binding.JSONArray, None] = None,
         reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
         auth: undefined.UndefinedNoneOr[str] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
+        deserialize_item: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
+    ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]:
+        metrics = rest_metrics.RequestMetrics(route=compiled_route.route)
+
+        try:
+            return await self._send_request(
+                compiled_route,
+                metrics,
+                query=query,
+                form_builder=form_builder,
+                json=json,
+                reason=reason,
+                auth=auth,
+                priority=priority,
+                deserialize_item=deserialize_item,
+            )
+
+        finally:
+            if metrics_hook := self._http_settings.metrics_hook:
+                try:
+                    metrics_hook.on_request(metrics)
+                except Exception:
+                    _LOGGER.exception("an error occurred in the REST metrics hook")
+
+    # Ignore too long and too complex, respectively
+    # We rather keep everything we can here inline.
+    @typing.final
+    async def _send_request(  # noqa: CFQ001, C901
+        self,
+        compiled_route: routes.CompiledRoute,
+        metrics: rest_metrics.RequestMetrics,
+        *,
+        query: typing.Optional[data_binding.StringMapBuilder],
+        form_builder: typing.Optional[data_binding.URLEncodedFormBuilder],
+        json: typing.Union[data_binding.JSONObject, data_binding.JSONArray, None],
+        reason: undefined.UndefinedOr[str],
+        auth: undefined.UndefinedNoneOr[str],
+        priority: rest_api.RequestPriority,
+        deserialize_item: typing.Optional[typing.Callable[[typing.Any], typing.Any]],
     ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]:
         # Make a ratelimit-protected HTTP request to a JSON endpoint and expect some form
         # of JSON response.
@@ -794,7 +981,12 @@ async def _perform_request(  # noqa: CFQ001, C901
                     data = await form_builder.build(stack, executor=self._executor)
 
                 if compiled_route.route.has_ratelimits:
-                    await stack.enter_async_context(self._bucket_manager.acquire_bucket(compiled_route, auth))
+                    acquire_start = time.monotonic()
+                    global_wait = await stack.enter_async_context(
+                        self._bucket_manager.acquire_bucket(compiled_route, auth, priority)
+                    )
+                    metrics.queue_wait += time.monotonic() - acquire_start - global_wait
+                    metrics.global_wait += global_wait
 
                 if trace_logging_enabled:
                     uuid = time.uuid()
@@ -809,6 +1001,7 @@ async def _perform_request(  # noqa: CFQ001, C901
                     start = time.monotonic()
 
                 # Make the request.
+                network_start = time.monotonic()
                 response = await self._client_session.request(
                     compiled_route.method,
                     url,
@@ -820,6 +1013,8 @@ async def _perform_request(  # noqa: CFQ001, C901
                     proxy=self._proxy_settings.url,
                     proxy_headers=self._proxy_settings.all_headers,
                 )
+                metrics.network_time += time.monotonic() - network_start
+                metrics.status = response.status
 
                 if trace_logging_enabled:
                     time_taken = (time.monotonic() - start) * 1_000  # pyright: ignore[reportUnboundVariable]
@@ -851,6 +1046,7 @@ async def _perform_request(  # noqa: CFQ001, C901
                     self._max_retries - retry_count,
                 )
                 retry_count += 1
+                metrics.retries += 1
 
                 await asyncio.sleep(sleep_time)
                 continue
@@ -859,6 +1055,7 @@ async def _perform_request(  # noqa: CFQ001, C901
                 await stack.aclose()
 
             if time_before_retry is not None:
+                metrics.rate_limits += 1
                 await asyncio.sleep(time_before_retry)
                 continue
 
@@ -871,7 +1068,30 @@ async def _perform_request(  # noqa: CFQ001, C901
             if 200 <= response.status < 300:
                 if response.content_type == _APPLICATION_JSON:
                     # Only deserializing here stops Cloudflare shenanigans messing us around.
-                    return self._loads(await response.read())
+                    if deserialize_item is None or trace_logging_enabled:
+                        # Trace logging will have already read the whole body
+                        network_start = time.monotonic()
+                        body = await response.read()
+                        deserialize_start = time.monotonic()
+                        payload = self._loads(body)
+                        metrics.network_time += deserialize_start - network_start
+                        metrics.deserialize_time += time.monotonic() - deserialize_start
+
+                        if deserialize_item is None:
+                            return payload
+
+                        assert isinstance(payload, list)
+                        return [deserialize_item(item) for item in payload]
+
+                    # Only the raw JSON of one element is held at a time, but the entities of the whole
+                    # page are collected, as the request must complete before the caller can use them.
+                    network_start = time.monotonic()
+                    items = [
+                        deserialize_item(item)
+                        async for item in data_binding.stream_json_array(response.content, self._loads)
+                    ]
+                    metrics.network_time += time.monotonic() - network_start
+                    return items
 
                 real_url = str(response.real_url)
                 raise errors.HTTPError(f"Expected JSON [{response.content_type=}, {real_url=}]")
@@ -883,6 +1103,7 @@ async def _perform_request(  # noqa: CFQ001, C901
 
                 sleep_time = next(backoff)
                 retry_count += 1
+                metrics.retries += 1
                 _LOGGER.warning(
                     "Received status %s on request, backing off for %.2fs and retrying. Retries remaining: %s",
                     response.status,
@@ -1342,6 +1563,41 @@ def fetch_messages(
             first_id=timestamp,
         )
 
+    def fetch_messages_concurrently(
+        self,
+        channel: snowflakes.SnowflakeishOr[channels_.TextableChannel],
+        *,
+        after: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
+        before: undefined.UndefinedOr[snowflakes.SearchableSnowflakeishOr[snowflakes.Unique]] = undefined.UNDEFINED,
+        slices: int = 4,
+        max_buffered_pages: int = 16,
+    ) -> iterators.LazyIterator[messages_.Message]:
+        if after is undefined.UNDEFINED:
+            # No messages can predate the channel itself
+            start = snowflakes.Snowflake(channel)
+        elif isinstance(after, datetime.datetime):
+            start = snowflakes.Snowflake.from_datetime(after)
+        else:
+            start = snowflakes.Snowflake(after)
+
+        if before is undefined.UNDEFINED:
+            end = snowflakes.Snowflake.from_datetime(time.utc_datetime())
+        elif isinstance(before, datetime.datetime):
+            end = snowflakes.Snowflake.from_datetime(before)
+        else:
+            end = snowflakes.Snowflake(before)
+
+        return special_endpoints_impl.SlicedMessageIterator(
+            entity_factory=self._entity_factory,
+            request_call=self._request,
+            channel=channel,
+            after=start,
+            before=end,
+            slices=slices,
+            max_buffered_pages=max_buffered_pages,
+            executor=self._executor,
+        )
+
     async def fetch_message(
         self,
         channel: snowflakes.SnowflakeishOr[channels_.TextableChannel],
@@ -1516,6 +1772,7 @@ async def create_message(
             typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
         ] = undefined.UNDEFINED,
         flags: typing.Union[undefined.UndefinedType, int, messages_.MessageFlag] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
     ) -> messages_.Message:
         route = routes.POST_CHANNEL_MESSAGES.compile(channel=channel)
         body, form_builder = self._build_message_payload(
@@ -1545,9 +1802,9 @@ async def create_message(
 
         if form_builder is not None:
             form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
-            response = await self._request(route, form_builder=form_builder)
+            response = await self._request(route, form_builder=form_builder, priority=priority)
         else:
-            response = await self._request(route, json=body)
+            response = await self._request(route, json=body, priority=priority)
 
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_message(response)
@@ -1887,6 +2144,7 @@ async def execute_webhook(
             typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
         ] = undefined.UNDEFINED,
         flags: typing.Union[undefined.UndefinedType, int, messages_.MessageFlag] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
     ) -> messages_.Message:
         # int(ExecutableWebhook) isn't guaranteed to be valid nor the ID used to execute this entity as a webhook.
         webhook_id = webhook if isinstance(webhook, int) else webhook.webhook_id
@@ -1915,9 +2173,9 @@ async def execute_webhook(
 
         if form_builder is not None:
             form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
-            response = await self._request(route, form_builder=form_builder, query=query, auth=None)
+            response = await self._request(route, form_builder=form_builder, query=query, auth=None, priority=priority)
         else:
-            response = await self._request(route, json=body, query=query, auth=None)
+            response = await self._request(route, json=body, query=query, auth=None, priority=priority)
 
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_message(response)
@@ -1970,6 +2228,7 @@ async def edit_webhook_message(
         role_mentions: undefined.UndefinedOr[
             typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
         ] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
     ) -> messages_.Message:
         # int(ExecutableWebhook) isn't guaranteed to be valid nor the ID used to execute this entity as a webhook.
         webhook_id = webhook if isinstance(webhook, int) else webhook.webhook_id
@@ -1993,9 +2252,9 @@ async def edit_webhook_message(
 
         if form_builder is not None:
             form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
-            response = await self._request(route, form_builder=form_builder, query=query, auth=None)
+            response = await self._request(route, form_builder=form_builder, query=query, auth=None, priority=priority)
         else:
-            response = await self._request(route, json=body, query=query, auth=None)
+            response = await self._request(route, json=body, query=query, auth=None, priority=priority)
 
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_message(response)
@@ -3211,6 +3470,7 @@ async def edit_member(
         ] = undefined.UNDEFINED,
         communication_disabled_until: undefined.UndefinedNoneOr[datetime.datetime] = undefined.UNDEFINED,
         reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
     ) -> guilds.Member:
         route = routes.PATCH_GUILD_MEMBER.compile(guild=guild, user=user)
         body = data_binding.JSONObjectBuilder()
@@ -3229,7 +3489,7 @@ async def edit_member(
         else:
             body.put("communication_disabled_until", communication_disabled_until)
 
-        response = await self._request(route, json=body, reason=reason)
+        response = await self._request(route, json=body, reason=reason, priority=priority)
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_member(response, guild_id=snowflakes.Snowflake(guild))
 
@@ -3255,9 +3515,10 @@ async def add_role_to_member(
         role: snowflakes.SnowflakeishOr[guilds.PartialRole],
         *,
         reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
     ) -> None:
         route = routes.PUT_GUILD_MEMBER_ROLE.compile(guild=guild, user=user, role=role)
-        await self._request(route, reason=reason)
+        await self._request(route, reason=reason, priority=priority)
 
     async def remove_role_from_member(
         self,
@@ -3266,9 +3527,10 @@ async def remove_role_from_member(
         role: snowflakes.SnowflakeishOr[guilds.PartialRole],
         *,
         reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
     ) -> None:
         route = routes.DELETE_GUILD_MEMBER_ROLE.compile(guild=guild, user=user, role=role)
-        await self._request(route, reason=reason)
+        await self._request(route, reason=reason, priority=priority)
 
     async def kick_user(
         self,
@@ -3713,14 +3975,20 @@ def _deserialize_command_list(
     ) -> typing.List[commands.PartialCommand]:
         command_objs: typing.List[commands.PartialCommand] = []
         for payload in command_payloads:
-            try:
-                command_objs.append(self._entity_factory.deserialize_command(payload, guild_id=guild_id))
-
-            except errors.UnrecognisedEntityError:
-                pass
+            if (command := self._try_deserialize_command(payload, guild_id)) is not None:
+                command_objs.append(command)
 
         return command_objs
 
+    def _try_deserialize_command(
+        self, payload: data_binding.JSONObject, guild_id: typing.Optional[snowflakes.Snowflake]
+    ) -> typing.Optional[commands.PartialCommand]:
+        try:
+            return self._entity_factory.deserialize_command(payload, guild_id=guild_id)
+
+        except errors.UnrecognisedEntityError:
+            return None
+
     async def fetch_application_commands(
         self,
         application: snowflakes.SnowflakeishOr[guilds.PartialApplication],
@@ -3735,10 +4003,12 @@ async def fetch_application_commands(
         query = data_binding.StringMapBuilder()
         query.put("with_localizations", True)
 
-        response = await self._request(route, query=query)
-        assert isinstance(response, list)
         guild_id = snowflakes.Snowflake(guild) if guild is not undefined.UNDEFINED else None
-        return self._deserialize_command_list(response, guild_id)
+        response = await self._request(
+            route, query=query, deserialize_item=lambda payload: self._try_deserialize_command(payload, guild_id)
+        )
+        assert isinstance(response, list)
+        return [command for command in response if command is not None]
 
     async def _create_application_command(
         self,
@@ -4069,6 +4339,7 @@ async def edit_interaction_response(
         role_mentions: undefined.UndefinedOr[
             typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
         ] = undefined.UNDEFINED,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
     ) -> messages_.Message:
         route = routes.PATCH_INTERACTION_RESPONSE.compile(webhook=application, token=token)
 
@@ -4088,18 +4359,22 @@ async def edit_interaction_response(
 
         if form_builder is not None:
             form_builder.add_field("payload_json", self._dumps(body), content_type=_APPLICATION_JSON)
-            response = await self._request(route, form_builder=form_builder, auth=None)
+            response = await self._request(route, form_builder=form_builder, auth=None, priority=priority)
         else:
-            response = await self._request(route, json=body, auth=None)
+            response = await self._request(route, json=body, auth=None, priority=priority)
 
         assert isinstance(response, dict)
         return self._entity_factory.deserialize_message(response)
 
     async def delete_interaction_response(
-        self, application: snowflakes.SnowflakeishOr[guilds.PartialApplication], token: str
+        self,
+        application: snowflakes.SnowflakeishOr[guilds.PartialApplication],
+        token: str,
+        *,
+        priority: rest_api.RequestPriority = rest_api.RequestPriority.NORMAL,
     ) -> None:
         route = routes.DELETE_INTERACTION_RESPONSE.compile(webhook=application, token=token)
-        await self._request(route, auth=None)
+        await self._request(route, auth=None, priority=priority)
 
     async def create_autocomplete_response(
         self,
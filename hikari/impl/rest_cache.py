@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Caching of REST API responses.
+
+Pass a [`hikari.impl.rest_cache.RESTResponseCacheImpl`][] as the
+`response_cache` of the HTTP settings to cache the responses of GET requests
+for resources which rarely change:
+
+```py
+http_settings = hikari.impl.HTTPSettings(response_cache=RESTResponseCacheImpl())
+```
+
+Cached responses are invalidated when a request to change the resource or
+the collection it is in is made through the same REST client, and, when used
+by a [`hikari.impl.gateway_bot.GatewayBot`][], when a gateway event reports
+a change to it.
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("DEFAULT_RESPONSE_TTLS", "RESTResponseCache", "RESTResponseCacheImpl")
+
+import abc
+import re
+import typing
+
+from hikari import intents as intents_
+from hikari.events import application_events
+from hikari.events import base_events
+from hikari.events import channel_events
+from hikari.events import guild_events
+from hikari.events import member_events
+from hikari.events import role_events
+from hikari.events import user_events
+from hikari.internal import collections
+from hikari.internal import routes
+from hikari.internal import time
+
+if typing.TYPE_CHECKING:
+    from hikari.api import event_manager as event_manager_
+    from hikari.internal import data_binding
+
+    _Response = typing.Union[data_binding.JSONObject, data_binding.JSONArray]
+
+DEFAULT_RESPONSE_TTLS: typing.Final[typing.Mapping[routes.Route, float]] = {
+    routes.GET_APPLICATION_COMMAND: 300.0,
+    routes.GET_APPLICATION_COMMANDS: 300.0,
+    routes.GET_APPLICATION_GUILD_COMMAND: 300.0,
+    routes.GET_APPLICATION_GUILD_COMMANDS: 300.0,
+    routes.GET_APPLICATION_COMMAND_PERMISSIONS: 300.0,
+    routes.GET_APPLICATION_GUILD_COMMANDS_PERMISSIONS: 300.0,
+    routes.GET_TEMPLATE: 300.0,
+    routes.GET_GUILD_TEMPLATES: 300.0,
+    routes.GET_WEBHOOK: 60.0,
+    routes.GET_WEBHOOK_WITH_TOKEN: 60.0,
+    routes.GET_CHANNEL_WEBHOOKS: 60.0,
+    routes.GET_GUILD_WEBHOOKS: 60.0,
+    routes.GET_INVITE: 60.0,
+    routes.GET_CHANNEL_INVITES: 60.0,
+    routes.GET_GUILD_INVITES: 60.0,
+    routes.GET_STICKER: 3600.0,
+    routes.GET_STICKER_PACKS: 3600.0,
+}
+"""The default number of seconds to cache the responses of each route for."""
+
+
+class RESTResponseCache(abc.ABC):
+    """Interface for a cache of REST API responses.
+
+    Only the responses to GET requests are cached. Responses are looked up
+    by a hashable key for the request, which includes the compiled route,
+    the query and a hash of the authorization used, so clients with
+    different tokens can share the same cache.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    def cacheable_routes(self) -> typing.Optional[typing.Collection[routes.Route]]:
+        """The routes whose responses may be cached.
+
+        This is used to only listen to the gateway events which can
+        invalidate a cached response. If this is [`None`][], the responses of
+        any route may be cached.
+        """
+        return None
+
+    @abc.abstractmethod
+    def get(self, compiled_route: routes.CompiledRoute, key: typing.Hashable, /) -> typing.Optional[_Response]:
+        """Get the cached response to a request.
+
+        Parameters
+        ----------
+        compiled_route
+            The route of the request.
+        key
+            The key for the request.
+
+        Returns
+        -------
+        typing.Optional[typing.Union[hikari.internal.data_binding.JSONObject, hikari.internal.data_binding.JSONArray]]
+            The cached response, or [`None`][] if it isn't cached.
+        """
+
+    @abc.abstractmethod
+    def put(self, compiled_route: routes.CompiledRoute, key: typing.Hashable, response: _Response, /) -> None:
+        """Cache the response to a request.
+
+        Parameters
+        ----------
+        compiled_route
+            The route of the request.
+        key
+            The key for the request.
+        response
+            The response to cache. This must not be modified afterwards.
+        """
+
+    @abc.abstractmethod
+    def invalidate(self, path: str, /, *, descendants: bool = True) -> None:
+        """Remove the cached responses for a path.
+
+        Parameters
+        ----------
+        path
+            The compiled path to remove the responses for, such as
+            `/channels/123/webhooks`.
+        descendants
+            Whether to also remove the responses for every path under `path`.
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove every cached response."""
+
+
+class RESTResponseCacheImpl(RESTResponseCache):
+    """A size-bounded REST response cache with a time to live for each route.
+
+    Parameters
+    ----------
+    ttls
+        The number of seconds to cache the responses of each route for.
+        Responses for routes which aren't in this mapping aren't cached.
+    max_size
+        The maximum number of responses to cache. The least recently used
+        responses are removed first once this is reached.
+    """
+
+    __slots__: typing.Sequence[str] = ("_entries", "_groups", "_ttls")
+
+    def __init__(
+        self, ttls: typing.Mapping[routes.Route, float] = DEFAULT_RESPONSE_TTLS, *, max_size: int = 1024
+    ) -> None:
+        self._ttls = ttls
+        self._entries: collections.LRUCacheMap[typing.Hashable, _CachedResponse] = collections.LRUCacheMap(
+            limit=max_size, on_expire=self._on_expire
+        )
+        # The keys of the cached responses and their paths, grouped by the resource they're under
+        # (e.g. "/channels/123"), so that invalidating a path doesn't need to check every response.
+        self._groups: typing.Dict[str, typing.Dict[typing.Hashable, str]] = {}
+
+    @property
+    def cacheable_routes(self) -> typing.Collection[routes.Route]:
+        return self._ttls.keys()
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups which found a cached response."""
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups for a cacheable route which didn't find a cached response."""
+        return self._entries.misses
+
+    def get(self, compiled_route: routes.CompiledRoute, key: typing.Hashable, /) -> typing.Optional[_Response]:
+        if compiled_route.route not in self._ttls:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key, entry.path)
+            return None
+
+        return entry.response
+
+    def put(self, compiled_route: routes.CompiledRoute, key: typing.Hashable, response: _Response, /) -> None:
+        if (ttl := self._ttls.get(compiled_route.route)) is None:
+            return
+
+        path = compiled_route.compiled_path
+        self._groups.setdefault(_group_of(path), {})[key] = path
+        self._entries[key] = _CachedResponse(key, path, time.monotonic() + ttl, response)
+
+    def invalidate(self, path: str, /, *, descendants: bool = True) -> None:
+        prefix = path + "/"
+        if path.count("/") >= 2:
+            # Every path under this one is in the same group
+            groups = [_group_of(path)]
+        else:
+            groups = [group for group in self._groups if group == path or group.startswith(prefix)]
+
+        for group in groups:
+            keys = self._groups.get(group)
+            if not keys:
+                continue
+
+            for key, key_path in tuple(keys.items()):
+                if key_path == path or (descendants and key_path.startswith(prefix)):
+                    self._remove(key, key_path)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._groups.clear()
+
+    def _remove(self, key: typing.Hashable, path: str) -> None:
+        del self._entries[key]
+        self._forget(key, path)
+
+    def _forget(self, key: typing.Hashable, path: str) -> None:
+        group = _group_of(path)
+        keys = self._groups[group]
+        del keys[key]
+
+        if not keys:
+            del self._groups[group]
+
+    def _on_expire(self, entry: _CachedResponse) -> None:
+        self._forget(entry.key, entry.path)
+
+
+class _CachedResponse:
+    __slots__: typing.Sequence[str] = ("expires_at", "key", "path", "response")
+
+    def __init__(self, key: typing.Hashable, path: str, expires_at: float, response: _Response) -> None:
+        self.expires_at = expires_at
+        self.key = key
+        self.path = path
+        self.response = response
+
+
+def _group_of(path: str) -> str:
+    # "/channels/123/webhooks" -> "/channels/123"
+    return "/".join(path.split("/", 3)[:3])
+
+
+_PLACEHOLDER_REGEX: typing.Final[typing.Pattern[str]] = re.compile(r"{[^}]*}")
+
+# The paths each event invalidates, formatted with the event. A response cache only
+# subscribes to an event if one of its cacheable routes is under one of these paths.
+_INVALIDATIONS: typing.Final[typing.Sequence[typing.Tuple[typing.Type[base_events.Event], typing.Sequence[str]]]] = (
+    (guild_events.GuildUpdateEvent, ("/guilds/{0.guild_id}",)),
+    (guild_events.GuildLeaveEvent, ("/guilds/{0.guild_id}",)),
+    (guild_events.EmojisUpdateEvent, ("/guilds/{0.guild_id}/emojis",)),
+    (guild_events.StickersUpdateEvent, ("/guilds/{0.guild_id}/stickers",)),
+    (role_events.RoleEvent, ("/guilds/{0.guild_id}/roles",)),
+    (member_events.MemberEvent, ("/guilds/{0.guild_id}/members/{0.user_id}",)),
+    (channel_events.GuildChannelCreateEvent, ("/guilds/{0.guild_id}/channels",)),
+    (channel_events.GuildChannelUpdateEvent, ("/channels/{0.channel_id}", "/guilds/{0.guild_id}/channels")),
+    (channel_events.GuildChannelDeleteEvent, ("/channels/{0.channel_id}", "/guilds/{0.guild_id}/channels")),
+    (
+        channel_events.WebhookUpdateEvent,
+        # The event doesn't say which webhook was changed, so every single webhook has to go
+        ("/channels/{0.channel_id}/webhooks", "/guilds/{0.guild_id}/webhooks", "/webhooks"),
+    ),
+    (
+        channel_events.InviteEvent,
+        ("/invites/{0.code}", "/channels/{0.channel_id}/invites", "/guilds/{0.guild_id}/invites"),
+    ),
+    (
+        application_events.ApplicationCommandPermissionsUpdateEvent,
+        ("/applications/{0.permissions.application_id}/guilds/{0.permissions.guild_id}/commands",),
+    ),
+    (user_events.OwnUserUpdateEvent, ("/users/@me",)),
+)
+
+
+def _strip_placeholders(template: str) -> str:
+    # "/guilds/{guild}/roles" -> "/guilds/{}/roles"
+    return _PLACEHOLDER_REGEX.sub("{}", template)
+
+
+def subscribe_invalidation(
+    response_cache: RESTResponseCache, event_manager: event_manager_.EventManager, intents: intents_.Intents
+) -> None:
+    """Subscribe a response cache to the gateway events which invalidate its responses.
+
+    Only the events which can be received with `intents` and which can
+    invalidate the responses of one of the
+    [`hikari.impl.rest_cache.RESTResponseCache.cacheable_routes`][] are
+    subscribed to.
+
+    Parameters
+    ----------
+    response_cache
+        The response cache to invalidate.
+    event_manager
+        The event manager to subscribe to.
+    intents
+        The intents the gateway connections are using.
+    """
+    cacheable_routes = response_cache.cacheable_routes
+    cacheable_templates = (
+        None if cacheable_routes is None else [_strip_placeholders(route.path_template) for route in cacheable_routes]
+    )
+
+    for event_type, path_templates in _INVALIDATIONS:
+        intent_groups = base_events.get_required_intents_for(event_type)
+        if intent_groups and not any((intents & group) == group for group in intent_groups):
+            continue
+
+        if cacheable_templates is not None and not any(
+            template == prefix or template.startswith(prefix + "/")
+            for prefix in map(_strip_placeholders, path_templates)
+            for template in cacheable_templates
+        ):
+            continue
+
+        event_manager.subscribe(event_type, _make_invalidator(response_cache, path_templates))
+
+
+def _make_invalidator(
+    response_cache: RESTResponseCache, path_templates: typing.Sequence[str]
+) -> typing.Callable[[base_events.Event], typing.Coroutine[typing.Any, typing.Any, None]]:
+    async def invalidate(event: base_events.Event) -> None:
+        for template in path_templates:
+            response_cache.invalidate(template.format(event))
+
+    return invalidate
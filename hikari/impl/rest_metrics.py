@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Instrumentation of REST API requests.
+
+Pass a [`hikari.impl.rest_metrics.RESTMetricsHook`][] as the `metrics_hook`
+of the HTTP settings to be told about every request made. The built-in
+[`hikari.impl.rest_metrics.RESTMetricsAggregator`][] keeps histograms of the
+timings for each route, which can be exported in the Prometheus text format:
+
+```py
+metrics = RESTMetricsAggregator()
+http_settings = hikari.impl.HTTPSettings(metrics_hook=metrics)
+
+...
+
+print(metrics.to_prometheus())
+```
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "DEFAULT_LATENCY_BUCKETS",
+    "Histogram",
+    "RequestMetrics",
+    "RESTMetricsAggregator",
+    "RESTMetricsHook",
+)
+
+import abc
+import bisect
+import typing
+
+import attrs
+
+from hikari.internal import attrs_extensions
+
+if typing.TYPE_CHECKING:
+    from hikari.internal import routes
+
+DEFAULT_LATENCY_BUCKETS: typing.Final[typing.Sequence[float]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""The default upper bounds of the histogram buckets, in seconds."""
+
+_TIMINGS: typing.Final[typing.Sequence[typing.Tuple[str, str]]] = (
+    ("queue_wait", "Time spent waiting in the rate limit bucket queue."),
+    ("global_wait", "Time spent waiting on the global rate limit."),
+    ("network_time", "Time spent sending requests and receiving responses."),
+    ("deserialize_time", "Time spent decoding response bodies."),
+)
+_TIMING_NAMES: typing.Final[typing.FrozenSet[str]] = frozenset(name for name, _ in _TIMINGS)
+
+
+@attrs_extensions.with_copy
+@attrs.define(kw_only=True, weakref_slot=False)
+class RequestMetrics:
+    """Measurements of a single REST API request.
+
+    These cover the whole request, including any retries. All times are in
+    seconds.
+    """
+
+    route: routes.Route = attrs.field()
+    """The route the request was made to."""
+
+    status: typing.Optional[int] = attrs.field(default=None)
+    """The status of the last response received, or [`None`][] if none was received."""
+
+    queue_wait: float = attrs.field(default=0.0)
+    """The time spent waiting in the rate limit bucket queue."""
+
+    global_wait: float = attrs.field(default=0.0)
+    """The time spent waiting on the global rate limit."""
+
+    network_time: float = attrs.field(default=0.0)
+    """The time spent sending the request and receiving the response."""
+
+    deserialize_time: float = attrs.field(default=0.0)
+    """The time spent decoding the response body.
+
+    When the response is streamed (see
+    [`hikari.impl.config.HTTPSettings.stream_json_arrays`][]), the body is
+    decoded while it is being received, so this is included in
+    [`hikari.impl.rest_metrics.RequestMetrics.network_time`][] instead.
+    """
+
+    retries: int = attrs.field(default=0)
+    """The number of times the request was retried after a connection error or server error."""
+
+    rate_limits: int = attrs.field(default=0)
+    """The number of rate limited (429) responses received."""
+
+
+class RESTMetricsHook(abc.ABC):
+    """Interface for a hook which is told about every REST API request made."""
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    def on_request(self, metrics: RequestMetrics, /) -> None:
+        """Handle the metrics of a finished request.
+
+        This is called on the event loop once a request has finished, whether
+        it succeeded or failed, so it must not block.
+
+        Parameters
+        ----------
+        metrics
+            The metrics of the request.
+        """
+
+
+class Histogram:
+    """A histogram of observed values with fixed buckets.
+
+    Parameters
+    ----------
+    buckets
+        The upper bounds of the buckets, in ascending order.
+    """
+
+    __slots__: typing.Sequence[str] = ("_buckets", "_counts", "_sum")
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        # The last count is for values above every bucket
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._sum = 0.0
+
+    @property
+    def buckets(self) -> typing.Sequence[float]:
+        """The upper bounds of the buckets."""
+        return self._buckets
+
+    @property
+    def count(self) -> int:
+        """The number of values observed."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """The sum of the values observed."""
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        """Observe a value.
+
+        Parameters
+        ----------
+        value
+            The value to observe.
+        """
+        self._sum += value
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+
+    def cumulative_counts(self) -> typing.Sequence[int]:
+        """Get the number of values observed in each bucket or any bucket before it.
+
+        Returns
+        -------
+        typing.Sequence[int]
+            The cumulative count for each bucket, followed by the total count.
+        """
+        counts: typing.List[int] = []
+        total = 0
+        for count in self._counts:
+            total += count
+            counts.append(total)
+
+        return counts
+
+
+class _RouteMetrics:
+    __slots__: typing.Sequence[str] = ("histograms", "rate_limits", "retries", "statuses")
+
+    def __init__(self, buckets: typing.Sequence[float]) -> None:
+        self.histograms = {name: Histogram(buckets) for name, _ in _TIMINGS}
+        self.rate_limits = 0
+        self.retries = 0
+        self.statuses: typing.Dict[typing.Optional[int], int] = {}
+
+
+class RESTMetricsAggregator(RESTMetricsHook):
+    """In-memory aggregator of REST API request metrics.
+
+    Keeps a histogram of each timing and counts of the statuses, retries and
+    rate limits for each route.
+
+    Parameters
+    ----------
+    buckets
+        The upper bounds of the histogram buckets, in seconds.
+    """
+
+    __slots__: typing.Sequence[str] = ("_buckets", "_routes")
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._routes: typing.Dict[routes.Route, _RouteMetrics] = {}
+
+    def on_request(self, metrics: RequestMetrics, /) -> None:
+        if (route_metrics := self._routes.get(metrics.route)) is None:
+            route_metrics = self._routes[metrics.route] = _RouteMetrics(self._buckets)
+
+        for name, _ in _TIMINGS:
+            route_metrics.histograms[name].observe(getattr(metrics, name))
+
+        route_metrics.rate_limits += metrics.rate_limits
+        route_metrics.retries += metrics.retries
+        route_metrics.statuses[metrics.status] = route_metrics.statuses.get(metrics.status, 0) + 1
+
+    @property
+    def known_routes(self) -> typing.Sequence[routes.Route]:
+        """The routes which requests have been made to."""
+        return list(self._routes)
+
+    def get_histogram(self, route: routes.Route, timing: str, /) -> typing.Optional[Histogram]:
+        """Get the histogram of a timing for a route.
+
+        Parameters
+        ----------
+        route
+            The route to get the histogram for.
+        timing
+            The name of the timing, one of `queue_wait`, `global_wait`,
+            `network_time` and `deserialize_time`.
+
+        Returns
+        -------
+        typing.Optional[hikari.impl.rest_metrics.Histogram]
+            The histogram, or [`None`][] if no requests have been made to
+            the route.
+
+        Raises
+        ------
+        KeyError
+            If `timing` isn't a known timing.
+        """
+        if timing not in _TIMING_NAMES:
+            raise KeyError(timing)
+
+        route_metrics = self._routes.get(route)
+        return route_metrics.histograms[timing] if route_metrics else None
+
+    def get_status_counts(self, route: routes.Route, /) -> typing.Mapping[typing.Optional[int], int]:
+        """Get the number of requests to a route which finished with each status.
+
+        Requests which didn't receive a response are counted under [`None`][].
+
+        Parameters
+        ----------
+        route
+            The route to get the counts for.
+
+        Returns
+        -------
+        typing.Mapping[typing.Optional[int], int]
+            The number of requests for each status.
+        """
+        route_metrics = self._routes.get(route)
+        return dict(route_metrics.statuses) if route_metrics else {}
+
+    def clear(self) -> None:
+        """Remove all the metrics collected so far."""
+        self._routes.clear()
+
+    def to_prometheus(self, *, prefix: str = "hikari_rest") -> str:
+        """Export the metrics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix
+            The prefix for the name of each metric.
+
+        Returns
+        -------
+        str
+            The metrics, ready to be served to Prometheus.
+        """
+        lines: typing.List[str] = []
+        labels = {route: _format_route_labels(route) for route in self._routes}
+
+        for name, description in _TIMINGS:
+            metric = f"{prefix}_{name}_seconds"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} histogram")
+
+            for route, route_metrics in self._routes.items():
+                histogram = route_metrics.histograms[name]
+                bounds = [_format_float(bound) for bound in histogram.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, histogram.cumulative_counts()):
+                    lines.append(f'{metric}_bucket{{{labels[route]},le="{bound}"}} {count}')
+
+                lines.append(f"{metric}_sum{{{labels[route]}}} {_format_float(histogram.sum)}")
+                lines.append(f"{metric}_count{{{labels[route]}}} {histogram.count}")
+
+        metric = f"{prefix}_requests_total"
+        lines.append(f"# HELP {metric} Requests made, by the status of the last response.")
+        lines.append(f"# TYPE {metric} counter")
+        for route, route_metrics in self._routes.items():
+            for status, count in route_metrics.statuses.items():
+                lines.append(f'{metric}{{{labels[route]},status="{status or "none"}"}} {count}')
+
+        for name, description in (
+            ("retries", "Retries after connection errors and server errors."),
+            ("rate_limits", "Rate limited (429) responses received."),
+        ):
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for route, route_metrics in self._routes.items():
+                lines.append(f"{metric}{{{labels[route]}}} {getattr(route_metrics, name)}")
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_route_labels(route: routes.Route) -> str:
+    return f'method="{route.method}",route="{_escape_label_value(route.path_template)}"'
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Persistence of gateway sessions, to resume them after a restart.
+
+Pass a [`hikari.impl.session_store.SessionStore`][] as the `session_store` of
+a [`hikari.impl.gateway_bot.GatewayBot`][] to have the sessions of its shards
+saved when it is closed and resumed when it is next started, instead of
+identifying again:
+
+```py
+bot = hikari.GatewayBot(token, session_store=hikari.impl.FileSessionStore("sessions.json"))
+```
+
+!!! warning
+    Discord does not send `READY` nor `GUILD_CREATE` for a resumed session,
+    so the cache will start empty and only fill in as entities are updated.
+
+    Sessions expire shortly after disconnecting, so this is only useful for
+    quick restarts. Shards will identify again if their session is no longer
+    valid.
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("FileSessionStore", "SessionStore", "ShardSession")
+
+import abc
+import asyncio
+import logging
+import os
+import typing
+
+import attrs
+
+from hikari import snowflakes
+from hikari.internal import attrs_extensions
+from hikari.internal import data_binding
+
+_LOGGER: typing.Final[logging.Logger] = logging.getLogger("hikari.gateway")
+
+
+@attrs_extensions.with_copy
+@attrs.frozen(kw_only=True, weakref_slot=False)
+class ShardSession:
+    """State needed to resume the session of a shard."""
+
+    shard_id: int = attrs.field()
+    """ID of the shard the session belongs to."""
+
+    shard_count: int = attrs.field()
+    """Number of shards the session was started with."""
+
+    intents: int = attrs.field()
+    """Intents the session was started with."""
+
+    session_id: str = attrs.field()
+    """ID of the session."""
+
+    seq: int = attrs.field()
+    """Sequence number of the last event received."""
+
+    resume_gateway_url: str = attrs.field()
+    """URL to connect to when resuming the session."""
+
+    user_id: snowflakes.Snowflake = attrs.field()
+    """ID of the user the session is for."""
+
+
+class SessionStore(abc.ABC):
+    """Base for storage of the shard sessions of a bot between restarts."""
+
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def load(self) -> typing.Sequence[ShardSession]:
+        """Load the stored sessions.
+
+        Returns
+        -------
+        typing.Sequence[ShardSession]
+            The stored sessions. This should be empty if none are stored.
+        """
+
+    @abc.abstractmethod
+    async def save(self, sessions: typing.Sequence[ShardSession], /) -> None:
+        """Replace the stored sessions.
+
+        Parameters
+        ----------
+        sessions
+            The sessions to store. This may be empty, which means that no
+            session can be resumed.
+        """
+
+
+class FileSessionStore(SessionStore):
+    """Session store which keeps the sessions in a JSON file.
+
+    The file is replaced atomically and is only readable by the current
+    user, as the sessions allow resuming the connections of the bot.
+
+    Parameters
+    ----------
+    path
+        Path of the file to store the sessions in.
+    """
+
+    __slots__: typing.Sequence[str] = ("_path",)
+
+    def __init__(self, path: typing.Union[str, os.PathLike[str]]) -> None:
+        self._path = os.fspath(path)
+
+    @property
+    def path(self) -> str:
+        """Path of the file the sessions are stored in."""
+        return self._path
+
+    async def load(self) -> typing.Sequence[ShardSession]:
+        loop = asyncio.get_running_loop()
+
+        try:
+            raw_payload = await loop.run_in_executor(None, _read_file, self._path)
+            payload = typing.cast(
+                "typing.Sequence[typing.Mapping[str, typing.Any]]", data_binding.default_json_loads(raw_payload)
+            )
+
+            return [
+                ShardSession(
+                    shard_id=int(session["shard_id"]),
+                    shard_count=int(session["shard_count"]),
+                    intents=int(session["intents"]),
+                    session_id=session["session_id"],
+                    seq=int(session["seq"]),
+                    resume_gateway_url=session["resume_gateway_url"],
+                    user_id=snowflakes.Snowflake(session["user_id"]),
+                )
+                for session in payload
+            ]
+
+        except FileNotFoundError:
+            return []
+
+        except (ValueError, TypeError, KeyError) as ex:
+            _LOGGER.warning("ignoring invalid session file %r", self._path, exc_info=ex)
+            return []
+
+    async def save(self, sessions: typing.Sequence[ShardSession], /) -> None:
+        payload = data_binding.default_json_dumps(
+            [
+                {
+                    "shard_id": session.shard_id,
+                    "shard_count": session.shard_count,
+                    "intents": session.intents,
+                    "session_id": session.session_id,
+                    "seq": session.seq,
+                    "resume_gateway_url": session.resume_gateway_url,
+                    "user_id": str(session.user_id),
+                }
+                for session in sessions
+            ]
+        )
+        await asyncio.get_running_loop().run_in_executor(None, _write_file, self._path, payload)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
+def _write_file(path: str, payload: bytes) -> None:
+    temporary_path = path + ".tmp"
+    fd = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with open(fd, "wb") as fp:
+        fp.write(payload)
+
+    os.replace(temporary_path, path)
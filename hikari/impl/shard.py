@@ -46,8 +46,10 @@
 from hikari import urls
 from hikari.api import shard
 from hikari.impl import rate_limits
+from hikari.impl import session_store
 from hikari.internal import aio
 from hikari.internal import data_binding
+from hikari.internal import etf
 from hikari.internal import net
 from hikari.internal import time
 from hikari.internal import ux
@@ -57,6 +59,7 @@
 
     import aiohttp.http_websocket
     import aiohttp.typedefs
+    import zstandard
 
     from hikari import channels
     from hikari import guilds
@@ -103,6 +106,13 @@
 _NON_PRIORITY_RATELIMIT: typing.Final[typing.Tuple[float, int]] = (60.0, 117)
 # Used to identify the end of a ZLIB payload
 _ZLIB_SUFFIX: typing.Final[bytes] = b"\x00\x00\xff\xff"
+# Start of a dispatch payload
+_DISPATCH_PREFIX: typing.Final[bytes] = b'{"t":"'
+# Transport compressions supported and the value to send in the query-string for them
+_COMPRESSION_QUERY_VALUES: typing.Final[typing.Mapping[str, str]] = {
+    shard.GatewayCompression.TRANSPORT_ZLIB_STREAM: "zlib-stream",
+    shard.GatewayCompression.TRANSPORT_ZSTD_STREAM: "zstd-stream",
+}
 # Close codes which don't invalidate the current session.
 _RECONNECTABLE_CLOSE_CODES: typing.FrozenSet[errors.ShardCloseCode] = frozenset(
     (
@@ -117,6 +127,27 @@
 _CUSTOM_STATUS_NAME = "Custom Status"
 
 
+def _sniff_dispatch(payload: bytes) -> typing.Optional[typing.Tuple[str, int]]:
+    # Discord sends the "t", "s" and "op" fields of a dispatch first, in this order and without
+    # whitespace, so they can be read without decoding the rest. Anything else will be decoded.
+    if not payload.startswith(_DISPATCH_PREFIX):
+        return None
+
+    name_end = payload.find(b'"', 6)
+    if name_end == -1 or not payload.startswith(b'","s":', name_end):
+        return None
+
+    seq_start = name_end + 6
+    seq_end = payload.find(b",", seq_start)
+    if seq_end == -1 or not payload.startswith(b',"op":0,', seq_end):
+        return None
+
+    try:
+        return payload[6:name_end].decode("ascii"), int(payload[seq_start:seq_end])
+    except ValueError:
+        return None
+
+
 def _log_filterer(token: bytes) -> typing.Callable[[bytes], bytes]:
     def filterer(entry: bytes) -> bytes:
         return entry.replace(token, b"**REDACTED TOKEN**")
@@ -129,7 +160,7 @@ class _GatewayTransport:
     """Internal component to handle lower-level communication logic.
 
     This includes translating aiohttp error conditions to hikari ones,
-    handling inbound zlib packets, creating the websocket and client session,
+    handling inbound zlib and zstd packets, creating the websocket and client session,
     and ensuring all resources are freed deterministically where possible.
 
     Payload logging is also performed here.
@@ -137,6 +168,7 @@ class _GatewayTransport:
 
     __slots__ = (
         "_zlib",
+        "_zstd",
         "_sent_close",
         "_logger",
         "_exit_stack",
@@ -150,7 +182,8 @@ class _GatewayTransport:
     def __init__(
         self,
         ws: aiohttp.ClientWebSocketResponse,
-        transport_compression: bool,
+        transport_compression: typing.Optional[str],
+        binary: bool,
         exit_stack: contextlib.AsyncExitStack,
         logger: logging.Logger,
         log_filterer: typing.Callable[[bytes], bytes],
@@ -163,11 +196,17 @@ def __init__(
         self._sent_close = False
         self._ws = ws
         self._zlib = zlib.decompressobj()
+        self._zstd: typing.Optional[zstandard.ZstdDecompressionObj] = None
         self._loads = loads
         self._dumps = dumps
 
-        if transport_compression:
+        if transport_compression == shard.GatewayCompression.TRANSPORT_ZSTD_STREAM:
+            self._zstd = _create_zstd_decompressobj()
+            self._receive_and_check = self._receive_and_check_zstd
+        elif transport_compression == shard.GatewayCompression.TRANSPORT_ZLIB_STREAM:
             self._receive_and_check = self._receive_and_check_zlib
+        elif binary:
+            self._receive_and_check = self._receive_and_check_binary
         else:
             self._receive_and_check = self._receive_and_check_text
 
@@ -192,13 +231,19 @@ async def send_close(self, *, code: int, message: bytes) -> None:
             # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
             await asyncio.sleep(0.25)
 
-    async def receive_json(self) -> typing.Any:
-        pl = await self._receive_and_check()
-        if self._logger.isEnabledFor(ux.TRACE):
-            filtered = self._log_filterer(pl)
-            self._logger.log(ux.TRACE, "received payload with size %s\n    %s", len(pl), filtered)
+    async def receive_json(
+        self, *, skip_dispatch: typing.Optional[typing.Callable[[str, int], bool]] = None
+    ) -> typing.Any:
+        while True:
+            pl = await self._receive_and_check()
+            if self._logger.isEnabledFor(ux.TRACE):
+                filtered = self._log_filterer(pl)
+                self._logger.log(ux.TRACE, "received payload with size %s\n    %s", len(pl), filtered)
+
+            if skip_dispatch is not None and (header := _sniff_dispatch(pl)) is not None and skip_dispatch(*header):
+                continue
 
-        return self._loads(pl)
+            return self._loads(pl)
 
     async def send_json(self, data: data_binding.JSONObject) -> None:
         pl = self._dumps(data)
@@ -241,6 +286,15 @@ async def _receive_and_check_text(self) -> bytes:
 
         self._handle_other_message(message)
 
+    async def _receive_and_check_binary(self) -> bytes:
+        message = await self._ws.receive()
+
+        if message.type == aiohttp.WSMsgType.BINARY:
+            assert isinstance(message.data, bytes)
+            return message.data
+
+        self._handle_other_message(message)
+
     async def _receive_and_check_zlib(self) -> bytes:
         message = await self._ws.receive()
 
@@ -267,6 +321,17 @@ async def _receive_and_check_zlib(self) -> bytes:
 
         self._handle_other_message(message)
 
+    async def _receive_and_check_zstd(self) -> bytes:
+        message = await self._ws.receive()
+
+        if message.type == aiohttp.WSMsgType.BINARY:
+            # Discord flushes the zstd stream at the end of every payload, so, unlike
+            # zlib, a single message always decompresses to a complete payload.
+            assert self._zstd is not None
+            return self._zstd.decompress(message.data)
+
+        self._handle_other_message(message)
+
     @classmethod
     async def connect(
         cls,
@@ -277,7 +342,8 @@ async def connect(
         log_filterer: typing.Callable[[bytes], bytes],
         dumps: data_binding.JSONEncoder,
         loads: data_binding.JSONDecoder,
-        transport_compression: bool,
+        transport_compression: typing.Optional[str],
+        binary: bool,
         url: str,
     ) -> _GatewayTransport:
         """Generate a single-use websocket connection.
@@ -314,6 +380,7 @@ async def connect(
                 return cls(
                     ws=web_socket,
                     transport_compression=transport_compression,
+                    binary=binary,
                     exit_stack=exit_stack,
                     logger=logger,
                     log_filterer=log_filterer,
@@ -346,6 +413,19 @@ async def connect(
             raise
 
 
+def _create_zstd_decompressobj() -> zstandard.ZstdDecompressionObj:
+    # This is kept inline as zstandard is an optional dependency.
+    try:
+        import zstandard
+
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "You must install the optional `zstandard` dependency to use the `transport_zstd_stream` compression."
+        ) from exc
+
+    return zstandard.ZstdDecompressor().decompressobj()
+
+
 def _serialize_datetime(dt: typing.Optional[datetime.datetime]) -> typing.Optional[int]:
     if dt is None:
         return None
@@ -397,11 +477,20 @@ class GatewayShardImpl(shard.GatewayShard):
         The event factory this shard should use.
     compression
         Compression format to use for the shard. Only supported values are
-        `"transport_zlib_stream"` or [`None`][] to disable it.
+        `"transport_zlib_stream"`, `"transport_zstd_stream"` or [`None`][]
+        to disable it.
+
+        !!! note
+            `"transport_zstd_stream"` requires the `zstandard` package
+            to be installed, otherwise a [`RuntimeError`][] is raised.
     dumps
         The JSON encoder this application should use.
+
+        This is ignored when using the `"etf"` data format.
     loads
         The JSON decoder this application should use.
+
+        This is ignored when using the `"etf"` data format.
     initial_activity
         The initial activity to appear to have for this shard, or
         [`None`][] if no activity should be set initially. This is the
@@ -426,11 +515,28 @@ class GatewayShardImpl(shard.GatewayShard):
     proxy_settings
         The proxy settings to use while negotiating a websocket.
     data_format
-        Data format to use for inbound data. Only supported format is `"json"`.
+        Data format to use for the gateway payloads. Supported formats are
+        `"json"` and `"etf"`.
+
+        When using `"etf"`, snowflakes are received as integers instead of
+        strings, which saves having to parse them from strings later on.
+    identify_rate_limiter
+        The rate limiter to acquire before identifying with a new session,
+        including when re-identifying after a session is invalidated.
+
+        Shards that run in the same application should share the same
+        rate limiter. Defaults to [`None`][], which will not rate limit
+        identifies.
+    session
+        A session to resume when the shard is started, instead of identifying
+        with a new one, as returned by
+        [`hikari.impl.shard.GatewayShardImpl.get_session`][]. If it is no
+        longer valid, a new session will be identified.
     """
 
     __slots__: typing.Sequence[str] = (
         "_activity",
+        "_data_format",
         "_dumps",
         "_event_manager",
         "_event_factory",
@@ -438,11 +544,13 @@ class GatewayShardImpl(shard.GatewayShard):
         "_handshake_event",
         "_heartbeat_latency",
         "_http_settings",
+        "_identify_rate_limiter",
         "_idle_since",
         "_intents",
         "_is_afk",
         "_is_closing",
         "_keep_alive_task",
+        "_keep_session",
         "_large_threshold",
         "_last_heartbeat_ack_received",
         "_last_heartbeat_sent",
@@ -480,29 +588,41 @@ def __init__(
         http_settings: config.HTTPSettings,
         proxy_settings: config.ProxySettings,
         data_format: str = shard.GatewayDataFormat.JSON,
+        identify_rate_limiter: typing.Optional[rate_limits.BaseIdentifyRateLimiter] = None,
         event_manager: event_manager_.EventManager,
         event_factory: event_factory_.EventFactory,
         token: str,
         url: str,
+        session: typing.Optional[session_store.ShardSession] = None,
     ) -> None:
-        if data_format != shard.GatewayDataFormat.JSON:
+        if data_format == shard.GatewayDataFormat.ETF:
+            dumps = etf.dumps
+            loads = etf.loads
+        elif data_format != shard.GatewayDataFormat.JSON:
             raise NotImplementedError(f"Unsupported gateway data format: {data_format}")
 
-        if compression and compression != shard.GatewayCompression.TRANSPORT_ZLIB_STREAM:
+        if compression and compression not in _COMPRESSION_QUERY_VALUES:
             raise NotImplementedError(f"Unsupported compression format {compression}")
 
+        if compression == shard.GatewayCompression.TRANSPORT_ZSTD_STREAM:
+            # Fail now if the optional dependency is missing, rather than every time the shard connects
+            _create_zstd_decompressobj()
+
         self._activity = initial_activity
+        self._data_format = data_format
         self._event_manager = event_manager
         self._event_factory = event_factory
         self._gateway_url = url
         self._handshake_event: typing.Optional[asyncio.Event] = None
         self._heartbeat_latency = float("nan")
         self._http_settings = http_settings
+        self._identify_rate_limiter = identify_rate_limiter
         self._idle_since = initial_idle_since
         self._intents = intents
         self._is_afk = initial_is_afk
         self._is_closing = False
         self._keep_alive_task: typing.Optional[asyncio.Task[None]] = None
+        self._keep_session = False
         self._large_threshold = large_threshold
         self._last_heartbeat_ack_received = float("nan")
         self._last_heartbeat_sent = float("nan")
@@ -521,12 +641,18 @@ def __init__(
         self._total_rate_limit = rate_limits.WindowedBurstRateLimiter(
             f"shard {shard_id} total rate limit", *_TOTAL_RATELIMIT
         )
-        self._transport_compression = compression is not None
+        self._transport_compression = compression
         self._dumps = dumps
         self._loads = loads
         self._user_id: typing.Optional[snowflakes.Snowflake] = None
         self._ws: typing.Optional[_GatewayTransport] = None
 
+        if session is not None:
+            self._resume_gateway_url = session.resume_gateway_url
+            self._seq = session.seq
+            self._session_id = session.session_id
+            self._user_id = session.user_id
+
     @property
     def heartbeat_latency(self) -> float:
         return self._heartbeat_latency
@@ -551,7 +677,22 @@ def is_connected(self) -> bool:
     def shard_count(self) -> int:
         return self._shard_count
 
-    async def close(self) -> None:
+    async def close(self, *, keep_session: bool = False) -> None:
+        """Close the websocket if it is connected.
+
+        Parameters
+        ----------
+        keep_session
+            If [`True`][], the session is left open on Discord's side, so that
+            it can be resumed later on with the state returned by
+            [`hikari.impl.shard.GatewayShardImpl.get_session`][]. Otherwise, it
+            is invalidated.
+
+        Raises
+        ------
+        hikari.errors.ComponentStateConflictError
+            If the shard is not running.
+        """
         if not self._keep_alive_task:
             raise errors.ComponentStateConflictError("Cannot close an inactive shard")
 
@@ -561,6 +702,7 @@ async def close(self) -> None:
 
         self._logger.info("shard has been requested to shutdown")
         self._is_closing = True
+        self._keep_session = keep_session
 
         self._keep_alive_task.cancel()
         try:
@@ -572,8 +714,30 @@ async def close(self) -> None:
         self._non_priority_rate_limit.close()
         self._total_rate_limit.close()
         self._is_closing = False
+        self._keep_session = False
         self._logger.info("shard shutdown successfully")
 
+    def get_session(self) -> typing.Optional[session_store.ShardSession]:
+        """Get the state needed to resume the current session.
+
+        Returns
+        -------
+        typing.Optional[hikari.impl.session_store.ShardSession]
+            The session, or [`None`][] if the shard has no session to resume.
+        """
+        if self._session_id is None or self._seq is None or self._resume_gateway_url is None or self._user_id is None:
+            return None
+
+        return session_store.ShardSession(
+            shard_id=self._shard_id,
+            shard_count=self._shard_count,
+            intents=int(self._intents),
+            session_id=self._session_id,
+            seq=self._seq,
+            resume_gateway_url=self._resume_gateway_url,
+            user_id=self._user_id,
+        )
+
     def get_user_id(self) -> snowflakes.Snowflake:
         self._check_if_connected()
         assert self._user_id is not None, "user_id was not known, this is probably a bug"
@@ -713,12 +877,24 @@ async def _heartbeat(self, heartbeat_interval: float) -> None:
 
             await asyncio.sleep(heartbeat_interval)
 
+    def _skip_dispatch(self, name: str, seq: int) -> bool:
+        if name == _READY or name == _RESUMED or self._event_manager.is_raw_event_enabled(name):
+            return False
+
+        self._seq = seq
+        self._logger.log(ux.TRACE, "skipping %s with seq %s as nothing consumes it", name, seq)
+        return True
+
     async def _poll_events(self) -> None:
         assert self._ws is not None
         assert self._handshake_event is not None
 
+        # Payloads of dispatches that nothing consumes are skipped without decoding them,
+        # which is only possible with JSON
+        skip_dispatch = self._skip_dispatch if self._data_format == shard.GatewayDataFormat.JSON else None
+
         while True:
-            payload = await self._ws.receive_json()
+            payload = await self._ws.receive_json(skip_dispatch=skip_dispatch)
 
             op = payload[_OP]
 
@@ -793,14 +969,19 @@ async def _connect(self) -> typing.Tuple[asyncio.Task[None], ...]:
 
         assert self._handshake_event is not None
 
+        if self._seq is None and self._identify_rate_limiter is not None:
+            # Wait for our turn before connecting, as the gateway will not wait long for an IDENTIFY
+            self._logger.debug("waiting to be allowed to identify")
+            await self._identify_rate_limiter.acquire(self._shard_id)
+
         url_parts = urllib.parse.urlparse(self._resume_gateway_url or self._gateway_url, allow_fragments=True)
 
         query = dict(urllib.parse.parse_qsl(url_parts.query))
         query["v"] = str(urls.VERSION)
-        query["encoding"] = "json"
+        query["encoding"] = self._data_format
 
         if self._transport_compression:
-            query["compress"] = "zlib-stream"
+            query["compress"] = _COMPRESSION_QUERY_VALUES[self._transport_compression]
 
         url = urllib.parse.urlunparse(
             (url_parts.scheme, url_parts.netloc, url_parts.path, url_parts.params, urllib.parse.urlencode(query), "")
@@ -812,6 +993,7 @@ async def _connect(self) -> typing.Tuple[asyncio.Task[None], ...]:
             logger=self._logger,
             proxy_settings=self._proxy_settings,
             transport_compression=self._transport_compression,
+            binary=self._data_format == shard.GatewayDataFormat.ETF,
             loads=self._loads,
             dumps=self._dumps,
             url=url,
@@ -968,7 +1150,7 @@ async def _keep_alive(self) -> None:
                     ws = self._ws
                     self._ws = None
 
-                    if self._is_closing:
+                    if self._is_closing and not self._keep_session:
                         await ws.send_close(
                             code=errors.ShardCloseCode.GOING_AWAY, message=b"shard disconnecting permanently"
                         )
@@ -0,0 +1,566 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Cache implementations which share guild state between local processes."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("SharedCacheImpl", "SharedCacheReader")
+
+import io
+import os
+import pickle  # noqa: S403 - only entities written by this process are unpickled
+import typing
+
+from hikari import snowflakes
+from hikari.api import cache
+from hikari.api import config as config_api
+from hikari.impl import cache as cache_impl
+from hikari.impl import config as config_impl
+from hikari.internal import cache as cache_utility
+from hikari.internal import collections
+from hikari.internal import shared_store
+
+if typing.TYPE_CHECKING:
+    from hikari import channels
+    from hikari import emojis
+    from hikari import guilds
+    from hikari import invites
+    from hikari import messages
+    from hikari import presences
+    from hikari import stickers
+    from hikari import traits
+    from hikari import users
+    from hikari import voices
+
+_GUILD: typing.Final[int] = 1
+"""Guild records, which are grouped by whether the guild is available."""
+_GUILD_CHANNEL: typing.Final[int] = 2
+_ROLE: typing.Final[int] = 3
+_APP_ID: typing.Final[str] = "app"
+SHARED_COMPONENTS: typing.Final[config_api.CacheComponents] = (
+    config_api.CacheComponents.GUILDS | config_api.CacheComponents.GUILD_CHANNELS | config_api.CacheComponents.ROLES
+)
+"""The cache components which are shared through the store."""
+
+
+class _EntityPickler(pickle.Pickler):
+    # The app is replaced with a placeholder, which is swapped for the reader's app when loading.
+    __slots__: typing.Sequence[str] = ("_app",)
+
+    def __init__(self, file: typing.IO[bytes], app: traits.RESTAware) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._app = app
+
+    def persistent_id(self, obj: typing.Any) -> typing.Optional[str]:
+        return _APP_ID if obj is self._app else None
+
+
+class _EntityUnpickler(pickle.Unpickler):  # nosec
+    __slots__: typing.Sequence[str] = ("_app",)
+
+    def __init__(self, file: typing.IO[bytes], app: traits.RESTAware) -> None:
+        super().__init__(file)
+        self._app = app
+
+    def persistent_load(self, pid: typing.Any) -> typing.Any:
+        if pid != _APP_ID:
+            raise pickle.UnpicklingError(f"Unknown persistent ID {pid!r}")
+
+        return self._app
+
+
+class _PickledCacheView(cache.CacheView[snowflakes.Snowflake, typing.Any]):
+    # The entities are only unpickled when they are accessed.
+    __slots__: typing.Sequence[str] = ("_loads", "_payloads")
+
+    def __init__(
+        self, payloads: typing.Mapping[snowflakes.Snowflake, bytes], loads: typing.Callable[[bytes], typing.Any]
+    ) -> None:
+        self._loads = loads
+        self._payloads = payloads
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return key in self._payloads
+
+    def __getitem__(self, key: snowflakes.Snowflake) -> typing.Any:
+        return self._loads(self._payloads[key])
+
+    def __iter__(self) -> typing.Iterator[snowflakes.Snowflake]:
+        return iter(self._payloads)
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    @typing.overload
+    def get_item_at(self, index: int, /) -> typing.Any: ...
+
+    @typing.overload
+    def get_item_at(self, index: slice, /) -> typing.Sequence[typing.Any]: ...
+
+    def get_item_at(self, index: typing.Union[slice, int], /) -> typing.Union[typing.Any, typing.Sequence[typing.Any]]:
+        return collections.get_index_or_slice(self, index)
+
+
+class SharedCacheImpl(cache_impl.CacheImpl):
+    """In-memory cache which also publishes guild state for other processes.
+
+    This behaves exactly like [`hikari.impl.cache.CacheImpl`][], but the
+    cached guilds, guild channels and roles are also written to a
+    memory-mapped store file. Other processes on the same host (such as a
+    REST bot) can then read them through a
+    [`hikari.impl.shared_cache.SharedCacheReader`][] without an external
+    service.
+
+    Only one process may write to a store file at a time.
+
+    Parameters
+    ----------
+    app
+        The object of the REST aware app this is bound to.
+    settings
+        The cache settings to use.
+    path
+        The path of the store file. Any existing store at this path is
+        replaced.
+    """
+
+    __slots__: typing.Sequence[str] = ("_store",)
+
+    def __init__(
+        self, app: traits.RESTAware, settings: config_impl.CacheSettings, path: typing.Union[str, os.PathLike[str]]
+    ) -> None:
+        self._store = shared_store.SharedRecordStore.create(path)
+        super().__init__(app, settings)
+
+    def close(self) -> None:
+        """Close the store file.
+
+        The file is left in place so readers can keep using the last
+        published state.
+        """
+        self._store.close()
+
+    async def load(self, path: typing.Union[str, os.PathLike[str]], /) -> None:
+        try:
+            await super().load(path)
+
+        finally:
+            self._store.clear()
+            for guild_id in self._guild_entries:
+                self._publish_guild(guild_id)
+
+            for channel_id in self._guild_channel_entries:
+                self._publish_guild_channel(channel_id)
+
+            for role_id in self._role_entries:
+                self._publish_role(role_id)
+
+    def _dumps(self, entity: typing.Any) -> bytes:
+        buffer = io.BytesIO()
+        _EntityPickler(buffer, self._app).dump(entity)
+        return buffer.getvalue()
+
+    def _publish_guild(self, guild_id: snowflakes.Snowflake) -> None:
+        guild_record = self._guild_entries.get(guild_id)
+        if guild_record and guild_record.guild:
+            self._store.put(
+                _GUILD, guild_id, self._dumps(guild_record.guild), group=int(bool(guild_record.is_available))
+            )
+
+        else:
+            self._store.delete(_GUILD, guild_id)
+
+    def _publish_guild_channel(self, channel_id: snowflakes.Snowflake) -> None:
+        channel = self._guild_channel_entries.get(channel_id)
+        if channel:
+            self._store.put(_GUILD_CHANNEL, channel_id, self._dumps(channel), group=channel.guild_id)
+
+        else:
+            self._store.delete(_GUILD_CHANNEL, channel_id)
+
+    def _publish_role(self, role_id: snowflakes.Snowflake) -> None:
+        role = self._role_entries.get(role_id)
+        if role:
+            self._store.put(_ROLE, role_id, self._dumps(role), group=role.guild_id)
+
+        else:
+            self._store.delete(_ROLE, role_id)
+
+    def clear(self) -> None:
+        super().clear()
+        self._store.clear()
+
+    def clear_guilds(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        result = super().clear_guilds()
+        for guild_id in result:
+            self._publish_guild(guild_id)
+
+        return result
+
+    def delete_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        result = super().delete_guild(guild)
+        self._publish_guild(snowflakes.Snowflake(guild))
+        return result
+
+    def set_guild(self, guild: guilds.GatewayGuild, /) -> None:
+        super().set_guild(guild)
+        self._publish_guild(guild.id)
+
+    def set_guild_availability(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], is_available: bool, /
+    ) -> None:
+        super().set_guild_availability(guild, is_available)
+        self._publish_guild(snowflakes.Snowflake(guild))
+
+    def clear_guild_channels(self) -> cache.CacheView[snowflakes.Snowflake, channels.PermissibleGuildChannel]:
+        result = super().clear_guild_channels()
+        for channel_id in result:
+            self._publish_guild_channel(channel_id)
+
+        return result
+
+    def clear_guild_channels_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, channels.PermissibleGuildChannel]:
+        result = super().clear_guild_channels_for_guild(guild)
+        for channel_id in result:
+            self._publish_guild_channel(channel_id)
+
+        return result
+
+    def delete_guild_channel(
+        self, channel: snowflakes.SnowflakeishOr[channels.PartialChannel], /
+    ) -> typing.Optional[channels.PermissibleGuildChannel]:
+        result = super().delete_guild_channel(channel)
+        self._publish_guild_channel(snowflakes.Snowflake(channel))
+        return result
+
+    def set_guild_channel(self, channel: channels.PermissibleGuildChannel, /) -> None:
+        super().set_guild_channel(channel)
+        self._publish_guild_channel(channel.id)
+
+    def clear_roles(self) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        result = super().clear_roles()
+        for role_id in result:
+            self._publish_role(role_id)
+
+        return result
+
+    def clear_roles_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        result = super().clear_roles_for_guild(guild)
+        for role_id in result:
+            self._publish_role(role_id)
+
+        return result
+
+    def delete_role(self, role: snowflakes.SnowflakeishOr[guilds.PartialRole], /) -> typing.Optional[guilds.Role]:
+        result = super().delete_role(role)
+        self._publish_role(snowflakes.Snowflake(role))
+        return result
+
+    def set_role(self, role: guilds.Role, /) -> None:
+        super().set_role(role)
+        self._publish_role(role.id)
+
+
+class SharedCacheReader(cache.Cache):
+    """Read-only cache of the guild state published by a [`hikari.impl.shared_cache.SharedCacheImpl`][].
+
+    This can be used by other processes on the same host as the writer, such
+    as a REST bot, to look up the guilds, guild channels and roles known to a
+    gateway bot. The writer's updates become visible as soon as they're made.
+    Every lookup builds new entity objects.
+
+    Everything else is treated as not cached.
+
+    !!! warning
+        The records are loaded with [`pickle`][], so the store file must only
+        be writable by trusted processes.
+
+    Parameters
+    ----------
+    app
+        The object of the REST aware app the entities should be bound to.
+    path
+        The path of the store file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the store file doesn't exist.
+    """
+
+    __slots__: typing.Sequence[str] = ("_app", "_settings", "_store")
+
+    def __init__(self, app: traits.RESTAware, path: typing.Union[str, os.PathLike[str]]) -> None:
+        self._app = app
+        self._settings = config_impl.CacheSettings(components=SHARED_COMPONENTS)
+        self._store = shared_store.SharedRecordStore.open(path)
+
+    @property
+    def settings(self) -> config_impl.CacheSettings:
+        return self._settings
+
+    def close(self) -> None:
+        """Close the store file."""
+        self._store.close()
+
+    def _loads(self, payload: bytes) -> typing.Any:
+        return _EntityUnpickler(io.BytesIO(payload), self._app).load()
+
+    def _get(self, kind: int, key: snowflakes.Snowflakeish) -> typing.Any:
+        payload = self._store.get(kind, int(key))
+        return self._loads(payload) if payload is not None else None
+
+    def _view(self, kind: int, keys: typing.Iterable[int]) -> cache.CacheView[snowflakes.Snowflake, typing.Any]:
+        # Take the payloads now, so the view isn't affected by later writes.
+        payloads: typing.Dict[snowflakes.Snowflake, bytes] = {}
+        for key in keys:
+            if (payload := self._store.get(kind, key)) is not None:
+                payloads[snowflakes.Snowflake(key)] = payload
+
+        if not payloads:
+            return cache_utility.EmptyCacheView()
+
+        return _PickledCacheView(payloads, self._loads)
+
+    def get_dm_channel_id(
+        self, user: snowflakes.SnowflakeishOr[users.PartialUser], /
+    ) -> typing.Optional[snowflakes.Snowflake]:
+        return None
+
+    def get_dm_channel_ids_view(self) -> cache.CacheView[snowflakes.Snowflake, snowflakes.Snowflake]:
+        return cache_utility.EmptyCacheView()
+
+    def get_emoji(
+        self, emoji: snowflakes.SnowflakeishOr[emojis.CustomEmoji], /
+    ) -> typing.Optional[emojis.KnownCustomEmoji]:
+        return None
+
+    def get_emojis_view(self) -> cache.CacheView[snowflakes.Snowflake, emojis.KnownCustomEmoji]:
+        return cache_utility.EmptyCacheView()
+
+    def get_emojis_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, emojis.KnownCustomEmoji]:
+        return cache_utility.EmptyCacheView()
+
+    def get_sticker(
+        self, sticker: snowflakes.SnowflakeishOr[stickers.GuildSticker], /
+    ) -> typing.Optional[stickers.GuildSticker]:
+        return None
+
+    def get_stickers_view(self) -> cache.CacheView[snowflakes.Snowflake, stickers.GuildSticker]:
+        return cache_utility.EmptyCacheView()
+
+    def get_stickers_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, stickers.GuildSticker]:
+        return cache_utility.EmptyCacheView()
+
+    def get_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        return typing.cast("typing.Optional[guilds.GatewayGuild]", self._get(_GUILD, snowflakes.Snowflake(guild)))
+
+    def _get_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /, *, availability: bool
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        guild_id = snowflakes.Snowflake(guild)
+        if self._store.get_group(_GUILD, guild_id) != int(availability):
+            return None
+
+        return self.get_guild(guild_id)
+
+    def get_available_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        return self._get_guild(guild, availability=True)
+
+    def get_unavailable_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> typing.Optional[guilds.GatewayGuild]:
+        return self._get_guild(guild, availability=False)
+
+    def get_guilds_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        return self._view(_GUILD, self._store.keys(_GUILD))
+
+    def get_available_guilds_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        return self._view(_GUILD, self._store.keys(_GUILD, group=1))
+
+    def get_unavailable_guilds_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.GatewayGuild]:
+        return self._view(_GUILD, self._store.keys(_GUILD, group=0))
+
+    def get_guild_channel(
+        self, channel: snowflakes.SnowflakeishOr[channels.PartialChannel], /
+    ) -> typing.Optional[channels.PermissibleGuildChannel]:
+        return typing.cast(
+            "typing.Optional[channels.PermissibleGuildChannel]",
+            self._get(_GUILD_CHANNEL, snowflakes.Snowflake(channel)),
+        )
+
+    def get_guild_channels_view(self) -> cache.CacheView[snowflakes.Snowflake, channels.PermissibleGuildChannel]:
+        return self._view(_GUILD_CHANNEL, self._store.keys(_GUILD_CHANNEL))
+
+    def get_guild_channels_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, channels.PermissibleGuildChannel]:
+        view = self._view(_GUILD_CHANNEL, self._store.keys(_GUILD_CHANNEL, group=snowflakes.Snowflake(guild)))
+        if not view:
+            return view
+
+        return cache_utility.CacheMappingView(cache_utility.sort_guild_channels(dict(view.items())))
+
+    def get_thread(
+        self, thread: snowflakes.SnowflakeishOr[channels.PartialChannel], /
+    ) -> typing.Optional[channels.GuildThreadChannel]:
+        return None
+
+    def get_threads_view(self) -> cache.CacheView[snowflakes.Snowflake, channels.GuildThreadChannel]:
+        return cache_utility.EmptyCacheView()
+
+    def get_threads_view_for_channel(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        /,
+    ) -> cache.CacheView[snowflakes.Snowflake, channels.GuildThreadChannel]:
+        return cache_utility.EmptyCacheView()
+
+    def get_threads_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, channels.GuildThreadChannel]:
+        return cache_utility.EmptyCacheView()
+
+    def get_invite(self, code: typing.Union[invites.InviteCode, str], /) -> typing.Optional[invites.InviteWithMetadata]:
+        return None
+
+    def get_invites_view(self) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        return cache_utility.EmptyCacheView()
+
+    def get_invites_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        return cache_utility.EmptyCacheView()
+
+    def get_invites_view_for_channel(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        /,
+    ) -> cache.CacheView[str, invites.InviteWithMetadata]:
+        return cache_utility.EmptyCacheView()
+
+    def get_me(self) -> typing.Optional[users.OwnUser]:
+        return None
+
+    def get_member(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> typing.Optional[guilds.Member]:
+        return None
+
+    def get_members_view(
+        self,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, guilds.Member]]:
+        return cache_utility.EmptyCacheView()
+
+    def get_members_view_for_guild(
+        self, guild_id: snowflakes.Snowflakeish, /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Member]:
+        return cache_utility.EmptyCacheView()
+
+    def get_message(
+        self, message: snowflakes.SnowflakeishOr[messages.PartialMessage], /
+    ) -> typing.Optional[messages.Message]:
+        return None
+
+    def get_messages_view(self) -> cache.CacheView[snowflakes.Snowflake, messages.Message]:
+        return cache_utility.EmptyCacheView()
+
+    def get_presence(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> typing.Optional[presences.MemberPresence]:
+        return None
+
+    def get_presences_view(
+        self,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, presences.MemberPresence]]:
+        return cache_utility.EmptyCacheView()
+
+    def get_presences_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, presences.MemberPresence]:
+        return cache_utility.EmptyCacheView()
+
+    def get_role(self, role: snowflakes.SnowflakeishOr[guilds.PartialRole], /) -> typing.Optional[guilds.Role]:
+        return typing.cast("typing.Optional[guilds.Role]", self._get(_ROLE, snowflakes.Snowflake(role)))
+
+    def get_roles_view(self) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        return self._view(_ROLE, self._store.keys(_ROLE))
+
+    def get_roles_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        return self._view(_ROLE, self._store.keys(_ROLE, group=snowflakes.Snowflake(guild)))
+
+    def get_user(self, user: snowflakes.SnowflakeishOr[users.PartialUser], /) -> typing.Optional[users.User]:
+        return None
+
+    def get_users_view(self) -> cache.CacheView[snowflakes.Snowflake, users.User]:
+        return cache_utility.EmptyCacheView()
+
+    def get_voice_state(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        user: snowflakes.SnowflakeishOr[users.PartialUser],
+        /,
+    ) -> typing.Optional[voices.VoiceState]:
+        return None
+
+    def get_voice_states_view(
+        self,
+    ) -> cache.CacheView[snowflakes.Snowflake, cache.CacheView[snowflakes.Snowflake, voices.VoiceState]]:
+        return cache_utility.EmptyCacheView()
+
+    def get_voice_states_view_for_channel(
+        self,
+        guild: snowflakes.SnowflakeishOr[guilds.PartialGuild],
+        channel: snowflakes.SnowflakeishOr[channels.PartialChannel],
+        /,
+    ) -> cache.CacheView[snowflakes.Snowflake, voices.VoiceState]:
+        return cache_utility.EmptyCacheView()
+
+    def get_voice_states_view_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, voices.VoiceState]:
+        return cache_utility.EmptyCacheView()
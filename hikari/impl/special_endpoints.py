@@ -49,6 +49,8 @@
 )
 
 import asyncio
+import collections
+import functools
 import typing
 
 import attrs
@@ -102,6 +104,7 @@ async def __call__(
             json: typing.Union[data_binding.JSONObjectBuilder, data_binding.JSONArray, None] = None,
             reason: undefined.UndefinedOr[str] = undefined.UNDEFINED,
             auth: undefined.UndefinedNoneOr[str] = undefined.UNDEFINED,
+            deserialize_item: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
         ) -> typing.Union[None, data_binding.JSONObject, data_binding.JSONArray]: ...
 
     class _ThreadDeserializeSig(typing.Protocol["_GuildThreadChannelCovT"]):
@@ -530,12 +533,181 @@ async def _next_chunk(self) -> typing.Optional[typing.Generator[messages.Message
         if not chunk:
             return None
         if self._direction == "after":
-            chunk.reverse()
+            # The response may be shared with other requests, so it must not be modified
+            chunk = chunk[::-1]
 
         self._first_id = chunk[-1]["id"]
         return (self._entity_factory.deserialize_message(m) for m in chunk)
 
 
+class _MessageHistorySlice:
+    """State of a single time slice in a [`SlicedMessageIterator`][]."""
+
+    __slots__: typing.Sequence[str] = ("after", "before", "error", "exhausted", "pages", "task")
+
+    def __init__(self, after: snowflakes.Snowflake, before: snowflakes.Snowflake) -> None:
+        self.after = after
+        self.before = before
+        self.error: typing.Optional[BaseException] = None
+        self.exhausted = False
+        self.pages: typing.Deque[typing.Sequence[messages.Message]] = collections.deque()
+        self.task: typing.Optional[asyncio.Task[typing.Sequence[messages.Message]]] = None
+
+
+class SlicedMessageIterator(iterators.LazyIterator["messages.Message"]):
+    """Implementation of an iterator which fetches several slices of message history at once.
+
+    The range of message IDs is split into contiguous time slices which are
+    fetched concurrently. Messages are yielded oldest first, with each slice
+    being drained before the next one, so the result is in the same order as
+    a sequential fetch.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_buffer",
+        "_buffered_pages",
+        "_entity_factory",
+        "_executor",
+        "_max_buffered_pages",
+        "_request_call",
+        "_route",
+        "_slices",
+    )
+
+    def __init__(
+        self,
+        entity_factory: entity_factory_.EntityFactory,
+        request_call: _RequestCallSig,
+        channel: snowflakes.SnowflakeishOr[channels.TextableChannel],
+        after: snowflakes.Snowflake,
+        before: snowflakes.Snowflake,
+        *,
+        slices: int,
+        max_buffered_pages: int,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        if slices < 1:
+            raise ValueError("'slices' must be greater than 0")
+
+        if max_buffered_pages < 1:
+            raise ValueError("'max_buffered_pages' must be greater than 0")
+
+        self._buffer: typing.Optional[typing.Iterator[messages.Message]] = None
+        self._buffered_pages = 0
+        self._entity_factory = entity_factory
+        self._executor = executor
+        self._max_buffered_pages = max_buffered_pages
+        self._request_call = request_call
+        self._route = routes.GET_CHANNEL_MESSAGES.compile(channel=channel)
+        self._slices: typing.Deque[_MessageHistorySlice] = collections.deque()
+
+        # Each slice covers the IDs in [start, end), the first one starting
+        # right after `after` and the last one ending right before `before`.
+        start = after + 1
+        step = max(1, (before - start) // slices)
+        for index in range(slices):
+            end = before if index == slices - 1 else min(before, start + step)
+            if start >= end:
+                break
+
+            self._slices.append(_MessageHistorySlice(snowflakes.Snowflake(start - 1), snowflakes.Snowflake(end)))
+            start = end
+
+    async def _fetch_page(self, history_slice: _MessageHistorySlice) -> typing.Sequence[messages.Message]:
+        query = data_binding.StringMapBuilder()
+        query.put("after", history_slice.after)
+        query.put("limit", 100)
+
+        chunk = await self._request_call(compiled_route=self._route, query=query)
+        assert isinstance(chunk, list)
+
+        # Pages come newest first and may run past the end of the slice
+        payloads = [payload for payload in reversed(chunk) if int(payload["id"]) < history_slice.before]
+
+        if len(chunk) < 100 or len(payloads) < len(chunk):
+            history_slice.exhausted = True
+        else:
+            history_slice.after = snowflakes.Snowflake(payloads[-1]["id"])
+
+        if self._executor is None or not payloads:
+            return self._deserialize(payloads)
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._deserialize, payloads)
+
+    def _deserialize(self, payloads: data_binding.JSONArray) -> typing.Sequence[messages.Message]:
+        return [self._entity_factory.deserialize_message(payload) for payload in payloads]
+
+    def _on_page(
+        self, history_slice: _MessageHistorySlice, task: asyncio.Task[typing.Sequence[messages.Message]]
+    ) -> None:
+        history_slice.task = None
+
+        if task.cancelled():
+            self._buffered_pages -= 1
+            return
+
+        if (exception := task.exception()) is not None:
+            history_slice.error = exception
+            self._buffered_pages -= 1
+            return
+
+        history_slice.pages.append(task.result())
+        self._fill()
+
+    def _fill(self) -> None:
+        for index, history_slice in enumerate(self._slices):
+            # The slice currently being consumed may always fetch, otherwise
+            # pages buffered for later slices could starve it forever.
+            if index and self._buffered_pages >= self._max_buffered_pages:
+                return
+
+            if history_slice.task is not None or history_slice.exhausted or history_slice.error is not None:
+                continue
+
+            history_slice.task = asyncio.create_task(self._fetch_page(history_slice))
+            history_slice.task.add_done_callback(functools.partial(self._on_page, history_slice))
+            self._buffered_pages += 1
+
+    def _cancel(self) -> None:
+        for history_slice in self._slices:
+            if history_slice.task is not None:
+                history_slice.task.cancel()
+
+        self._slices.clear()
+
+    async def __anext__(self) -> messages.Message:
+        while True:
+            if self._buffer is not None:
+                try:
+                    return next(self._buffer)
+                except StopIteration:
+                    self._buffer = None
+
+            if not self._slices:
+                raise StopAsyncIteration
+
+            current = self._slices[0]
+            if current.pages:
+                self._buffer = iter(current.pages.popleft())
+                self._buffered_pages -= 1
+                self._fill()
+                continue
+
+            if current.error is not None:
+                self._cancel()
+                raise current.error
+
+            if current.task is None:
+                if current.exhausted:
+                    self._slices.popleft()
+                    continue
+
+                self._fill()
+
+            assert current.task is not None
+            await asyncio.wait((current.task,))
+
+
 # We use an explicit forward reference for this, since this breaks potential
 # circular import issues (once the file has executed, using those resources is
 # not an issue for us).
@@ -609,7 +781,7 @@ async def _next_chunk(self) -> typing.Optional[typing.Generator[applications.Own
             return None
 
         if self._newest_first:
-            chunk.reverse()
+            chunk = chunk[::-1]
 
         self._first_id = chunk[-1]["id"]
         return (self._entity_factory.deserialize_own_guild(g) for g in chunk)
@@ -659,7 +831,7 @@ async def _next_chunk(self) -> typing.Optional[typing.Generator[guilds.GuildBan,
 
         if self._newest_first:
             # These are always returned in ascending order by [`.user.id`][].
-            chunk.reverse()
+            chunk = chunk[::-1]
 
         self._first_id = chunk[-1]["user"]["id"]
         return (self._entity_factory.deserialize_guild_member_ban(b) for b in chunk)
@@ -686,22 +858,27 @@ def __init__(
         self._entity_factory = entity_factory
         # This starts at the default provided by Discord instead of the max snowflake
         # because that caused Discord to take about 2 seconds more to return the first response.
-        self._first_id = undefined.UNDEFINED
+        self._first_id: typing.Union[str, undefined.UndefinedType] = undefined.UNDEFINED
 
     async def _next_chunk(self) -> typing.Optional[typing.Generator[guilds.Member, typing.Any, None]]:
         query = data_binding.StringMapBuilder()
         query.put("after", self._first_id)
         query.put("limit", 1000)
 
-        chunk = await self._request_call(compiled_route=self._route, query=query)
+        # Pages can hold up to 1000 members, so when streaming these are deserialized as they're received
+        # rather than holding the raw JSON of the whole page (the deserialized page is still held).
+        chunk = await self._request_call(compiled_route=self._route, query=query, deserialize_item=self._deserialize)
         assert isinstance(chunk, list)
 
         if not chunk:
             return None
 
-        self._first_id = chunk[-1]["user"]["id"]
+        self._first_id = str(chunk[-1].user.id)
+
+        return (member for member in chunk)
 
-        return (self._entity_factory.deserialize_member(m, guild_id=self._guild_id) for m in chunk)
+    def _deserialize(self, payload: data_binding.JSONObject) -> guilds.Member:
+        return self._entity_factory.deserialize_member(payload, guild_id=self._guild_id)
 
 
 # We use an explicit forward reference for this, since this breaks potential
@@ -752,7 +929,7 @@ async def _next_chunk(
 
         if self._newest_first:
             # These are always returned in ascending order by [`.user.id`][].
-            chunk.reverse()
+            chunk = chunk[::-1]
 
         self._first_id = chunk[-1]["user"]["id"]
         return (self._entity_factory.deserialize_scheduled_event_user(u, guild_id=self._guild_id) for u in chunk)
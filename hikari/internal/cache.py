@@ -25,11 +25,13 @@
 
 __all__: typing.Sequence[str] = (
     "CacheMappingView",
+    "BorrowedCacheMappingView",
     "EmptyCacheView",
     "GuildRecord",
     "BaseData",
     "InviteData",
     "MemberData",
+    "CompactMemberStore",
     "KnownCustomEmojiData",
     "RichActivityData",
     "MemberPresenceData",
@@ -39,6 +41,8 @@
     "RefCell",
     "unwrap_ref_cell",
     "copy_guild_channel",
+    "borrow_ref_cell",
+    "sort_guild_channels",
     "Cache3DMappingView",
     "DataT",
     "KeyT",
@@ -46,12 +50,15 @@
 )
 
 import abc
+import array
 import copy
 import datetime
+import sys
 import typing
 
 import attrs
 
+from hikari import channels as channels_
 from hikari import embeds as embeds_
 from hikari import emojis
 from hikari import guilds
@@ -70,7 +77,6 @@
     from typing_extensions import Self
 
     from hikari import applications
-    from hikari import channels as channels_
     from hikari import components as components_
     from hikari import traits
     from hikari import users as users_
@@ -146,6 +152,19 @@ def get_item_at(self, index: typing.Union[slice, int], /) -> typing.Union[ValueT
         return collections.get_index_or_slice(self, index)
 
 
+class BorrowedCacheMappingView(CacheMappingView[KeyT, ValueT]):
+    """A cache mapping view which returns the stored values rather than copies of them.
+
+    The returned values are shared with the cache and must not be modified.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @staticmethod
+    def _copy(value: ValueT) -> ValueT:
+        return value
+
+
 class EmptyCacheView(cache.CacheView[typing.Any, typing.Any]):
     """An empty cache view implementation."""
 
@@ -228,6 +247,12 @@ class GuildRecord:
     This will be [`None`][] if no members are cached for this guild.
     """
 
+    compact_members: typing.Optional[CompactMemberStore] = attrs.field(default=None)
+    """The members cached for this guild when members are stored compactly.
+
+    This will be [`None`][] if no members are cached for this guild.
+    """
+
     presences: typing.Optional[collections.ExtendedMutableMapping[snowflakes.Snowflake, MemberPresenceData]] = (
         attrs.field(default=None)
     )
@@ -266,6 +291,7 @@ def empty(self) -> bool:
                 self.guild,
                 self.invites,
                 self.members,
+                self.compact_members,
                 self.presences,
                 self.roles,
                 self.voice_states,
@@ -405,6 +431,9 @@ class MemberData(BaseData[guilds.Member]):
     raw_communication_disabled_until: typing.Optional[datetime.datetime] = attrs.field()
     # meta-attribute
     has_been_deleted: bool = attrs.field(default=False, init=False)
+    _borrowed: typing.Optional[typing.Tuple[users_.User, guilds.Member]] = attrs.field(
+        default=None, init=False, eq=False
+    )
 
     @classmethod
     def build_from_entity(
@@ -426,6 +455,9 @@ def build_from_entity(
         )
 
     def build_entity(self, _: traits.RESTAware, /) -> guilds.Member:
+        return self._build_entity(self.user.copy())
+
+    def _build_entity(self, user: users_.User, /) -> guilds.Member:
         return guilds.Member(
             guild_id=self.guild_id,
             nickname=self.nickname,
@@ -437,8 +469,372 @@ def build_entity(self, _: traits.RESTAware, /) -> guilds.Member:
             is_mute=self.is_mute,
             is_pending=self.is_pending,
             raw_communication_disabled_until=self.raw_communication_disabled_until,
-            user=self.user.copy(),
+            user=user,
+        )
+
+    def build_borrowed_entity(self, app: traits.RESTAware, /) -> guilds.Member:
+        """Get a member object built from this data which is shared between calls.
+
+        The member is only rebuilt when the cached user object is replaced,
+        so it must not be modified.
+
+        Parameters
+        ----------
+        app
+            The hikari application the built object should be bound to.
+
+        Returns
+        -------
+        hikari.guilds.Member
+            The shared member object.
+        """
+        user = self.user.object
+        if self._borrowed and self._borrowed[0] is user:
+            return self._borrowed[1]
+
+        member = self._build_entity(user)
+        self._borrowed = (user, member)
+        return member
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # The borrowed member is only a memo of the last member built, so it isn't worth pickling.
+        return {
+            field.name: getattr(self, field.name) for field in attrs.fields(MemberData) if field.name != "_borrowed"
+        }
+
+    def __setstate__(self, state: typing.Mapping[str, typing.Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        self._borrowed = None
+
+
+_UNIX_EPOCH: typing.Final[datetime.datetime] = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND: typing.Final[datetime.timedelta] = datetime.timedelta(microseconds=1)
+_NO_TIMESTAMP: typing.Final[int] = -(2**63)
+"""Sentinel used for [`None`][] in the timestamp columns."""
+_TRISTATE_TO_BITS: typing.Final[typing.Mapping[undefined.UndefinedOr[bool], int]] = {
+    undefined.UNDEFINED: 0,
+    False: 1,
+    True: 2,
+}
+_BITS_TO_TRISTATE: typing.Final[typing.Sequence[undefined.UndefinedOr[bool]]] = (undefined.UNDEFINED, False, True)
+_COMPACT_ROLES_AFTER: typing.Final[int] = 1024
+"""The minimum number of unused role slots before the role column is compacted."""
+
+
+def _datetime_to_micros(value: typing.Optional[datetime.datetime], /) -> int:
+    if value is None:
+        return _NO_TIMESTAMP
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+
+    return (value - _UNIX_EPOCH) // _MICROSECOND
+
+
+def _micros_to_datetime(value: int, /) -> typing.Optional[datetime.datetime]:
+    if value == _NO_TIMESTAMP:
+        return None
+
+    return _UNIX_EPOCH + datetime.timedelta(microseconds=value)
+
+
+def _intern(value: typing.Optional[str], /) -> typing.Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+class CompactMemberStore:
+    """A column-oriented store for the members cached for a single guild.
+
+    Rather than keeping an object per member, each field is kept in its own
+    column, with a row per member:
+
+    * Role IDs are packed into a single `array("Q")`, with an offset and
+      count per member.
+    * Timestamps are stored as 64-bit microsecond epochs.
+    * Nicknames and guild avatar hashes are interned.
+    * The deaf, mute and pending states are packed into a byte.
+
+    [`hikari.guilds.Member`][] objects are only built when they are requested.
+
+    Parameters
+    ----------
+    guild_id
+        The ID of the guild the members belong to.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_avatar_hashes",
+        "_disabled_until",
+        "_flags",
+        "_index",
+        "_joined_at",
+        "_nicknames",
+        "_premium_since",
+        "_role_counts",
+        "_role_offsets",
+        "_roles",
+        "_unused_roles",
+        "_users",
+        "guild_id",
+    )
+
+    guild_id: snowflakes.Snowflake
+    """The ID of the guild the members belong to."""
+
+    def __init__(self, guild_id: snowflakes.Snowflake) -> None:
+        self._avatar_hashes: typing.List[typing.Optional[str]] = []
+        self._disabled_until = array.array("q")
+        self._flags = bytearray()
+        self._index: typing.Dict[snowflakes.Snowflake, int] = {}
+        self._joined_at = array.array("q")
+        self._nicknames: typing.List[typing.Optional[str]] = []
+        self._premium_since = array.array("q")
+        self._role_counts = array.array("I")
+        self._role_offsets = array.array("Q")
+        self._roles = array.array("Q")
+        self._unused_roles = 0
+        self._users: typing.List[RefCell[users_.User]] = []
+        self.guild_id = guild_id
+
+    def __contains__(self, user_id: typing.Any) -> bool:
+        return user_id in self._index
+
+    def __iter__(self) -> typing.Iterator[snowflakes.Snowflake]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def set(
+        self,
+        member: typing.Union[guilds.Member, MemberData],
+        user: RefCell[users_.User],
+        /,
+        *,
+        user_id: typing.Optional[snowflakes.Snowflake] = None,
+    ) -> None:
+        """Insert or replace a member.
+
+        Parameters
+        ----------
+        member
+            The member or member data to store.
+        user
+            The reference cell of the cached user object for the member.
+        user_id
+            The ID of the member. Defaults to the ID of the user in `user`,
+            so this must be passed if the cell isn't filled in yet.
+        """
+        if user_id is None:
+            user_id = user.object.id
+
+        flags = (
+            _TRISTATE_TO_BITS[member.is_deaf]
+            | _TRISTATE_TO_BITS[member.is_mute] << 2
+            | _TRISTATE_TO_BITS[member.is_pending] << 4
         )
+        role_ids = member.role_ids
+        row = self._index.get(user_id)
+
+        if row is None:
+            self._index[user_id] = len(self._users)
+            self._avatar_hashes.append(_intern(member.guild_avatar_hash))
+            self._disabled_until.append(_datetime_to_micros(member.raw_communication_disabled_until))
+            self._flags.append(flags)
+            self._joined_at.append(_datetime_to_micros(member.joined_at))
+            self._nicknames.append(_intern(member.nickname))
+            self._premium_since.append(_datetime_to_micros(member.premium_since))
+            self._role_counts.append(len(role_ids))
+            self._role_offsets.append(len(self._roles))
+            self._roles.extend(role_ids)
+            self._users.append(user)
+            return
+
+        self._avatar_hashes[row] = _intern(member.guild_avatar_hash)
+        self._disabled_until[row] = _datetime_to_micros(member.raw_communication_disabled_until)
+        self._flags[row] = flags
+        self._joined_at[row] = _datetime_to_micros(member.joined_at)
+        self._nicknames[row] = _intern(member.nickname)
+        self._premium_since[row] = _datetime_to_micros(member.premium_since)
+        self._users[row] = user
+
+        old_count = self._role_counts[row]
+        if len(role_ids) <= old_count:
+            offset = self._role_offsets[row]
+            end = offset + len(role_ids)
+            self._roles[offset:end] = array.array("Q", role_ids)
+            self._unused_roles += old_count - len(role_ids)
+
+        else:
+            self._role_offsets[row] = len(self._roles)
+            self._roles.extend(role_ids)
+            self._unused_roles += old_count
+
+        self._role_counts[row] = len(role_ids)
+        self._maybe_compact_roles()
+
+    def get_user(self, user_id: snowflakes.Snowflake, /) -> typing.Optional[RefCell[users_.User]]:
+        """Get the reference cell of the user object for a stored member.
+
+        Parameters
+        ----------
+        user_id
+            The ID of the member.
+
+        Returns
+        -------
+        typing.Optional[RefCell[hikari.users.User]]
+            The user's reference cell, or [`None`][] if the member is not stored.
+        """
+        row = self._index.get(user_id)
+        return self._users[row] if row is not None else None
+
+    def build_member(self, user_id: snowflakes.Snowflake, /) -> guilds.Member:
+        """Build a member object from the stored data.
+
+        Parameters
+        ----------
+        user_id
+            The ID of the member.
+
+        Returns
+        -------
+        hikari.guilds.Member
+            The built member.
+
+        Raises
+        ------
+        KeyError
+            If the member is not stored.
+        """
+        row = self._index[user_id]
+        return guilds.Member(**self._build_fields(row), user=self._users[row].copy())
+
+    def build_member_data(self, user_id: snowflakes.Snowflake, /) -> MemberData:
+        """Build the data of a stored member, referring to its user's reference cell.
+
+        Parameters
+        ----------
+        user_id
+            The ID of the member.
+
+        Returns
+        -------
+        MemberData
+            The built member data.
+
+        Raises
+        ------
+        KeyError
+            If the member is not stored.
+        """
+        row = self._index[user_id]
+        return MemberData(**self._build_fields(row), user=self._users[row])
+
+    def copy(self) -> CompactMemberStore:
+        """Copy the store.
+
+        The columns are copied, but the user reference cells are shared.
+
+        Returns
+        -------
+        CompactMemberStore
+            The copy.
+        """
+        store = CompactMemberStore(self.guild_id)
+        store._avatar_hashes = self._avatar_hashes.copy()
+        store._disabled_until = copy.copy(self._disabled_until)
+        store._flags = self._flags.copy()
+        store._index = self._index.copy()
+        store._joined_at = copy.copy(self._joined_at)
+        store._nicknames = self._nicknames.copy()
+        store._premium_since = copy.copy(self._premium_since)
+        store._role_counts = copy.copy(self._role_counts)
+        store._role_offsets = copy.copy(self._role_offsets)
+        store._roles = copy.copy(self._roles)
+        store._unused_roles = self._unused_roles
+        store._users = self._users.copy()
+        return store
+
+    def delete(self, user_id: snowflakes.Snowflake, /) -> typing.Optional[RefCell[users_.User]]:
+        """Remove a member.
+
+        Parameters
+        ----------
+        user_id
+            The ID of the member.
+
+        Returns
+        -------
+        typing.Optional[RefCell[hikari.users.User]]
+            The reference cell of the removed member's user, or [`None`][]
+            if the member was not stored.
+        """
+        row = self._index.pop(user_id, None)
+        if row is None:
+            return None
+
+        user = self._users[row]
+        self._unused_roles += self._role_counts[row]
+        last = len(self._users) - 1
+
+        # Move the last row into the freed one so the columns stay dense
+        if row != last:
+            self._index[self._users[last].object.id] = row
+
+            for column in self._columns():
+                column[row] = column[last]
+
+        for column in self._columns():
+            del column[last]
+
+        self._maybe_compact_roles()
+        return user
+
+    def _build_fields(self, row: int, /) -> typing.Dict[str, typing.Any]:
+        flags = self._flags[row]
+        offset = self._role_offsets[row]
+        end = offset + self._role_counts[row]
+
+        return {
+            "guild_id": self.guild_id,
+            "nickname": self._nicknames[row],
+            "role_ids": tuple(map(snowflakes.Snowflake, self._roles[offset:end])),
+            "joined_at": _micros_to_datetime(self._joined_at[row]),
+            "guild_avatar_hash": self._avatar_hashes[row],
+            "premium_since": _micros_to_datetime(self._premium_since[row]),
+            "is_deaf": _BITS_TO_TRISTATE[flags & 0b11],
+            "is_mute": _BITS_TO_TRISTATE[flags >> 2 & 0b11],
+            "is_pending": _BITS_TO_TRISTATE[flags >> 4 & 0b11],
+            "raw_communication_disabled_until": _micros_to_datetime(self._disabled_until[row]),
+        }
+
+    def _columns(self) -> typing.Tuple[typing.MutableSequence[typing.Any], ...]:
+        return (
+            self._avatar_hashes,
+            self._disabled_until,
+            self._flags,
+            self._joined_at,
+            self._nicknames,
+            self._premium_since,
+            self._role_counts,
+            self._role_offsets,
+            self._users,
+        )
+
+    def _maybe_compact_roles(self) -> None:
+        if self._unused_roles < _COMPACT_ROLES_AFTER or self._unused_roles * 2 < len(self._roles):
+            return
+
+        roles = array.array("Q")
+        for row, (offset, count) in enumerate(zip(self._role_offsets, self._role_counts)):
+            self._role_offsets[row] = len(roles)
+            roles.extend(self._roles[offset : offset + count])  # noqa: E203 - Whitespace before ":"
+
+        self._roles = roles
+        self._unused_roles = 0
 
 
 @attrs_extensions.with_copy
@@ -1004,6 +1400,22 @@ def unwrap_ref_cell(cell: RefCell[ValueT]) -> ValueT:
     return cell.copy()
 
 
+def borrow_ref_cell(cell: RefCell[ValueT]) -> ValueT:
+    """Get the contents of a [`RefCell`][] instance without copying them.
+
+    Parameters
+    ----------
+    cell
+        The reference cell instance to unwrap.
+
+    Returns
+    -------
+    ValueT
+        The reference cell's content, shared with the cell.
+    """
+    return cell.object
+
+
 def copy_guild_channel(channel: ChannelT) -> ChannelT:
     """Logic for handling the copying of guild channel objects.
 
@@ -1017,6 +1429,40 @@ def copy_guild_channel(channel: ChannelT) -> ChannelT:
     return channel
 
 
+def sort_guild_channels(
+    channels: typing.Mapping[snowflakes.Snowflake, channels_.PermissibleGuildChannel], /
+) -> typing.Dict[snowflakes.Snowflake, channels_.PermissibleGuildChannel]:
+    """Sort a guild's channels in the order they're displayed in.
+
+    Parameters
+    ----------
+    channels
+        Mapping of IDs to the guild's channels. This must include the
+        categories the channels belong to.
+
+    Returns
+    -------
+    typing.Dict[hikari.snowflakes.Snowflake, hikari.channels.PermissibleGuildChannel]
+        The sorted mapping of IDs to channels.
+    """
+
+    def sorter(
+        args: typing.Tuple[snowflakes.Snowflake, channels_.PermissibleGuildChannel]
+    ) -> typing.Tuple[int, int, int]:
+        channel = args[1]
+        if isinstance(channel, channels_.GuildCategory):
+            return channel.position, -1, 0
+
+        parent_position = -1 if channel.parent_id is None else channels[channel.parent_id].position
+
+        if not isinstance(channel, channels_.GuildVoiceChannel):
+            return parent_position, 0, channel.position
+
+        return parent_position, 1, channel.position
+
+    return dict(sorted(channels.items(), key=sorter))
+
+
 class Cache3DMappingView(CacheMappingView[snowflakes.Snowflake, cache.CacheView[KeyT, ValueT]]):
     """A special case of the Mapping View which avoids copying the immutable values contained within it."""
 
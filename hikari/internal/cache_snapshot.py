@@ -0,0 +1,502 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Binary snapshots of the in-memory cache, used to warm it up after a restart.
+
+A snapshot is a header holding the version of hikari which wrote it followed
+by length-prefixed frames, each holding an independent pickle small enough to
+be encoded or decoded without holding up the event loop for long. The cells
+which are shared between cache entries (users, unknown custom emojis and the
+members referenced by voice states) are replaced by references when pickling
+the frames, so that their identities and reference counts are restored when
+loading the snapshot.
+
+Snapshots are only loaded by the version of hikari which wrote them, as the
+pickled entities are tied to the layout of its classes, and only the entity
+classes of hikari (and the standard library types they use) can be unpickled.
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "HEADER",
+    "ME",
+    "DM_CHANNEL_IDS",
+    "GUILD",
+    "MEMBERS",
+    "PRESENCES",
+    "END",
+    "SnapshotDecoder",
+    "SnapshotEncoder",
+    "read_frame",
+    "read_header",
+)
+
+import io
+import itertools
+import pickle  # noqa: S403 - only snapshots written by this library are unpickled
+import struct
+import sys
+import typing
+
+from hikari import _about as about
+from hikari import emojis
+from hikari import snowflakes
+from hikari import users
+from hikari.internal import cache as cache_utility
+
+if typing.TYPE_CHECKING:
+    from hikari import traits
+
+_MAGIC: typing.Final[bytes] = b"HKCACHE\x02"
+_VERSION: typing.Final[bytes] = about.__version__.encode("ascii")
+HEADER: typing.Final[bytes] = _MAGIC + bytes((len(_VERSION),)) + _VERSION
+"""Magic, format version and hikari version the snapshot files start with."""
+_FRAME: typing.Final[struct.Struct] = struct.Struct("<BI")
+"""Kind and payload length of a frame."""
+_ENTITIES_PER_FRAME: typing.Final[int] = 500
+_APP_ID: typing.Final[str] = "app"
+_USER: typing.Final[str] = "user"
+_EMOJI: typing.Final[str] = "emoji"
+_MEMBER: typing.Final[str] = "member"
+
+ME: typing.Final[int] = 1
+"""Frame holding the bot's own user."""
+DM_CHANNEL_IDS: typing.Final[int] = 2
+"""Frame holding the mapping of user IDs to DM channel IDs."""
+GUILD: typing.Final[int] = 3
+"""Frame holding a guild record (without its members and presences) and the entities it refers to."""
+MEMBERS: typing.Final[int] = 4
+"""Frame holding some of the members of a guild record."""
+PRESENCES: typing.Final[int] = 5
+"""Frame holding some of the presences of a guild record."""
+_DETACHED_MEMBERS: typing.Final[int] = 6
+"""Frame holding referenced members which aren't in their guild record."""
+_USERS: typing.Final[int] = 7
+_UNKNOWN_EMOJIS: typing.Final[int] = 8
+END: typing.Final[int] = 9
+"""Empty frame marking the end of a complete snapshot."""
+
+_Key = typing.Tuple[typing.Any, ...]
+_T = typing.TypeVar("_T")
+
+_ALLOWED_GLOBALS: typing.Final[typing.FrozenSet[typing.Tuple[str, str]]] = frozenset(
+    (
+        ("array", "_array_reconstructor"),
+        ("array", "array"),
+        ("datetime", "datetime"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+    )
+)
+"""The standard library globals which may be unpickled, on top of hikari's entity classes."""
+_ENTITY_MODULE_EXCLUDES: typing.Final[typing.Tuple[str, ...]] = ("hikari.api.", "hikari.impl.", "hikari.internal.")
+_INTERNAL_ENTITY_MODULES: typing.Final[typing.FrozenSet[str]] = frozenset(
+    ("hikari.internal.cache", "hikari.internal.collections")
+)
+
+
+def _is_entity_module(module_name: str) -> bool:
+    if module_name in _INTERNAL_ENTITY_MODULES:
+        return True
+
+    return module_name.startswith("hikari.") and not module_name.startswith(_ENTITY_MODULE_EXCLUDES)
+
+
+def _chunks(entries: typing.Iterable[_T], /) -> typing.Iterator[typing.List[_T]]:
+    iterator = iter(entries)
+    while chunk := list(itertools.islice(iterator, _ENTITIES_PER_FRAME)):
+        yield chunk
+
+
+def _reference_key(cell: cache_utility.RefCell[typing.Any]) -> typing.Optional[_Key]:
+    value = cell.object
+    if type(value) is cache_utility.MemberData:
+        return (_MEMBER, value.guild_id, value.user.object.id)
+
+    if isinstance(value, users.User):
+        return (_USER, value.id)
+
+    if isinstance(value, emojis.CustomEmoji):
+        return (_EMOJI, value.id)
+
+    return None
+
+
+class _Pickler(pickle.Pickler):
+    __slots__: typing.Sequence[str] = ("_app", "_references")
+
+    def __init__(self, file: typing.IO[bytes], encoder: SnapshotEncoder) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._app = encoder.app
+        self._references = encoder.references
+
+    def persistent_id(self, obj: typing.Any) -> typing.Any:
+        if obj is self._app:
+            return _APP_ID
+
+        if type(obj) is not cache_utility.RefCell or (key := _reference_key(obj)) is None:
+            return None
+
+        self._references.setdefault(key, obj)
+        return key
+
+
+class _Unpickler(pickle.Unpickler):  # nosec
+    __slots__: typing.Sequence[str] = ("_decoder",)
+
+    def __init__(self, file: typing.IO[bytes], decoder: SnapshotDecoder) -> None:
+        super().__init__(file)
+        self._decoder = decoder
+
+    def persistent_load(self, pid: typing.Any) -> typing.Any:
+        if pid == _APP_ID:
+            return self._decoder.app
+
+        if isinstance(pid, tuple) and pid and pid[0] in (_USER, _EMOJI, _MEMBER):
+            cell = self._decoder.get_cell(pid)
+            cell.ref_count += 1
+            return cell
+
+        raise pickle.UnpicklingError(f"Unknown persistent ID {pid!r}")
+
+    def find_class(self, module_name: str, name: str) -> typing.Any:
+        if (module_name, name) in _ALLOWED_GLOBALS:
+            return super().find_class(module_name, name)
+
+        # Only classes from modules which are already imported are looked up, so that unpickling
+        # can't import anything or get hold of the functions and modules these modules use.
+        if _is_entity_module(module_name) and (module := sys.modules.get(module_name)) is not None:
+            value = getattr(module, name, None)
+            if isinstance(value, type) and value.__module__ == module_name and value.__qualname__ == name:
+                return value
+
+        raise pickle.UnpicklingError(f"Global {module_name}.{name} is not allowed in a snapshot")
+
+
+class SnapshotEncoder:
+    """Encoder for the frames of a cache snapshot.
+
+    The `write` methods do blocking I/O, so they should be called from an
+    executor.
+
+    Parameters
+    ----------
+    app
+        The app the cached entities are bound to. It is replaced with a
+        placeholder in the snapshot.
+    file
+        The file to write the frames to, positioned after the header.
+    """
+
+    __slots__: typing.Sequence[str] = ("app", "references", "_file", "_written_members")
+
+    app: traits.RESTAware
+    """The app the cached entities are bound to."""
+
+    references: typing.Dict[_Key, cache_utility.RefCell[typing.Any]]
+    """The shared cells referred to by the encoded frames."""
+
+    def __init__(self, app: traits.RESTAware, file: typing.IO[bytes]) -> None:
+        self.app = app
+        self.references = {}
+        self._file = file
+        self._written_members: typing.Set[_Key] = set()
+
+    def encode(self, kind: int, value: typing.Any, /) -> bytes:
+        """Encode a frame.
+
+        Parameters
+        ----------
+        kind
+            The kind of the frame.
+        value
+            The value to store in the frame.
+
+        Returns
+        -------
+        bytes
+            The encoded frame.
+        """
+        buffer = io.BytesIO()
+        buffer.write(_FRAME.pack(kind, 0))
+        _Pickler(buffer, self).dump(value)
+        buffer.seek(0)
+        buffer.write(_FRAME.pack(kind, len(buffer.getbuffer()) - _FRAME.size))
+        return buffer.getvalue()
+
+    def write(self, kind: int, value: typing.Any, /) -> None:
+        """Encode a frame and write it to the file.
+
+        Parameters
+        ----------
+        kind
+            The kind of the frame.
+        value
+            The value to store in the frame.
+        """
+        self._file.write(self.encode(kind, value))
+
+    def write_members(
+        self,
+        guild_id: snowflakes.Snowflake,
+        members: typing.Iterable[typing.Tuple[snowflakes.Snowflake, cache_utility.MemberData]],
+    ) -> None:
+        """Encode the member frames of a guild record and write them to the file.
+
+        Parameters
+        ----------
+        guild_id
+            The ID of the guild.
+        members
+            The user IDs and data of the members of the guild record.
+        """
+        for chunk in _chunks(members):
+            self._written_members.update((_MEMBER, guild_id, user_id) for user_id, _ in chunk)
+            self.write(MEMBERS, (guild_id, chunk))
+
+    def write_presences(
+        self, guild_id: snowflakes.Snowflake, presences: typing.Iterable[cache_utility.MemberPresenceData]
+    ) -> None:
+        """Encode the presence frames of a guild record and write them to the file.
+
+        Parameters
+        ----------
+        guild_id
+            The ID of the guild.
+        presences
+            The presences of the guild record.
+        """
+        for chunk in _chunks(presences):
+            self.write(PRESENCES, (guild_id, chunk))
+
+    def write_references(self) -> None:
+        """Encode the frames of the cells referred to by the other frames and write them to the file.
+
+        This must be done after every other frame was written, and finishes
+        the snapshot.
+        """
+        # Members may refer to users, so they have to be encoded first
+        detached = [
+            (key, cell.object)
+            for key, cell in self.references.items()
+            if key[0] == _MEMBER and key not in self._written_members
+        ]
+        for kind, entries in (
+            (_DETACHED_MEMBERS, detached),
+            (_USERS, [(key, cell.object) for key, cell in self.references.items() if key[0] == _USER]),
+            (_UNKNOWN_EMOJIS, [(key, cell.object) for key, cell in self.references.items() if key[0] == _EMOJI]),
+        ):
+            for chunk in _chunks(entries):
+                self.write(kind, chunk)
+
+        self._file.write(_FRAME.pack(END, 0))
+
+
+class SnapshotDecoder:
+    """Decoder for the frames of a cache snapshot.
+
+    !!! warning
+        Snapshots are loaded with [`pickle`][]. While only hikari's entity
+        classes can be unpickled, they should still only be loaded from
+        trusted files.
+
+    Parameters
+    ----------
+    app
+        The app to bind the loaded entities to.
+    """
+
+    __slots__: typing.Sequence[str] = ("app", "is_complete", "_cells")
+
+    app: traits.RESTAware
+    """The app to bind the loaded entities to."""
+
+    is_complete: bool
+    """Whether the end frame was decoded."""
+
+    def __init__(self, app: traits.RESTAware) -> None:
+        self.app = app
+        self.is_complete = False
+        self._cells: typing.Dict[_Key, cache_utility.RefCell[typing.Any]] = {}
+
+    @property
+    def users(self) -> typing.Mapping[snowflakes.Snowflake, cache_utility.RefCell[users.User]]:
+        """The user cells referred to by the decoded frames."""
+        return {key[1]: cell for key, cell in self._cells.items() if key[0] == _USER}
+
+    @property
+    def unknown_emojis(self) -> typing.Mapping[snowflakes.Snowflake, cache_utility.RefCell[emojis.CustomEmoji]]:
+        """The unknown custom emoji cells referred to by the decoded frames."""
+        return {key[1]: cell for key, cell in self._cells.items() if key[0] == _EMOJI}
+
+    def get_cell(self, key: _Key, /) -> cache_utility.RefCell[typing.Any]:
+        """Get a shared cell.
+
+        The contents of the cell are filled in once its own frame is decoded.
+
+        Parameters
+        ----------
+        key
+            The key of the cell.
+
+        Returns
+        -------
+        hikari.internal.cache.RefCell[typing.Any]
+            The cell.
+        """
+        try:
+            return self._cells[key]
+        except KeyError:
+            cell = self._cells[key] = cache_utility.RefCell(None)
+            return cell
+
+    def decode(self, kind: int, payload: bytes, /) -> typing.Any:
+        """Decode a frame.
+
+        The frames of the referred to cells are consumed by the decoder.
+
+        Parameters
+        ----------
+        kind
+            The kind of the frame.
+        payload
+            The payload of the frame.
+
+        Returns
+        -------
+        typing.Any
+            The value stored in the frame. For [`MEMBERS`][] frames, this is
+            the ID of the guild and the user IDs and cells of the members.
+
+        Raises
+        ------
+        ValueError
+            If the snapshot is invalid.
+        """
+        if self.is_complete:
+            raise ValueError("Snapshot has frames after its end")
+
+        if kind == END:
+            missing = sum(cell.object is None for cell in self._cells.values())
+            if missing:
+                raise ValueError(f"Snapshot is missing {missing} referenced entities")
+
+            self.is_complete = True
+            return None
+
+        value = _Unpickler(io.BytesIO(payload), self).load()
+
+        if kind == MEMBERS:
+            guild_id, members = value
+            cells = []
+            for user_id, member in members:
+                cell = self.get_cell((_MEMBER, guild_id, user_id))
+                cell.object = member
+                cells.append((user_id, cell))
+
+            return guild_id, cells
+
+        if kind in (_DETACHED_MEMBERS, _USERS, _UNKNOWN_EMOJIS):
+            for key, entity in value:
+                self.get_cell(key).object = entity
+
+        return value
+
+    def read(self, file: typing.IO[bytes], /) -> typing.Tuple[int, typing.Any]:
+        """Read and decode the next frame of a snapshot.
+
+        This does blocking I/O, so it should be called from an executor.
+
+        Parameters
+        ----------
+        file
+            The file to read from, positioned at the start of a frame.
+
+        Returns
+        -------
+        typing.Tuple[int, typing.Any]
+            The kind of the frame and the value stored in it, as returned
+            by [`hikari.internal.cache_snapshot.SnapshotDecoder.decode`][].
+
+        Raises
+        ------
+        ValueError
+            If the snapshot is invalid.
+        """
+        kind, payload = read_frame(file)
+        return kind, self.decode(kind, payload)
+
+
+def read_header(file: typing.IO[bytes], /) -> None:
+    """Read and check the header of a snapshot.
+
+    Parameters
+    ----------
+    file
+        The file to read from, positioned at its start.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a snapshot or was written by another version of
+        hikari.
+    """
+    if file.read(len(_MAGIC)) != _MAGIC:
+        raise ValueError("File is not a cache snapshot")
+
+    length = file.read(1)
+    version = file.read(length[0]) if length else b""
+    if version != _VERSION:
+        raise ValueError(
+            f"Snapshot was written by hikari {version.decode('ascii', 'replace')}, not {about.__version__}"
+        )
+
+
+def read_frame(file: typing.IO[bytes], /) -> typing.Tuple[int, bytes]:
+    """Read the next frame of a snapshot.
+
+    Parameters
+    ----------
+    file
+        The file to read from, positioned at the start of a frame.
+
+    Returns
+    -------
+    typing.Tuple[int, bytes]
+        The kind and payload of the frame.
+
+    Raises
+    ------
+    ValueError
+        If the snapshot is truncated.
+    """
+    header = file.read(_FRAME.size)
+    if len(header) != _FRAME.size:
+        raise ValueError("Snapshot is truncated")
+
+    kind, length = _FRAME.unpack(header)
+    payload = file.read(length)
+    if len(payload) != length:
+        raise ValueError("Snapshot is truncated")
+
+    return kind, payload
@@ -30,17 +30,22 @@
     "ExtendedMutableMapping",
     "FreezableDict",
     "LimitedCapacityCacheMap",
+    "LRUCacheMap",
+    "TTLCacheMap",
+    "TinyLFUCacheMap",
     "get_index_or_slice",
 )
 
 import abc
 import array
 import bisect
+import collections as collections_
 import itertools
 import sys
 import typing
 
 from hikari import snowflakes
+from hikari.internal import time
 
 if typing.TYPE_CHECKING:
     from typing_extensions import Self
@@ -166,7 +171,7 @@ def __init__(
         limit: int,
         on_expire: typing.Optional[typing.Callable[[ValueT], None]] = None,
     ) -> None:
-        self._data: typing.Dict[KeyT, ValueT] = source or {}
+        self._data: typing.Dict[KeyT, ValueT] = {} if source is None else source
         self._limit = limit
         self._on_expire = on_expire
         self._garbage_collect()
@@ -180,12 +185,15 @@ def copy(self) -> LimitedCapacityCacheMap[KeyT, ValueT]:
     def freeze(self) -> typing.Dict[KeyT, ValueT]:
         return self._data.copy()
 
+    def _evict(self, key: KeyT) -> None:
+        value = self._data.pop(key)
+
+        if self._on_expire:
+            self._on_expire(value)
+
     def _garbage_collect(self) -> None:
         while len(self._data) > self._limit:
-            value = self._data.pop(next(iter(self._data)))
-
-            if self._on_expire:
-                self._on_expire(value)
+            self._evict(next(iter(self._data)))
 
     def __delitem__(self, key: KeyT) -> None:
         del self._data[key]
@@ -204,6 +212,440 @@ def __setitem__(self, key: KeyT, value: ValueT) -> None:
         self._garbage_collect()
 
 
+class _StatisticsCacheMap(LimitedCapacityCacheMap[KeyT, ValueT]):
+    """Base class of the capacity-limited mappings which count how well they perform.
+
+    Key lookups are counted in `hits` and `misses`, while entries removed by
+    the eviction policy are counted in `evictions`. This is kept out of
+    [`LimitedCapacityCacheMap`][] so its lookups stay as cheap as a dict's.
+    """
+
+    __slots__: typing.Sequence[str] = ("_evictions", "_hits", "_misses")
+
+    def __init__(
+        self,
+        source: typing.Optional[typing.Dict[KeyT, ValueT]] = None,
+        /,
+        *,
+        limit: int,
+        on_expire: typing.Optional[typing.Callable[[ValueT], None]] = None,
+    ) -> None:
+        self._evictions = 0
+        self._hits = 0
+        self._misses = 0
+        super().__init__(source, limit=limit, on_expire=on_expire)
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries which have been removed by the eviction policy."""
+        return self._evictions
+
+    @property
+    def hits(self) -> int:
+        """Number of key lookups which found an entry."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of key lookups which didn't find an entry."""
+        return self._misses
+
+    def items(self) -> typing.ItemsView[KeyT, ValueT]:
+        # Iterating over the entries shouldn't count as looking them up.
+        return self._data.items()
+
+    def values(self) -> typing.ValuesView[ValueT]:
+        return self._data.values()
+
+    def _evict(self, key: KeyT) -> None:
+        self._evictions += 1
+        super()._evict(key)
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        try:
+            value = self._data[key]
+
+        except KeyError:
+            self._misses += 1
+            raise
+
+        self._hits += 1
+        return value
+
+
+class LRUCacheMap(_StatisticsCacheMap[KeyT, ValueT]):
+    """Implementation of a capacity-limited least-recently-used mapping.
+
+    This will start removing the entries which were least recently looked up
+    or set after it's maximum capacity is reached as new entries are added.
+
+    Parameters
+    ----------
+    source
+        A source dictionary of keys to values to create this from.
+    limit
+        The limit for how many objects should be stored by this mapping before
+        it starts removing the least recently used entries.
+    on_expire
+        A function to call each time an item is garbage collected from this
+        map. This should take one positional argument of the same type stored
+        in this mapping as the value and should return [`None`][].
+
+        This will always be called after the entry has been removed.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    _data: collections_.OrderedDict[KeyT, ValueT]
+
+    def __init__(
+        self,
+        source: typing.Optional[typing.Dict[KeyT, ValueT]] = None,
+        /,
+        *,
+        limit: int,
+        on_expire: typing.Optional[typing.Callable[[ValueT], None]] = None,
+    ) -> None:
+        super().__init__(collections_.OrderedDict(source or ()), limit=limit, on_expire=on_expire)
+
+    def copy(self) -> LRUCacheMap[KeyT, ValueT]:
+        return LRUCacheMap(self._data.copy(), limit=self._limit, on_expire=self._on_expire)
+
+    def freeze(self) -> typing.Dict[KeyT, ValueT]:
+        return dict(self._data)
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        value = super().__getitem__(key)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._garbage_collect()
+
+
+class TTLCacheMap(_StatisticsCacheMap[KeyT, ValueT]):
+    """Implementation of a capacity-limited mapping with expiring entries.
+
+    Entries expire once `ttl` seconds have passed since they were last set,
+    and the least recently set entries are removed first once it's maximum
+    capacity is reached.
+
+    Parameters
+    ----------
+    source
+        A source dictionary of keys to values to create this from.
+    limit
+        The limit for how many objects should be stored by this mapping before
+        it starts removing the oldest entries.
+    ttl
+        How long entries should be kept for in seconds.
+    on_expire
+        A function to call each time an item is garbage collected from this
+        map. This should take one positional argument of the same type stored
+        in this mapping as the value and should return [`None`][].
+
+        This will always be called after the entry has been removed.
+    """
+
+    __slots__: typing.Sequence[str] = ("_expiries", "_ttl")
+
+    _data: collections_.OrderedDict[KeyT, ValueT]
+
+    def __init__(
+        self,
+        source: typing.Optional[typing.Dict[KeyT, ValueT]] = None,
+        /,
+        *,
+        limit: int,
+        ttl: float,
+        on_expire: typing.Optional[typing.Callable[[ValueT], None]] = None,
+    ) -> None:
+        expires_at = time.monotonic() + ttl
+        self._ttl = ttl
+        self._expiries: collections_.OrderedDict[KeyT, float] = collections_.OrderedDict(
+            (key, expires_at) for key in source or ()
+        )
+        super().__init__(collections_.OrderedDict(source or ()), limit=limit, on_expire=on_expire)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._expiries.clear()
+
+    def copy(self) -> TTLCacheMap[KeyT, ValueT]:
+        result = TTLCacheMap(self._data.copy(), limit=self._limit, ttl=self._ttl, on_expire=self._on_expire)
+        result._expiries = self._expiries.copy()
+        return result
+
+    def freeze(self) -> typing.Dict[KeyT, ValueT]:
+        self._garbage_collect()
+        return dict(self._data)
+
+    def items(self) -> typing.ItemsView[KeyT, ValueT]:
+        self._garbage_collect()
+        return super().items()
+
+    def values(self) -> typing.ValuesView[ValueT]:
+        self._garbage_collect()
+        return super().values()
+
+    def _evict(self, key: KeyT) -> None:
+        del self._expiries[key]
+        super()._evict(key)
+
+    def _garbage_collect(self) -> None:
+        now = time.monotonic()
+        # Entries are kept in the order they were set in, so they expire in order.
+        while self._expiries:
+            key, expires_at = next(iter(self._expiries.items()))
+            if expires_at > now:
+                break
+
+            self._evict(key)
+
+        super()._garbage_collect()
+
+    def __contains__(self, key: typing.Any) -> bool:
+        expires_at = self._expiries.get(key)
+        return expires_at is not None and expires_at > time.monotonic()
+
+    def __delitem__(self, key: KeyT) -> None:
+        del self._data[key]
+        del self._expiries[key]
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        expires_at = self._expiries.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._evict(key)
+
+        return super().__getitem__(key)
+
+    def __iter__(self) -> typing.Iterator[KeyT]:
+        self._garbage_collect()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._garbage_collect()
+        return super().__len__()
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._expiries[key] = time.monotonic() + self._ttl
+        self._expiries.move_to_end(key)
+        self._garbage_collect()
+
+
+_GOLDEN_RATIO_64: typing.Final[int] = 0x9E3779B97F4A7C15
+_UINT64_MASK: typing.Final[int] = 0xFFFFFFFFFFFFFFFF
+_MAX_FREQUENCY: typing.Final[int] = 15
+_HALVE_COUNTS: typing.Final[bytes] = bytes(count >> 1 for count in range(256))
+
+
+class _FrequencySketch:
+    """A count-min sketch of saturating counters used to estimate how often keys are used.
+
+    The counters are halved once the sketch has seen enough additions, so
+    the estimates favour recent use.
+    """
+
+    __slots__: typing.Sequence[str] = ("_additions", "_mask", "_sample_size", "_table", "_width")
+
+    def __init__(self, capacity: int) -> None:
+        # Four counters per cached entry keeps collisions between rarely used keys low.
+        self._width = 1 << max(4 * capacity - 1, 15).bit_length()
+        self._mask = self._width - 1
+        self._sample_size = 10 * self._width
+        self._additions = 0
+        self._table = bytearray(4 * self._width)
+
+    def _indexes(self, key: typing.Hashable) -> typing.Tuple[int, int, int, int]:
+        # Derive the index for each row from one mixed hash (Kirsch-Mitzenmacher double hashing).
+        mixed = (hash(key) * _GOLDEN_RATIO_64) & _UINT64_MASK
+        first = mixed >> 32
+        second = mixed | 1
+        mask = self._mask
+        width = self._width
+        return (
+            first & mask,
+            width + ((first + second) & mask),
+            2 * width + ((first + 2 * second) & mask),
+            3 * width + ((first + 3 * second) & mask),
+        )
+
+    def clear(self) -> None:
+        self._additions = 0
+        self._table = bytearray(len(self._table))
+
+    def copy(self) -> _FrequencySketch:
+        result = _FrequencySketch(0)
+        result._additions = self._additions
+        result._mask = self._mask
+        result._sample_size = self._sample_size
+        result._table = self._table[:]
+        result._width = self._width
+        return result
+
+    def frequency(self, key: typing.Hashable) -> int:
+        table = self._table
+        first, second, third, fourth = self._indexes(key)
+        return min(table[first], table[second], table[third], table[fourth])
+
+    def increment(self, key: typing.Hashable) -> None:
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < _MAX_FREQUENCY:
+                table[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = table.translate(_HALVE_COUNTS)
+            self._additions //= 2
+
+
+class TinyLFUCacheMap(_StatisticsCacheMap[KeyT, ValueT]):
+    """Implementation of a capacity-limited W-TinyLFU mapping.
+
+    New entries go into a small least-recently-used window. Entries leaving the
+    window are only admitted into the main segmented LRU area if they have been
+    used more often than the entry they would replace, with how often keys are
+    used being estimated by a compact frequency sketch. This keeps frequently
+    used entries cached through bursts of entries which are only used once.
+
+    Parameters
+    ----------
+    source
+        A source dictionary of keys to values to create this from.
+    limit
+        The limit for how many objects should be stored by this mapping.
+    on_expire
+        A function to call each time an item is garbage collected from this
+        map. This should take one positional argument of the same type stored
+        in this mapping as the value and should return [`None`][].
+
+        This will always be called after the entry has been removed.
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_probation",
+        "_protected",
+        "_protected_limit",
+        "_sketch",
+        "_window",
+        "_window_limit",
+    )
+
+    def __init__(
+        self,
+        source: typing.Optional[typing.Dict[KeyT, ValueT]] = None,
+        /,
+        *,
+        limit: int,
+        on_expire: typing.Optional[typing.Callable[[ValueT], None]] = None,
+    ) -> None:
+        self._window_limit = min(limit, max(1, limit // 100))
+        self._protected_limit = (limit - self._window_limit) * 4 // 5
+        self._probation: collections_.OrderedDict[KeyT, None] = collections_.OrderedDict()
+        self._protected: collections_.OrderedDict[KeyT, None] = collections_.OrderedDict()
+        self._sketch = _FrequencySketch(limit)
+        self._window: collections_.OrderedDict[KeyT, None] = collections_.OrderedDict()
+        super().__init__(limit=limit, on_expire=on_expire)
+
+        for key, value in (source or {}).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._window.clear()
+        self._sketch.clear()
+
+    def copy(self) -> TinyLFUCacheMap[KeyT, ValueT]:
+        result: TinyLFUCacheMap[KeyT, ValueT] = TinyLFUCacheMap(limit=self._limit, on_expire=self._on_expire)
+        result._data = self._data.copy()
+        result._probation = self._probation.copy()
+        result._protected = self._protected.copy()
+        result._sketch = self._sketch.copy()
+        result._window = self._window.copy()
+        return result
+
+    def _garbage_collect(self) -> None:
+        # Entries are removed as they're admitted from the window.
+        return None
+
+    def _admit(self, candidate: KeyT) -> None:
+        if len(self._probation) + len(self._protected) < self._limit - self._window_limit:
+            self._probation[candidate] = None
+            return
+
+        victims = self._probation or self._protected
+        if not victims:
+            self._evict(candidate)
+            return
+
+        victim = next(iter(victims))
+        if self._sketch.frequency(candidate) > self._sketch.frequency(victim):
+            del victims[victim]
+            self._evict(victim)
+            self._probation[candidate] = None
+
+        else:
+            self._evict(candidate)
+
+    def _touch(self, key: KeyT) -> None:
+        if key in self._window:
+            self._window.move_to_end(key)
+
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+
+        else:
+            del self._probation[key]
+            self._protected[key] = None
+
+            if len(self._protected) > self._protected_limit:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def __delitem__(self, key: KeyT) -> None:
+        del self._data[key]
+
+        if key in self._window:
+            del self._window[key]
+
+        elif key in self._probation:
+            del self._probation[key]
+
+        else:
+            del self._protected[key]
+
+    def __getitem__(self, key: KeyT) -> ValueT:
+        self._sketch.increment(key)
+        value = super().__getitem__(key)
+        self._touch(key)
+        return value
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        self._sketch.increment(key)
+
+        if key in self._data:
+            self._data[key] = value
+            self._touch(key)
+            return
+
+        self._data[key] = value
+        self._window[key] = None
+
+        if len(self._window) > self._window_limit:
+            candidate, _ = self._window.popitem(last=False)
+            self._admit(candidate)
+
+
 # TODO: can this be immutable?
 class SnowflakeSet(typing.MutableSet[snowflakes.Snowflake]):
     r"""Set of [`hikari.snowflakes.Snowflake`][] objects.
@@ -32,12 +32,15 @@
     "default_json_loads",
     "default_json_dumps",
     "JSONObjectBuilder",
+    "JSONArrayParser",
     "JSONPayload",
     "StringMapBuilder",
     "URLEncodedFormBuilder",
+    "stream_json_array",
 )
 
 import datetime
+import re
 import typing
 
 import aiohttp
@@ -97,6 +100,17 @@
 _APPLICATION_OCTET_STREAM: typing.Final[str] = "application/octet-stream"
 _JSON_CONTENT_TYPE: typing.Final[str] = "application/json"
 _UTF_8: typing.Final[str] = "utf-8"
+_JSON_ARRAY_TOKEN: typing.Final[typing.Pattern[bytes]] = re.compile(rb'[\[\]{},"]')
+_JSON_STRING_END: typing.Final[typing.Pattern[bytes]] = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_JSON_NESTED_SKIP: typing.Final[typing.Pattern[bytes]] = re.compile(
+    rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL
+)
+_OPENING_TOKENS: typing.Final[bytes] = b"[{"
+_OPEN_BRACKET: typing.Final[int] = ord("[")
+_CLOSE_BRACKET: typing.Final[int] = ord("]")
+_CLOSE_BRACE: typing.Final[int] = ord("}")
+_COMMA: typing.Final[int] = ord(",")
+_QUOTE: typing.Final[int] = ord('"')
 
 default_json_dumps: JSONEncoder
 """Default json encoder to use."""
@@ -129,6 +143,161 @@ def __init__(self, value: typing.Any, dumps: JSONEncoder = default_json_dumps) -
         super().__init__(dumps(value), content_type=_JSON_CONTENT_TYPE, encoding=_UTF_8)
 
 
+@typing.final
+class JSONArrayParser:
+    """Incremental parser for a JSON array which decodes each element as soon as it is complete.
+
+    This allows decoding large array payloads while they are being received,
+    without keeping the whole payload or the whole decoded array in memory.
+
+    Parameters
+    ----------
+    loads
+        The JSON decoder to decode each element with.
+    """
+
+    __slots__: typing.Sequence[str] = ("_buffer", "_count", "_depth", "_finished", "_loads", "_position", "_start")
+
+    def __init__(self, loads: JSONDecoder = default_json_loads) -> None:
+        self._buffer = b""
+        self._count = 0
+        self._depth = 0
+        self._finished = False
+        self._loads = loads
+        self._position = 0
+        self._start = 0
+
+    def feed(self, data: bytes) -> typing.List[JSONish]:
+        """Feed the next chunk of the payload to the parser.
+
+        Parameters
+        ----------
+        data
+            The next chunk of the payload.
+
+        Returns
+        -------
+        typing.List[JSONish]
+            The elements which were completed by this chunk.
+
+        Raises
+        ------
+        ValueError
+            If the payload is not a valid JSON array.
+        """
+        buffer = self._buffer + data
+        depth = self._depth
+        position = self._position
+        start = self._start
+        elements: typing.List[JSONish] = []
+
+        while True:
+            if depth > 1:
+                # Only brackets matter inside of an element, so skip over anything else (including strings)
+                skipped = _JSON_NESTED_SKIP.match(buffer, position)
+                assert skipped is not None
+                position = skipped.end()
+                if position == len(buffer) or buffer[position] == _QUOTE:
+                    # The element continues in the next chunk
+                    break
+
+                depth += 1 if buffer[position] in _OPENING_TOKENS else -1
+                position += 1
+                continue
+
+            match = _JSON_ARRAY_TOKEN.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+
+            index = match.start()
+            token = buffer[index]
+
+            if self._finished or (depth == 0 and (token != _OPEN_BRACKET or buffer[:index].strip())):
+                raise ValueError("Expected a JSON array")
+
+            if token == _QUOTE:
+                string_end = _JSON_STRING_END.match(buffer, index + 1)
+                if string_end is None:
+                    # The string continues in the next chunk
+                    position = index
+                    break
+
+                position = string_end.end()
+                continue
+
+            position = index + 1
+            if token in _OPENING_TOKENS:
+                depth += 1
+                if depth == 1:
+                    start = position
+
+            elif token == _CLOSE_BRACE:
+                raise ValueError("Expected a JSON array")
+
+            else:
+                element = buffer[start:index].strip()
+                if element:
+                    elements.append(self._loads(element))
+                    self._count += 1
+                elif token == _COMMA or self._count:
+                    raise ValueError("Empty element in JSON array")
+
+                start = position
+                if token == _CLOSE_BRACKET:
+                    depth = 0
+                    self._finished = True
+
+        # Only keep the element currently being received (or anything trailing the array)
+        keep = start if depth or self._finished else position
+        self._buffer = buffer[keep:]
+        self._depth = depth
+        self._position = position - keep
+        self._start = max(0, start - keep)
+        return elements
+
+    def close(self) -> None:
+        """Check that the whole payload was received.
+
+        Raises
+        ------
+        ValueError
+            If the payload ended before the end of the array.
+        """
+        if not self._finished or self._buffer.strip():
+            raise ValueError("Incomplete JSON array")
+
+
+async def stream_json_array(
+    stream: aiohttp.StreamReader, loads: JSONDecoder = default_json_loads
+) -> typing.AsyncIterator[JSONish]:
+    """Decode a JSON array from a stream, yielding each element as soon as it is received.
+
+    Parameters
+    ----------
+    stream
+        The stream to read the payload from.
+    loads
+        The JSON decoder to decode each element with.
+
+    Returns
+    -------
+    typing.AsyncIterator[JSONish]
+        An async iterator of the decoded elements.
+
+    Raises
+    ------
+    ValueError
+        If the payload is not a valid JSON array.
+    """
+    parser = JSONArrayParser(loads)
+    async for chunk in stream.iter_any():
+        for element in parser.feed(chunk):
+            yield element
+
+    parser.close()
+
+
 @typing.final
 class URLEncodedFormBuilder:
     """Helper class to generate [`aiohttp.FormData`][]."""
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Encoder and decoder for the Erlang external term format used by the gateway.
+
+Terms are converted to and from the same structures the JSON encoder and
+decoder use, so the rest of the library does not need to know which of the
+two formats a shard is using:
+
+- Maps become [`dict`][]s, with atom and binary keys decoded as [`str`][].
+- Lists and tuples become [`list`][]s.
+- Binaries become [`str`][]s.
+- The `nil`, `true` and `false` atoms become [`None`][], [`True`][] and
+  [`False`][], while any other atom becomes a [`str`][].
+- Integers (including big integers) become [`int`][]s. This means that, unlike
+  JSON, snowflakes are received as integers.
+"""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("dumps", "loads")
+
+import struct
+import sys
+import typing
+import zlib
+
+_VERSION: typing.Final[int] = 131
+_NEW_FLOAT_EXT: typing.Final[int] = 70
+_COMPRESSED: typing.Final[int] = 80
+_SMALL_INTEGER_EXT: typing.Final[int] = 97
+_INTEGER_EXT: typing.Final[int] = 98
+_FLOAT_EXT: typing.Final[int] = 99
+_ATOM_EXT: typing.Final[int] = 100
+_SMALL_TUPLE_EXT: typing.Final[int] = 104
+_LARGE_TUPLE_EXT: typing.Final[int] = 105
+_NIL_EXT: typing.Final[int] = 106
+_STRING_EXT: typing.Final[int] = 107
+_LIST_EXT: typing.Final[int] = 108
+_BINARY_EXT: typing.Final[int] = 109
+_SMALL_BIG_EXT: typing.Final[int] = 110
+_LARGE_BIG_EXT: typing.Final[int] = 111
+_SMALL_ATOM_EXT: typing.Final[int] = 115
+_MAP_EXT: typing.Final[int] = 116
+_ATOM_UTF8_EXT: typing.Final[int] = 118
+_SMALL_ATOM_UTF8_EXT: typing.Final[int] = 119
+
+_U16: typing.Final[struct.Struct] = struct.Struct(">H")
+_U32: typing.Final[struct.Struct] = struct.Struct(">I")
+_I32: typing.Final[struct.Struct] = struct.Struct(">i")
+_F64: typing.Final[struct.Struct] = struct.Struct(">d")
+_MIN_I32: typing.Final[int] = -(2**31)
+_MAX_I32: typing.Final[int] = 2**31 - 1
+
+_TRUE_ATOM: typing.Final[bytes] = bytes((_SMALL_ATOM_UTF8_EXT, 4)) + b"true"
+_FALSE_ATOM: typing.Final[bytes] = bytes((_SMALL_ATOM_UTF8_EXT, 5)) + b"false"
+_NIL_ATOM: typing.Final[bytes] = bytes((_SMALL_ATOM_UTF8_EXT, 3)) + b"nil"
+
+# Atoms are almost exclusively used as map keys and for the "nil", "true" and "false"
+# values, so the set of atoms seen is tiny. Caching them avoids decoding and interning
+# the same few names over and over again.
+_atoms: typing.Dict[bytes, typing.Any] = {b"nil": None, b"true": True, b"false": False}
+
+
+def _decode_atom(name: bytes) -> typing.Any:
+    try:
+        return _atoms[name]
+    except KeyError:
+        atom = _atoms[name] = sys.intern(str(name, "utf-8"))
+        return atom
+
+
+def _decode(data: bytes, offset: int) -> typing.Tuple[typing.Any, int]:
+    tag = data[offset]
+    offset += 1
+
+    if tag == _BINARY_EXT:
+        size = _U32.unpack_from(data, offset)[0]
+        offset += 4
+        return str(data[offset : offset + size], "utf-8"), offset + size  # noqa: E203 - Whitespace before ":"
+
+    if tag == _MAP_EXT:
+        arity = _U32.unpack_from(data, offset)[0]
+        offset += 4
+        result = {}
+        for _ in range(arity):
+            key, offset = _decode(data, offset)
+            result[key], offset = _decode(data, offset)
+        return result, offset
+
+    if tag == _SMALL_INTEGER_EXT:
+        return data[offset], offset + 1
+
+    if tag == _SMALL_ATOM_UTF8_EXT or tag == _SMALL_ATOM_EXT:
+        size = data[offset]
+        offset += 1
+        return _decode_atom(data[offset : offset + size]), offset + size  # noqa: E203 - Whitespace before ":"
+
+    if tag == _INTEGER_EXT:
+        return _I32.unpack_from(data, offset)[0], offset + 4
+
+    if tag == _SMALL_BIG_EXT or tag == _LARGE_BIG_EXT:
+        if tag == _SMALL_BIG_EXT:
+            size = data[offset]
+            offset += 1
+        else:
+            size = _U32.unpack_from(data, offset)[0]
+            offset += 4
+
+        sign = data[offset]
+        offset += 1
+        value = int.from_bytes(data[offset : offset + size], "little")  # noqa: E203 - Whitespace before ":"
+        return -value if sign else value, offset + size
+
+    if tag == _LIST_EXT:
+        length = _U32.unpack_from(data, offset)[0]
+        offset += 4
+        items = [None] * length
+        for i in range(length):
+            items[i], offset = _decode(data, offset)
+
+        tail, offset = _decode(data, offset)
+        if tail != []:
+            raise ValueError("improper lists are not supported")
+
+        return items, offset
+
+    if tag == _NIL_EXT:
+        return [], offset
+
+    if tag == _NEW_FLOAT_EXT:
+        return _F64.unpack_from(data, offset)[0], offset + 8
+
+    if tag == _ATOM_UTF8_EXT or tag == _ATOM_EXT:
+        size = _U16.unpack_from(data, offset)[0]
+        offset += 2
+        return _decode_atom(data[offset : offset + size]), offset + size  # noqa: E203 - Whitespace before ":"
+
+    if tag == _STRING_EXT:
+        # Erlang encodes lists of small integers as "strings"
+        size = _U16.unpack_from(data, offset)[0]
+        offset += 2
+        return list(data[offset : offset + size]), offset + size  # noqa: E203 - Whitespace before ":"
+
+    if tag == _SMALL_TUPLE_EXT or tag == _LARGE_TUPLE_EXT:
+        if tag == _SMALL_TUPLE_EXT:
+            arity = data[offset]
+            offset += 1
+        else:
+            arity = _U32.unpack_from(data, offset)[0]
+            offset += 4
+
+        items = [None] * arity
+        for i in range(arity):
+            items[i], offset = _decode(data, offset)
+        return items, offset
+
+    if tag == _FLOAT_EXT:
+        return float(data[offset : offset + 31].rstrip(b"\x00")), offset + 31  # noqa: E203 - Whitespace before ":"
+
+    raise ValueError(f"unsupported ETF tag {tag}")
+
+
+def loads(data: typing.Union[str, bytes]) -> typing.Any:
+    """Decode an ETF payload.
+
+    Parameters
+    ----------
+    data
+        The payload to decode.
+
+    Returns
+    -------
+    typing.Any
+        The decoded payload.
+
+    Raises
+    ------
+    TypeError
+        If the payload is a [`str`][], as ETF is a binary format.
+    ValueError
+        If the payload is not valid ETF or contains unsupported terms.
+    """
+    if isinstance(data, str):
+        raise TypeError("ETF payloads must be bytes")
+
+    # Atoms are cached by their raw bytes, which requires the slices to be hashable
+    data = bytes(data)
+
+    try:
+        if data[0] != _VERSION:
+            raise ValueError(f"unsupported ETF version {data[0]}")
+
+        if data[1] == _COMPRESSED:
+            size = _U32.unpack_from(data, 2)[0]
+            data = zlib.decompress(data[6:], bufsize=size)
+            offset = 0
+        else:
+            offset = 1
+
+        result, offset = _decode(data, offset)
+
+    except (IndexError, struct.error, UnicodeDecodeError, zlib.error) as ex:
+        raise ValueError("malformed ETF payload") from ex
+
+    if offset != len(data):
+        raise ValueError("trailing data after ETF term")
+
+    return result
+
+
+def _encode(obj: typing.Any, buff: bytearray) -> None:
+    if isinstance(obj, str):
+        encoded = obj.encode("utf-8")
+        buff.append(_BINARY_EXT)
+        buff += _U32.pack(len(encoded))
+        buff += encoded
+
+    elif obj is None:
+        buff += _NIL_ATOM
+
+    # Must come before int, as bool is a subclass of it
+    elif obj is True:
+        buff += _TRUE_ATOM
+
+    elif obj is False:
+        buff += _FALSE_ATOM
+
+    elif isinstance(obj, int):
+        if 0 <= obj <= 255:
+            buff.append(_SMALL_INTEGER_EXT)
+            buff.append(obj)
+        elif _MIN_I32 <= obj <= _MAX_I32:
+            buff.append(_INTEGER_EXT)
+            buff += _I32.pack(obj)
+        else:
+            magnitude = abs(obj)
+            encoded = magnitude.to_bytes((magnitude.bit_length() + 7) // 8, "little")
+            if len(encoded) > 255:
+                raise ValueError("integer is too large to be encoded")
+
+            buff.append(_SMALL_BIG_EXT)
+            buff.append(len(encoded))
+            buff.append(obj < 0)
+            buff += encoded
+
+    elif isinstance(obj, float):
+        buff.append(_NEW_FLOAT_EXT)
+        buff += _F64.pack(obj)
+
+    elif isinstance(obj, typing.Mapping):
+        buff.append(_MAP_EXT)
+        buff += _U32.pack(len(obj))
+        for key, value in obj.items():
+            _encode(key, buff)
+            _encode(value, buff)
+
+    elif isinstance(obj, (list, tuple)):
+        if obj:
+            buff.append(_LIST_EXT)
+            buff += _U32.pack(len(obj))
+            for item in obj:
+                _encode(item, buff)
+
+        buff.append(_NIL_EXT)
+
+    elif isinstance(obj, (bytes, bytearray)):
+        buff.append(_BINARY_EXT)
+        buff += _U32.pack(len(obj))
+        buff += obj
+
+    else:
+        raise TypeError(f"cannot encode object of type {type(obj).__name__} to ETF")
+
+
+def dumps(obj: typing.Any) -> bytes:
+    """Encode an object to an ETF payload.
+
+    Parameters
+    ----------
+    obj
+        The object to encode.
+
+    Returns
+    -------
+    bytes
+        The encoded payload.
+
+    Raises
+    ------
+    TypeError
+        If the object contains a type that cannot be encoded.
+    """
+    buff = bytearray((_VERSION,))
+    _encode(obj, buff)
+    return bytes(buff)
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""A memory-mapped record store which can be shared between local processes."""
+
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("SharedRecordStore",)
+
+import mmap
+import os
+import pathlib
+import struct
+import typing
+
+_MAGIC: typing.Final[bytes] = b"HKSC"
+_VERSION: typing.Final[int] = 1
+_HEADER: typing.Final[struct.Struct] = struct.Struct("<4sHHQ")
+"""Magic, version, flags and the offset the written records end at."""
+_HEADER_SIZE: typing.Final[int] = 64
+_FLAGS_OFFSET: typing.Final[int] = 6
+_END_OFFSET: typing.Final[int] = 8
+_STALE_FLAG: typing.Final[int] = 1 << 0
+"""Set once a store file has been replaced by a compacted one."""
+_RECORD: typing.Final[struct.Struct] = struct.Struct("<IB3xQQ")
+"""Payload length, kind, key and group."""
+_DELETED: typing.Final[int] = 0x80
+_DEFAULT_CAPACITY: typing.Final[int] = 64 * 1024 * 1024
+
+_Entry = typing.Tuple[int, int, int]
+"""The offset and length of a record's payload and the record's group."""
+
+
+class SharedRecordStore:
+    """An append-only store of binary records backed by a memory-mapped file.
+
+    A single writer appends records to the file while any number of readers
+    in other processes on the same host map the same file and follow the
+    records as they're written. Records are identified by a kind and an
+    integer key, and may belong to an integer group (e.g. a guild ID) so
+    related records can be looked up together.
+
+    Writing a record for a key replaces the previous record for it. Once the
+    file is full, the writer copies the live records into a new file which
+    replaces the old one, and readers switch over to the new file the next
+    time they access the store.
+
+    !!! warning
+        Only one writer may use a store file at a time. The store should be
+        placed somewhere only trusted processes can write to, as the records
+        are trusted by the readers.
+
+    Use [`SharedRecordStore.create`][] and [`SharedRecordStore.open`][] to
+    make a store.
+    """
+
+    __slots__: typing.Sequence[str] = ("_file", "_groups", "_index", "_is_writer", "_map", "_path", "_position")
+
+    def __init__(self, path: pathlib.Path, /, *, is_writer: bool) -> None:
+        self._is_writer = is_writer
+        self._path = path
+        self._open_file()
+
+    def _open_file(self) -> None:
+        self._groups: typing.Dict[int, typing.Dict[int, typing.Set[int]]] = {}
+        self._index: typing.Dict[int, typing.Dict[int, _Entry]] = {}
+        self._position = _HEADER_SIZE
+        self._file = self._path.open("r+b" if self._is_writer else "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE if self._is_writer else mmap.ACCESS_READ)
+
+        magic, version, _, _ = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{str(self._path)!r} is not a shared record store")
+
+        self._read_records()
+
+    @classmethod
+    def create(
+        cls, path: typing.Union[str, os.PathLike[str]], /, *, capacity: int = _DEFAULT_CAPACITY
+    ) -> SharedRecordStore:
+        """Create a new store, replacing any existing store at the path, and open it for writing.
+
+        Parameters
+        ----------
+        path
+            The path of the store file.
+        capacity
+            The initial size of the store file in bytes.
+
+        Returns
+        -------
+        SharedRecordStore
+            The store, opened for writing.
+        """
+        path = pathlib.Path(path)
+        _write_store_file(path, [], capacity)
+        return cls(path, is_writer=True)
+
+    @classmethod
+    def open(cls, path: typing.Union[str, os.PathLike[str]], /) -> SharedRecordStore:
+        """Open an existing store for reading.
+
+        Parameters
+        ----------
+        path
+            The path of the store file.
+
+        Returns
+        -------
+        SharedRecordStore
+            The store, opened for reading.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the store file doesn't exist.
+        ValueError
+            If the file isn't a store file.
+        """
+        return cls(pathlib.Path(path), is_writer=False)
+
+    @property
+    def is_writer(self) -> bool:
+        """Whether this store was opened for writing."""
+        return self._is_writer
+
+    def close(self) -> None:
+        """Close the store."""
+        self._map.close()
+        self._file.close()
+
+    def get(self, kind: int, key: int, /) -> typing.Optional[bytes]:
+        """Get the payload of a record.
+
+        Parameters
+        ----------
+        kind
+            The kind of the record.
+        key
+            The key of the record.
+
+        Returns
+        -------
+        typing.Optional[bytes]
+            The record's payload, or [`None`][] if there is no record for the key.
+        """
+        self.refresh()
+        entry = self._index.get(kind, {}).get(key)
+        if entry is None:
+            return None
+
+        offset, length, _ = entry
+        return self._map[offset : offset + length]  # noqa: E203 - Whitespace before ":"
+
+    def get_group(self, kind: int, key: int, /) -> typing.Optional[int]:
+        """Get the group of a record.
+
+        Parameters
+        ----------
+        kind
+            The kind of the record.
+        key
+            The key of the record.
+
+        Returns
+        -------
+        typing.Optional[int]
+            The record's group, or [`None`][] if there is no record for the key.
+        """
+        self.refresh()
+        entry = self._index.get(kind, {}).get(key)
+        return entry[2] if entry else None
+
+    def keys(self, kind: int, /, *, group: typing.Optional[int] = None) -> typing.List[int]:
+        """Get the keys of the records of a kind.
+
+        Parameters
+        ----------
+        kind
+            The kind of the records.
+        group
+            If provided, only the keys of records in this group will be returned.
+
+        Returns
+        -------
+        typing.List[int]
+            The keys. These will be sorted when `group` is passed, otherwise
+            they'll be in the order their records were first written.
+        """
+        self.refresh()
+        if group is None:
+            return list(self._index.get(kind, ()))
+
+        return sorted(self._groups.get(kind, {}).get(group, ()))
+
+    def put(self, kind: int, key: int, payload: bytes, /, *, group: int = 0) -> None:
+        """Write a record, replacing any previous record for the key.
+
+        Parameters
+        ----------
+        kind
+            The kind of the record. This must be below `128`.
+        key
+            The unsigned 64-bit key of the record.
+        payload
+            The record's payload.
+        group
+            The unsigned 64-bit group of the record.
+
+        Raises
+        ------
+        RuntimeError
+            If the store wasn't opened for writing.
+        """
+        self._write(kind, key, group, payload)
+
+    def delete(self, kind: int, key: int, /) -> None:
+        """Delete a record.
+
+        Parameters
+        ----------
+        kind
+            The kind of the record.
+        key
+            The key of the record.
+
+        Raises
+        ------
+        RuntimeError
+            If the store wasn't opened for writing.
+        """
+        self._ensure_writer()
+        if key in self._index.get(kind, ()):
+            self._write(kind | _DELETED, key, 0, b"")
+
+    def clear(self) -> None:
+        """Delete all the records in the store.
+
+        Raises
+        ------
+        RuntimeError
+            If the store wasn't opened for writing.
+        """
+        self._ensure_writer()
+        self._index.clear()
+        self._groups.clear()
+        self._compact(0)
+
+    def refresh(self) -> None:
+        """Read any records which have been written since the store was last accessed.
+
+        This is done automatically when reading from the store.
+        """
+        if self._is_writer:
+            return
+
+        (flags,) = struct.unpack_from("<H", self._map, _FLAGS_OFFSET)
+        if flags & _STALE_FLAG:
+            self.close()
+            self._open_file()
+
+        else:
+            self._read_records()
+
+    def _apply(self, kind: int, key: int, group: int, offset: int, length: int) -> None:
+        if kind & _DELETED:
+            kind &= ~_DELETED
+            _, _, old_group = self._index[kind].pop(key)
+            self._groups[kind][old_group].discard(key)
+            return
+
+        index = self._index.setdefault(kind, {})
+        groups = self._groups.setdefault(kind, {})
+        if key in index:
+            groups[index[key][2]].discard(key)
+
+        index[key] = (offset, length, group)
+        groups.setdefault(group, set()).add(key)
+
+    def _compact(self, extra: int) -> None:
+        records = [
+            (kind, key, group, self._map[offset : offset + length])  # noqa: E203 - Whitespace before ":"
+            for kind, index in self._index.items()
+            for key, (offset, length, group) in index.items()
+        ]
+        used = sum(_RECORD.size + len(payload) for *_, payload in records)
+        capacity = max(len(self._map), 2 * (_HEADER_SIZE + used + extra))
+        self.close()
+        _write_store_file(self._path, records, capacity)
+        self._open_file()
+
+    def _ensure_writer(self) -> None:
+        if not self._is_writer:
+            raise RuntimeError("This store was not opened for writing")
+
+    def _read_records(self) -> None:
+        (end,) = struct.unpack_from("<Q", self._map, _END_OFFSET)
+        while self._position < end:
+            length, kind, key, group = _RECORD.unpack_from(self._map, self._position)
+            self._apply(kind, key, group, self._position + _RECORD.size, length)
+            self._position += _RECORD.size + length
+
+    def _write(self, kind: int, key: int, group: int, payload: bytes) -> None:
+        self._ensure_writer()
+        size = _RECORD.size + len(payload)
+        if self._position + size > len(self._map):
+            self._compact(size)
+
+        position = self._position
+        _RECORD.pack_into(self._map, position, len(payload), kind, key, group)
+        self._map[position + _RECORD.size : position + size] = payload  # noqa: E203 - Whitespace before ":"
+        self._position += size
+        # The end offset is updated last, so readers never see partially written records.
+        struct.pack_into("<Q", self._map, _END_OFFSET, self._position)
+        self._apply(kind, key, group, position + _RECORD.size, len(payload))
+
+
+def _write_store_file(
+    path: pathlib.Path, records: typing.Sequence[typing.Tuple[int, int, int, bytes]], capacity: int
+) -> None:
+    temp_path = path.with_name(path.name + ".tmp")
+    with temp_path.open("wb") as file:
+        end = _HEADER_SIZE + sum(_RECORD.size + len(payload) for *_, payload in records)
+        file.write(_HEADER.pack(_MAGIC, _VERSION, 0, end).ljust(_HEADER_SIZE, b"\0"))
+
+        for kind, key, group, payload in records:
+            file.write(_RECORD.pack(len(payload), kind, key, group))
+            file.write(payload)
+
+        file.truncate(max(capacity, end))
+
+    os.chmod(temp_path, 0o600)
+    _mark_stale(path)
+    # Replacing the file is atomic, so readers either open the old or the new file.
+    os.replace(temp_path, path)
+
+
+def _mark_stale(path: pathlib.Path) -> None:
+    # Tell any readers of the current file to switch over to the file which is about to replace it.
+    try:
+        with path.open("r+b") as file, mmap.mmap(file.fileno(), 0) as mapped:
+            if _HEADER.unpack_from(mapped)[0] == _MAGIC:
+                flags = struct.unpack_from("<H", mapped, _FLAGS_OFFSET)[0] | _STALE_FLAG
+                struct.pack_into("<H", mapped, _FLAGS_OFFSET, flags)
+
+    except (FileNotFoundError, ValueError, struct.error):
+        pass
@@ -32,6 +32,7 @@
 
 import abc
 import asyncio
+import collections
 import typing
 
 from hikari.internal import spel
@@ -669,6 +670,46 @@ def awaiting(self, window_size: int = 10) -> LazyIterator[ValueT]:
         # Not type safe. Can I make this type safe?
         return _AwaitingLazyIterator(typing.cast("LazyIterator[typing.Awaitable[ValueT]]", self), window_size)
 
+    def prefetch(self, depth: int) -> LazyIterator[ValueT]:
+        """Request up to `depth` pages ahead of the page being iterated over.
+
+        This only has an effect on iterators which request their items a page
+        at a time, such as the ones returned by the REST client, and should be
+        called on them directly rather than on an iterator made from them.
+
+        !!! note
+            Pages are still requested one at a time and respect the rate limits,
+            but up to `depth` pages more than needed may be requested if you
+            stop iterating early (e.g. when using [`hikari.iterators.LazyIterator.limit`][]).
+
+        Parameters
+        ----------
+        depth
+            The number of pages to request ahead. Set this to `0` to only
+            request each page once it's needed, which is the default.
+
+        Examples
+        --------
+        ```py
+            >>> async for message in rest.fetch_messages(channel).prefetch(2):
+            ...     await archive(message)
+        ```
+
+        Returns
+        -------
+        LazyIterator[ValueT]
+            This lazy iterator.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is negative.
+        """
+        if depth < 0:
+            raise ValueError("'depth' must be greater than or equal to 0")
+
+        return self
+
     @staticmethod
     def _map_predicates_and_attr_getters(
         alg_name: str,
@@ -775,16 +816,66 @@ def _next_chunk(self) -> typing.Optional[typing.Generator[ValueT, None, None]]:
             generator = (SomeObject(raw_item) for raw_item in raw_items)
             return generator
     ```
+
+    Calling [`hikari.iterators.LazyIterator.prefetch`][] makes `_next_chunk`
+    be called for the following chunks as soon as the previous call returns,
+    rather than once the previous chunk has been iterated over. Calls to
+    `_next_chunk` are never made concurrently, so implementations should
+    update whatever they use to request the next chunk before returning.
     """
 
-    __slots__: typing.Sequence[str] = ("_buffer",)
+    __slots__: typing.Sequence[str] = ("_buffer", "_pending_chunks", "_prefetch_depth")
 
     def __init__(self) -> None:
         self._buffer: typing.Optional[typing.Generator[ValueT, None, None]] = (_ for _ in ())
+        self._pending_chunks: typing.Deque[asyncio.Task[typing.Optional[typing.Generator[ValueT, None, None]]]] = (
+            collections.deque()
+        )
+        self._prefetch_depth = 0
 
     @abc.abstractmethod
     async def _next_chunk(self) -> typing.Optional[typing.Generator[ValueT, None, None]]: ...
 
+    def prefetch(self, depth: int) -> BufferedLazyIterator[ValueT]:
+        # <<inherited docstring from LazyIterator>>.
+        super().prefetch(depth)
+        self._prefetch_depth = depth
+        return self
+
+    async def _fetch_chunk(self) -> typing.Optional[typing.Generator[ValueT, None, None]]:
+        if not self._prefetch_depth and not self._pending_chunks:
+            return await self._next_chunk()
+
+        # Keep the chunk being waited for and the next `depth` chunks requested, one after the other
+        while len(self._pending_chunks) <= self._prefetch_depth:
+            previous = self._pending_chunks[-1] if self._pending_chunks else None
+            task = asyncio.create_task(self._next_chunk_after(previous))
+            # The chunks after a failed one are never waited for
+            task.add_done_callback(_retrieve_exception)
+            self._pending_chunks.append(task)
+
+        chunk = await self._pending_chunks.popleft()
+        if chunk is None:
+            # Every chunk after the last one would also be None
+            for task in self._pending_chunks:
+                task.cancel()
+
+            self._pending_chunks.clear()
+
+        return chunk
+
+    async def _next_chunk_after(
+        self, previous: typing.Optional[asyncio.Task[typing.Optional[typing.Generator[ValueT, None, None]]]]
+    ) -> typing.Optional[typing.Generator[ValueT, None, None]]:
+        if previous is not None:
+            try:
+                if await asyncio.shield(previous) is None:
+                    return None
+            except Exception:
+                return None
+
+        return await self._next_chunk()
+
     async def __anext__(self) -> ValueT:
         # This sneaky snippet of code lets us use generators rather than lists.
         # This is important, as we can use this to make generators that
@@ -795,12 +886,17 @@ async def __anext__(self) -> ValueT:
             if self._buffer is not None:
                 return next(self._buffer)
         except StopIteration:
-            self._buffer = await self._next_chunk()
+            self._buffer = await self._fetch_chunk()
             if self._buffer is not None:
                 return next(self._buffer)
         self._complete()
 
 
+def _retrieve_exception(task: asyncio.Task[typing.Any]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
 class FlatLazyIterator(typing.Generic[ValueT], LazyIterator[ValueT]):
     """A lazy iterator that has all items in-memory and ready.
 
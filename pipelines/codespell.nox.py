@@ -22,7 +22,7 @@
 from pipelines import config
 from pipelines import nox
 
-IGNORED_WORDS = ["ro", "falsy", "ws"]
+IGNORED_WORDS = ["ro", "falsy", "ws", "deque"]
 
 
 @nox.session()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the time taken to make many requests on one REST bucket with and without concurrent requests.
+
+Each simulated request takes a fixed round trip time and reports the
+remaining requests in a window, like a burst of reaction or role updates.
+"""
+import asyncio
+import sys
+import time
+
+from hikari.impl import buckets
+from hikari.internal import routes
+
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+LIMIT = 50
+ROUND_TRIP = 0.05
+
+
+async def run(concurrent: bool) -> float:
+    bucket_manager = buckets.RESTBucketManager(max_rate_limit=300, concurrent=concurrent)
+    bucket_manager.start()
+    route = routes.Route("PUT", "/channels/{channel}/messages/{message}/reactions/{emoji}/@me").compile(
+        channel=123, message=456, emoji="foo"
+    )
+    sent = 0
+
+    async def request() -> None:
+        nonlocal sent
+        async with bucket_manager.acquire_bucket(route, "token"):
+            await asyncio.sleep(ROUND_TRIP)
+            sent += 1
+            bucket_manager.update_rate_limits(route, "token", "abc", max(0, LIMIT - sent), LIMIT, 60)
+
+    # Resolve the bucket first, as unknown buckets only allow one request at a time.
+    await request()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+    await bucket_manager.close()
+    return elapsed
+
+
+def main() -> None:
+    for concurrent in (False, True):
+        elapsed = asyncio.run(run(concurrent))
+        print("concurrent" if concurrent else "serial", round(elapsed, 3), f"s for {REQUESTS} requests")
+
+
+main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Measure the cost of reading members and users back out of the cache.
+
+The default cache builds (or copies) a new entity on every access, while the
+borrowing cache hands out shared snapshots which are only rebuilt when the
+cached data changes.
+"""
+import datetime
+import sys
+import time
+
+import mock
+
+from hikari import guilds
+from hikari import snowflakes
+from hikari import users
+from hikari.impl import cache
+from hikari.impl import config
+
+MEMBERS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+PASSES = 5
+GUILD_ID = snowflakes.Snowflake(123456789123456789)
+
+
+def make_member(app: mock.Mock, i: int) -> guilds.Member:
+    user = users.UserImpl(
+        id=snowflakes.Snowflake(323456789123456789 + i),
+        app=app,
+        discriminator="0",
+        username=f"user {i}",
+        global_name=None,
+        avatar_hash=None,
+        banner_hash=None,
+        accent_color=None,
+        is_bot=False,
+        is_system=False,
+        flags=users.UserFlag.NONE,
+    )
+    return guilds.Member(
+        guild_id=GUILD_ID,
+        user=user,
+        nickname=None,
+        role_ids=[],
+        joined_at=datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+        premium_since=None,
+        is_deaf=False,
+        guild_avatar_hash=None,
+        is_mute=False,
+        is_pending=False,
+        raw_communication_disabled_until=None,
+    )
+
+
+def iterate_members(cache_impl: cache.CacheImpl) -> None:
+    for _ in cache_impl.get_members_view_for_guild(GUILD_ID).values():
+        pass
+
+
+def iterate_users(cache_impl: cache.CacheImpl) -> None:
+    for _ in cache_impl.get_users_view().values():
+        pass
+
+
+def measure(borrow_entities: bool) -> None:
+    app = mock.Mock()
+    cache_impl = cache.CacheImpl(app, config.CacheSettings(borrow_entities=borrow_entities))
+    for i in range(MEMBERS):
+        cache_impl.set_member(make_member(app, i))
+
+    name = "borrowed" if borrow_entities else "default"
+    for label, iterate in (("members", iterate_members), ("users", iterate_users)):
+        # The first pass builds the borrowed members
+        iterate(cache_impl)
+
+        start = time.perf_counter()
+        for _ in range(PASSES):
+            iterate(cache_impl)
+
+        elapsed = time.perf_counter() - start
+
+        print(f"{name} {label} view iteration", elapsed / PASSES / MEMBERS * 1_000_000_000, "ns/entry")
+
+
+measure(borrow_entities=False)
+measure(borrow_entities=True)
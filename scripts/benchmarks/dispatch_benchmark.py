@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Measure the cost of dispatching events through the event manager.
+
+The legacy manager reproduces the previous dispatch logic, which walked the
+event's MRO and looked up listeners and waiters for every class on each call.
+"""
+import asyncio
+import sys
+import time
+import typing
+
+import attrs
+import mock
+
+from hikari import intents
+from hikari.events import base_events
+from hikari.events import message_events
+from hikari.events import reaction_events
+from hikari.events import typing_events
+from hikari.impl import event_manager
+from hikari.internal import aio
+
+EVENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+BATCH = 10_000
+
+
+class LegacyEventManager(event_manager.EventManagerImpl):
+    __slots__: typing.Sequence[str] = ()
+
+    def _enabled_for_event(self, event_type: typing.Type[base_events.Event], /) -> bool:
+        for cls in event_type.dispatches():
+            if cls in self._listeners or cls in self._waiters:
+                return True
+
+        return False
+
+    def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
+        tasks = []
+
+        for cls in event.dispatches():
+            if listeners := self._listeners.get(cls):
+                for callback in listeners:
+                    tasks.append(self._invoke_callback(callback, event))
+
+            if cls not in self._waiters:
+                continue
+
+        if tasks:
+            return asyncio.gather(*tasks)
+
+        return aio.completed_future()
+
+
+async def listener(_: base_events.Event) -> None:
+    pass
+
+
+def build(cls: typing.Type[event_manager.EventManagerImpl]) -> event_manager.EventManagerImpl:
+    manager = cls(mock.Mock(), mock.Mock(), intents.Intents.ALL)
+
+    # A command handler, a logger and some bookkeeping
+    manager.subscribe(message_events.GuildMessageCreateEvent, listener)
+    manager.subscribe(message_events.GuildMessageCreateEvent, listener)
+    manager.subscribe(message_events.MessageCreateEvent, listener)
+    # Unrelated listeners, which make the maps larger
+    manager.subscribe(message_events.MessageDeleteEvent, listener)
+    manager.subscribe(message_events.GuildMessageUpdateEvent, listener)
+    manager.subscribe(reaction_events.GuildReactionAddEvent, listener)
+    manager.subscribe(reaction_events.GuildReactionDeleteEvent, listener)
+    manager.subscribe(typing_events.GuildTypingEvent, listener)
+    manager.subscribe(base_events.ExceptionEvent, listener)
+    return manager
+
+
+async def run_dispatch(manager: event_manager.EventManagerImpl, event: base_events.Event, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count // BATCH):
+        for _ in range(BATCH):
+            manager.dispatch(event)
+
+        # Let the listeners run so the loop does not grow unbounded
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    return time.perf_counter() - start
+
+
+def run_enabled_for_event(manager: event_manager.EventManagerImpl, count: int) -> float:
+    start = time.perf_counter()
+    enabled_for_event = manager._enabled_for_event
+    for _ in range(count):
+        enabled_for_event(message_events.DMMessageCreateEvent)
+
+    return time.perf_counter() - start
+
+
+def mock_event(cls: typing.Type[base_events.EventT]) -> base_events.EventT:
+    return cls(**{field.name: mock.Mock() for field in attrs.fields(cls)})  # type: ignore[arg-type]
+
+
+async def main() -> None:
+    message_create_event = mock_event(message_events.GuildMessageCreateEvent)
+    typing_event = mock_event(typing_events.DMTypingEvent)
+
+    for name, cls in (("legacy", LegacyEventManager), ("compiled", event_manager.EventManagerImpl)):
+        manager = build(cls)
+        enabled_time = run_enabled_for_event(manager, EVENTS)
+        no_listeners_time = await run_dispatch(manager, typing_event, EVENTS)
+        dispatch_time = await run_dispatch(manager, message_create_event, EVENTS)
+
+        print(f"{name} _enabled_for_event", enabled_time / EVENTS * 1_000_000_000, "ns/call")
+        print(f"{name} dispatch (no listeners)", no_listeners_time / EVENTS * 1_000_000_000, "ns/event")
+        print(f"{name} dispatch (3 listeners)", dispatch_time / EVENTS * 1_000_000, "µs/event")
+
+
+asyncio.run(main())
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the hit rate and cost of the size-limited cache eviction policies.
+
+The workload mimics a message cache: most lookups target a small set of
+recently active messages, with regular scans of messages which are only seen
+once.
+"""
+import random
+import sys
+import time
+import typing
+
+from hikari.internal import collections
+
+OPERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+LIMIT = 300
+
+
+def workload(seed: int) -> typing.List[int]:
+    rng = random.Random(seed)
+    keys = []
+    next_new_key = 1_000_000
+    for _ in range(OPERATIONS):
+        if rng.random() < 0.3:
+            # New messages which are rarely looked at again
+            keys.append(next_new_key)
+            next_new_key += 1
+
+        else:
+            # Skewed lookups of a working set a bit larger than the cache
+            keys.append(int(rng.paretovariate(1.2)) % 1_000)
+
+    return keys
+
+
+def run(cache_map: collections.LimitedCapacityCacheMap[int, int], keys: typing.List[int]) -> typing.Tuple[int, float]:
+    # The FIFO map doesn't count its own hits, so they're counted here for every map
+    hits = 0
+    start = time.perf_counter()
+    for key in keys:
+        try:
+            cache_map[key]
+        except KeyError:
+            cache_map[key] = key
+        else:
+            hits += 1
+
+    return hits, time.perf_counter() - start
+
+
+def main() -> None:
+    keys = workload(0)
+    maps: typing.Sequence[typing.Tuple[str, collections.LimitedCapacityCacheMap[int, int]]] = (
+        ("fifo", collections.LimitedCapacityCacheMap(limit=LIMIT)),
+        ("lru", collections.LRUCacheMap(limit=LIMIT)),
+        ("ttl", collections.TTLCacheMap(limit=LIMIT, ttl=600)),
+        ("tiny-lfu", collections.TinyLFUCacheMap(limit=LIMIT)),
+    )
+
+    for name, cache_map in maps:
+        hits, elapsed = run(cache_map, keys)
+        hit_rate = hits / OPERATIONS
+        print(f"{name} hit rate", round(hit_rate * 100, 2), "%")
+        print(f"{name} cost", elapsed / OPERATIONS * 1_000_000_000, "ns/operation")
+
+
+main()
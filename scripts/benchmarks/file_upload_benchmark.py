@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the throughput of uploading a file read in an executor and memory mapped.
+
+The file is uploaded as a multipart form, in the same way attachments are,
+to a local HTTP server which discards the body.
+"""
+import asyncio
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+import aiohttp
+from aiohttp import web
+
+from hikari import files
+from hikari.internal import data_binding
+
+SIZE_MIB = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+UPLOADS = 10
+
+
+async def sink(request: web.Request) -> web.Response:
+    size = 0
+    async for chunk in request.content.iter_any():
+        size += len(chunk)
+
+    return web.json_response({"size": size})
+
+
+async def upload(session: aiohttp.ClientSession, url: str, resource: files.File) -> None:
+    form_builder = data_binding.URLEncodedFormBuilder()
+    form_builder.add_resource("files[0]", resource)
+
+    async with contextlib.AsyncExitStack() as stack:
+        form = await form_builder.build(stack)
+        async with session.post(url, data=form) as response:
+            assert (await response.json())["size"] > SIZE_MIB * 1024 * 1024
+
+
+async def run(path: str) -> None:
+    app = web.Application(client_max_size=0)
+    app.router.add_post("/", sink)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/"
+
+    async with aiohttp.ClientSession() as session:
+        for memory_map in (False, True):
+            resource = files.File(path, memory_map=memory_map)
+            await upload(session, url, resource)
+
+            start = time.perf_counter()
+            for _ in range(UPLOADS):
+                await upload(session, url, resource)
+
+            elapsed = time.perf_counter() - start
+            name = "memory mapped" if memory_map else "threaded"
+            print(name, f"{SIZE_MIB * UPLOADS / elapsed:.0f} MiB/s", f"({UPLOADS} uploads of {SIZE_MIB} MiB)")
+
+    await runner.cleanup()
+
+
+def main() -> None:
+    with tempfile.NamedTemporaryFile(delete=False) as file:
+        file.write(os.urandom(SIZE_MIB * 1024 * 1024))
+
+    try:
+        asyncio.run(run(file.name))
+    finally:
+        os.unlink(file.name)
+
+
+main()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the cost of the gateway transport compressions.
+
+Every payload is compressed the same way Discord does it (a single stream per
+connection, flushed at the end of every payload) and then decompressed the same
+way `hikari.impl.shard._GatewayTransport` does it.
+
+By default, a synthetic traffic mix is used. A file containing one JSON payload
+per line can be passed as the first argument to use recorded traffic instead.
+"""
+import random
+import sys
+import timeit
+import typing
+import zlib
+
+import zstandard
+
+from hikari.internal import data_binding
+
+_ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+
+def synthetic_payloads(count: int) -> typing.List[bytes]:
+    rng = random.Random(1234)
+    payloads = []
+
+    for seq in range(count):
+        guild_id = str(rng.randrange(10**17, 10**18))
+        user = {
+            "id": str(rng.randrange(10**17, 10**18)),
+            "username": f"user{rng.randrange(10_000)}",
+            "global_name": None,
+            "discriminator": "0",
+            "avatar": "%032x" % rng.getrandbits(128),
+            "public_flags": 0,
+        }
+
+        if rng.random() < 0.6:
+            event = "PRESENCE_UPDATE"
+            data: typing.Dict[str, typing.Any] = {
+                "user": {"id": user["id"]},
+                "status": rng.choice(("online", "idle", "dnd", "offline")),
+                "guild_id": guild_id,
+                "client_status": {"desktop": "online"},
+                "activities": [],
+            }
+        else:
+            event = "MESSAGE_CREATE"
+            data = {
+                "id": str(rng.randrange(10**17, 10**18)),
+                "type": 0,
+                "tts": False,
+                "timestamp": "2024-06-01T12:00:00.000000+00:00",
+                "pinned": False,
+                "nonce": str(rng.randrange(10**17, 10**18)),
+                "mentions": [],
+                "mention_roles": [],
+                "mention_everyone": False,
+                "member": {
+                    "roles": [str(rng.randrange(10**17, 10**18)) for _ in range(rng.randrange(5))],
+                    "premium_since": None,
+                    "nick": None,
+                    "mute": False,
+                    "joined_at": "2023-01-01T00:00:00.000000+00:00",
+                    "flags": 0,
+                    "deaf": False,
+                    "avatar": None,
+                },
+                "flags": 0,
+                "embeds": [],
+                "edited_timestamp": None,
+                "content": " ".join(rng.choice(("hello", "world", "hikari", "ping", "pong")) for _ in range(12)),
+                "components": [],
+                "channel_id": str(rng.randrange(10**17, 10**18)),
+                "author": user,
+                "attachments": [],
+                "guild_id": guild_id,
+            }
+
+        payloads.append(data_binding.default_json_dumps({"op": 0, "t": event, "s": seq, "d": data}))
+
+    return payloads
+
+
+def recorded_payloads(path: str) -> typing.List[bytes]:
+    with open(path, "rb") as fp:
+        return [line.strip() for line in fp if line.strip()]
+
+
+def zlib_stream(payloads: typing.Sequence[bytes]) -> typing.List[bytes]:
+    compressor = zlib.compressobj()
+    return [compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH) for payload in payloads]
+
+
+def zstd_stream(payloads: typing.Sequence[bytes]) -> typing.List[bytes]:
+    compressor = zstandard.ZstdCompressor().compressobj()
+    return [compressor.compress(payload) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK) for payload in payloads]
+
+
+def inflate_zlib(frames: typing.Sequence[bytes]) -> None:
+    decompressor = zlib.decompressobj()
+    for frame in frames:
+        assert frame.endswith(_ZLIB_SUFFIX)
+        decompressor.decompress(frame)
+
+
+def inflate_zstd(frames: typing.Sequence[bytes]) -> None:
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    for frame in frames:
+        decompressor.decompress(frame)
+
+
+payloads = recorded_payloads(sys.argv[1]) if len(sys.argv) > 1 else synthetic_payloads(20_000)
+zlib_frames = zlib_stream(payloads)
+zstd_frames = zstd_stream(payloads)
+
+raw_size = sum(map(len, payloads))
+zlib_size = sum(map(len, zlib_frames))
+zstd_size = sum(map(len, zstd_frames))
+
+zlib_time = min(timeit.repeat(lambda: inflate_zlib(zlib_frames), number=1, repeat=5))
+zstd_time = min(timeit.repeat(lambda: inflate_zstd(zstd_frames), number=1, repeat=5))
+
+print("payloads", len(payloads))
+print("uncompressed", raw_size, "bytes")
+print("zlib-stream", zlib_size, "bytes", f"({zlib_size / raw_size:.1%})")
+print("zstd-stream", zstd_size, "bytes", f"({zstd_size / raw_size:.1%})")
+print("zlib-stream inflate", zlib_time / len(payloads) * 1_000_000, "µs/payload")
+print("zstd-stream inflate", zstd_time / len(payloads) * 1_000_000, "µs/payload")
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Measure end-to-end gateway throughput by replaying traffic into a real shard.
+
+The replay server from `scripts/gateway_stub.py` runs in this process and pushes
+the dispatches as fast as the connection allows. Every configuration runs in a
+fresh process, with the `GatewayShardImpl`, `EventManagerImpl` and `CacheImpl`
+that `GatewayBot` sets up, so the memory used by one does not leak into the next.
+
+The dispatch latency is the time the dispatch task of a single payload spends
+running, which covers deserializing the event, updating the cache and scheduling
+the listeners. This is the latency an idle bot would see.
+
+A recording made with `scripts/gateway_recording.py` can be passed as the first
+argument, otherwise synthetic traffic is used.
+"""
+import asyncio
+import concurrent.futures
+import multiprocessing
+import resource
+import statistics
+import sys
+import time
+import types
+import typing
+
+from aiohttp import web
+
+import hikari
+from hikari.api import CacheComponents
+from hikari.events import base_events
+from hikari.impl import config
+from hikari.impl import shard as shard_impl
+from scripts import gateway_recording
+from scripts import gateway_stub
+
+CONFIGURATIONS: typing.Sequence[typing.Tuple[str, hikari.Intents, CacheComponents]] = (
+    ("all intents, full cache", hikari.Intents.ALL, CacheComponents.ALL),
+    ("all intents, no cache", hikari.Intents.ALL, CacheComponents.NONE),
+    ("all intents, no presence cache", hikari.Intents.ALL, CacheComponents.ALL & ~CacheComponents.PRESENCES),
+    ("unprivileged intents, full cache", hikari.Intents.ALL_UNPRIVILEGED, CacheComponents.ALL),
+    (
+        "message intents, guild cache",
+        hikari.Intents.GUILDS | hikari.Intents.GUILD_MESSAGES | hikari.Intents.MESSAGE_CONTENT,
+        CacheComponents.GUILDS | CacheComponents.GUILD_CHANNELS | CacheComponents.ROLES,
+    ),
+)
+REPEAT = 3
+# Heartbeat ACKs are only received once every dispatch sent before them is consumed
+REPLAY_HEARTBEAT_INTERVAL = 3_600_000
+LISTENED_EVENTS: typing.Sequence[typing.Type[base_events.Event]] = (
+    hikari.GuildAvailableEvent,
+    hikari.MessageCreateEvent,
+    hikari.MessageUpdateEvent,
+    hikari.ReactionAddEvent,
+    hikari.MemberUpdateEvent,
+)
+
+
+class DispatchTimer:
+    """Proxy to an event manager which times every dispatch task it creates.
+
+    Only the time the dispatch task spends running is measured. The replay is
+    faster than the event manager, so the time spent waiting for the event loop
+    would only measure the size of the backlog.
+    """
+
+    def __init__(self, event_manager: hikari.api.EventManager) -> None:
+        self.event_manager = event_manager
+        self.finished = asyncio.Event()
+        self.finished_at = float("nan")
+        self.latencies: typing.List[float] = []
+        self.pending = 0
+        self.received_end = False
+        self.replayed = 0
+        self.started_at: typing.Optional[float] = None
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self.event_manager, name)
+
+    def consume_raw_event(self, event_name: str, shard: hikari.api.GatewayShard, payload: typing.Any) -> None:
+        if event_name != gateway_stub.REPLAY_END_EVENT:
+            self.event_manager.consume_raw_event(event_name, shard, payload)
+            return
+
+        self.received_end = True
+        self.replayed = payload["count"]
+        if not self.pending:
+            self.finished.set()
+
+    def task_factory(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        coro: typing.Coroutine[typing.Any, typing.Any, typing.Any],
+        **kwargs: typing.Any,
+    ) -> asyncio.Task[typing.Any]:
+        if coro.__name__ == "_handle_dispatch":
+            if self.started_at is None:
+                self.started_at = time.perf_counter()
+
+            self.pending += 1
+            coro = self._time_dispatch(coro)
+
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    @types.coroutine
+    def _time_dispatch(
+        self, coro: typing.Coroutine[typing.Any, typing.Any, None]
+    ) -> typing.Generator[typing.Any, typing.Any, None]:
+        # Drive the coroutine ourselves, so that only the time spent running it is counted
+        elapsed = 0.0
+        send: typing.Any = None
+        throw: typing.Optional[BaseException] = None
+
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    yielded = coro.send(send) if throw is None else coro.throw(throw)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start
+
+                try:
+                    send, throw = (yield yielded), None
+                except BaseException as ex:
+                    send, throw = None, ex
+
+        finally:
+            self.finished_at = time.perf_counter()
+            self.latencies.append(elapsed)
+            self.pending -= 1
+
+            if self.received_end and not self.pending:
+                self.finished.set()
+
+
+def rss() -> float:
+    """Return the current resident set size of this process in MiB."""
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * resource.getpagesize() / (1024 * 1024)
+
+    except OSError:
+        # No procfs, fall back to the peak. It includes whatever the parent process had when this one was forked
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+async def listener(_: base_events.Event) -> None:
+    pass
+
+
+async def replay(url: str, intents: hikari.Intents, components: CacheComponents) -> typing.Dict[str, float]:
+    bot = hikari.GatewayBot(
+        "replay",
+        banner=None,
+        logs="ERROR",
+        intents=intents,
+        cache_settings=config.CacheSettings(components=components),
+        auto_chunk_members=False,
+    )
+    for event_type in LISTENED_EVENTS:
+        bot.subscribe(event_type, listener)
+
+    timer = DispatchTimer(bot.event_manager)
+    asyncio.get_running_loop().set_task_factory(timer.task_factory)
+    shard = shard_impl.GatewayShardImpl(
+        event_manager=timer,  # type: ignore[arg-type]
+        event_factory=bot.event_factory,
+        http_settings=bot.http_settings,
+        proxy_settings=bot.proxy_settings,
+        intents=intents,
+        token="replay",
+        url=url,
+    )
+
+    await shard.start()
+    await timer.finished.wait()
+    await shard.close()
+
+    latencies = timer.latencies
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "events": timer.replayed,
+        "events_per_second": timer.replayed / (timer.finished_at - typing.cast(float, timer.started_at)),
+        "p50": percentiles[49],
+        "p99": percentiles[98],
+        "rss": rss(),
+    }
+
+
+def run_configuration(url: str, intents: int, components: int) -> typing.Dict[str, float]:
+    return asyncio.run(replay(url, hikari.Intents(intents), CacheComponents(components)))
+
+
+async def main() -> None:
+    if len(sys.argv) > 1:
+        recording = gateway_recording.read_recording(sys.argv[1])
+    else:
+        recording = list(gateway_recording.synthesize())
+
+    runner = web.AppRunner(gateway_stub.create_app(recording, heartbeat_interval=REPLAY_HEARTBEAT_INTERVAL))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    url = f"ws://{host}:{port}{gateway_stub.gateway_route_v8}"
+
+    print("recorded dispatches", len(recording))
+    loop = asyncio.get_running_loop()
+    try:
+        for name, intents, components in CONFIGURATIONS:
+            results = []
+            for _ in range(REPEAT):
+                with concurrent.futures.ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    results.append(
+                        await loop.run_in_executor(pool, run_configuration, url, int(intents), int(components))
+                    )
+
+            # The fastest run is the one least disturbed by everything else running on the machine
+            result = max(results, key=lambda r: r["events_per_second"])
+
+            print(
+                f"{name}: {result['events']} events, {result['events_per_second']:.0f} events/s, "
+                f"p50 {result['p50'] * 1_000_000:.1f} µs, p99 {result['p99'] * 1_000_000:.1f} µs, "
+                f"RSS {result['rss']:.1f} MiB"
+            )
+
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
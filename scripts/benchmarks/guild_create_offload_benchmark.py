@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Measure how long large `GUILD_CREATE` payloads stall the event loop.
+
+The payloads are consumed by the `EventManagerImpl` and `CacheImpl` that
+`GatewayBot` sets up, once with the members and presences deserialized on the
+event loop and once with them offloaded to the executor.
+
+A ticker task wakes up every millisecond while the payloads are consumed. Its
+lag, the time between when it should have woken up and when it did, is how
+long every other task in the bot would have been kept waiting.
+
+The synthesized payloads are frozen out of the garbage collector, as a bot does
+not keep them around once they are consumed. Full collections still stall the
+event loop regardless of which thread triggers them, and grow with the size of
+the cache.
+
+The number of guilds and members in each guild can be passed as the first and
+second arguments.
+"""
+import asyncio
+import concurrent.futures
+import gc
+import statistics
+import sys
+import time
+import typing
+from unittest import mock
+
+import hikari
+from scripts import gateway_recording
+
+GUILDS = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+MEMBERS = int(sys.argv[2]) if len(sys.argv) > 2 else 25_000
+OFFLOAD_THRESHOLDS: typing.Sequence[typing.Optional[int]] = (None, 1_000)
+TICK_INTERVAL = 0.001
+
+
+async def tick(lags: typing.List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_INTERVAL
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append(max(time.perf_counter() - expected, 0.0))
+
+
+async def consume(
+    payloads: typing.Sequence[typing.Any], offload_threshold: typing.Optional[int]
+) -> typing.Tuple[float, typing.List[float]]:
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    bot = hikari.GatewayBot(
+        "offload",
+        banner=None,
+        logs="ERROR",
+        intents=hikari.Intents.ALL,
+        auto_chunk_members=False,
+        dispatch_queue_size=len(payloads),
+        executor=executor,
+        offload_threshold=offload_threshold,
+    )
+    shard = mock.Mock(id=0, get_user_id=mock.Mock(return_value=hikari.Snowflake(1)))
+    lags: typing.List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(tick(lags, stop))
+    await asyncio.sleep(TICK_INTERVAL * 10)
+    lags.clear()
+
+    start = time.perf_counter()
+    for payload in payloads:
+        bot.event_manager.consume_raw_event("GUILD_CREATE", shard, payload)
+
+    # The dispatch worker of the shard only stays alive while it has events to consume
+    while bot.event_manager.get_dispatch_queue_stats()[0].size or bot.event_manager._dispatch_workers[0]._task:
+        await asyncio.sleep(TICK_INTERVAL)
+
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    executor.shutdown()
+
+    members = sum(len(bot.cache.get_members_view_for_guild(guild)) for guild in bot.cache.get_guilds_view())
+    assert members == GUILDS * MEMBERS, "not every member was cached"
+    return elapsed, lags
+
+
+def main() -> None:
+    payloads = [payload for _, payload in gateway_recording.synthesize(guilds=GUILDS, members=MEMBERS, events=0)]
+    gc.collect()
+    gc.freeze()
+    print(f"{GUILDS} guilds with {MEMBERS:,} members each")
+    print(f"{'offload threshold':<20}{'total':>12}{'max lag':>12}{'p99 lag':>12}{'mean lag':>12}")
+
+    for offload_threshold in OFFLOAD_THRESHOLDS:
+        elapsed, lags = asyncio.run(consume(payloads, offload_threshold))
+        gc.collect()
+        p99 = statistics.quantiles(lags, n=100, method="inclusive")[-1] if len(lags) > 1 else lags[0]
+        print(
+            f"{str(offload_threshold):<20}{elapsed * 1000:>10.0f}ms{max(lags) * 1000:>10.1f}ms"
+            f"{p99 * 1000:>10.1f}ms{statistics.fmean(lags) * 1000:>10.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the time taken to export a channel's message history sequentially and in time slices.
+
+Each simulated request takes a fixed round trip time. The bucket is assumed
+to allow concurrent requests (`HTTPSettings.concurrent_bucket_requests`).
+"""
+import asyncio
+import sys
+import time
+import types
+
+from hikari import snowflakes
+from hikari.impl import special_endpoints
+
+PAGES = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+ROUND_TRIP = 0.02
+HISTORY = range(1000, 1000 + PAGES * 100 * 7, 7)
+
+
+async def request_call(compiled_route, query):
+    await asyncio.sleep(ROUND_TRIP)
+    after = int(query["after"])
+    start = max(0, (after - 1000) // 7 + 1)
+    return [{"id": str(message_id)} for message_id in reversed(HISTORY[start : start + 100])]
+
+
+async def run(slices: int) -> float:
+    entity_factory = types.SimpleNamespace(deserialize_message=lambda payload: payload)
+    if slices:
+        iterator = special_endpoints.SlicedMessageIterator(
+            entity_factory,
+            request_call,
+            123,
+            snowflakes.Snowflake(0),
+            snowflakes.Snowflake(HISTORY[-1] + 1),
+            slices=slices,
+            max_buffered_pages=16,
+        )
+    else:
+        iterator = special_endpoints.MessageIterator(entity_factory, request_call, 123, "after", "0")
+
+    start = time.perf_counter()
+    count = 0
+    async for _ in iterator:
+        count += 1
+
+    elapsed = time.perf_counter() - start
+    assert count == len(HISTORY), count
+    return elapsed
+
+
+def main() -> None:
+    for slices in (0, 2, 4, 8):
+        elapsed = asyncio.run(run(slices))
+        name = f"sliced({slices})" if slices else "sequential"
+        print(name, round(elapsed, 3), f"s for {PAGES} pages")
+
+
+main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the peak memory used to decode a page of members at once and while it is being received.
+
+The page is fed in 16 KiB chunks, as it would be read from the connection,
+and each member is turned into a small object standing in for the entity.
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from hikari.internal import data_binding
+
+MEMBERS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+CHUNK_SIZE = 16 * 1024
+
+
+class Member:
+    __slots__ = ("id", "nick")
+
+    def __init__(self, payload):
+        self.id = int(payload["user"]["id"])
+        self.nick = payload["nick"]
+
+
+PAYLOAD = json.dumps(
+    [
+        {
+            "user": {"id": str(i), "username": f"user{i}", "avatar": "a" * 32, "discriminator": "0", "flags": 0},
+            "nick": f"nick{i}",
+            "roles": [str(i * 10 + r) for r in range(5)],
+            "joined_at": "2021-01-01T00:00:00+00:00",
+            "deaf": False,
+            "mute": False,
+        }
+        for i in range(MEMBERS)
+    ]
+).encode()
+CHUNKS = [PAYLOAD[i : i + CHUNK_SIZE] for i in range(0, len(PAYLOAD), CHUNK_SIZE)]
+
+
+def buffered():
+    body = b"".join(CHUNKS)
+    return [Member(payload) for payload in data_binding.default_json_loads(body)]
+
+
+def streamed():
+    parser = data_binding.JSONArrayParser()
+    members = [Member(payload) for chunk in CHUNKS for payload in parser.feed(chunk)]
+    parser.close()
+    return members
+
+
+def main() -> None:
+    for func in (buffered, streamed):
+        start = time.perf_counter()
+        members = func()
+        elapsed = time.perf_counter() - start
+        assert len(members) == MEMBERS
+
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(func.__name__, f"peak {peak / 1024:.0f} KiB", round(elapsed * 1000, 1), f"ms for {MEMBERS} members")
+
+
+main()
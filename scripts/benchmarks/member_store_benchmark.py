@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Measure the memory used per cached member and the cost of reading members back.
+
+Both caches hold the same users, so the difference between the two comes from
+how the member data itself is stored.
+"""
+import datetime
+import gc
+import sys
+import time
+import tracemalloc
+import typing
+
+import mock
+
+from hikari import guilds
+from hikari import snowflakes
+from hikari import users
+from hikari.impl import cache
+from hikari.impl import config
+
+MEMBERS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+GUILD_ID = snowflakes.Snowflake(123456789123456789)
+ROLE_IDS = [snowflakes.Snowflake(223456789123456789 + i) for i in range(20)]
+NICKNAMES = [f"nickname {i}" for i in range(50)]
+JOINED_AT = datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc)
+
+
+def make_member(app: mock.Mock, i: int) -> guilds.Member:
+    user = users.UserImpl(
+        id=snowflakes.Snowflake(323456789123456789 + i),
+        app=app,
+        discriminator="0",
+        username=f"user {i}",
+        global_name=None,
+        avatar_hash=None,
+        banner_hash=None,
+        accent_color=None,
+        is_bot=False,
+        is_system=False,
+        flags=users.UserFlag.NONE,
+    )
+    return guilds.Member(
+        guild_id=GUILD_ID,
+        user=user,
+        # Most members have no nickname and a few roles
+        nickname=NICKNAMES[i % len(NICKNAMES)] if i % 5 == 0 else None,
+        role_ids=ROLE_IDS[: i % 6],
+        joined_at=JOINED_AT + datetime.timedelta(seconds=i),
+        premium_since=None,
+        is_deaf=False,
+        guild_avatar_hash=None,
+        is_mute=False,
+        is_pending=False,
+        raw_communication_disabled_until=None,
+    )
+
+
+def traced_bytes(fill: typing.Callable[[], None]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    fill()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used
+
+
+def measure_users() -> int:
+    app = mock.Mock()
+    members = [make_member(app, i) for i in range(MEMBERS)]
+    cache_impl = cache.CacheImpl(app, config.CacheSettings())
+
+    def fill() -> None:
+        for member in members:
+            cache_impl._increment_ref_count(cache_impl._set_user(member.user))
+
+    return traced_bytes(fill)
+
+
+def measure(compact_members: bool, users_bytes: int) -> None:
+    app = mock.Mock()
+    members = [make_member(app, i) for i in range(MEMBERS)]
+    cache_impl = cache.CacheImpl(app, config.CacheSettings(compact_members=compact_members))
+
+    def fill() -> None:
+        for member in members:
+            cache_impl.set_member(member)
+
+    used = traced_bytes(fill) - users_bytes
+
+    user_ids = [member.user.id for member in members]
+    start = time.perf_counter()
+    for user_id in user_ids:
+        cache_impl.get_member(GUILD_ID, user_id)
+
+    get_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in cache_impl.get_members_view_for_guild(GUILD_ID).values():
+        pass
+
+    view_time = time.perf_counter() - start
+
+    name = "compact" if compact_members else "default"
+    print(f"{name} set_member", used / MEMBERS, "bytes/member (excluding the user cache)")
+    print(f"{name} get_member", get_time / MEMBERS * 1_000_000, "µs/member")
+    print(f"{name} members view iteration", view_time / MEMBERS * 1_000_000, "µs/member")
+
+
+users_bytes = measure_users()
+print("user cache", users_bytes / MEMBERS, "bytes/user")
+measure(compact_members=False, users_bytes=users_bytes)
+measure(compact_members=True, users_bytes=users_bytes)
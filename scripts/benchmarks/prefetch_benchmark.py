@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the time taken to page through message history with and without prefetching pages.
+
+Each simulated request takes a fixed round trip time, and processing each
+page of messages (e.g. writing them to an archive) takes a fixed time.
+"""
+import asyncio
+import sys
+import time
+import types
+
+from hikari.impl import special_endpoints
+
+PAGES = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+ROUND_TRIP = 0.02
+PROCESS_TIME = 0.015
+
+
+async def request_call(compiled_route, query):
+    await asyncio.sleep(ROUND_TRIP)
+    before = int(query.get("before", PAGES * 100))
+    return [{"id": str(message_id)} for message_id in range(before - 1, max(before - 101, 0), -1)]
+
+
+async def run(depth: int) -> float:
+    entity_factory = types.SimpleNamespace(deserialize_message=lambda payload: payload)
+    iterator = special_endpoints.MessageIterator(entity_factory, request_call, 123, "before", str(PAGES * 100))
+
+    start = time.perf_counter()
+    count = 0
+    async for _ in iterator.prefetch(depth):
+        count += 1
+        if count % 100 == 0:
+            await asyncio.sleep(PROCESS_TIME)
+
+    elapsed = time.perf_counter() - start
+    assert count == PAGES * 100 - 1, count
+    return elapsed
+
+
+def main() -> None:
+    for depth in (0, 1, 2):
+        elapsed = asyncio.run(run(depth))
+        print(f"prefetch({depth})", round(elapsed, 3), f"s for {PAGES} pages")
+
+
+main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare how long urgent requests wait behind a backlog on one REST bucket with and without priorities.
+
+A backlog of member edits is queued on a bucket, followed by a few urgent
+edits on the same bucket, and the wait of each priority is reported.
+"""
+import asyncio
+import sys
+
+from hikari.api import rest as rest_api
+from hikari.impl import buckets
+from hikari.internal import routes
+
+BACKLOG = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+URGENT = 5
+LIMIT = 10
+WINDOW = 0.1
+ROUND_TRIP = 0.005
+
+
+async def run(prioritize: bool) -> None:
+    bucket_manager = buckets.RESTBucketManager(max_rate_limit=300)
+    bucket_manager.start()
+    route = routes.Route("PATCH", "/guilds/{guild}/members/{user}").compile(guild=123, user=456)
+    loop = asyncio.get_running_loop()
+    window_end = loop.time() + WINDOW
+    sent = 0
+
+    async def request(priority: rest_api.RequestPriority) -> None:
+        nonlocal sent, window_end
+        async with bucket_manager.acquire_bucket(route, "token", priority):
+            await asyncio.sleep(ROUND_TRIP)
+            now = loop.time()
+            if now >= window_end:
+                window_end = now + WINDOW
+                sent = 0
+
+            sent += 1
+            bucket_manager.update_rate_limits(route, "token", "abc", max(0, LIMIT - sent), LIMIT, window_end - now)
+
+    # Resolve the bucket first
+    await request(rest_api.RequestPriority.NORMAL)
+    bucket_manager._queue_wait_statistics[rest_api.RequestPriority.NORMAL] = buckets.QueueWaitStatistics()
+
+    backlog_priority = rest_api.RequestPriority.LOW if prioritize else rest_api.RequestPriority.NORMAL
+    urgent_priority = rest_api.RequestPriority.HIGH if prioritize else rest_api.RequestPriority.NORMAL
+    backlog = [asyncio.create_task(request(backlog_priority)) for _ in range(BACKLOG)]
+    await asyncio.sleep(0)
+    urgent = [asyncio.create_task(request(urgent_priority)) for _ in range(URGENT)]
+
+    start = loop.time()
+    await asyncio.gather(*urgent)
+    urgent_elapsed = loop.time() - start
+    await asyncio.gather(*backlog)
+    await bucket_manager.close()
+
+    print("prioritized" if prioritize else "fifo", f"urgent requests done after {urgent_elapsed:.3f}s")
+    for priority, statistics in bucket_manager.queue_wait_statistics.items():
+        if statistics.count:
+            print(
+                f"    {priority.name}: {statistics.count} requests,",
+                f"mean wait {statistics.mean_wait:.3f}s, max wait {statistics.max_wait:.3f}s",
+            )
+
+
+def main() -> None:
+    for prioritize in (False, True):
+        asyncio.run(run(prioritize))
+
+
+main()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Compare the 429s hit by several processes sharing a token with and without a rate limit broker.
+
+Each worker process adds reactions through its own REST client, against a
+local stub server which enforces a per-channel rate limit and counts the
+requests it rejects.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import typing
+
+from aiohttp import web
+
+from hikari.impl import config
+from hikari.impl import rate_limit_broker
+from hikari.impl import rest
+
+WORKERS = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+REQUESTS_PER_WORKER = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+LIMIT = 5
+PERIOD = 0.5
+
+
+class StubServer:
+    def __init__(self) -> None:
+        self.windows: typing.Dict[str, typing.Tuple[float, int]] = {}
+        self.accepted = 0
+        self.rejected = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        channel = request.match_info["channel"]
+        now = time.monotonic()
+        reset_at, count = self.windows.get(channel, (0.0, 0))
+        if reset_at <= now:
+            reset_at, count = now + PERIOD, 0
+
+        headers = {
+            "X-RateLimit-Bucket": "reactions",
+            "X-RateLimit-Limit": str(LIMIT),
+            "X-RateLimit-Reset-After": f"{reset_at - now:.3f}",
+        }
+        if count >= LIMIT:
+            self.rejected += 1
+            headers["X-RateLimit-Remaining"] = "0"
+            return web.json_response(
+                {"message": "You are being rate limited.", "retry_after": reset_at - now, "global": False},
+                status=429,
+                headers=headers,
+            )
+
+        count += 1
+        self.accepted += 1
+        self.windows[channel] = (reset_at, count)
+        headers["X-RateLimit-Remaining"] = str(LIMIT - count)
+        return web.Response(status=204, headers=headers)
+
+
+async def run_worker(url: str, socket_path: typing.Optional[str]) -> None:
+    backend = rate_limit_broker.BrokerRateLimitBackend(socket_path) if socket_path else None
+    app = rest.RESTApp(url=url, http_settings=config.HTTPSettings(rate_limit_backend=backend))
+    await app.start()
+
+    async with app.acquire("token", "Bot") as client:
+        await asyncio.gather(*(client.add_reaction(123, i, "a:emoji:456") for i in range(REQUESTS_PER_WORKER)))
+
+    await app.close()
+
+
+def worker(url: str, socket_path: typing.Optional[str]) -> None:
+    # The 429s are counted by the server instead
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run_worker(url, socket_path))
+
+
+async def run(use_broker: bool) -> typing.Tuple[StubServer, float]:
+    server = StubServer()
+    app = web.Application()
+    app.router.add_route("PUT", "/channels/{channel}/messages/{message}/reactions/{emoji}/@me", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, "broker.sock") if use_broker else None
+        broker = rate_limit_broker.RateLimitBroker(socket_path) if socket_path else None
+        if broker:
+            await broker.start()
+
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=worker, args=(f"http://127.0.0.1:{port}", socket_path)) for _ in range(WORKERS)
+        ]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, process.join) for process in processes))
+        elapsed = time.perf_counter() - start
+
+        if broker:
+            await broker.close()
+
+    await runner.cleanup()
+    return server, elapsed
+
+
+def main() -> None:
+    for use_broker in (False, True):
+        server, elapsed = asyncio.run(run(use_broker))
+        name = "broker" if use_broker else "no broker"
+        print(name, "429s", server.rejected, "of", server.accepted + server.rejected, "requests")
+        print(name, "time", round(elapsed, 2), "s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Measure the per-request overhead of recording REST metrics.
+
+"recorded" is the bookkeeping done for every request, and "aggregated" adds
+passing the metrics to a RESTMetricsAggregator hook.
+"""
+import timeit
+import typing
+
+from hikari.impl import rest_metrics
+from hikari.internal import routes
+from hikari.internal import time
+
+NUMBER = 100_000
+
+
+def record(hook: typing.Optional[rest_metrics.RESTMetricsHook]) -> None:
+    metrics = rest_metrics.RequestMetrics(route=routes.GET_CHANNEL)
+    start = time.monotonic()
+    global_wait = 0.0
+    metrics.queue_wait += time.monotonic() - start - global_wait
+    metrics.global_wait += global_wait
+    start = time.monotonic()
+    metrics.network_time += time.monotonic() - start
+    metrics.status = 200
+    start = time.monotonic()
+    metrics.deserialize_time += time.monotonic() - start
+
+    if hook:
+        hook.on_request(metrics)
+
+
+def main() -> None:
+    for name, hook in (("recorded", None), ("aggregated", rest_metrics.RESTMetricsAggregator())):
+        elapsed = min(timeit.repeat(lambda: record(hook), number=NUMBER, repeat=3))
+        print(name, round(elapsed / NUMBER * 1_000_000, 2), "us per request")
+
+
+main()
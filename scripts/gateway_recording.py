@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Record gateway DISPATCH traffic, or synthesize some, for replaying later.
+
+Recordings are JSON lines files holding one `{"t": name, "d": data}` object per
+dispatch. Files ending in `.gz` are gzip compressed, which usually makes them
+around 10 times smaller.
+
+Usage:
+
+    # Record real traffic (the bot token is read from the HIKARI_TOKEN environment variable)
+    python scripts/gateway_recording.py record traffic.jsonl.gz --duration 600
+
+    # Generate a synthetic recording
+    python scripts/gateway_recording.py synthesize traffic.jsonl.gz --guilds 50 --events 100000
+
+Tokens and voice session IDs are scrubbed from the recorded payloads, and
+READY/RESUMED are not recorded at all, as the replay server sends its own.
+"""
+import argparse
+import asyncio
+import gzip
+import os
+import random
+import sys
+import typing
+
+import hikari
+from hikari.internal import data_binding
+
+SCRUBBED_KEYS: typing.Final[typing.FrozenSet[str]] = frozenset(("token", "session_id"))
+"""Keys whose values are replaced before a payload is recorded."""
+
+SKIPPED_EVENTS: typing.Final[typing.FrozenSet[str]] = frozenset(("READY", "RESUMED"))
+"""Events which are never recorded."""
+
+_SCRUBBED_VALUE: typing.Final[str] = "scrubbed"
+
+
+def scrub(payload: typing.Any) -> typing.Any:
+    """Return a copy of the payload with all secret values replaced."""
+    if isinstance(payload, dict):
+        return {
+            key: _SCRUBBED_VALUE if key in SCRUBBED_KEYS and isinstance(value, str) else scrub(value)
+            for key, value in payload.items()
+        }
+
+    if isinstance(payload, list):
+        return [scrub(value) for value in payload]
+
+    return payload
+
+
+def _open(path: str, mode: str) -> typing.BinaryIO:
+    if path.endswith(".gz"):
+        return typing.cast("typing.BinaryIO", gzip.open(path, mode))
+
+    return open(path, mode)
+
+
+class RecordingWriter:
+    """Append dispatches to a recording file."""
+
+    def __init__(self, path: str) -> None:
+        self._fp = _open(path, "wb")
+        self.count = 0
+
+    def write(self, name: str, data: typing.Any) -> None:
+        if name in SKIPPED_EVENTS:
+            return
+
+        self._fp.write(data_binding.default_json_dumps({"t": name, "d": scrub(data)}))
+        self._fp.write(b"\n")
+        self.count += 1
+
+    def close(self) -> None:
+        self._fp.close()
+
+    def __enter__(self) -> "RecordingWriter":
+        return self
+
+    def __exit__(self, *_: typing.Any) -> None:
+        self.close()
+
+
+def read_recording(path: str) -> typing.List[typing.Tuple[str, typing.Any]]:
+    """Read all the dispatches in a recording file as `(name, data)` pairs."""
+    with _open(path, "rb") as fp:
+        entries = [data_binding.default_json_loads(line) for line in fp if line.strip()]
+
+    return [(entry["t"], entry["d"]) for entry in entries]
+
+
+#######################
+# Recording real data #
+#######################
+
+
+async def record(path: str, token: str, intents: hikari.Intents, duration: float) -> None:
+    bot = hikari.GatewayBot(
+        token, intents=intents, cache_settings=hikari.impl.CacheSettings(components=hikari.api.CacheComponents.NONE)
+    )
+
+    with RecordingWriter(path) as writer:
+
+        @bot.listen(hikari.ShardPayloadEvent)
+        async def on_payload(event: hikari.ShardPayloadEvent) -> None:
+            writer.write(event.name, event.payload)
+
+        await bot.start()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            await bot.close()
+
+    print(f"recorded {writer.count} dispatches into {path}")
+
+
+########################
+# Synthesizing traffic #
+########################
+
+
+class _Synthesizer:
+    def __init__(self, seed: int) -> None:
+        self._rng = random.Random(seed)
+        self.guilds: typing.List[typing.Dict[str, typing.Any]] = []
+
+    def snowflake(self) -> str:
+        return str(self._rng.randrange(10**17, 10**18))
+
+    def user(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "id": self.snowflake(),
+            "username": f"user{self._rng.randrange(100_000)}",
+            "global_name": None,
+            "discriminator": "0",
+            "avatar": "%032x" % self._rng.getrandbits(128),
+            "public_flags": 0,
+        }
+
+    def member(self, user: typing.Dict[str, typing.Any], roles: typing.Sequence[str]) -> typing.Dict[str, typing.Any]:
+        return {
+            "user": user,
+            "roles": self._rng.sample(roles, self._rng.randrange(min(4, len(roles)) + 1)),
+            "nick": None,
+            "avatar": None,
+            "joined_at": "2023-01-01T00:00:00.000000+00:00",
+            "premium_since": None,
+            "deaf": False,
+            "mute": False,
+            "pending": False,
+            "flags": 0,
+            "communication_disabled_until": None,
+        }
+
+    def presence(self, guild_id: str, user_id: str) -> typing.Dict[str, typing.Any]:
+        status = self._rng.choice(("online", "idle", "dnd"))
+        activities = []
+        if self._rng.random() < 0.5:
+            # Most activities are games or music, which come with a few assets and timestamps
+            activities.append(
+                {
+                    "type": 0,
+                    "name": f"game {self._rng.randrange(1_000)}",
+                    "application_id": self.snowflake(),
+                    "created_at": 1717243200000,
+                    "timestamps": {"start": 1717243100000},
+                    "details": "In a match",
+                    "state": "Ranked",
+                    "assets": {
+                        "large_image": self.snowflake(),
+                        "large_text": "Some map",
+                        "small_image": self.snowflake(),
+                        "small_text": "Some character",
+                    },
+                }
+            )
+
+        return {
+            "user": {"id": user_id},
+            "guild_id": guild_id,
+            "status": status,
+            "activities": activities,
+            "client_status": {"desktop": status},
+        }
+
+    def guild_create(self, members: int, channels: int, roles: int) -> typing.Dict[str, typing.Any]:
+        guild_id = self.snowflake()
+        role_payloads = [
+            {
+                "id": guild_id if i == 0 else self.snowflake(),
+                "name": "@everyone" if i == 0 else f"role {i}",
+                "color": 0,
+                "hoist": False,
+                "icon": None,
+                "unicode_emoji": None,
+                "position": i,
+                "permissions": "1071698660929",
+                "managed": False,
+                "mentionable": False,
+                "flags": 0,
+            }
+            for i in range(roles)
+        ]
+        role_ids = [role["id"] for role in role_payloads[1:]]
+        channel_payloads = [
+            {
+                "id": self.snowflake(),
+                "guild_id": guild_id,
+                "name": f"channel-{i}",
+                "type": 0,
+                "position": i,
+                "permission_overwrites": [],
+                "rate_limit_per_user": 0,
+                "nsfw": False,
+                "topic": None,
+                "last_message_id": None,
+                "parent_id": None,
+            }
+            for i in range(channels)
+        ]
+        member_payloads = [self.member(self.user(), role_ids) for _ in range(members)]
+        presences = [
+            self.presence(guild_id, member["user"]["id"]) for member in member_payloads if self._rng.random() < 0.5
+        ]
+        guild = {
+            "id": guild_id,
+            "name": f"guild {len(self.guilds)}",
+            "icon": None,
+            "splash": None,
+            "discovery_splash": None,
+            "banner": None,
+            "description": None,
+            "owner_id": member_payloads[0]["user"]["id"],
+            "afk_channel_id": None,
+            "afk_timeout": 300,
+            "verification_level": 1,
+            "default_message_notifications": 1,
+            "explicit_content_filter": 0,
+            "features": [],
+            "mfa_level": 0,
+            "application_id": None,
+            "system_channel_id": None,
+            "system_channel_flags": 0,
+            "rules_channel_id": None,
+            "public_updates_channel_id": None,
+            "vanity_url_code": None,
+            "premium_tier": 0,
+            "premium_subscription_count": 0,
+            "preferred_locale": "en-US",
+            "nsfw_level": 0,
+            "max_video_channel_users": 25,
+            "joined_at": "2023-01-01T00:00:00.000000+00:00",
+            "large": members > 250,
+            "unavailable": False,
+            "member_count": members,
+            "roles": role_payloads,
+            "emojis": [],
+            "stickers": [],
+            "channels": channel_payloads,
+            "threads": [],
+            "members": member_payloads,
+            "presences": presences,
+            "voice_states": [],
+        }
+        self.guilds.append(guild)
+        return guild
+
+    def message(self, guild: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        member = self._rng.choice(guild["members"])
+        channel = self._rng.choice(guild["channels"])
+        message_id = self.snowflake()
+        channel["last_message_id"] = message_id
+        return {
+            "id": message_id,
+            "type": 0,
+            "channel_id": channel["id"],
+            "guild_id": guild["id"],
+            "author": member["user"],
+            "member": {key: value for key, value in member.items() if key != "user"},
+            "content": " ".join(self._rng.choice(("hello", "world", "hikari", "ping", "pong")) for _ in range(12)),
+            "timestamp": "2024-06-01T12:00:00.000000+00:00",
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "components": [],
+            "pinned": False,
+            "flags": 0,
+            "nonce": self.snowflake(),
+        }
+
+    def event(self) -> typing.Tuple[str, typing.Dict[str, typing.Any]]:
+        guild = self._rng.choice(self.guilds)
+        roll = self._rng.random()
+
+        if roll < 0.4:
+            return "MESSAGE_CREATE", self.message(guild)
+
+        if roll < 0.65:
+            return "PRESENCE_UPDATE", self.presence(guild["id"], self._rng.choice(guild["members"])["user"]["id"])
+
+        if roll < 0.75:
+            member = self._rng.choice(guild["members"])
+            return "TYPING_START", {
+                "channel_id": self._rng.choice(guild["channels"])["id"],
+                "guild_id": guild["id"],
+                "user_id": member["user"]["id"],
+                "timestamp": 1717243200,
+                "member": member,
+            }
+
+        if roll < 0.85:
+            member = self._rng.choice(guild["members"])
+            return "MESSAGE_REACTION_ADD", {
+                "user_id": member["user"]["id"],
+                "channel_id": self._rng.choice(guild["channels"])["id"],
+                "message_id": self.snowflake(),
+                "guild_id": guild["id"],
+                "member": member,
+                "emoji": {"id": None, "name": "\N{OK HAND SIGN}"},
+                "burst": False,
+                "type": 0,
+            }
+
+        if roll < 0.9:
+            payload = self.message(guild)
+            payload["edited_timestamp"] = "2024-06-01T12:01:00.000000+00:00"
+            return "MESSAGE_UPDATE", payload
+
+        if roll < 0.95:
+            member = self._rng.choice(guild["members"])
+            return "GUILD_MEMBER_UPDATE", {"guild_id": guild["id"], **member}
+
+        return "MESSAGE_DELETE", {
+            "id": self.snowflake(),
+            "channel_id": self._rng.choice(guild["channels"])["id"],
+            "guild_id": guild["id"],
+        }
+
+
+def synthesize(
+    *, guilds: int = 50, members: int = 100, channels: int = 10, roles: int = 10, events: int = 50_000, seed: int = 1234
+) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    """Generate a recording-like stream of dispatches.
+
+    One `GUILD_CREATE` is yielded for every guild, followed by a mix of
+    message, presence, typing, reaction and member events in those guilds.
+    """
+    synthesizer = _Synthesizer(seed)
+
+    for _ in range(guilds):
+        yield "GUILD_CREATE", synthesizer.guild_create(members, channels, roles)
+
+    for _ in range(events):
+        yield synthesizer.event()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="record real gateway traffic")
+    record_parser.add_argument("output")
+    record_parser.add_argument("--duration", type=float, default=300.0, help="seconds to record for")
+    record_parser.add_argument("--intents", type=int, default=int(hikari.Intents.ALL_UNPRIVILEGED))
+
+    synthesize_parser = commands.add_parser("synthesize", help="generate synthetic gateway traffic")
+    synthesize_parser.add_argument("output")
+    synthesize_parser.add_argument("--guilds", type=int, default=50)
+    synthesize_parser.add_argument("--members", type=int, default=100)
+    synthesize_parser.add_argument("--channels", type=int, default=10)
+    synthesize_parser.add_argument("--roles", type=int, default=10)
+    synthesize_parser.add_argument("--events", type=int, default=50_000)
+    synthesize_parser.add_argument("--seed", type=int, default=1234)
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        if not (token := os.environ.get("HIKARI_TOKEN")):
+            sys.exit("The HIKARI_TOKEN environment variable must be set to record traffic")
+
+        asyncio.run(record(args.output, token, hikari.Intents(args.intents), args.duration))
+        return
+
+    with RecordingWriter(args.output) as writer:
+        for name, data in synthesize(
+            guilds=args.guilds,
+            members=args.members,
+            channels=args.channels,
+            roles=args.roles,
+            events=args.events,
+            seed=args.seed,
+        ):
+            writer.write(name, data)
+
+    print(f"synthesized {writer.count} dispatches into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,21 +19,79 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+"""A fake Discord API and gateway to run hikari against locally.
+
+Usage:
+
+    # Serve a static handshake
+    python scripts/gateway_stub.py
+
+    # Replay a recording made with scripts/gateway_recording.py as fast as possible
+    python scripts/gateway_stub.py --replay traffic.jsonl.gz
+"""
+import argparse
+import asyncio
 import logging
 import time
+import typing
+import zlib
 
+from aiohttp import WSMsgType
 from aiohttp import web
 
-logging.basicConfig(level="DEBUG")
+from hikari import intents as intents_
+from hikari.internal import data_binding
 
+_LOGGER = logging.getLogger("gateway_stub")
 
 host = "localhost"
 port = 8080
 
 gateway_route_v8 = "/gateway/v8"
-gateway_uri_v8 = f"ws://{host}:{port}{gateway_route_v8}"
 heartbeat_interval = 5_000
 
+REPLAY_END_EVENT: typing.Final[str] = "HIKARI_REPLAY_END"
+"""Name of the dispatch sent once the whole recording has been replayed."""
+
+# Discord only sends these to shards which identified with the given intents
+_EVENT_INTENTS: typing.Final[typing.Mapping[str, intents_.Intents]] = {
+    "GUILD_CREATE": intents_.Intents.GUILDS,
+    "GUILD_UPDATE": intents_.Intents.GUILDS,
+    "GUILD_DELETE": intents_.Intents.GUILDS,
+    "GUILD_ROLE_CREATE": intents_.Intents.GUILDS,
+    "GUILD_ROLE_UPDATE": intents_.Intents.GUILDS,
+    "GUILD_ROLE_DELETE": intents_.Intents.GUILDS,
+    "CHANNEL_CREATE": intents_.Intents.GUILDS,
+    "CHANNEL_UPDATE": intents_.Intents.GUILDS,
+    "CHANNEL_DELETE": intents_.Intents.GUILDS,
+    "THREAD_CREATE": intents_.Intents.GUILDS,
+    "THREAD_UPDATE": intents_.Intents.GUILDS,
+    "THREAD_DELETE": intents_.Intents.GUILDS,
+    "GUILD_MEMBER_ADD": intents_.Intents.GUILD_MEMBERS,
+    "GUILD_MEMBER_UPDATE": intents_.Intents.GUILD_MEMBERS,
+    "GUILD_MEMBER_REMOVE": intents_.Intents.GUILD_MEMBERS,
+    "GUILD_BAN_ADD": intents_.Intents.GUILD_MODERATION,
+    "GUILD_BAN_REMOVE": intents_.Intents.GUILD_MODERATION,
+    "GUILD_EMOJIS_UPDATE": intents_.Intents.GUILD_EMOJIS,
+    "GUILD_STICKERS_UPDATE": intents_.Intents.GUILD_EMOJIS,
+    "INVITE_CREATE": intents_.Intents.GUILD_INVITES,
+    "INVITE_DELETE": intents_.Intents.GUILD_INVITES,
+    "VOICE_STATE_UPDATE": intents_.Intents.GUILD_VOICE_STATES,
+    "PRESENCE_UPDATE": intents_.Intents.GUILD_PRESENCES,
+}
+# These events are split between a guild and a DM intent, depending on where they happened
+_MESSAGE_EVENT_INTENTS: typing.Final[typing.Mapping[str, typing.Tuple[intents_.Intents, intents_.Intents]]] = {
+    "MESSAGE_CREATE": (intents_.Intents.GUILD_MESSAGES, intents_.Intents.DM_MESSAGES),
+    "MESSAGE_UPDATE": (intents_.Intents.GUILD_MESSAGES, intents_.Intents.DM_MESSAGES),
+    "MESSAGE_DELETE": (intents_.Intents.GUILD_MESSAGES, intents_.Intents.DM_MESSAGES),
+    "MESSAGE_DELETE_BULK": (intents_.Intents.GUILD_MESSAGES, intents_.Intents.DM_MESSAGES),
+    "MESSAGE_REACTION_ADD": (intents_.Intents.GUILD_MESSAGE_REACTIONS, intents_.Intents.DM_MESSAGE_REACTIONS),
+    "MESSAGE_REACTION_REMOVE": (intents_.Intents.GUILD_MESSAGE_REACTIONS, intents_.Intents.DM_MESSAGE_REACTIONS),
+    "MESSAGE_REACTION_REMOVE_ALL": (intents_.Intents.GUILD_MESSAGE_REACTIONS, intents_.Intents.DM_MESSAGE_REACTIONS),
+    "MESSAGE_REACTION_REMOVE_EMOJI": (intents_.Intents.GUILD_MESSAGE_REACTIONS, intents_.Intents.DM_MESSAGE_REACTIONS),
+    "TYPING_START": (intents_.Intents.GUILD_MESSAGE_TYPING, intents_.Intents.DM_MESSAGE_TYPING),
+}
+
 me_user_id = "1234567890"
 me_username = "nekokatt"
 me_global_name = None
@@ -48,19 +106,25 @@
 me_premium_type = 0
 me_public_flags = 0
 
+recording_key = web.AppKey("recording", list)
+heartbeat_interval_key = web.AppKey("heartbeat_interval", int)
 route_table = web.RouteTableDef()
 
 
+def _gateway_url(req: web.Request) -> str:
+    return f"ws://{req.host}{gateway_route_v8}"
+
+
 @route_table.get("/api/v8/gateway")
-def v8_get_gateway(_):
-    return web.json_response({"url": gateway_uri_v8})
+def v8_get_gateway(req):
+    return web.json_response({"url": _gateway_url(req)})
 
 
 @route_table.get("/api/v8/gateway/bot")
-def v8_get_gateway_bot(_):
+def v8_get_gateway_bot(req):
     return web.json_response(
         {
-            "url": gateway_uri_v8,
+            "url": _gateway_url(req),
             "shards": 1,
             "session_start_limit": {"total": 1000, "remaining": 1000, "reset_after": 1},
         }
@@ -69,7 +133,26 @@ def v8_get_gateway_bot(_):
 
 @route_table.get("/api/v8/users/@me")
 def v8_get_my_user(_):
-    body = {
+    return web.json_response(my_user())
+
+
+@route_table.get(gateway_route_v8)
+async def gateway_v8(req):
+    res = web.WebSocketResponse()
+    await res.prepare(req)
+    gateway = GatewayV8(
+        res,
+        req.app[recording_key],
+        compress=req.query.get("compress"),
+        heartbeat_interval=req.app[heartbeat_interval_key],
+        url=_gateway_url(req),
+    )
+    await gateway.run()
+    return res
+
+
+def my_user():
+    return {
         "id": me_user_id,
         "username": me_username,
         "global_name": me_global_name,
@@ -84,60 +167,176 @@ def v8_get_my_user(_):
         "premium_type": me_premium_type,
         "public_flags": me_public_flags,
     }
-    return web.json_response(body)
 
 
-@route_table.get(gateway_route_v8)
-async def gateway_v8(req):
-    res = web.WebSocketResponse()
-    await res.prepare(req)
-    await GatewayV8(res).run()
-    return res
+def is_enabled(name, data, intents):
+    """Whether Discord would send the dispatch to a shard with the given intents."""
+    if required := _EVENT_INTENTS.get(name):
+        return bool(intents & required)
+
+    if required_pair := _MESSAGE_EVENT_INTENTS.get(name):
+        return bool(intents & required_pair[0 if "guild_id" in data else 1])
+
+    return True
 
 
 class GatewayV8:
-    def __init__(self, ws: web.WebSocketResponse):
+    def __init__(
+        self,
+        ws: web.WebSocketResponse,
+        recording=(),
+        compress=None,
+        heartbeat_interval=heartbeat_interval,
+        url=f"ws://{host}:{port}{gateway_route_v8}",
+    ):
         self.ws = ws
+        self.heartbeat_interval = heartbeat_interval
+        self.url = url
         self.last_heartbeat = float("nan")
         self.seq = 0
+        self.recording = recording
+        self.compressor = None
+        self.send_lock = asyncio.Lock()
+
+        if compress == "zlib-stream":
+            self.compressor = zlib.compressobj()
+            self.flush_mode = zlib.Z_SYNC_FLUSH
+        elif compress == "zstd-stream":
+            import zstandard
+
+            self.compressor = zstandard.ZstdCompressor().compressobj()
+            self.flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
 
     async def run(self):
         await self.send_hello()
-        await self.receive_identify()
-        while True:
-            print("received payload", await self.poll_messages())
-        print("Closed")
+        identify = await self.receive_identify()
+
+        replay_task = None
+        if identify is not None and self.recording:
+            # Keep acknowledging heartbeats while replaying, so the shard does not think we are a zombie
+            replay_task = asyncio.create_task(self.replay(intents_.Intents(identify["d"]["intents"])))
+
+        try:
+            while (payload := await self.poll_messages()) is not None:
+                _LOGGER.debug("received payload %s", payload)
+
+        finally:
+            if replay_task is not None:
+                replay_task.cancel()
+                await asyncio.gather(replay_task, return_exceptions=True)
+
+        _LOGGER.debug("closed")
+
+    def encode(self, payload):
+        if self.compressor is None:
+            return data_binding.default_json_dumps(payload).decode()
+
+        data = self.compressor.compress(data_binding.default_json_dumps(payload))
+        return data + self.compressor.flush(self.flush_mode)
+
+    async def send_frame(self, frame):
+        if isinstance(frame, str):
+            await self.ws.send_str(frame)
+        else:
+            await self.ws.send_bytes(frame)
+
+    async def send(self, payload):
+        # Frames have to be sent in the order they were compressed in
+        async with self.send_lock:
+            await self.send_frame(self.encode(payload))
+
+    def encode_dispatch(self, name, data):
+        self.seq += 1
+        return self.encode({"t": name, "s": self.seq, "op": 0, "d": data})
 
     async def send_hello(self):
-        await self.ws.send_json({"op": 10, "d": {"heartbeat_interval": heartbeat_interval}})
+        await self.send({"op": 10, "d": {"heartbeat_interval": self.heartbeat_interval}})
 
     async def receive_identify(self):
         payload = await self.poll_messages()
-        if payload["op"] != 2:
-            print("Expected IDENTIFY, got", payload)
+        if payload is None or payload["op"] != 2:
+            _LOGGER.warning("expected IDENTIFY, got %s", payload)
             await self.ws.close(code=4003, message=b"not authenticated")
-        else:
-            print("received IDENTIFY", payload)
+            return None
+
+        _LOGGER.debug("received IDENTIFY with intents %s", payload["d"]["intents"])
+        return payload
+
+    async def replay(self, intents):
+        guild_ids = [data["id"] for name, data in self.recording if name == "GUILD_CREATE"]
+        ready = {
+            "v": 10,
+            "user": my_user(),
+            "guilds": [{"id": guild_id, "unavailable": True} for guild_id in guild_ids],
+            "session_id": "replay",
+            "resume_gateway_url": self.url,
+            "application": {"id": me_user_id, "flags": 0},
+        }
+
+        async with self.send_lock:
+            # Encode everything beforehand, so that only sending the frames is timed
+            frames = [self.encode_dispatch("READY", ready)]
+            frames.extend(
+                self.encode_dispatch(name, data) for name, data in self.recording if is_enabled(name, data, intents)
+            )
+            sent = len(frames) - 1
+            frames.append(self.encode_dispatch(REPLAY_END_EVENT, {"count": sent}))
+
+            start = time.perf_counter()
+            for frame in frames:
+                await self.send_frame(frame)
+
+        _LOGGER.info("replayed %s dispatches in %.2fs", sent, time.perf_counter() - start)
 
     async def poll_messages(self):
         while True:
-            payload = await self.ws.receive_json()
+            message = await self.ws.receive()
+            if message.type not in (WSMsgType.TEXT, WSMsgType.BINARY):
+                return None
+
+            payload = data_binding.default_json_loads(message.data)
             op = payload["op"]
 
             if op == 1:
-                print("Recv heartbeat, seq =", payload["d"])
+                _LOGGER.debug("received heartbeat, seq = %s", payload["d"])
                 self.last_heartbeat = time.perf_counter()
-                print("Sending heartbeat ack")
-                await self.ws.send_json({"op": 11, "d": None})
+                await self.send({"op": 11, "d": None})
                 continue
 
             if op == 11:
-                print("Recv Heartbeat ACK")
+                _LOGGER.debug("received heartbeat ACK")
                 continue
 
             return payload
 
 
-server = web.Application()
-server.add_routes(route_table)
-web.run_app(server, host=host, port=port)
+def create_app(recording=(), heartbeat_interval=heartbeat_interval):
+    """Create the stub application, optionally replaying the given `(name, data)` dispatches.
+
+    As heartbeat ACKs are queued behind the replayed dispatches, the heartbeat
+    interval should be longer than the replay takes to be consumed.
+    """
+    server = web.Application()
+    server[recording_key] = list(recording)
+    server[heartbeat_interval_key] = heartbeat_interval
+    server.add_routes(route_table)
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=host)
+    parser.add_argument("--port", type=int, default=port)
+    parser.add_argument("--replay", metavar="RECORDING", help="recording to replay after every IDENTIFY")
+    args = parser.parse_args()
+
+    logging.basicConfig(level="DEBUG")
+
+    host, port = args.host, args.port
+    recording = []
+    if args.replay:
+        from gateway_recording import read_recording
+
+        recording = read_recording(args.replay)
+
+    web.run_app(create_app(recording), host=host, port=port)
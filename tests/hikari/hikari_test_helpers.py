@@ -152,9 +152,12 @@ class AsyncContextManagerMock:
     aenter_count = 0
     aexit_count = 0
 
+    def __init__(self, enter_result=None):
+        self.enter_result = enter_result
+
     async def __aenter__(self):
         self.aenter_count += 1
-        return self
+        return self if self.enter_result is None else self.enter_result
 
     async def __aexit__(self, *args):
         self.aexit_count += 1
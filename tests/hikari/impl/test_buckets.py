@@ -27,12 +27,84 @@
 import pytest
 
 from hikari import errors
+from hikari.api import rest as rest_api
 from hikari.impl import buckets
 from hikari.impl import rate_limits
 from hikari.internal import routes
 from hikari.internal import time as hikari_date
 
 
+class TestQueueWaitStatistics:
+    def test_record(self):
+        statistics = buckets.QueueWaitStatistics()
+
+        statistics.record(1.5)
+        statistics.record(0.5)
+
+        assert statistics.count == 2
+        assert statistics.total_wait == 2.0
+        assert statistics.max_wait == 1.5
+        assert statistics.mean_wait == 1.0
+
+    def test_mean_wait_when_empty(self):
+        assert buckets.QueueWaitStatistics().mean_wait == 0.0
+
+
+class TestPriorityLock:
+    @pytest.mark.asyncio
+    async def test_acquire_when_not_locked(self):
+        lock = buckets._PriorityLock()
+
+        await lock.acquire()
+
+        assert lock.locked() is True
+
+    def test_release_when_not_locked(self):
+        with pytest.raises(RuntimeError, match="Lock is not acquired"):
+            buckets._PriorityLock().release()
+
+    @pytest.mark.asyncio
+    async def test_release_hands_lock_to_highest_priority(self):
+        lock = buckets._PriorityLock()
+        order = []
+
+        async def waiter(name, priority):
+            await lock.acquire(priority)
+            order.append(name)
+            lock.release()
+
+        await lock.acquire()
+        tasks = [
+            asyncio.create_task(waiter("low", -1)),
+            asyncio.create_task(waiter("normal1", 0)),
+            asyncio.create_task(waiter("high", 1)),
+            asyncio.create_task(waiter("normal2", 0)),
+        ]
+        await asyncio.sleep(0)
+        lock.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["high", "normal1", "normal2", "low"]
+        assert lock.locked() is False
+
+    @pytest.mark.asyncio
+    async def test_release_skips_cancelled_waiters(self):
+        lock = buckets._PriorityLock()
+        await lock.acquire()
+        cancelled = asyncio.create_task(lock.acquire(1))
+        waiting = asyncio.create_task(lock.acquire(0))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        lock.release()
+        await waiting
+
+        assert lock.locked() is True
+        lock.release()
+        assert lock.locked() is False
+
+
 class TestRESTBucket:
     @pytest.fixture
     def template(self):
@@ -44,10 +116,11 @@ def compiled_route(self, template):
 
     @pytest.mark.asyncio
     async def test_async_context_manager(self, compiled_route):
-        with mock.patch.object(buckets.RESTBucket, "acquire", new=mock.AsyncMock()) as acquire:
+        with mock.patch.object(buckets.RESTBucket, "acquire_timed", new=mock.AsyncMock(return_value=1.5)) as acquire:
             with mock.patch.object(buckets.RESTBucket, "release") as release:
-                async with buckets.RESTBucket("spaghetti", compiled_route, object(), float("inf")):
+                async with buckets.RESTBucket("spaghetti", compiled_route, object(), float("inf")) as global_wait:
                     acquire.assert_awaited_once_with()
+                    assert global_wait == 1.5
                     release.assert_not_called()
 
             release.assert_called_once_with()
@@ -65,6 +138,16 @@ def test_release(self, compiled_route):
 
             rl._lock.release.assert_called_once_with()
 
+    def test_release_when_in_flight(self, compiled_route):
+        with buckets.RESTBucket(__name__, compiled_route, object(), float("inf"), concurrent=True) as rl:
+            rl._lock = mock.Mock()
+            rl._in_flight = 2
+
+            rl.release()
+
+            assert rl.in_flight == 1
+            rl._lock.release.assert_not_called()
+
     def test_update_rate_limit(self, compiled_route):
         with buckets.RESTBucket(__name__, compiled_route, object(), float("inf")) as rl:
             rl.remaining = 1
@@ -80,6 +163,17 @@ def test_update_rate_limit(self, compiled_route):
             assert rl.reset_at == 27
             assert rl.period == 27 - 4.20
 
+    @pytest.mark.parametrize(("in_flight", "expected_remaining"), [(0, 9), (1, 9), (4, 6), (12, 0)])
+    def test_update_rate_limit_when_concurrent_requests_in_flight(self, compiled_route, in_flight, expected_remaining):
+        with buckets.RESTBucket(__name__, compiled_route, object(), float("inf"), concurrent=True) as rl:
+            rl._in_flight = in_flight
+
+            with mock.patch.object(hikari_date, "monotonic", return_value=4.20):
+                rl.update_rate_limit(9, 18, 27)
+
+            assert rl.remaining == expected_remaining
+            assert rl.limit == 18
+
     @pytest.mark.asyncio
     async def test_acquire_when_unknown_bucket(self, compiled_route):
         with buckets.RESTBucket(buckets.UNKNOWN_HASH, compiled_route, object(), float("inf")) as rl:
@@ -87,7 +181,7 @@ async def test_acquire_when_unknown_bucket(self, compiled_route):
             with mock.patch.object(rate_limits.WindowedBurstRateLimiter, "acquire") as super_acquire:
                 assert await rl.acquire() is None
 
-            rl._lock.acquire.assert_awaited_once_with()
+            rl._lock.acquire.assert_awaited_once_with(0)
             super_acquire.assert_not_called()
 
     @pytest.mark.asyncio
@@ -102,7 +196,7 @@ async def test_acquire_when_too_long_ratelimit(self, compiled_route):
         with stack:
             await rl.acquire()
 
-        rl._lock.acquire.assert_awaited_once_with()
+        rl._lock.acquire.assert_awaited_once_with(0)
         rl._lock.release.assert_called_once_with()
 
     @pytest.mark.asyncio
@@ -115,8 +209,8 @@ async def test_acquire_when_too_long_global_ratelimit(self, compiled_route):
                 with pytest.raises(errors.RateLimitTooLongError):
                     await rl.acquire()
 
-            rl._lock.acquire.assert_awaited_once_with()
-            super_acquire.assert_awaited_once_with()
+            rl._lock.acquire.assert_awaited_once_with(0)
+            super_acquire.assert_awaited_once_with(0)
             rl._lock.release.assert_called_once_with()
             global_ratelimit.acquire.assert_not_called()
 
@@ -129,9 +223,173 @@ async def test_acquire(self, compiled_route):
             with mock.patch.object(rate_limits.WindowedBurstRateLimiter, "acquire") as super_acquire:
                 await rl.acquire()
 
-            super_acquire.assert_awaited_once_with()
-            rl._lock.acquire.assert_awaited_once_with()
-            global_ratelimit.acquire.assert_awaited_once_with()
+            super_acquire.assert_awaited_once_with(0)
+            rl._lock.acquire.assert_awaited_once_with(0)
+            global_ratelimit.acquire.assert_awaited_once_with(0)
+
+    @pytest.mark.asyncio
+    async def test_acquire_timed(self, compiled_route):
+        global_ratelimit = mock.Mock(acquire=mock.AsyncMock(), reset_at=None)
+
+        with buckets.RESTBucket("spaghetti", compiled_route, global_ratelimit, float("inf")) as rl:
+            rl._lock = mock.AsyncMock()
+            with mock.patch.object(rate_limits.WindowedBurstRateLimiter, "acquire"):
+                with mock.patch.object(hikari_date, "monotonic", side_effect=[1.0, 2.0, 3.0, 5.5]):
+                    assert await rl.acquire_timed() == 2.5
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_concurrent(self, compiled_route):
+        global_ratelimit = mock.Mock(acquire=mock.AsyncMock(), reset_at=None)
+
+        with buckets.RESTBucket("spaghetti", compiled_route, global_ratelimit, float("inf"), concurrent=True) as rl:
+            rl._lock = mock.Mock(acquire=mock.AsyncMock())
+            with mock.patch.object(rate_limits.WindowedBurstRateLimiter, "acquire") as super_acquire:
+                await rl.acquire()
+
+            super_acquire.assert_awaited_once_with(0)
+            rl._lock.acquire.assert_awaited_once_with(0)
+            rl._lock.release.assert_called_once_with()
+            global_ratelimit.acquire.assert_awaited_once_with(0)
+            assert rl.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_records_wait_statistics(self, compiled_route):
+        statistics = {rest_api.RequestPriority.HIGH: mock.Mock()}
+        with buckets.RESTBucket("spaghetti", compiled_route, object(), float("inf"), wait_statistics=statistics) as rl:
+            with mock.patch.object(buckets.RESTBucket, "_acquire") as acquire:
+                with mock.patch.object(hikari_date, "monotonic", side_effect=[10, 12.5]):
+                    await rl.acquire(rest_api.RequestPriority.HIGH)
+
+            acquire.assert_awaited_once_with(rest_api.RequestPriority.HIGH)
+            statistics[rest_api.RequestPriority.HIGH].record.assert_called_once_with(2.5)
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_priority_without_wait_statistics(self, compiled_route):
+        statistics = {rest_api.RequestPriority.HIGH: mock.Mock()}
+        with buckets.RESTBucket("spaghetti", compiled_route, object(), float("inf"), wait_statistics=statistics) as rl:
+            with mock.patch.object(buckets.RESTBucket, "_acquire") as acquire:
+                await rl.acquire(5)
+
+            acquire.assert_awaited_once_with(5)
+            statistics[rest_api.RequestPriority.HIGH].record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_passes_priority(self, compiled_route):
+        with buckets.RESTBucket("spaghetti", compiled_route, mock.AsyncMock(), float("inf")) as rl:
+            rl._lock = mock.Mock(acquire=mock.AsyncMock())
+            rl._global_ratelimit = mock.Mock(acquire=mock.AsyncMock(), reset_at=None)
+
+            with mock.patch.object(rate_limits.WindowedBurstRateLimiter, "acquire") as super_acquire:
+                await rl.acquire(rest_api.RequestPriority.LOW)
+
+            rl._lock.acquire.assert_awaited_once_with(rest_api.RequestPriority.LOW)
+            super_acquire.assert_awaited_once_with(rest_api.RequestPriority.LOW)
+            rl._global_ratelimit.acquire.assert_awaited_once_with(rest_api.RequestPriority.LOW)
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_concurrent_and_unknown_bucket(self, compiled_route):
+        with buckets.RESTBucket(buckets.UNKNOWN_HASH, compiled_route, object(), float("inf"), concurrent=True) as rl:
+            rl._lock = mock.Mock(acquire=mock.AsyncMock())
+            await rl.acquire()
+
+            rl._lock.acquire.assert_awaited_once_with(0)
+            rl._lock.release.assert_not_called()
+            assert rl.in_flight == 0
+
+            rl.release()
+
+            rl._lock.release.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_concurrent_and_too_long_ratelimit(self, compiled_route):
+        stack = contextlib.ExitStack()
+        rl = stack.enter_context(buckets.RESTBucket("spaghetti", compiled_route, object(), 60, concurrent=True))
+        rl._lock = mock.Mock(acquire=mock.AsyncMock())
+        rl.reset_at = time.perf_counter() + 999999999999999999999999999
+        stack.enter_context(mock.patch.object(buckets.RESTBucket, "is_rate_limited", return_value=True))
+        stack.enter_context(pytest.raises(errors.RateLimitTooLongError))
+
+        with stack:
+            await rl.acquire()
+
+        rl._lock.release.assert_called_once_with()
+        assert rl.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_concurrent_allows_remaining_requests_at_once(self, compiled_route):
+        global_ratelimit = rate_limits.ManualRateLimiter()
+
+        with buckets.RESTBucket("spaghetti", compiled_route, global_ratelimit, float("inf"), concurrent=True) as rl:
+            rl.update_rate_limit(3, 3, hikari_date.monotonic() + 60)
+
+            for _ in range(3):
+                await asyncio.wait_for(rl.acquire(), timeout=1)
+
+            assert rl.in_flight == 3
+            assert rl.remaining == 0
+
+            blocked = asyncio.create_task(rl.acquire())
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+            blocked.cancel()
+
+            for _ in range(3):
+                rl.release()
+
+            assert rl.in_flight == 0
+            assert not rl._lock.locked()
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_unknown_bucket_with_backend(self, compiled_route):
+        backend = mock.Mock(acquire=mock.AsyncMock(return_value=(0, False)))
+
+        with buckets.RESTBucket(
+            buckets.UNKNOWN_HASH, compiled_route, object(), float("inf"), backend=backend, unknown_backend_hash="shared"
+        ) as rl:
+            await rl.acquire()
+
+            backend.acquire.assert_awaited_once_with("shared", exclusive=True)
+            rl.resolve("spaghetti")
+            rl.release()
+
+            backend.release.assert_called_once_with("shared", "spaghetti")
+            assert not rl._lock.locked()
+
+    @pytest.mark.asyncio
+    async def test_acquire_with_backend(self, compiled_route):
+        global_ratelimit = mock.Mock(acquire=mock.AsyncMock(), reset_at=None)
+        backend = mock.Mock(acquire=mock.AsyncMock(side_effect=[(0.5, False), (0, False)]))
+        stack = contextlib.ExitStack()
+        rl = stack.enter_context(
+            buckets.RESTBucket("spaghetti", compiled_route, global_ratelimit, float("inf"), backend=backend)
+        )
+        stack.enter_context(mock.patch.object(rate_limits.WindowedBurstRateLimiter, "acquire"))
+        sleep = stack.enter_context(mock.patch.object(asyncio, "sleep"))
+
+        with stack:
+            await rl.acquire()
+            rl.release()
+
+        assert backend.acquire.await_args_list == [
+            mock.call("spaghetti", exclusive=False),
+            mock.call("spaghetti", exclusive=False),
+        ]
+        sleep.assert_awaited_once_with(0.5)
+        backend.release.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_too_long_backend_ratelimit(self, compiled_route):
+        global_ratelimit = mock.Mock(acquire=mock.AsyncMock(), reset_at=None)
+        backend = mock.Mock(acquire=mock.AsyncMock(return_value=(120, True)))
+
+        with buckets.RESTBucket("spaghetti", compiled_route, global_ratelimit, 60, backend=backend) as rl:
+            with mock.patch.object(rate_limits.WindowedBurstRateLimiter, "acquire"):
+                with pytest.raises(errors.RateLimitTooLongError) as exc_info:
+                    await rl.acquire()
+
+            assert exc_info.value.is_global is True
+            assert exc_info.value.retry_after == 120
+            assert not rl._lock.locked()
 
     def test_resolve_when_not_unknown(self, compiled_route):
         with buckets.RESTBucket("spaghetti", compiled_route, object(), float("inf")) as rl:
@@ -418,7 +676,96 @@ async def test_update_rate_limits_updates_params(self, bucket_manager):
                 bucket_manager.update_rate_limits(route, "auth", "123", 22, 23, 5.32)
                 bucket.update_rate_limit.assert_called_once_with(22, 23, 27 + 5.32)
 
+    @pytest.mark.asyncio
+    async def test_acquire_bucket_when_concurrent(self):
+        bucket_manager = buckets.RESTBucketManager(max_rate_limit=float("inf"), concurrent=True)
+        bucket_manager._gc_task = object()
+
+        bucket = bucket_manager.acquire_bucket(routes.Route("GET", "/foo").compile(), "auth")
+
+        assert bucket._concurrent is True
+
+    @pytest.mark.asyncio
+    async def test_acquire_bucket_with_priority(self, bucket_manager):
+        route = routes.Route("GET", "/foo").compile()
+        with mock.patch.object(buckets.RESTBucket, "acquire_timed") as acquire:
+            with mock.patch.object(buckets.RESTBucket, "release") as release:
+                async with bucket_manager.acquire_bucket(route, "auth", rest_api.RequestPriority.HIGH):
+                    acquire.assert_awaited_once_with(rest_api.RequestPriority.HIGH)
+                    release.assert_not_called()
+
+                release.assert_called_once_with()
+
+    def test_acquire_bucket_shares_wait_statistics(self, bucket_manager):
+        bucket = bucket_manager.acquire_bucket(routes.Route("GET", "/foo").compile(), "auth")
+
+        assert bucket._wait_statistics is bucket_manager.queue_wait_statistics
+        assert set(bucket_manager.queue_wait_statistics) == set(rest_api.RequestPriority)
+
+    @pytest.mark.asyncio
+    async def test_acquire_bucket_with_backend(self):
+        backend = object()
+        bucket_manager = buckets.RESTBucketManager(max_rate_limit=float("inf"), backend=backend)
+        bucket_manager._gc_task = object()
+
+        route = routes.Route("GET", "/channels/{channel}/messages/{message}").compile(channel=123, message=456)
+
+        bucket = bucket_manager.acquire_bucket(route, "auth")
+
+        assert bucket._backend is backend
+        assert bucket._unknown_backend_hash == buckets._create_unknown_backend_hash(
+            route, buckets._create_authentication_hash("auth")
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_rate_limits_publishes_to_backend(self):
+        backend = mock.Mock()
+        bucket_manager = buckets.RESTBucketManager(max_rate_limit=float("inf"), backend=backend)
+        bucket_manager._gc_task = object()
+        route = routes.Route("GET", "/channels/{channel}").compile(channel=123)
+
+        bucket_manager.update_rate_limits(route, "auth", "abc", 2, 5, 1.5)
+
+        backend.update.assert_called_once_with(
+            route.create_real_bucket_hash("abc", buckets._create_authentication_hash("auth")), 2, 5, 1.5
+        )
+
+    def test_throttle_throttles_backend(self):
+        backend = mock.Mock()
+        bucket_manager = buckets.RESTBucketManager(max_rate_limit=float("inf"), backend=backend)
+        bucket_manager._global_ratelimit = mock.Mock()
+
+        bucket_manager.throttle(12.3)
+
+        bucket_manager._global_ratelimit.throttle.assert_called_once_with(12.3)
+        backend.throttle.assert_called_once_with(12.3)
+
+    @pytest.mark.asyncio
+    async def test_close_closes_backend(self):
+        backend = mock.Mock(close=mock.AsyncMock())
+        bucket_manager = buckets.RESTBucketManager(max_rate_limit=float("inf"), backend=backend)
+        bucket_manager.start()
+
+        await bucket_manager.close()
+
+        backend.close.assert_awaited_once_with()
+
     @pytest.mark.parametrize(("gc_task", "is_alive"), [(None, False), ("some", True)])
     def test_is_alive(self, bucket_manager, gc_task, is_alive):
         bucket_manager._gc_task = gc_task
         assert bucket_manager.is_alive is is_alive
+
+
+def test__create_unknown_backend_hash():
+    route = routes.Route("GET", "/channels/{channel}/messages/{message}")
+
+    result = buckets._create_unknown_backend_hash(route.compile(channel=123, message=456), "auth")
+
+    assert result == buckets._create_unknown_backend_hash(route.compile(channel=123, message=789), "auth")
+    assert result != buckets._create_unknown_backend_hash(route.compile(channel=321, message=456), "auth")
+    assert result.startswith(buckets.UNKNOWN_HASH)
+
+
+@pytest.mark.parametrize(("authentication", "expected"), [(None, "-"), ("Bot token", "3dc6f6499e02ed26")])
+def test__create_authentication_hash(authentication, expected):
+    assert buckets._create_authentication_hash(authentication) == expected
@@ -20,15 +20,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import datetime
+import typing
 
 import mock
 import pytest
 
+from hikari import channels
 from hikari import embeds
 from hikari import emojis
 from hikari import guilds
 from hikari import invites
 from hikari import messages
+from hikari import presences
 from hikari import snowflakes
 from hikari import stickers
 from hikari import undefined
@@ -38,6 +41,7 @@
 from hikari.impl import cache as cache_impl_
 from hikari.impl import config
 from hikari.internal import cache as cache_utilities
+from hikari.internal import cache_snapshot
 from hikari.internal import collections
 from tests.hikari import hikari_test_helpers
 
@@ -66,6 +70,30 @@ def test__init___(self, app_impl):
 
         create_cache.assert_called_once_with()
 
+    @pytest.mark.parametrize(
+        ("policy", "expected_type"),
+        [
+            (config_api.CacheEvictionPolicy.FIFO, collections.LimitedCapacityCacheMap),
+            (config_api.CacheEvictionPolicy.LRU, collections.LRUCacheMap),
+            (config_api.CacheEvictionPolicy.TTL, collections.TTLCacheMap),
+            (config_api.CacheEvictionPolicy.TINY_LFU, collections.TinyLFUCacheMap),
+        ],
+    )
+    def test__create_limited_map(self, app_impl, policy, expected_type):
+        on_expire = mock.Mock()
+        cache_impl = cache_impl_.CacheImpl(app_impl, config.CacheSettings(eviction_policy=policy, eviction_ttl=5))
+
+        result = cache_impl._create_limited_map(12, on_expire)
+
+        assert type(result) is expected_type
+        assert result._limit == 12
+        assert result._on_expire is on_expire
+        assert type(cache_impl._message_entries) is expected_type
+        assert type(cache_impl._dm_channel_entries) is expected_type
+
+        if policy is config_api.CacheEvictionPolicy.TTL:
+            assert result._ttl == 5
+
     def test__is_cache_enabled_for(self, cache_impl):
         cache_impl._settings.components = config_api.CacheComponents.MESSAGES | config_api.CacheComponents.GUILDS
 
@@ -2289,6 +2317,205 @@ def test_update_member(self, cache_impl):
         cache_impl.get_member.assert_has_calls([mock.call(123123, 65234123), mock.call(123123, 65234123)])
         cache_impl.set_member.assert_called_once_with(mock_member)
 
+    @pytest.fixture
+    def compact_cache_impl(self, app_impl):
+        return cache_impl_.CacheImpl(app=app_impl, settings=config.CacheSettings(compact_members=True))
+
+    @staticmethod
+    def _make_member(guild_id: int, user_id: int, nickname: typing.Optional[str] = None) -> guilds.Member:
+        return guilds.Member(
+            guild_id=snowflakes.Snowflake(guild_id),
+            user=mock.Mock(users.User, id=snowflakes.Snowflake(user_id)),
+            nickname=nickname,
+            role_ids=[snowflakes.Snowflake(guild_id)],
+            joined_at=datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+            premium_since=None,
+            is_deaf=False,
+            guild_avatar_hash=None,
+            is_mute=False,
+            is_pending=False,
+            raw_communication_disabled_until=None,
+        )
+
+    def test_set_member_when_compact(self, compact_cache_impl):
+        compact_cache_impl.set_member(self._make_member(123, 456, "nick"))
+        compact_cache_impl.set_member(self._make_member(123, 456, "new nick"))
+
+        guild_record = compact_cache_impl._guild_entries[snowflakes.Snowflake(123)]
+        assert guild_record.members is None
+        assert list(guild_record.compact_members) == [456]
+        assert compact_cache_impl._user_entries[snowflakes.Snowflake(456)].ref_count == 1
+
+        member = compact_cache_impl.get_member(123, 456)
+        assert member.nickname == "new nick"
+        assert member.role_ids == (123,)
+        assert member.user.id == 456
+
+    def test_get_member_when_compact_for_unknown_member(self, compact_cache_impl):
+        compact_cache_impl.set_member(self._make_member(123, 456))
+
+        assert compact_cache_impl.get_member(123, 789) is None
+        assert compact_cache_impl.get_member(321, 456) is None
+
+    def test_delete_member_when_compact(self, compact_cache_impl):
+        compact_cache_impl.set_member(self._make_member(123, 456, "nick"))
+        compact_cache_impl.set_member(self._make_member(123, 789))
+
+        member = compact_cache_impl.delete_member(123, 456)
+
+        assert member.nickname == "nick"
+        assert compact_cache_impl.get_member(123, 456) is None
+        assert snowflakes.Snowflake(456) not in compact_cache_impl._user_entries
+        assert compact_cache_impl.delete_member(123, 456) is None
+
+        compact_cache_impl.delete_member(123, 789)
+
+        assert snowflakes.Snowflake(123) not in compact_cache_impl._guild_entries
+
+    def test_clear_members_for_guild_when_compact(self, compact_cache_impl):
+        compact_cache_impl.set_member(self._make_member(123, 456))
+        compact_cache_impl.set_member(self._make_member(123, 789))
+        compact_cache_impl.set_member(self._make_member(321, 456))
+
+        result = compact_cache_impl.clear_members_for_guild(123)
+
+        assert set(result.keys()) == {456, 789}
+        assert result[snowflakes.Snowflake(789)].user.id == 789
+        assert snowflakes.Snowflake(123) not in compact_cache_impl._guild_entries
+        assert snowflakes.Snowflake(789) not in compact_cache_impl._user_entries
+        assert compact_cache_impl._user_entries[snowflakes.Snowflake(456)].ref_count == 1
+        assert compact_cache_impl.clear_members_for_guild(123) == {}
+
+    def test_get_members_view_when_compact(self, compact_cache_impl):
+        compact_cache_impl.set_member(self._make_member(123, 456, "one"))
+        compact_cache_impl.set_member(self._make_member(123, 789, "two"))
+        compact_cache_impl.set_member(self._make_member(321, 456, "three"))
+
+        result = compact_cache_impl.get_members_view()
+
+        assert set(result.keys()) == {123, 321}
+        assert {user_id: member.nickname for user_id, member in result[snowflakes.Snowflake(123)].items()} == {
+            456: "one",
+            789: "two",
+        }
+        assert result[snowflakes.Snowflake(321)][snowflakes.Snowflake(456)].nickname == "three"
+
+    def test_get_members_view_for_guild_when_compact(self, compact_cache_impl):
+        compact_cache_impl.set_member(self._make_member(123, 456, "one"))
+
+        result = compact_cache_impl.get_members_view_for_guild(123)
+
+        assert list(result.keys()) == [456]
+        assert result[snowflakes.Snowflake(456)].nickname == "one"
+        assert compact_cache_impl.get_members_view_for_guild(321) == {}
+
+    def test__set_member_when_compact_returns_snapshot(self, compact_cache_impl):
+        compact_cache_impl.set_member(self._make_member(123, 456, "old"))
+
+        cached = compact_cache_impl._set_member(self._make_member(123, 456, "new"))
+        unknown = compact_cache_impl._set_member(self._make_member(123, 789, "unknown"))
+
+        assert cached.object.nickname == "new"
+        assert unknown.object.nickname == "unknown"
+        assert compact_cache_impl.get_member(123, 456).nickname == "new"
+        assert compact_cache_impl.get_member(123, 789) is None
+        assert snowflakes.Snowflake(789) not in compact_cache_impl._user_entries
+        assert compact_cache_impl._garbage_collect_member(mock.Mock(), cached, decrement=1) is None
+
+    @pytest.fixture
+    def borrowed_cache_impl(self, app_impl):
+        return cache_impl_.CacheImpl(app=app_impl, settings=config.CacheSettings(borrow_entities=True))
+
+    def test_get_member_when_borrowing(self, borrowed_cache_impl):
+        borrowed_cache_impl.set_member(self._make_member(123, 456, "nick"))
+
+        member = borrowed_cache_impl.get_member(123, 456)
+
+        assert member.nickname == "nick"
+        assert borrowed_cache_impl.get_member(123, 456) is member
+        assert borrowed_cache_impl.get_members_view_for_guild(123)[snowflakes.Snowflake(456)] is member
+        assert borrowed_cache_impl.get_members_view()[snowflakes.Snowflake(123)][snowflakes.Snowflake(456)] is member
+        assert member.user is borrowed_cache_impl.get_user(456)
+
+        borrowed_cache_impl.set_member(self._make_member(123, 456, "new nick"))
+
+        new_member = borrowed_cache_impl.get_member(123, 456)
+        assert new_member is not member
+        assert new_member.nickname == "new nick"
+        assert member.nickname == "nick"
+
+    def test_get_entities_when_borrowing(self, borrowed_cache_impl):
+        guild = mock.Mock(guilds.GatewayGuild, id=snowflakes.Snowflake(123))
+        role = mock.Mock(guilds.Role, id=snowflakes.Snowflake(321), guild_id=snowflakes.Snowflake(123))
+        thread = mock.Mock(
+            channels.GuildThreadChannel,
+            id=snowflakes.Snowflake(654),
+            guild_id=snowflakes.Snowflake(123),
+            parent_id=snowflakes.Snowflake(987),
+        )
+        channel = mock.Mock(
+            channels.GuildTextChannel,
+            id=snowflakes.Snowflake(987),
+            guild_id=snowflakes.Snowflake(123),
+            parent_id=None,
+            position=1,
+            permission_overwrites={},
+        )
+        me = mock.Mock(users.OwnUser)
+        borrowed_cache_impl.set_guild(guild)
+        borrowed_cache_impl.set_role(role)
+        borrowed_cache_impl.set_thread(thread)
+        borrowed_cache_impl.set_guild_channel(channel)
+        borrowed_cache_impl.set_me(me)
+        borrowed_cache_impl.set_member(self._make_member(123, 456))
+
+        cached_guild = borrowed_cache_impl.get_guild(123)
+        assert borrowed_cache_impl.get_available_guild(123) is cached_guild
+        assert borrowed_cache_impl.get_guilds_view()[snowflakes.Snowflake(123)] is cached_guild
+        assert borrowed_cache_impl.get_available_guilds_view()[snowflakes.Snowflake(123)] is cached_guild
+        cached_role = borrowed_cache_impl.get_role(321)
+        assert borrowed_cache_impl.get_roles_view()[snowflakes.Snowflake(321)] is cached_role
+        assert borrowed_cache_impl.get_roles_view_for_guild(123)[snowflakes.Snowflake(321)] is cached_role
+        cached_thread = borrowed_cache_impl.get_thread(654)
+        assert borrowed_cache_impl.get_threads_view()[snowflakes.Snowflake(654)] is cached_thread
+        assert borrowed_cache_impl.get_threads_view_for_guild(123)[snowflakes.Snowflake(654)] is cached_thread
+        assert borrowed_cache_impl.get_threads_view_for_channel(123, 987)[snowflakes.Snowflake(654)] is cached_thread
+        cached_channel = borrowed_cache_impl.get_guild_channel(987)
+        assert borrowed_cache_impl.get_guild_channels_view()[snowflakes.Snowflake(987)] is cached_channel
+        assert borrowed_cache_impl.get_guild_channels_view_for_guild(123)[snowflakes.Snowflake(987)] is cached_channel
+        assert borrowed_cache_impl.get_me() is borrowed_cache_impl.get_me()
+        cached_user = borrowed_cache_impl.get_user(456)
+        assert borrowed_cache_impl.get_users_view()[snowflakes.Snowflake(456)] is cached_user
+
+    def test_borrowed_entities_are_replaced_when_updated(self, borrowed_cache_impl):
+        member = self._make_member(123, 456, "nick")
+        member.user.username = "old"
+        borrowed_cache_impl.set_member(member)
+        borrowed_member = borrowed_cache_impl.get_member(123, 456)
+        borrowed_user = borrowed_cache_impl.get_user(456)
+
+        new_member = self._make_member(123, 456, "nick")
+        new_member.user.username = "new"
+        borrowed_cache_impl.set_member(new_member)
+
+        assert borrowed_user.username == "old"
+        assert borrowed_member.user is borrowed_user
+        assert borrowed_cache_impl.get_user(456).username == "new"
+        assert borrowed_cache_impl.get_member(123, 456).user.username == "new"
+
+    def test_modifying_borrowed_entities_modifies_cache(self, borrowed_cache_impl):
+        borrowed_cache_impl.set_member(self._make_member(123, 456, "nick"))
+
+        borrowed_cache_impl.get_member(123, 456).user.username = "modified"
+
+        assert borrowed_cache_impl.get_user(456).username == "modified"
+        assert borrowed_cache_impl.get_member(123, 456).user.username == "modified"
+
+    def test_get_member_when_not_borrowing(self, compact_cache_impl):
+        compact_cache_impl.set_member(self._make_member(123, 456))
+
+        assert compact_cache_impl.get_member(123, 456) is not compact_cache_impl.get_member(123, 456)
+
     @pytest.mark.skip(reason="TODO")
     def test_clear_presences(self, cache_impl): ...
 
@@ -3137,3 +3364,230 @@ def test_function_default(self, cache_impl, name, component, expected):
         assert fn(*(None for _ in range(n))) == expected
 
         cache_impl._is_cache_enabled_for.assert_called_once_with(component)
+
+
+def _make_user(app, user_id):
+    return users.UserImpl(
+        id=snowflakes.Snowflake(user_id),
+        app=app,
+        discriminator="0",
+        username=f"user {user_id}",
+        global_name=None,
+        avatar_hash=None,
+        banner_hash=None,
+        accent_color=None,
+        is_bot=False,
+        is_system=False,
+        flags=users.UserFlag.NONE,
+    )
+
+
+def _make_member(guild_id, user):
+    return guilds.Member(
+        guild_id=snowflakes.Snowflake(guild_id),
+        is_deaf=False,
+        is_mute=False,
+        is_pending=False,
+        joined_at=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        nickname=None,
+        premium_since=None,
+        raw_communication_disabled_until=None,
+        role_ids=[snowflakes.Snowflake(guild_id)],
+        user=user,
+        guild_avatar_hash=None,
+    )
+
+
+def _make_presence(app, guild_id, user_id, emoji):
+    return presences.MemberPresence(
+        app=app,
+        user_id=snowflakes.Snowflake(user_id),
+        guild_id=snowflakes.Snowflake(guild_id),
+        visible_status=presences.Status.ONLINE,
+        activities=[
+            presences.RichActivity(
+                name="Custom Status",
+                type=presences.ActivityType.CUSTOM,
+                created_at=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+                timestamps=None,
+                application_id=None,
+                details=None,
+                emoji=emoji,
+                party=None,
+                assets=None,
+                secrets=None,
+                is_instance=None,
+                flags=None,
+                buttons=[],
+            )
+        ],
+        client_status=presences.ClientStatus(
+            desktop=presences.Status.ONLINE, mobile=presences.Status.OFFLINE, web=presences.Status.OFFLINE
+        ),
+    )
+
+
+def _make_voice_state(app, guild_id, member):
+    return voices.VoiceState(
+        app=app,
+        channel_id=snowflakes.Snowflake(999),
+        guild_id=snowflakes.Snowflake(guild_id),
+        is_guild_deafened=False,
+        is_guild_muted=False,
+        is_self_deafened=False,
+        is_self_muted=False,
+        is_streaming=False,
+        is_suppressed=False,
+        is_video_enabled=False,
+        user_id=member.user.id,
+        member=member,
+        session_id="session",
+        requested_to_speak_at=None,
+    )
+
+
+@pytest.mark.asyncio
+class TestCacheImplSnapshot:
+    @pytest.fixture
+    def app(self):
+        return mock.Mock()
+
+    @pytest.fixture
+    def settings(self):
+        return config.CacheSettings()
+
+    @pytest.fixture
+    def populated_cache(self, app, settings):
+        cache = cache_impl_.CacheImpl(app, settings)
+        emoji = emojis.CustomEmoji(id=snowflakes.Snowflake(777), name="blep", is_animated=False)
+        # Enough members for them to be split over multiple frames
+        for guild_id in (100, 200):
+            for user_id in range(1, 1201):
+                cache.set_member(_make_member(guild_id, _make_user(app, user_id)))
+
+            cache.set_presence(_make_presence(app, guild_id, 1, emoji))
+            cache.set_voice_state(_make_voice_state(app, guild_id, _make_member(guild_id, _make_user(app, 5000))))
+
+        cache.set_dm_channel_id(snowflakes.Snowflake(1), snowflakes.Snowflake(42))
+        return cache
+
+    async def test_dump_and_load(self, tmp_path, populated_cache, app, settings):
+        path = tmp_path / "cache.snapshot"
+        await populated_cache.dump(path)
+        cache = cache_impl_.CacheImpl(app, settings)
+
+        await cache.load(path)
+
+        assert not (tmp_path / "cache.snapshot.tmp").exists()
+        for guild_id in (100, 200):
+            assert cache.get_members_view_for_guild(guild_id) == populated_cache.get_members_view_for_guild(guild_id)
+            assert cache.get_presence(guild_id, 1) == populated_cache.get_presence(guild_id, 1)
+            assert cache.get_presence(guild_id, 1).app is app
+            assert cache.get_voice_state(guild_id, 5000) == populated_cache.get_voice_state(guild_id, 5000)
+
+        assert cache.get_dm_channel_id(1) == 42
+        assert cache.get_users_view() == populated_cache.get_users_view()
+
+    async def test_load_restores_shared_references(self, tmp_path, populated_cache, app, settings):
+        path = tmp_path / "cache.snapshot"
+        await populated_cache.dump(path)
+        cache = cache_impl_.CacheImpl(app, settings)
+
+        await cache.load(path)
+
+        user = cache._user_entries[snowflakes.Snowflake(1)]
+        assert cache._guild_entries[snowflakes.Snowflake(100)].members[snowflakes.Snowflake(1)].object.user is user
+        assert cache._guild_entries[snowflakes.Snowflake(200)].members[snowflakes.Snowflake(1)].object.user is user
+        for user_id, cell in populated_cache._user_entries.items():
+            assert cache._user_entries[user_id].ref_count == cell.ref_count
+
+        guild_record = cache._guild_entries[snowflakes.Snowflake(100)]
+        voice_state = guild_record.voice_states[snowflakes.Snowflake(5000)]
+        assert voice_state.member.ref_count == 1
+        emoji = cache._unknown_custom_emoji_entries[snowflakes.Snowflake(777)]
+        assert emoji.ref_count == 2
+        assert guild_record.presences[snowflakes.Snowflake(1)].activities[0].emoji is emoji
+
+    async def test_load_when_not_a_snapshot(self, tmp_path, populated_cache):
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"not a snapshot")
+
+        with pytest.raises(ValueError, match="File is not a cache snapshot"):
+            await populated_cache.load(path)
+
+        assert populated_cache.get_users_view() == {}
+
+    async def test_load_when_written_by_another_version(self, tmp_path, populated_cache, app, settings):
+        path = tmp_path / "cache.snapshot"
+        await populated_cache.dump(path)
+        path.write_bytes(path.read_bytes().replace(cache_snapshot.HEADER, cache_snapshot._MAGIC + b"\x050.0.1", 1))
+        cache = cache_impl_.CacheImpl(app, settings)
+
+        with pytest.raises(ValueError, match="Snapshot was written by hikari 0.0.1"):
+            await cache.load(path)
+
+        assert cache._guild_entries == {}
+
+    async def test_load_when_truncated(self, tmp_path, populated_cache, app, settings):
+        path = tmp_path / "cache.snapshot"
+        await populated_cache.dump(path)
+        path.write_bytes(path.read_bytes()[:-100])
+        cache = cache_impl_.CacheImpl(app, settings)
+
+        with pytest.raises(ValueError, match="Snapshot is truncated"):
+            await cache.load(path)
+
+        assert cache._guild_entries == {}
+
+    async def test_dump_and_load_with_compact_members(self, tmp_path, app):
+        settings = config.CacheSettings(compact_members=True)
+        populated_cache = cache_impl_.CacheImpl(app, settings)
+        for user_id in range(1, 1201):
+            populated_cache.set_member(_make_member(100, _make_user(app, user_id)))
+
+        path = tmp_path / "cache.snapshot"
+        await populated_cache.dump(path)
+        cache = cache_impl_.CacheImpl(app, settings)
+
+        await cache.load(path)
+
+        assert cache.get_members_view_for_guild(100) == populated_cache.get_members_view_for_guild(100)
+        assert cache._user_entries[snowflakes.Snowflake(1)].ref_count == 1
+        assert (
+            cache._guild_entries[snowflakes.Snowflake(100)].compact_members.get_user(snowflakes.Snowflake(1))
+            is cache._user_entries[snowflakes.Snowflake(1)]
+        )
+
+    async def test_dump_with_compact_members_writes_member_frames(self, tmp_path, app):
+        populated_cache = cache_impl_.CacheImpl(app, config.CacheSettings(compact_members=True))
+        for user_id in range(1, 1201):
+            populated_cache.set_member(_make_member(100, _make_user(app, user_id)))
+
+        path = tmp_path / "cache.snapshot"
+        await populated_cache.dump(path)
+
+        kinds = []
+        with open(path, "rb") as fp:
+            cache_snapshot.read_header(fp)
+            decoder = cache_snapshot.SnapshotDecoder(app)
+            while not decoder.is_complete:
+                kind, value = decoder.read(fp)
+                kinds.append(kind)
+                if kind == cache_snapshot.GUILD:
+                    assert value[1].compact_members is None
+
+        assert kinds.count(cache_snapshot.MEMBERS) == 3
+
+    async def test_load_compact_members_into_dict_cache(self, tmp_path, app):
+        populated_cache = cache_impl_.CacheImpl(app, config.CacheSettings(compact_members=True))
+        for user_id in range(1, 11):
+            populated_cache.set_member(_make_member(100, _make_user(app, user_id)))
+
+        path = tmp_path / "cache.snapshot"
+        await populated_cache.dump(path)
+        cache = cache_impl_.CacheImpl(app, config.CacheSettings())
+
+        await cache.load(path)
+
+        assert cache.get_members_view_for_guild(100) == populated_cache.get_members_view_for_guild(100)
+        assert cache._guild_entries[snowflakes.Snowflake(100)].compact_members is None
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import multiprocessing
+import threading
+
+import mock
+import pytest
+
+from hikari.impl import cluster
+from hikari.impl import rate_limits
+
+
+class TestSplitShardIds:
+    @pytest.mark.parametrize(
+        ("shard_ids", "processes", "expected"),
+        [
+            ((0, 1, 2, 3), 2, [(0, 1), (2, 3)]),
+            ((0, 1, 2, 3, 4), 2, [(0, 1, 2), (3, 4)]),
+            ((0, 1, 2, 3, 4, 5, 6), 3, [(0, 1, 2), (3, 4), (5, 6)]),
+            ((5, 9), 4, [(5,), (9,)]),
+            ((), 2, []),
+            ((0, 1, 2), 1, [(0, 1, 2)]),
+        ],
+    )
+    def test_split_shard_ids(self, shard_ids, processes, expected):
+        assert cluster.split_shard_ids(shard_ids, processes) == expected
+
+    def test_split_shard_ids_when_processes_less_than_1(self):
+        with pytest.raises(ValueError, match=r"'processes' must be greater than or equal to 1"):
+            cluster.split_shard_ids((0, 1), 0)
+
+
+class TestIdentifyCoordinator:
+    def test_serve(self):
+        coordinator_end1, worker_end1 = multiprocessing.Pipe()
+        coordinator_end2, worker_end2 = multiprocessing.Pipe()
+        coordinator = cluster.IdentifyCoordinator([coordinator_end1, coordinator_end2], 2)
+        thread = threading.Thread(target=coordinator.serve)
+        thread.start()
+
+        try:
+            worker_end1.send((10, 0))
+            worker_end2.send((20, 1))
+
+            assert worker_end1.poll(5)
+            assert worker_end1.recv() == 10
+            assert worker_end2.poll(5)
+            assert worker_end2.recv() == 20
+        finally:
+            worker_end1.close()
+            worker_end2.close()
+            thread.join(5)
+
+        assert not thread.is_alive()
+
+    def test_serve_when_no_workers(self):
+        cluster.IdentifyCoordinator([], 2).serve()
+
+    def test_serve_only_holds_back_requests_with_same_key(self):
+        coordinator_end, worker_end = multiprocessing.Pipe()
+        coordinator = cluster.IdentifyCoordinator([coordinator_end], 2)
+
+        with mock.patch.object(rate_limits, "_IDENTIFY_PERIOD", new=0.2):
+            worker_end.send((1, 0))
+            worker_end.send((2, 2))
+            worker_end.send((3, 1))
+            thread = threading.Thread(target=coordinator.serve)
+            thread.start()
+
+            try:
+                assert worker_end.poll(5)
+                assert worker_end.recv() == 1
+                assert worker_end.poll(5)
+                assert worker_end.recv() == 3
+                assert not worker_end.poll(0.05)
+                assert worker_end.poll(5)
+                assert worker_end.recv() == 2
+            finally:
+                worker_end.close()
+                thread.join(5)
+
+        assert not thread.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_serve_drops_requests_of_closed_worker(self):
+        coordinator_end1, worker_end1 = multiprocessing.Pipe()
+        coordinator_end2, worker_end2 = multiprocessing.Pipe()
+        coordinator = cluster.IdentifyCoordinator([coordinator_end1, coordinator_end2], 1)
+        task = asyncio.create_task(coordinator._serve())
+
+        try:
+            worker_end1.send((1, 0))
+            worker_end1.send((2, 0))
+            worker_end2.send((3, 0))
+            while not worker_end1.poll():
+                await asyncio.sleep(0.01)
+
+            assert worker_end1.recv() == 1
+            (dropped,) = coordinator._pending[coordinator_end1]
+
+            worker_end1.close()
+            while coordinator_end1 in coordinator._pending:
+                await asyncio.sleep(0.01)
+
+            await asyncio.sleep(0)
+            assert dropped.cancelled()
+            assert len(coordinator._pending[coordinator_end2]) == 1
+        finally:
+            worker_end2.close()
+            await asyncio.wait_for(task, timeout=5)
+
+        assert coordinator._pending == {}
+
+
+class TestIdentifyGate:
+    @pytest.mark.asyncio
+    async def test_acquire(self):
+        worker_end, coordinator_end = multiprocessing.Pipe()
+        gate = cluster.IdentifyGate(worker_end)
+
+        try:
+            task = asyncio.create_task(gate.acquire(5))
+            await asyncio.sleep(0)
+
+            assert coordinator_end.poll(5)
+            request_id, shard_id = coordinator_end.recv()
+            assert shard_id == 5
+            assert not task.done()
+
+            coordinator_end.send(request_id)
+            await asyncio.wait_for(task, timeout=5)
+        finally:
+            gate.close()
+            coordinator_end.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_coordinator_gone(self):
+        worker_end, coordinator_end = multiprocessing.Pipe()
+        gate = cluster.IdentifyGate(worker_end)
+
+        task = asyncio.create_task(gate.acquire(5))
+        await asyncio.sleep(0)
+        coordinator_end.close()
+
+        with pytest.raises(RuntimeError, match=r"The cluster coordinator is no longer running"):
+            await asyncio.wait_for(task, timeout=5)
+
+        assert worker_end.closed
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_closed(self):
+        worker_end, coordinator_end = multiprocessing.Pipe()
+        gate = cluster.IdentifyGate(worker_end)
+        gate.close()
+
+        with pytest.raises(RuntimeError, match=r"The cluster coordinator is no longer running"):
+            await gate.acquire(5)
+
+        coordinator_end.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_pending_acquires(self):
+        worker_end, coordinator_end = multiprocessing.Pipe()
+        gate = cluster.IdentifyGate(worker_end)
+
+        task = asyncio.create_task(gate.acquire(5))
+        await asyncio.sleep(0)
+        gate.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert worker_end.closed
+        coordinator_end.close()
@@ -22,8 +22,10 @@
 
 import asyncio
 import base64
+import concurrent.futures
 import contextlib
 import random
+import threading
 
 import mock
 import pytest
@@ -88,6 +90,29 @@ async def test__request_guild_members_handles_state_conflict_error(shard):
 
 
 class TestEventManagerImpl:
+    def test___init___when_offload_threshold_less_than_1(self):
+        with pytest.raises(ValueError, match="'offload_threshold' must be greater than 0"):
+            event_manager.EventManagerImpl(
+                mock.Mock(), mock.Mock(), intents.Intents.ALL, dispatch_queue_size=10, offload_threshold=0
+            )
+
+    def test___init___when_offload_threshold_without_dispatch_queue(self):
+        with pytest.raises(ValueError, match="'offload_threshold' can only be used with 'dispatch_queue_size'"):
+            event_manager.EventManagerImpl(mock.Mock(), mock.Mock(), intents.Intents.ALL, offload_threshold=100)
+
+    def test___init___when_offload_threshold_with_process_pool_executor(self):
+        executor = mock.Mock(concurrent.futures.ProcessPoolExecutor)
+
+        with pytest.raises(ValueError, match="'offload_threshold' can't be used with a process pool 'executor'"):
+            event_manager.EventManagerImpl(
+                mock.Mock(),
+                mock.Mock(),
+                intents.Intents.ALL,
+                dispatch_queue_size=10,
+                executor=executor,
+                offload_threshold=100,
+            )
+
     @pytest.fixture
     def entity_factory(self):
         return mock.Mock()
@@ -613,6 +638,23 @@ async def test_on_guild_create_when_not_dispatching_and_caching(
 
         event_manager_impl.dispatch.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_on_guild_create_when_offloaded(self, event_manager_impl, shard, event_factory):
+        payload = {"members": [{}, {}], "unavailable": False}
+        event_manager_impl._offload_threshold = 2
+        event_manager_impl._enabled_for_event = mock.Mock(return_value=True)
+        event_manager_impl._cache_enabled_for = mock.Mock(return_value=False)
+        event_factory.deserialize_guild_available_event.side_effect = lambda *args: mock.Mock(
+            thread_id=threading.get_ident()
+        )
+
+        with mock.patch.object(event_manager, "_request_guild_members"):
+            await event_manager_impl.on_guild_create(shard, payload)
+
+        event_factory.deserialize_guild_available_event.assert_called_once_with(shard, payload)
+        event = event_manager_impl.dispatch.await_args.args[0]
+        assert event.thread_id != threading.get_ident()
+
     @pytest.mark.parametrize("include_unavailable", [True, False])
     @pytest.mark.asyncio
     async def test_on_guild_create_when_stateless(
@@ -1152,6 +1194,46 @@ async def test_on_guild_members_chunk_stateless(self, stateless_event_manager_im
             event_factory.deserialize_guild_member_chunk_event.return_value
         )
 
+    @pytest.mark.asyncio
+    async def test_on_guild_members_chunk_when_offloaded(self, event_manager_impl, shard, event_factory):
+        payload = {"members": [{}, {}]}
+        members = {i: f"member{i}" for i in range(2500)}
+        event = mock.Mock(members=members, presences={})
+        threads = []
+
+        def deserialize(*args):
+            threads.append(threading.get_ident())
+            return event
+
+        event_factory.deserialize_guild_member_chunk_event.side_effect = deserialize
+        event_manager_impl._offload_threshold = 2
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            event_manager_impl._executor = executor
+            with mock.patch.object(asyncio, "sleep", new=mock.AsyncMock()) as sleep:
+                await event_manager_impl.on_guild_members_chunk(shard, payload)
+
+        assert threads
+        assert threads[0] != threading.get_ident()
+        event_factory.deserialize_guild_member_chunk_event.assert_called_once_with(shard, payload)
+        assert event_manager_impl._cache.set_member.call_count == 2500
+        # Merging the members yields to the event loop between batches
+        assert sleep.await_count == 2
+        event_manager_impl.dispatch.assert_awaited_once_with(event)
+
+    @pytest.mark.asyncio
+    async def test_on_guild_members_chunk_when_under_offload_threshold(self, event_manager_impl, shard, event_factory):
+        payload = {"members": [{}]}
+        event_factory.deserialize_guild_member_chunk_event.side_effect = lambda *args: mock.Mock(
+            members={}, presences={}, thread_id=threading.get_ident()
+        )
+        event_manager_impl._offload_threshold = 2
+
+        await event_manager_impl.on_guild_members_chunk(shard, payload)
+
+        event = event_manager_impl.dispatch.await_args.args[0]
+        assert event.thread_id == threading.get_ident()
+
     @pytest.mark.asyncio
     async def test_on_guild_role_create_stateful(self, event_manager_impl, shard, event_factory):
         payload = {}
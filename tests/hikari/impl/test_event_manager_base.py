@@ -44,6 +44,13 @@
 from tests.hikari import hikari_test_helpers
 
 
+class StubEvent(base_events.Event):
+    app = None
+
+
+class StubSubEvent(StubEvent): ...
+
+
 class TestGenerateWeakListener:
     @pytest.mark.asyncio
     async def test__generate_weak_listener_when_method_is_None(self):
@@ -369,6 +376,96 @@ def test_is_enabled(self, is_caching, listener_group_count, waiter_group_count,
         assert consumer.is_enabled is expected_result
 
 
+class TestDispatchWorker:
+    @pytest.fixture
+    def worker(self):
+        event_manager = mock.Mock(_handle_dispatch=mock.AsyncMock())
+        return event_manager_base._DispatchWorker(event_manager, mock.Mock(id=5), 2)
+
+    @pytest.mark.asyncio
+    async def test_watch_shard(self, worker):
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            with mock.patch.object(event_manager_base._DispatchWorker, "_remove_on_close", new=mock.Mock()) as remove:
+                worker.watch_shard()
+
+        create_task.assert_called_once_with(remove.return_value, name="dispatch worker watcher (shard 5)")
+        assert worker._watcher is create_task.return_value
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [None, RuntimeError("closed with error")])
+    async def test__remove_on_close(self, worker, error):
+        worker._shard.join = mock.AsyncMock(side_effect=error)
+        worker._event_manager._dispatch_workers = {5: worker, 6: object()}
+
+        await worker._remove_on_close()
+
+        worker._shard.join.assert_awaited_once_with()
+        assert list(worker._event_manager._dispatch_workers) == [6]
+
+    @pytest.mark.asyncio
+    async def test__remove_on_close_when_replaced(self, worker):
+        worker._shard.join = mock.AsyncMock()
+        new_worker = object()
+        worker._event_manager._dispatch_workers = {5: new_worker}
+
+        await worker._remove_on_close()
+
+        assert worker._event_manager._dispatch_workers == {5: new_worker}
+
+    @pytest.mark.asyncio
+    async def test_put_starts_single_task(self, worker):
+        consumer = object()
+
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            with mock.patch.object(event_manager_base._DispatchWorker, "_run", new=mock.Mock()) as run:
+                worker.put(consumer, {"a": 1})
+                worker.put(consumer, {"b": 2})
+
+        create_task.assert_called_once_with(run.return_value, name="dispatch worker (shard 5)")
+        assert worker._task is create_task.return_value
+        assert list(worker._queue) == [(consumer, {"a": 1}), (consumer, {"b": 2})]
+
+    @pytest.mark.asyncio
+    async def test_put_when_full(self, worker):
+        worker._task = object()
+
+        with mock.patch.object(event_manager_base, "_LOGGER") as logger:
+            for i in range(4):
+                worker.put(object(), {"i": i})
+
+        logger.warning.assert_called_once()
+        stats = worker.stats()
+        assert stats.size == 4
+        assert stats.high_watermark == 4
+        assert stats.enqueued == 4
+        assert stats.overflowed == 2
+
+    @pytest.mark.asyncio
+    async def test_run_consumes_in_order(self, worker):
+        consumer = object()
+        processed = []
+
+        async def handle_dispatch(consumer, shard, payload):
+            processed.append(payload["i"])
+            assert event_manager_base._DETACHED_DISPATCH.get() is True
+
+        worker._event_manager._handle_dispatch = handle_dispatch
+
+        with mock.patch.object(event_manager_base, "_DISPATCH_BATCH_SIZE", new=2):
+            for i in range(5):
+                worker.put(consumer, {"i": i})
+
+            await worker._task
+
+        assert processed == [0, 1, 2, 3, 4]
+        assert worker._task is None
+        assert worker.stats() == event_manager_base.DispatchQueueStats(
+            shard_id=5, size=0, max_size=2, high_watermark=5, enqueued=5, consumed=5, overflowed=3
+        )
+        # The worker's context should not leak out
+        assert event_manager_base._DETACHED_DISPATCH.get() is False
+
+
 class TestEventManagerBase:
     @pytest.fixture
     def event_manager(self):
@@ -543,6 +640,187 @@ async def test_consume_raw_event_skips_raw_dispatch_when_not_enabled(self, event
         event_manager._event_factory.deserialize_shard_payload_event.vassert_not_called()
         event_manager._enabled_for_event.assert_called_once_with(shard_events.ShardPayloadEvent)
 
+    def test___init___when_dispatch_queue_size_not_positive(self):
+        with pytest.raises(ValueError, match="'dispatch_queue_size' must be greater than 0"):
+            event_manager_base.EventManagerBase(mock.Mock(), mock.Mock(), dispatch_queue_size=0)
+
+    @pytest.mark.asyncio
+    async def test_consume_raw_event_when_queued_and_consumer_not_enabled(self, event_manager):
+        event_manager._dispatch_queue_size = 10
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._consumers = {"existing_event": mock.Mock(is_enabled=False)}
+
+        with mock.patch.object(asyncio, "create_task") as create_task:
+            event_manager.consume_raw_event("EXISTING_EVENT", mock.Mock(id=1), {"berp": "baz"})
+
+        create_task.assert_not_called()
+        assert event_manager._dispatch_workers == {}
+
+    @pytest.mark.asyncio
+    async def test_consume_raw_event_when_queued(self, event_manager):
+        event_manager._dispatch_queue_size = 10
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        consumer = mock.Mock(is_enabled=True)
+        event_manager._consumers = {"existing_event": consumer}
+        shard = mock.Mock(id=1)
+
+        with mock.patch.object(event_manager_base, "_DispatchWorker") as dispatch_worker:
+            event_manager.consume_raw_event("EXISTING_EVENT", shard, {"berp": "baz"})
+            event_manager.consume_raw_event("EXISTING_EVENT", shard, {"berp": "bop"})
+
+        dispatch_worker.assert_called_once_with(event_manager, shard, 10)
+        dispatch_worker.return_value.watch_shard.assert_called_once_with()
+        assert event_manager._dispatch_workers == {1: dispatch_worker.return_value}
+        dispatch_worker.return_value.put.assert_has_calls(
+            [mock.call(consumer, {"berp": "baz"}), mock.call(consumer, {"berp": "bop"})]
+        )
+
+    def test_is_raw_event_enabled_when_shard_payload_event_enabled(self, event_manager):
+        event_manager._enabled_for_event = mock.Mock(return_value=True)
+        event_manager._consumers = {"existing_event": mock.Mock(is_enabled=False)}
+
+        assert event_manager.is_raw_event_enabled("EXISTING_EVENT") is True
+
+        event_manager._enabled_for_event.assert_called_once_with(shard_events.ShardPayloadEvent)
+
+    @pytest.mark.parametrize("is_enabled", [True, False])
+    def test_is_raw_event_enabled(self, event_manager, is_enabled):
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._consumers = {"existing_event": mock.Mock(is_enabled=is_enabled)}
+
+        assert event_manager.is_raw_event_enabled("EXISTING_EVENT") is is_enabled
+
+    def test_is_raw_event_enabled_when_unknown_event(self, event_manager):
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._consumers = {}
+
+        assert event_manager.is_raw_event_enabled("UNEXISTING_EVENT") is True
+
+    def test_get_dispatch_queue_stats(self, event_manager):
+        worker_1 = mock.Mock()
+        worker_2 = mock.Mock()
+        event_manager._dispatch_workers = {1: worker_1, 2: worker_2}
+
+        assert event_manager.get_dispatch_queue_stats() == [worker_1.stats.return_value, worker_2.stats.return_value]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_when_detached(self, event_manager):
+        called = asyncio.Event()
+
+        async def listener(event):
+            assert event_manager_base._DETACHED_DISPATCH.get() is False
+            called.set()
+
+        event_manager._listeners = {StubEvent: [listener]}
+        token = event_manager_base._DETACHED_DISPATCH.set(True)
+        try:
+            future = event_manager.dispatch(StubEvent())
+        finally:
+            event_manager_base._DETACHED_DISPATCH.reset(token)
+
+        assert future.done()
+        await asyncio.wait_for(called.wait(), timeout=1)
+
+    def test__get_dispatch_entry(self, event_manager):
+        listener_1 = object()
+        listener_2 = object()
+        listener_3 = object()
+        event_manager._listeners = {
+            StubSubEvent: [listener_1],
+            StubEvent: [listener_2, listener_3],
+            member_events.MemberCreateEvent: [object()],
+        }
+        event_manager._waiters = {base_events.Event: set(), member_events.MemberCreateEvent: set()}
+
+        entry = event_manager._get_dispatch_entry(StubSubEvent)
+
+        assert entry == ((listener_1, listener_2, listener_3), (base_events.Event,), True)
+        assert event_manager._dispatch_table == {StubSubEvent: entry}
+        # It should now be served from the table
+        event_manager._listeners = {}
+        assert event_manager._get_dispatch_entry(StubSubEvent) is entry
+
+    def test__get_dispatch_entry_when_nothing_registered(self, event_manager):
+        event_manager._listeners = {member_events.MemberCreateEvent: [object()]}
+        event_manager._waiters = {}
+
+        assert event_manager._get_dispatch_entry(StubEvent) == ((), (), False)
+
+    def test_subscribe_clears_dispatch_table(self, event_manager):
+        async def listener(event): ...
+
+        event_manager._dispatch_table = {StubEvent: ((), (), False)}
+
+        event_manager.subscribe(StubEvent, listener)
+        assert event_manager._dispatch_table == {}
+        assert event_manager._get_dispatch_entry(StubEvent) == ((listener,), (), True)
+
+        event_manager.subscribe(StubEvent, listener)
+        assert event_manager._dispatch_table == {}
+        assert event_manager._get_dispatch_entry(StubEvent) == ((listener, listener), (), True)
+
+    def test_unsubscribe_clears_dispatch_table(self, event_manager):
+        async def listener(event): ...
+
+        event_manager._listeners = {StubEvent: [listener, listener]}
+        event_manager._dispatch_table = {StubEvent: ((listener, listener), (), True)}
+
+        event_manager.unsubscribe(StubEvent, listener)
+        assert event_manager._dispatch_table == {}
+        assert event_manager._get_dispatch_entry(StubEvent) == ((listener,), (), True)
+
+        event_manager.unsubscribe(StubEvent, listener)
+        assert event_manager._dispatch_table == {}
+        assert event_manager._get_dispatch_entry(StubEvent) == ((), (), False)
+
+    @pytest.mark.asyncio
+    async def test_dispatch_invokes_listeners_in_order(self, event_manager):
+        called = []
+
+        async def listener_1(event):
+            called.append(1)
+
+        async def listener_2(event):
+            called.append(2)
+
+        event_manager._listeners = {StubEvent: [listener_2], StubSubEvent: [listener_1]}
+        event = StubSubEvent()
+
+        await event_manager.dispatch(event)
+        await event_manager.dispatch(event)
+
+        assert called == [1, 2, 1, 2]
+        assert event_manager._dispatch_table == {StubSubEvent: ((listener_1, listener_2), (), True)}
+
+    @pytest.mark.asyncio
+    async def test_wait_for_and_dispatch_update_dispatch_table(self, event_manager):
+        event_manager._check_event = mock.Mock()
+        event = StubSubEvent()
+        assert event_manager._get_dispatch_entry(StubSubEvent) == ((), (), False)
+
+        task = asyncio.create_task(event_manager.wait_for(StubEvent, timeout=1))
+        await asyncio.sleep(0)
+
+        assert event_manager._dispatch_table == {}
+        assert event_manager._enabled_for_event(StubSubEvent) is True
+
+        await event_manager.dispatch(event)
+
+        assert await task is event
+        assert event_manager._waiters == {}
+        assert event_manager._dispatch_table == {}
+        assert event_manager._enabled_for_event(StubSubEvent) is False
+
+    @pytest.mark.asyncio
+    async def test_wait_for_timeout_clears_dispatch_table(self, event_manager):
+        event_manager._check_event = mock.Mock()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await event_manager.wait_for(StubEvent, timeout=0)
+
+        assert event_manager._waiters == {}
+        assert event_manager._enabled_for_event(StubEvent) is False
+
     @pytest.mark.asyncio
     async def test_handle_dispatch_invokes_callback(self, event_manager):
         event_manager._enabled_for_consumer = mock.Mock(return_value=True)
@@ -20,7 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import asyncio
+import concurrent.futures
 import contextlib
+import multiprocessing
+import os
 import sys
 import warnings
 
@@ -29,17 +32,22 @@
 
 from hikari import applications
 from hikari import errors
+from hikari import intents as intents_
 from hikari import presences
 from hikari import snowflakes
 from hikari import undefined
 from hikari.impl import cache as cache_impl
+from hikari.impl import cluster
 from hikari.impl import config
 from hikari.impl import entity_factory as entity_factory_impl
 from hikari.impl import event_factory as event_factory_impl
 from hikari.impl import event_manager as event_manager_impl
 from hikari.impl import gateway_bot as bot_impl
+from hikari.impl import rate_limits
 from hikari.impl import rest as rest_impl
+from hikari.impl import rest_cache as rest_cache_impl
 from hikari.impl import shard as shard_impl
+from hikari.impl import shared_cache as shared_cache_impl
 from hikari.impl import voice as voice_impl
 from hikari.internal import aio
 from hikari.internal import signals
@@ -81,7 +89,7 @@ def test_validate_activity_when_no_warning():
 class TestGatewayBot:
     @pytest.fixture
     def cache(self):
-        return mock.Mock()
+        return mock.Mock(settings=mock.Mock(snapshot_path=None))
 
     @pytest.fixture
     def entity_factory(self):
@@ -117,7 +125,7 @@ def proxy_settings(self):
 
     @pytest.fixture
     def http_settings(self):
-        return mock.Mock()
+        return mock.Mock(response_cache=None)
 
     @pytest.fixture
     def bot(
@@ -166,8 +174,8 @@ def test_init(self):
         warn_if_not_optimized = stack.enter_context(mock.patch.object(ux, "warn_if_not_optimized"))
         print_banner = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
         executor = object()
-        cache_settings = object()
-        http_settings = object()
+        cache_settings = mock.Mock(shared_store_path=None)
+        http_settings = mock.Mock(response_cache=None)
         proxy_settings = object()
         intents = object()
 
@@ -183,7 +191,11 @@ def test_init(self):
                 http_settings=http_settings,
                 intents=intents,
                 auto_chunk_members=False,
+                dispatch_queue_size=500,
+                offload_threshold=10_000,
                 logs="DEBUG",
+                gateway_compression="transport_zstd_stream",
+                gateway_data_format="etf",
                 max_rate_limit=200,
                 max_retries=0,
                 proxy_settings=proxy_settings,
@@ -192,6 +204,8 @@ def test_init(self):
 
         assert bot._http_settings is http_settings
         assert bot._proxy_settings is proxy_settings
+        assert bot._gateway_compression == "transport_zstd_stream"
+        assert bot._gateway_data_format == "etf"
         assert bot._cache is cache.return_value
         cache.assert_called_once_with(bot, cache_settings)
         assert bot._event_manager is event_manager.return_value
@@ -201,6 +215,9 @@ def test_init(self):
             intents,
             auto_chunk_members=False,
             cache=cache.return_value,
+            dispatch_queue_size=500,
+            executor=executor,
+            offload_threshold=10_000,
         )
         assert bot._entity_factory is entity_factory.return_value
         entity_factory.assert_called_once_with(bot)
@@ -240,8 +257,10 @@ def test_init_when_no_settings(self):
         stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
         stack.enter_context(mock.patch.object(ux, "warn_if_not_optimized"))
         http_settings = stack.enter_context(mock.patch.object(config, "HTTPSettings"))
+        http_settings.return_value.response_cache = None
         proxy_settings = stack.enter_context(mock.patch.object(config, "ProxySettings"))
         cache_settings = stack.enter_context(mock.patch.object(config, "CacheSettings"))
+        cache_settings.return_value.shared_store_path = None
 
         with stack:
             bot = bot_impl.GatewayBot("token", cache_settings=None, http_settings=None, proxy_settings=None)
@@ -253,6 +272,40 @@ def test_init_when_no_settings(self):
         cache.assert_called_once_with(bot, cache_settings.return_value)
         cache_settings.assert_called_once_with()
 
+    def test_init_with_shared_store_path(self):
+        stack = contextlib.ExitStack()
+        cache = stack.enter_context(mock.patch.object(shared_cache_impl, "SharedCacheImpl"))
+        stack.enter_context(mock.patch.object(ux, "init_logging"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
+        stack.enter_context(mock.patch.object(ux, "warn_if_not_optimized"))
+        cache_settings = config.CacheSettings(shared_store_path="cache.store")
+
+        with stack:
+            bot = bot_impl.GatewayBot("token", cache_settings=cache_settings)
+
+        assert bot._cache is cache.return_value
+        cache.assert_called_once_with(bot, cache_settings, "cache.store")
+
+    def test_init_with_response_cache(self):
+        stack = contextlib.ExitStack()
+        event_manager = stack.enter_context(mock.patch.object(event_manager_impl, "EventManagerImpl"))
+        subscribe_invalidation = stack.enter_context(mock.patch.object(rest_cache_impl, "subscribe_invalidation"))
+        stack.enter_context(mock.patch.object(ux, "init_logging"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "print_banner"))
+        stack.enter_context(mock.patch.object(ux, "warn_if_not_optimized"))
+        response_cache = rest_cache_impl.RESTResponseCacheImpl()
+
+        with stack:
+            bot_impl.GatewayBot(
+                "token",
+                http_settings=config.HTTPSettings(response_cache=response_cache),
+                intents=intents_.Intents.GUILDS,
+            )
+
+        subscribe_invalidation.assert_called_once_with(
+            response_cache, event_manager.return_value, intents_.Intents.GUILDS
+        )
+
     def test_init_strips_token(self):
         stack = contextlib.ExitStack()
         stack.enter_context(mock.patch.object(ux, "init_logging"))
@@ -266,6 +319,28 @@ def test_init_strips_token(self):
 
         assert bot._token == "token yeet"
 
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"dispatch_queue_size": 10, "offload_threshold": 0}, "'offload_threshold' must be greater than 0"),
+            ({"offload_threshold": 100}, "'offload_threshold' can only be used with 'dispatch_queue_size'"),
+            (
+                {
+                    "dispatch_queue_size": 10,
+                    "executor": mock.Mock(concurrent.futures.ProcessPoolExecutor),
+                    "offload_threshold": 100,
+                },
+                "'offload_threshold' can't be used with a process pool 'executor'",
+            ),
+        ],
+    )
+    def test_init_when_offload_threshold_unsupported(self, kwargs, message):
+        with mock.patch.object(ux, "init_logging") as init_logging:
+            with pytest.raises(ValueError, match=message):
+                bot_impl.GatewayBot("token", **kwargs)
+
+        init_logging.assert_not_called()
+
     def test_cache(self, bot, cache):
         assert bot.cache is cache
 
@@ -381,7 +456,7 @@ def __await__(self):
                 if self._error:
                     raise self._error
 
-            def __call__(self):
+            def __call__(self, **kwargs):
                 return self
 
             def assert_awaited_once(self):
@@ -404,6 +479,7 @@ def assert_awaited_once(self):
         shard1 = mock.Mock(id=1, close=AwaitableMock(error))
         shard2 = mock.Mock(id=2, close=AwaitableMock())
         bot._shards = {0: shard0, 1: shard1, 2: shard2}
+        bot._identify_rate_limiter = identify_rate_limiter = mock.Mock()
 
         with stack:
             await bot.close()
@@ -441,6 +517,8 @@ def assert_awaited_once(self):
         # Clear out maps
         assert bot._shards == {}
         cache.clear.assert_called_once_with()
+        identify_rate_limiter.close.assert_called_once_with()
+        assert bot._identify_rate_limiter is None
 
         event_manager.dispatch.assert_has_calls(
             [
@@ -449,6 +527,87 @@ def assert_awaited_once(self):
             ]
         )
 
+    @pytest.mark.asyncio
+    async def test_close_with_session_store(self, bot, event_manager, rest, voice):
+        event_manager.dispatch = mock.AsyncMock()
+        rest.close = mock.AsyncMock()
+        voice.close = mock.AsyncMock()
+        bot._closed_event = mock.Mock()
+        bot._closing_event = mock.Mock(is_set=mock.Mock(return_value=False))
+        bot._session_store = session_store = mock.Mock(save=mock.AsyncMock())
+        shard0 = mock.Mock(is_alive=True, close=mock.AsyncMock(), get_session=mock.Mock(return_value="session0"))
+        shard1 = mock.Mock(is_alive=True, close=mock.AsyncMock(), get_session=mock.Mock(return_value=None))
+        bot._shards = {0: shard0, 1: shard1}
+
+        await bot.close()
+
+        shard0.close.assert_awaited_once_with(keep_session=True)
+        shard1.close.assert_awaited_once_with(keep_session=True)
+        session_store.save.assert_awaited_once_with(["session0"])
+        assert bot._shards == {}
+
+    @pytest.mark.asyncio
+    async def test_close_with_cache_snapshot(self, bot, event_manager, rest, voice, cache):
+        event_manager.dispatch = mock.AsyncMock()
+        rest.close = mock.AsyncMock()
+        voice.close = mock.AsyncMock()
+        cache.settings.snapshot_path = "cache.snapshot"
+        cache.dump = mock.AsyncMock()
+        bot._closed_event = mock.Mock()
+        bot._closing_event = mock.Mock(is_set=mock.Mock(return_value=False))
+
+        await bot.close()
+
+        cache.dump.assert_awaited_once_with("cache.snapshot")
+        cache.clear.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_load_cache_snapshot(self, bot, cache, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"snapshot")
+        cache.load = mock.AsyncMock()
+
+        await bot._load_cache_snapshot(str(path))
+
+        cache.load.assert_awaited_once_with(str(path))
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_load_cache_snapshot_when_invalid(self, bot, cache, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"snapshot")
+        cache.load = mock.AsyncMock(side_effect=ValueError("invalid"))
+
+        await bot._load_cache_snapshot(str(path))
+
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_load_cache_snapshot_when_missing(self, bot, cache, tmp_path):
+        cache.load = mock.AsyncMock(side_effect=FileNotFoundError)
+
+        await bot._load_cache_snapshot(str(tmp_path / "cache.snapshot"))
+
+    @pytest.mark.asyncio
+    async def test_load_shard_sessions(self, bot):
+        bot._intents = intents_.Intents.GUILDS
+        sessions = [
+            mock.Mock(shard_id=0, shard_count=2, intents=int(intents_.Intents.GUILDS)),
+            mock.Mock(shard_id=1, shard_count=2, intents=int(intents_.Intents.ALL)),
+            mock.Mock(shard_id=2, shard_count=3, intents=int(intents_.Intents.GUILDS)),
+        ]
+        bot._session_store = session_store = mock.Mock(
+            load=mock.AsyncMock(return_value=sessions), save=mock.AsyncMock()
+        )
+
+        assert await bot._load_shard_sessions(2) == {0: sessions[0]}
+
+        session_store.save.assert_awaited_once_with(())
+
+    @pytest.mark.asyncio
+    async def test_load_shard_sessions_without_store(self, bot):
+        assert await bot._load_shard_sessions(2) == {}
+
     def test_dispatch(self, bot, event_manager):
         event = object()
 
@@ -620,6 +779,251 @@ def test_run(self, bot):
         handle_interrupts.assert_called_once_with(enabled=False, loop=loop, propagate_interrupts=False)
         handle_interrupts.return_value.assert_used_once()
 
+    def test_run_when_processes_less_than_1(self, bot):
+        with pytest.raises(ValueError, match=r"'processes' must be greater than or equal to 1"):
+            bot.run(processes=0)
+
+    def test_run_when_processes_with_shared_cache(self, bot):
+        bot._cache = mock.Mock(shared_cache_impl.SharedCacheImpl)
+
+        with pytest.raises(ValueError, match=r"'processes' can't be greater than 1 when using a shared cache store"):
+            bot.run(processes=2)
+
+    def test_run_when_processes_with_cache_snapshot(self, bot, cache):
+        cache.settings.snapshot_path = "cache.snapshot"
+
+        with pytest.raises(ValueError, match=r"'processes' can't be greater than 1 when using a cache snapshot"):
+            bot.run(processes=2)
+
+    def test_run_when_processes_with_session_store(self, bot):
+        bot._session_store = mock.Mock()
+
+        with pytest.raises(ValueError, match=r"'processes' can't be greater than 1 when using a session store"):
+            bot.run(processes=2)
+
+    def test_run_when_processes_is_1(self, bot):
+        stack = contextlib.ExitStack()
+        run_cluster = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_run_cluster"))
+        start_function = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "start", new=mock.Mock()))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "join", new=mock.Mock()))
+        stack.enter_context(
+            mock.patch.object(signals, "handle_interrupts", return_value=hikari_test_helpers.ContextManagerMock())
+        )
+        stack.enter_context(mock.patch.object(aio, "get_or_make_loop"))
+
+        with stack:
+            bot.run(close_loop=False, processes=1)
+
+        run_cluster.assert_not_called()
+        start_function.assert_called_once()
+
+    def test_run_with_processes(self, bot):
+        stack = contextlib.ExitStack()
+        run_cluster = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_run_cluster"))
+        start_function = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "start", new=mock.Mock()))
+        get_or_make_loop = stack.enter_context(mock.patch.object(aio, "get_or_make_loop"))
+
+        with stack:
+            bot.run(
+                activity="activity",
+                afk=True,
+                check_for_updates=False,
+                enable_signal_handlers=False,
+                idle_since="idle since",
+                ignore_session_start_limit=True,
+                large_threshold=100,
+                processes=4,
+                propagate_interrupts=True,
+                shard_ids=(1, 2),
+                shard_count=10,
+                status="status",
+            )
+
+        run_cluster.assert_called_once_with(
+            4,
+            ignore_session_start_limit=True,
+            propagate_interrupts=True,
+            shard_ids=(1, 2),
+            shard_count=10,
+            run_kwargs={
+                "activity": "activity",
+                "afk": True,
+                "asyncio_debug": None,
+                "check_for_updates": False,
+                "close_passed_executor": False,
+                "close_loop": True,
+                "coroutine_tracking_depth": None,
+                "enable_signal_handlers": False,
+                "idle_since": "idle since",
+                "large_threshold": 100,
+                "propagate_interrupts": True,
+                "status": "status",
+            },
+        )
+        start_function.assert_not_called()
+        get_or_make_loop.assert_not_called()
+
+    def test_run_cluster_when_fork_not_supported(self, bot):
+        with mock.patch.object(multiprocessing, "get_all_start_methods", return_value=["spawn"]):
+            with pytest.raises(RuntimeError, match=r"requires support for forking processes"):
+                bot._run_cluster(
+                    2,
+                    ignore_session_start_limit=False,
+                    propagate_interrupts=False,
+                    shard_ids=None,
+                    shard_count=None,
+                    run_kwargs={},
+                )
+
+    def test_run_cluster(self, bot):
+        requirements = mock.Mock(shard_count=5, session_start_limit=mock.Mock(remaining=10, max_concurrency=2))
+        context = mock.Mock()
+        pipes = [(mock.Mock(), mock.Mock()) for _ in range(2)]
+        context.Pipe.side_effect = pipes
+        workers = [mock.Mock(exitcode=0), mock.Mock(exitcode=0)]
+        context.Process.side_effect = workers
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(multiprocessing, "get_all_start_methods", return_value=["fork"]))
+        get_context = stack.enter_context(mock.patch.object(multiprocessing, "get_context", return_value=context))
+        loop = stack.enter_context(mock.patch.object(aio, "get_or_make_loop")).return_value
+        loop.run_until_complete.return_value = requirements
+        destroy_loop = stack.enter_context(mock.patch.object(aio, "destroy_loop"))
+        fetch_gateway_bot_info = stack.enter_context(
+            mock.patch.object(bot_impl.GatewayBot, "_fetch_gateway_bot_info", new=mock.Mock())
+        )
+        coordinator = stack.enter_context(mock.patch.object(cluster, "IdentifyCoordinator"))
+
+        with stack:
+            bot._run_cluster(
+                2,
+                ignore_session_start_limit=False,
+                propagate_interrupts=False,
+                shard_ids=None,
+                shard_count=None,
+                run_kwargs={"check_for_updates": True, "afk": True},
+            )
+
+        get_context.assert_called_once_with("fork")
+        loop.run_until_complete.assert_called_once_with(fetch_gateway_bot_info.return_value)
+        destroy_loop.assert_called_once_with(loop, bot_impl._LOGGER)
+        context.Process.assert_has_calls(
+            [
+                mock.call(
+                    target=bot._run_cluster_worker,
+                    args=(pipes[0][1], (0, 1, 2), 5, {"check_for_updates": True, "afk": True}),
+                    name="hikari cluster worker 0",
+                ),
+                mock.call(
+                    target=bot._run_cluster_worker,
+                    args=(pipes[1][1], (3, 4), 5, {"check_for_updates": False, "afk": True}),
+                    name="hikari cluster worker 1",
+                ),
+            ]
+        )
+        for (coordinator_end, worker_end), worker in zip(pipes, workers):
+            worker.start.assert_called_once_with()
+            worker.join.assert_called_once_with()
+            worker_end.close.assert_called_once_with()
+            coordinator_end.close.assert_called_once_with()
+
+        coordinator.assert_called_once_with([pipes[0][0], pipes[1][0]], 2)
+        coordinator.return_value.serve.assert_called_once_with()
+
+    def test_run_cluster_when_worker_failed(self, bot):
+        requirements = mock.Mock(shard_count=2, session_start_limit=mock.Mock(remaining=10, max_concurrency=1))
+        context = mock.Mock()
+        context.Pipe.side_effect = [(mock.Mock(), mock.Mock()) for _ in range(2)]
+        workers = [mock.Mock(exitcode=0), mock.Mock(exitcode=1)]
+        workers[1].name = "hikari cluster worker 1"
+        context.Process.side_effect = workers
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(multiprocessing, "get_all_start_methods", return_value=["fork"]))
+        stack.enter_context(mock.patch.object(multiprocessing, "get_context", return_value=context))
+        stack.enter_context(mock.patch.object(aio, "get_or_make_loop")).return_value.run_until_complete.return_value = (
+            requirements
+        )
+        stack.enter_context(mock.patch.object(aio, "destroy_loop"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_fetch_gateway_bot_info", new=mock.Mock()))
+        stack.enter_context(mock.patch.object(cluster, "IdentifyCoordinator"))
+
+        with stack:
+            with pytest.raises(
+                RuntimeError, match=r"Cluster worker\(s\) exited with an error: hikari cluster worker 1"
+            ):
+                bot._run_cluster(
+                    2,
+                    ignore_session_start_limit=False,
+                    propagate_interrupts=False,
+                    shard_ids=None,
+                    shard_count=None,
+                    run_kwargs={"check_for_updates": False},
+                )
+
+    @pytest.mark.parametrize(("propagate_interrupts", "raises"), [(True, True), (False, False)])
+    def test_run_cluster_when_interrupted(self, bot, propagate_interrupts, raises):
+        requirements = mock.Mock(shard_count=2, session_start_limit=mock.Mock(remaining=10, max_concurrency=1))
+        context = mock.Mock()
+        context.Pipe.side_effect = [(mock.Mock(), mock.Mock()) for _ in range(2)]
+        workers = [mock.Mock(exitcode=0, is_alive=mock.Mock(return_value=True)), mock.Mock(exitcode=0)]
+        workers[1].is_alive.return_value = False
+        context.Process.side_effect = workers
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(multiprocessing, "get_all_start_methods", return_value=["fork"]))
+        stack.enter_context(mock.patch.object(multiprocessing, "get_context", return_value=context))
+        stack.enter_context(mock.patch.object(aio, "get_or_make_loop")).return_value.run_until_complete.return_value = (
+            requirements
+        )
+        stack.enter_context(mock.patch.object(aio, "destroy_loop"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_fetch_gateway_bot_info", new=mock.Mock()))
+        coordinator = stack.enter_context(mock.patch.object(cluster, "IdentifyCoordinator"))
+        coordinator.return_value.serve.side_effect = KeyboardInterrupt
+        if raises:
+            stack.enter_context(pytest.raises(KeyboardInterrupt))
+
+        with stack:
+            bot._run_cluster(
+                2,
+                ignore_session_start_limit=False,
+                propagate_interrupts=propagate_interrupts,
+                shard_ids=None,
+                shard_count=None,
+                run_kwargs={"check_for_updates": False},
+            )
+
+        workers[0].terminate.assert_called_once_with()
+        workers[1].terminate.assert_not_called()
+        for worker in workers:
+            worker.join.assert_called_once_with()
+
+    def test_run_cluster_worker(self, bot):
+        connection = object()
+
+        stack = contextlib.ExitStack()
+        setpgid = stack.enter_context(mock.patch.object(os, "setpgid", create=True))
+        run = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "run"))
+        identify_gate = stack.enter_context(mock.patch.object(cluster, "IdentifyGate"))
+
+        with stack:
+            bot._run_cluster_worker(connection, (1, 2), 10, {"afk": True})
+
+        setpgid.assert_called_once_with(0, 0)
+        identify_gate.assert_called_once_with(connection)
+        assert bot._identify_rate_limiter is identify_gate.return_value
+        run.assert_called_once_with(shard_ids=(1, 2), shard_count=10, ignore_session_start_limit=True, afk=True)
+
+    @pytest.mark.asyncio
+    async def test_fetch_gateway_bot_info(self, bot, rest):
+        rest.fetch_gateway_bot_info = mock.AsyncMock()
+        rest.close = mock.AsyncMock()
+
+        assert await bot._fetch_gateway_bot_info() is rest.fetch_gateway_bot_info.return_value
+
+        rest.start.assert_called_once_with()
+        rest.close.assert_awaited_once_with()
+
     @pytest.mark.asyncio
     async def test_start_when_shard_ids_specified_without_shard_count(self, bot):
         with pytest.raises(TypeError, match=r"'shard_ids' must be passed with 'shard_count'"):
@@ -637,31 +1041,30 @@ async def test_start(self, bot, rest, voice, event_manager, event_factory, http_
         class MockSessionStartLimit:
             remaining = 10
             reset_at = "now"
-            max_concurrency = 1
+            max_concurrency = 16
 
         class MockInfo:
             url = "yourmom.eu"
             shard_count = 2
             session_start_limit = MockSessionStartLimit()
 
-        shard1 = mock.Mock()
-        shard2 = mock.Mock()
-        shards_iter = iter((shard1, shard2))
-
-        mock_start_one_shard = mock.Mock()
-
-        def _mock_start_one_shard(*args, **kwargs):
-            bot._shards[kwargs["shard_id"]] = next(shards_iter)
-            return mock_start_one_shard(*args, **kwargs)
-
         stack = contextlib.ExitStack()
         stack.enter_context(mock.patch.object(bot_impl, "_validate_activity"))
-        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", new=_mock_start_one_shard))
+        start_one_shard = stack.enter_context(
+            mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", new=mock.Mock())
+        )
+        identify_rate_limiter = stack.enter_context(mock.patch.object(rate_limits, "IdentifyRateLimiter"))
         create_task = stack.enter_context(mock.patch.object(asyncio, "create_task"))
-        gather = stack.enter_context(mock.patch.object(asyncio, "gather"))
+        gather = stack.enter_context(
+            mock.patch.object(asyncio, "gather", return_value=asyncio.get_running_loop().create_future())
+        )
+        shield = stack.enter_context(mock.patch.object(asyncio, "shield"))
         event = stack.enter_context(mock.patch.object(asyncio, "Event"))
+        event.return_value.is_set.return_value = False
         first_completed = stack.enter_context(
-            mock.patch.object(aio, "first_completed", side_effect=[None, asyncio.TimeoutError, None])
+            mock.patch.object(
+                aio, "first_completed", side_effect=lambda *args, **kwargs: gather.return_value.set_result(None)
+            )
         )
         check_for_updates = stack.enter_context(mock.patch.object(ux, "check_for_updates", new=mock.Mock()))
 
@@ -693,16 +1096,12 @@ def _mock_start_one_shard(*args, **kwargs):
             ]
         )
 
-        assert gather.call_count == 2
-        gather.assert_has_calls(
-            [mock.call(mock_start_one_shard.return_value), mock.call(mock_start_one_shard.return_value)]
-        )
+        identify_rate_limiter.assert_called_once_with(16)
+        assert bot._identify_rate_limiter is identify_rate_limiter.return_value
 
-        assert mock_start_one_shard.call_count == 2
-        mock_start_one_shard.assert_has_calls(
+        start_one_shard.assert_has_calls(
             [
                 mock.call(
-                    bot,
                     activity="some activity",
                     afk=True,
                     idle_since="some idle since",
@@ -711,23 +1110,47 @@ def _mock_start_one_shard(*args, **kwargs):
                     shard_id=i,
                     shard_count=20,
                     url="yourmom.eu",
+                    session=None,
                 )
                 for i in (2, 10)
             ]
         )
+        gather.assert_called_once_with(start_one_shard.return_value, start_one_shard.return_value)
+        shield.assert_called_once_with(gather.return_value)
+        first_completed.assert_awaited_once_with(event.return_value.wait.return_value, shield.return_value, timeout=5)
 
-        closing_event_closing_wait = event.return_value.wait.return_value
-        assert first_completed.await_count == 3
+    @pytest.mark.asyncio
+    async def test_start_when_identify_rate_limiter_already_set(self, bot, rest, event_manager):
+        class MockSessionStartLimit:
+            remaining = 10
+            reset_at = "now"
+            max_concurrency = 16
 
-        first_completed.assert_has_awaits(
-            [
-                # Shard 1
-                mock.call(closing_event_closing_wait, gather.return_value),
-                # Shard 2
-                mock.call(closing_event_closing_wait, shard1.join.return_value, timeout=5),
-                mock.call(closing_event_closing_wait, gather.return_value),
-            ]
+        class MockInfo:
+            url = "yourmom.eu"
+            shard_count = 2
+            session_start_limit = MockSessionStartLimit()
+
+        existing_identify_rate_limiter = object()
+        bot._identify_rate_limiter = existing_identify_rate_limiter
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", new=mock.Mock()))
+        identify_rate_limiter = stack.enter_context(mock.patch.object(rate_limits, "IdentifyRateLimiter"))
+        stack.enter_context(mock.patch.object(asyncio, "gather"))
+        stack.enter_context(
+            mock.patch.object(asyncio, "Event", return_value=mock.Mock(is_set=mock.Mock(return_value=False)))
         )
+        stack.enter_context(mock.patch.object(aio, "first_completed"))
+
+        event_manager.dispatch = mock.AsyncMock()
+        rest.fetch_gateway_bot_info = mock.AsyncMock(return_value=MockInfo())
+
+        with stack:
+            await bot.start(shard_ids=(2, 10), shard_count=20, check_for_updates=False)
+
+        identify_rate_limiter.assert_not_called()
+        assert bot._identify_rate_limiter is existing_identify_rate_limiter
 
     @pytest.mark.asyncio
     async def test_start_when_request_close_mid_startup(self, bot, rest, voice, event_manager, event_factory):
@@ -741,12 +1164,12 @@ class MockInfo:
             shard_count = 2
             session_start_limit = MockSessionStartLimit()
 
-        # Assume that we already started one shard
-        shard1 = mock.Mock()
-        bot._shards = {"1": shard1}
-
         stack = contextlib.ExitStack()
-        start_one_shard = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", new=mock.Mock()))
+        gather = stack.enter_context(
+            mock.patch.object(asyncio, "gather", return_value=asyncio.get_running_loop().create_future())
+        )
+        shield = stack.enter_context(mock.patch.object(asyncio, "shield"))
         first_completed = stack.enter_context(mock.patch.object(aio, "first_completed"))
         event = stack.enter_context(
             mock.patch.object(asyncio, "Event", return_value=mock.Mock(is_set=mock.Mock(return_value=True)))
@@ -758,11 +1181,9 @@ class MockInfo:
         with stack:
             await bot.start(shard_ids=(2, 10), shard_count=20, check_for_updates=False)
 
-        start_one_shard.assert_not_called()
-
-        first_completed.assert_called_once_with(
-            event.return_value.wait.return_value, shard1.join.return_value, timeout=5
-        )
+        first_completed.assert_awaited_once_with(event.return_value.wait.return_value, shield.return_value, timeout=5)
+        assert gather.return_value.cancelled()
+        event_manager.dispatch.assert_awaited_once_with(event_factory.deserialize_starting_event.return_value)
 
     @pytest.mark.asyncio
     async def test_start_when_shard_closed_mid_startup(self, bot, rest, voice, event_manager, event_factory):
@@ -776,12 +1197,16 @@ class MockInfo:
             shard_count = 2
             session_start_limit = MockSessionStartLimit()
 
-        # Assume that we already started one shard
+        # Assume that one shard already started while the other waits on the identify rate limiter
         shard1 = mock.Mock()
-        bot._shards = {"1": shard1}
+        bot._shards = {1: shard1}
 
         stack = contextlib.ExitStack()
-        start_one_shard = stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard"))
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", new=mock.Mock()))
+        gather = stack.enter_context(
+            mock.patch.object(asyncio, "gather", return_value=asyncio.get_running_loop().create_future())
+        )
+        shield = stack.enter_context(mock.patch.object(asyncio, "shield"))
         first_completed = stack.enter_context(mock.patch.object(aio, "first_completed"))
         event = stack.enter_context(
             mock.patch.object(asyncio, "Event", return_value=mock.Mock(is_set=mock.Mock(return_value=False)))
@@ -792,13 +1217,89 @@ class MockInfo:
         rest.fetch_gateway_bot_info = mock.AsyncMock(return_value=MockInfo())
 
         with stack:
-            await bot.start(shard_ids=(2, 10), shard_count=20, check_for_updates=False)
+            await bot.start(shard_ids=(1, 2), shard_count=20, check_for_updates=False)
 
-        start_one_shard.assert_not_called()
+        first_completed.assert_awaited_once_with(
+            event.return_value.wait.return_value, shield.return_value, shard1.join.return_value, timeout=5
+        )
+        assert gather.return_value.cancelled()
+        event_manager.dispatch.assert_awaited_once_with(event_factory.deserialize_starting_event.return_value)
 
-        first_completed.assert_called_once_with(
-            event.return_value.wait.return_value, shard1.join.return_value, timeout=5
+    @pytest.mark.asyncio
+    async def test_start_when_shards_start_while_waiting(self, bot, rest, voice, event_manager, event_factory):
+        class MockSessionStartLimit:
+            remaining = 10
+            reset_at = "now"
+            max_concurrency = 1
+
+        class MockInfo:
+            url = "yourmom.eu"
+            shard_count = 2
+            session_start_limit = MockSessionStartLimit()
+
+        shard1 = mock.Mock()
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", new=mock.Mock()))
+        gather = stack.enter_context(
+            mock.patch.object(asyncio, "gather", return_value=asyncio.get_running_loop().create_future())
+        )
+        shield = stack.enter_context(mock.patch.object(asyncio, "shield"))
+        event = stack.enter_context(
+            mock.patch.object(asyncio, "Event", return_value=mock.Mock(is_set=mock.Mock(return_value=False)))
+        )
+
+        def first_completed(*args, **kwargs):
+            if not bot._shards:
+                bot._shards[1] = shard1
+                raise asyncio.TimeoutError
+
+            gather.return_value.set_result(None)
+
+        first_completed = stack.enter_context(mock.patch.object(aio, "first_completed", side_effect=first_completed))
+
+        event_manager.dispatch = mock.AsyncMock()
+        rest.fetch_gateway_bot_info = mock.AsyncMock(return_value=MockInfo())
+
+        with stack:
+            await bot.start(shard_ids=(1, 2), shard_count=20, check_for_updates=False)
+
+        assert first_completed.await_args_list == [
+            mock.call(event.return_value.wait.return_value, shield.return_value, timeout=5),
+            mock.call(event.return_value.wait.return_value, shield.return_value, shard1.join.return_value, timeout=5),
+        ]
+        event_manager.dispatch.assert_awaited_with(event_factory.deserialize_started_event.return_value)
+
+    @pytest.mark.asyncio
+    async def test_start_when_shard_fails_to_start(self, bot, rest, voice, event_manager, event_factory):
+        class MockSessionStartLimit:
+            remaining = 10
+            reset_at = "now"
+            max_concurrency = 1
+
+        class MockInfo:
+            url = "yourmom.eu"
+            shard_count = 2
+            session_start_limit = MockSessionStartLimit()
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(bot_impl.GatewayBot, "_start_one_shard", new=mock.Mock()))
+        stack.enter_context(
+            mock.patch.object(asyncio, "gather", return_value=asyncio.get_running_loop().create_future())
+        )
+        stack.enter_context(mock.patch.object(asyncio, "shield"))
+        stack.enter_context(mock.patch.object(asyncio, "Event"))
+        stack.enter_context(
+            mock.patch.object(aio, "first_completed", side_effect=RuntimeError("shard 2 shut down immediately"))
         )
+        stack.enter_context(pytest.raises(RuntimeError, match="shard 2 shut down immediately"))
+
+        event_manager.dispatch = mock.AsyncMock()
+        rest.fetch_gateway_bot_info = mock.AsyncMock(return_value=MockInfo())
+
+        with stack:
+            await bot.start(shard_ids=(2, 10), shard_count=20, check_for_updates=False)
+
+        event_manager.dispatch.assert_awaited_once_with(event_factory.deserialize_starting_event.return_value)
 
     def test_stream(self, bot):
         event_type = object()
@@ -938,6 +1439,8 @@ async def test_start_one_shard(self, bot):
             )
 
         shard.assert_called_once_with(
+            compression=bot._gateway_compression,
+            data_format=bot._gateway_data_format,
             http_settings=bot._http_settings,
             proxy_settings=bot._proxy_settings,
             event_manager=bot._event_manager,
@@ -948,16 +1451,40 @@ async def test_start_one_shard(self, bot):
             initial_idle_since=None,
             initial_status=status,
             large_threshold=1000,
+            identify_rate_limiter=bot._identify_rate_limiter,
             shard_id=1,
             shard_count=3,
             loads=bot._loads,
             dumps=bot._dumps,
             token=bot._token,
             url="https://some.website",
+            session=None,
         )
         shard_obj.start.assert_awaited_once_with()
         assert bot._shards == {1: shard_obj}
 
+    @pytest.mark.asyncio
+    async def test_start_one_shard_with_session(self, bot):
+        bot._shards = {}
+        session = object()
+        shard_obj = mock.Mock(is_alive=True, start=mock.AsyncMock())
+
+        with mock.patch.object(shard_impl, "GatewayShardImpl", new=mock.Mock(return_value=shard_obj)) as shard:
+            await bot._start_one_shard(
+                activity=None,
+                afk=False,
+                idle_since=None,
+                status=presences.Status.ONLINE,
+                large_threshold=250,
+                shard_id=1,
+                shard_count=3,
+                url="https://some.website",
+                session=session,
+            )
+
+        assert shard.call_args.kwargs["session"] is session
+        assert bot._shards == {1: shard_obj}
+
     @pytest.mark.asyncio
     async def test_start_one_shard_when_not_alive(self, bot):
         activity = object()
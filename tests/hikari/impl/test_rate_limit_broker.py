@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import contextlib
+
+import mock
+import pytest
+
+from hikari import errors
+from hikari.impl import rate_limit_broker
+from hikari.internal import time
+
+pytestmark = pytest.mark.skipif(not hasattr(asyncio, "start_unix_server"), reason="Unix sockets are not supported")
+
+
+@contextlib.asynccontextmanager
+async def _run_broker(path):
+    broker = rate_limit_broker.RateLimitBroker(path)
+    backend = rate_limit_broker.BrokerRateLimitBackend(path)
+    other_backend = rate_limit_broker.BrokerRateLimitBackend(path)
+    await broker.start()
+
+    try:
+        yield broker, backend, other_backend
+
+    finally:
+        await backend.close()
+        await other_backend.close()
+        if broker.is_alive:
+            await broker.close()
+
+
+class TestRateLimitBroker:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return tmp_path / "broker.sock"
+
+    @pytest.mark.asyncio
+    async def test_start_when_already_started(self, path):
+        async with _run_broker(path) as (broker, _, _):
+            with pytest.raises(errors.ComponentStateConflictError):
+                await broker.start()
+
+    @pytest.mark.asyncio
+    async def test_close_when_not_started(self, path):
+        with pytest.raises(errors.ComponentStateConflictError):
+            await rate_limit_broker.RateLimitBroker(path).close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_unknown_bucket(self, path):
+        async with _run_broker(path) as (_, backend, _):
+            assert await backend.acquire("bucket", exclusive=False) == (0, False)
+
+    @pytest.mark.asyncio
+    async def test_acquire_shares_bucket_state(self, path):
+        async with _run_broker(path) as (_, backend, other_backend):
+            await backend.acquire("bucket", exclusive=False)
+            backend.update("bucket", 2, 5, 60)
+
+            assert await backend.acquire("bucket", exclusive=False) == (0, False)
+            assert await other_backend.acquire("bucket", exclusive=False) == (0, False)
+
+            retry_after, is_global = await other_backend.acquire("bucket", exclusive=False)
+            assert 59 < retry_after <= 60
+            assert is_global is False
+
+    @pytest.mark.asyncio
+    async def test_acquire_when_bucket_reset(self, path):
+        async with _run_broker(path) as (_, backend, _):
+            await backend.acquire("bucket", exclusive=False)
+            backend.update("bucket", 0, 2, 60)
+            assert (await backend.acquire("bucket", exclusive=False))[0] > 0
+
+            with mock.patch.object(time, "monotonic", return_value=time.monotonic() + 61):
+                assert await backend.acquire("bucket", exclusive=False) == (0, False)
+                assert await backend.acquire("bucket", exclusive=False) == (0, False)
+                assert (await backend.acquire("bucket", exclusive=False))[0] > 0
+
+    @pytest.mark.asyncio
+    async def test_update_keeps_lower_remaining_in_same_window(self, path):
+        async with _run_broker(path) as (_, backend, _):
+            await backend.acquire("bucket", exclusive=False)
+            backend.update("bucket", 1, 5, 60)
+            backend.update("bucket", 4, 5, 60)
+
+            assert await backend.acquire("bucket", exclusive=False) == (0, False)
+            assert (await backend.acquire("bucket", exclusive=False))[0] > 0
+
+    @pytest.mark.asyncio
+    async def test_throttle(self, path):
+        async with _run_broker(path) as (_, backend, other_backend):
+            await backend.acquire("bucket", exclusive=False)
+            backend.throttle(30)
+
+            retry_after, is_global = await other_backend.acquire("bucket", exclusive=False)
+
+            assert 29 < retry_after <= 30
+            assert is_global is True
+
+    @pytest.mark.asyncio
+    async def test_exclusive_acquire_waits_for_release(self, path):
+        async with _run_broker(path) as (_, backend, other_backend):
+            assert await backend.acquire("unknown", exclusive=True) == (0, False)
+            waiter = asyncio.ensure_future(other_backend.acquire("unknown", exclusive=True))
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+
+            backend.release("unknown", None)
+
+            assert await asyncio.wait_for(waiter, timeout=1) == (0, False)
+
+    @pytest.mark.asyncio
+    async def test_exclusive_acquire_after_resolving_reserves_on_bucket(self, path):
+        async with _run_broker(path) as (_, backend, other_backend):
+            assert await backend.acquire("unknown", exclusive=True) == (0, False)
+            waiters = [asyncio.ensure_future(other_backend.acquire("unknown", exclusive=True)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+
+            backend.update("bucket", 1, 2, 60)
+            backend.release("unknown", "bucket")
+
+            first, second = await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+            assert first == (0, False)
+            assert second[0] > 0
+
+    @pytest.mark.asyncio
+    async def test_lost_connection_releases_exclusive_reservations(self, path):
+        async with _run_broker(path) as (_, backend, other_backend):
+            assert await backend.acquire("unknown", exclusive=True) == (0, False)
+            waiter = asyncio.ensure_future(other_backend.acquire("unknown", exclusive=True))
+            await asyncio.sleep(0.05)
+
+            await backend.close()
+
+            assert await asyncio.wait_for(waiter, timeout=1) == (0, False)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_exclusive_acquire_is_released(self, path):
+        async with _run_broker(path) as (_, backend, other_backend):
+            assert await backend.acquire("unknown", exclusive=True) == (0, False)
+            cancelled = asyncio.ensure_future(other_backend.acquire("unknown", exclusive=True))
+            await asyncio.sleep(0.05)
+            cancelled.cancel()
+            backend.release("unknown", None)
+            await asyncio.sleep(0.05)
+
+            assert await asyncio.wait_for(backend.acquire("unknown", exclusive=True), timeout=1) == (0, False)
+
+    @pytest.mark.asyncio
+    async def test_backend_when_broker_closed(self, path):
+        async with _run_broker(path) as (broker, backend, _):
+            assert await backend.acquire("bucket", exclusive=False) == (0, False)
+            request = asyncio.ensure_future(backend.acquire("unknown", exclusive=True))
+            await asyncio.sleep(0)
+
+            await broker.close()
+
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(request, timeout=1)
+
+            with pytest.raises(ConnectionRefusedError):
+                await backend.acquire("bucket", exclusive=False)
@@ -65,6 +65,23 @@ def test_is_empty(self, queue, is_empty, mock_burst_limiter):
         mock_burst_limiter.queue = queue
         assert mock_burst_limiter.is_empty is is_empty
 
+    def test_enqueue_orders_by_priority(self, mock_burst_limiter):
+        mock_burst_limiter._enqueue("normal1", 0)
+        mock_burst_limiter._enqueue("low", -1)
+        mock_burst_limiter._enqueue("high1", 1)
+        mock_burst_limiter._enqueue("normal2", 0)
+        mock_burst_limiter._enqueue("high2", 1)
+
+        assert mock_burst_limiter.queue == ["high1", "high2", "normal1", "normal2", "low"]
+
+    def test_dequeue(self, mock_burst_limiter):
+        mock_burst_limiter._enqueue("normal", 0)
+        mock_burst_limiter._enqueue("high", 1)
+
+        assert mock_burst_limiter._dequeue() == "high"
+        assert mock_burst_limiter._dequeue() == "normal"
+        assert mock_burst_limiter._queue_priorities == {}
+
     @pytest.mark.asyncio
     async def test_close_removes_all_futures_from_queue(self, mock_burst_limiter):
         event_loop = asyncio.get_running_loop()
@@ -311,6 +328,20 @@ async def test_future_is_added_to_queue_if_throttle_task_is_not_None(self, ratel
         # use slice to prevent aborting test with index error rather than assertion error if this fails.
         assert ratelimiter.queue[-1:] == [future]
 
+    @pytest.mark.asyncio
+    async def test_future_is_added_to_queue_by_priority(self, ratelimiter):
+        event_loop = asyncio.get_running_loop()
+
+        ratelimiter.drip = mock.Mock()
+        ratelimiter.throttle_task = asyncio.get_running_loop().create_future()
+        ratelimiter.queue = [MockFuture()]
+        future = MockFuture()
+        event_loop.create_future = mock.Mock(return_value=future)
+
+        await ratelimiter.acquire(1)
+
+        assert ratelimiter.queue[:1] == [future]
+
     @pytest.mark.asyncio
     async def test_future_is_added_to_queue_if_rate_limited(self, ratelimiter):
         event_loop = asyncio.get_running_loop()
@@ -387,6 +418,21 @@ def mock_get_time_until_reset(_self, _):
         for i, future in enumerate(futures):
             assert future.done(), f"future {i} was incomplete!"
 
+    @pytest.mark.asyncio
+    async def test_throttle_skips_cancelled_futures(self):
+        event_loop = asyncio.get_running_loop()
+
+        with mock.patch.object(asyncio, "sleep"):
+            with rate_limits.WindowedBurstRateLimiter(__name__, 10, 1) as rl:
+                cancelled = event_loop.create_future()
+                cancelled.cancel()
+                future = event_loop.create_future()
+                rl.queue = [cancelled, future]
+                await rl.throttle()
+
+        assert future.done()
+        assert rl.remaining == 0
+
     @pytest.mark.asyncio
     async def test_throttle_resets_throttle_task(self):
         event_loop = asyncio.get_running_loop()
@@ -432,6 +478,43 @@ def test_is_rate_limited_when_rate_limit_not_expired_only_returns_False(self, re
             assert rl.is_rate_limited(now) is (remaining <= 0)
 
 
+class TestIdentifyRateLimiter:
+    @pytest.mark.asyncio
+    async def test_acquire_uses_limiter_per_key(self):
+        ratelimiter = rate_limits.IdentifyRateLimiter(2)
+
+        with mock.patch.object(rate_limits, "WindowedBurstRateLimiter") as windowed_burst_rate_limiter:
+            windowed_burst_rate_limiter.return_value.acquire = mock.AsyncMock()
+            await ratelimiter.acquire(0)
+            await ratelimiter.acquire(3)
+            await ratelimiter.acquire(4)
+
+        windowed_burst_rate_limiter.assert_has_calls(
+            [mock.call("identify key 0", 5.0, 1), mock.call("identify key 1", 5.0, 1)], any_order=True
+        )
+        assert windowed_burst_rate_limiter.call_count == 2
+        assert windowed_burst_rate_limiter.return_value.acquire.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_acquire_only_waits_on_same_key(self):
+        with rate_limits.IdentifyRateLimiter(2) as ratelimiter:
+            await ratelimiter.acquire(0)
+            await asyncio.wait_for(ratelimiter.acquire(1), timeout=1)
+
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(ratelimiter.acquire(2), timeout=0.1)
+
+    def test_close(self):
+        ratelimiter = rate_limits.IdentifyRateLimiter(2)
+        limiter = mock.Mock()
+        ratelimiter._limiters = {0: limiter}
+
+        ratelimiter.close()
+
+        limiter.close.assert_called_once_with()
+        assert ratelimiter._limiters == {}
+
+
 class TestExponentialBackOff:
     def test___init___raises_on_too_large_int_base(self):
         base = int(sys.float_info.max) + int(sys.float_info.max * 1 / 100)
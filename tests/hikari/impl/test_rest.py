@@ -52,10 +52,12 @@
 from hikari import users
 from hikari import webhooks
 from hikari.api import rest as rest_api
+from hikari.impl import buckets
 from hikari.impl import config
 from hikari.impl import entity_factory
 from hikari.impl import rate_limits
 from hikari.impl import rest
+from hikari.impl import rest_cache
 from hikari.impl import special_endpoints
 from hikari.internal import data_binding
 from hikari.internal import mentions
@@ -408,7 +410,9 @@ def mock_cache():
 def rest_client(rest_client_class, mock_cache):
     obj = rest_client_class(
         cache=mock_cache,
-        http_settings=mock.Mock(spec=config.HTTPSettings),
+        http_settings=mock.Mock(
+            spec=config.HTTPSettings, response_cache=None, stream_json_arrays=False, metrics_hook=None
+        ),
         max_rate_limit=float("inf"),
         proxy_settings=mock.Mock(spec=config.ProxySettings),
         token="some_token",
@@ -418,7 +422,7 @@ def rest_client(rest_client_class, mock_cache):
         executor=object(),
         entity_factory=mock.Mock(),
         bucket_manager=mock.Mock(
-            acquire_bucket=mock.Mock(return_value=hikari_test_helpers.AsyncContextManagerMock()),
+            acquire_bucket=mock.Mock(return_value=hikari_test_helpers.AsyncContextManagerMock(0.0)),
             acquire_authentication=mock.AsyncMock(),
         ),
         client_session=mock.Mock(request=mock.AsyncMock()),
@@ -693,6 +697,19 @@ async def test_close(self, rest_client, client_session_owner, bucket_manager_own
         else:
             rest_client._bucket_manager.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_close_cancels_coalesced_requests(self, rest_client):
+        rest_client._close_event = mock.Mock()
+        rest_client._client_session.close = mock.AsyncMock()
+        rest_client._bucket_manager.close = mock.AsyncMock()
+        request_task = mock.Mock()
+        rest_client._coalesced_requests = {"key": request_task}
+
+        await rest_client.close()
+
+        request_task.cancel.assert_called_once_with()
+        assert rest_client._coalesced_requests == {}
+
     @pytest.mark.parametrize("client_session_owner", [True, False])
     @pytest.mark.parametrize("bucket_manager_owner", [True, False])
     @pytest.mark.asyncio  # Function needs to be executed in a running loop
@@ -843,6 +860,56 @@ def test_fetch_messages_when_more_than_one_kwarg_passed(self, rest_client, kwarg
         with pytest.raises(TypeError):
             rest_client.fetch_messages(StubModel(123), **kwargs)
 
+    def test_fetch_messages_concurrently(self, rest_client):
+        channel = StubModel(123)
+        stub_iterator = mock.Mock()
+
+        with mock.patch.object(special_endpoints, "SlicedMessageIterator", return_value=stub_iterator) as iterator:
+            assert (
+                rest_client.fetch_messages_concurrently(
+                    channel,
+                    after=datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc),
+                    before=StubModel(735757641938108416),
+                    slices=8,
+                    max_buffered_pages=2,
+                )
+                == stub_iterator
+            )
+
+            iterator.assert_called_once_with(
+                entity_factory=rest_client._entity_factory,
+                request_call=rest_client._request,
+                channel=channel,
+                after=735757641938108416,
+                before=735757641938108416,
+                slices=8,
+                max_buffered_pages=2,
+                executor=rest_client._executor,
+            )
+
+    def test_fetch_messages_concurrently_with_default(self, rest_client):
+        channel = StubModel(123)
+        stub_iterator = mock.Mock()
+
+        with mock.patch.object(special_endpoints, "SlicedMessageIterator", return_value=stub_iterator) as iterator:
+            with mock.patch.object(
+                time,
+                "utc_datetime",
+                return_value=datetime.datetime(2020, 7, 23, 7, 18, 11, 554023, tzinfo=datetime.timezone.utc),
+            ):
+                assert rest_client.fetch_messages_concurrently(channel) == stub_iterator
+
+            iterator.assert_called_once_with(
+                entity_factory=rest_client._entity_factory,
+                request_call=rest_client._request,
+                channel=channel,
+                after=123,
+                before=735757641938108416,
+                slices=4,
+                max_buffered_pages=16,
+                executor=rest_client._executor,
+            )
+
     def test_fetch_reactions_for_emoji(self, rest_client):
         channel = StubModel(123)
         message = StubModel(456)
@@ -1645,6 +1712,241 @@ async def test___aenter__and__aexit__(self, rest_client):
 
         rest_client.close.assert_awaited_once_with()
 
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_shares_in_flight_request(self, rest_client):
+        route = routes.Route("GET", "/users/{user}").compile(user=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = True
+        event = asyncio.Event()
+
+        async def perform_request(**kwargs):
+            await event.wait()
+            return {"id": "123"}
+
+        rest_client._perform_request = mock.AsyncMock(side_effect=perform_request)
+
+        tasks = [asyncio.create_task(rest_client._request(route)) for _ in range(3)]
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await asyncio.gather(*tasks) == [{"id": "123"}] * 3
+        rest_client._perform_request.assert_awaited_once_with(
+            compiled_route=route, query=None, auth=undefined.UNDEFINED, priority=rest_api.RequestPriority.NORMAL
+        )
+        assert rest_client._coalesced_requests == {}
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_deserialize_item(self, rest_client):
+        route = routes.GET_GUILD_MEMBERS.compile(guild=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = False
+        rest_client._perform_request = mock.AsyncMock(return_value=[{"id": "1"}, {"id": "2"}])
+
+        assert await rest_client._request(route, deserialize_item=lambda item: int(item["id"])) == [1, 2]
+
+        rest_client._perform_request.assert_awaited_once_with(
+            compiled_route=route,
+            query=None,
+            form_builder=None,
+            json=None,
+            reason=undefined.UNDEFINED,
+            auth=undefined.UNDEFINED,
+            priority=rest_api.RequestPriority.NORMAL,
+            deserialize_item=None,
+        )
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_streaming_json_arrays(self, rest_client):
+        route = routes.GET_GUILD_MEMBERS.compile(guild=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = True
+        rest_client._http_settings.stream_json_arrays = True
+        rest_client._response_cache = mock.Mock()
+        rest_client._perform_request = mock.AsyncMock(return_value=[1, 2])
+        deserialize_item = mock.Mock()
+
+        assert await rest_client._request(route, deserialize_item=deserialize_item) == [1, 2]
+
+        rest_client._perform_request.assert_awaited_once_with(
+            compiled_route=route,
+            query=None,
+            form_builder=None,
+            json=None,
+            reason=undefined.UNDEFINED,
+            auth=undefined.UNDEFINED,
+            priority=rest_api.RequestPriority.NORMAL,
+            deserialize_item=deserialize_item,
+        )
+        rest_client._response_cache.get.assert_not_called()
+        rest_client._response_cache.put.assert_not_called()
+        deserialize_item.assert_not_called()
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_response_cached(self, rest_client):
+        route = routes.GET_CHANNEL_WEBHOOKS.compile(channel=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = False
+        rest_client._response_cache = mock.Mock()
+        rest_client._perform_request = mock.AsyncMock()
+
+        result = await rest_client._request(route)
+
+        assert result is rest_client._response_cache.get.return_value
+        rest_client._response_cache.get.assert_called_once_with(
+            route, (route, (), buckets._create_authentication_hash("Type some_token"))
+        )
+        rest_client._perform_request.assert_not_called()
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_response_not_cached(self, rest_client):
+        route = routes.GET_CHANNEL_WEBHOOKS.compile(channel=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = False
+        rest_client._response_cache = mock.Mock(get=mock.Mock(return_value=None))
+        rest_client._perform_request = mock.AsyncMock(return_value=[])
+
+        assert await rest_client._request(route, auth=None) == []
+
+        rest_client._perform_request.assert_awaited_once_with(
+            compiled_route=route,
+            query=None,
+            form_builder=None,
+            json=None,
+            reason=undefined.UNDEFINED,
+            auth=None,
+            priority=rest_api.RequestPriority.NORMAL,
+            deserialize_item=None,
+        )
+        rest_client._response_cache.put.assert_called_once_with(route, (route, (), "-"), [])
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_response_cache_shared_between_tokens(self, rest_client):
+        route = routes.GET_CHANNEL_WEBHOOKS.compile(channel=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = False
+        rest_client._response_cache = rest_cache.RESTResponseCacheImpl()
+        rest_client._perform_request = mock.AsyncMock(side_effect=[[{"id": "1"}], [{"id": "2"}]])
+
+        assert await rest_client._request(route) == [{"id": "1"}]
+        rest_client._token = "Bot other_token"
+        assert await rest_client._request(route) == [{"id": "2"}]
+        rest_client._token = "Type some_token"
+        assert await rest_client._request(route) == [{"id": "1"}]
+
+        assert rest_client._perform_request.await_count == 2
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_response_cached_with_token_strategy(self, rest_client):
+        route = routes.GET_CHANNEL_WEBHOOKS.compile(channel=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = False
+        rest_client._response_cache = mock.Mock()
+        rest_client._token = mock.Mock(rest_api.TokenStrategy, acquire=mock.AsyncMock(return_value="Bearer token"))
+
+        await rest_client._request(route)
+
+        rest_client._token.acquire.assert_awaited_once_with(rest_client)
+        rest_client._response_cache.get.assert_called_once_with(
+            route, (route, (), buckets._create_authentication_hash("Bearer token"))
+        )
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_not_get_invalidates_response_cache(self, rest_client):
+        route = routes.PATCH_APPLICATION_COMMAND.compile(application=123, command=456)
+        rest_client._close_event = asyncio.Event()
+        rest_client._response_cache = mock.Mock()
+        rest_client._perform_request = mock.AsyncMock(return_value={})
+
+        await rest_client._request(route, json={})
+
+        rest_client._response_cache.get.assert_not_called()
+        assert rest_client._response_cache.invalidate.call_args_list == [
+            mock.call("/applications/123/commands/456"),
+            mock.call("/applications/123/commands", descendants=False),
+        ]
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_and_different_query(self, rest_client):
+        route = routes.Route("GET", "/guilds/{guild}/members").compile(guild=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = True
+        rest_client._perform_request = mock.AsyncMock(return_value=[])
+        query_1 = data_binding.StringMapBuilder()
+        query_1.put("after", 1)
+        query_2 = data_binding.StringMapBuilder()
+        query_2.put("after", 2)
+
+        await asyncio.gather(rest_client._request(route, query=query_1), rest_client._request(route, query=query_2))
+
+        assert rest_client._perform_request.await_count == 2
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_and_not_get(self, rest_client):
+        route = routes.Route("PATCH", "/users/{user}").compile(user=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = True
+        rest_client._perform_request = mock.AsyncMock(return_value={})
+
+        await asyncio.gather(rest_client._request(route), rest_client._request(route))
+
+        assert rest_client._perform_request.await_count == 2
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_not_coalescing(self, rest_client):
+        route = routes.Route("GET", "/users/{user}").compile(user=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = False
+        rest_client._perform_request = mock.AsyncMock(return_value={})
+
+        await asyncio.gather(rest_client._request(route), rest_client._request(route))
+
+        assert rest_client._perform_request.await_count == 2
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_and_caller_cancelled(self, rest_client):
+        route = routes.Route("GET", "/users/{user}").compile(user=123)
+        rest_client._close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = True
+        event = asyncio.Event()
+
+        async def perform_request(**kwargs):
+            await event.wait()
+            return {"id": "123"}
+
+        rest_client._perform_request = mock.AsyncMock(side_effect=perform_request)
+
+        cancelled = asyncio.create_task(rest_client._request(route))
+        waiting = asyncio.create_task(rest_client._request(route))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        event.set()
+
+        assert await waiting == {"id": "123"}
+        assert cancelled.cancelled()
+
+    @hikari_test_helpers.timeout()
+    async def test__request_when_coalescing_and_closed_mid_request(self, rest_client):
+        route = routes.Route("GET", "/users/{user}").compile(user=123)
+        rest_client._close_event = close_event = asyncio.Event()
+        rest_client._http_settings.coalesce_get_requests = True
+        event = asyncio.Event()
+
+        async def perform_request(**kwargs):
+            await event.wait()
+
+        rest_client._perform_request = mock.AsyncMock(side_effect=perform_request)
+
+        task = asyncio.create_task(rest_client._request(route))
+        await asyncio.sleep(0)
+        close_event.set()
+
+        with pytest.raises(errors.ComponentStateConflictError, match="The REST client was closed mid-request"):
+            await task
+
+        event.set()
+        await asyncio.sleep(0)
+
     @hikari_test_helpers.timeout()
     async def test_perform_request_errors_if_both_json_and_form_builder_passed(self, rest_client):
         route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
@@ -1802,7 +2104,7 @@ async def test_perform_request_when_no_auth_passed(self, rest_client, exit_excep
 
         _, kwargs = rest_client._client_session.request.call_args_list[0]
         assert rest._AUTHORIZATION_HEADER not in kwargs["headers"]
-        rest_client._bucket_manager.acquire_bucket.assert_called_once_with(route, None)
+        rest_client._bucket_manager.acquire_bucket.assert_called_once_with(route, None, rest_api.RequestPriority.NORMAL)
         rest_client._bucket_manager.acquire_bucket.return_value.assert_used_once()
 
     @hikari_test_helpers.timeout()
@@ -1816,7 +2118,9 @@ async def test_perform_request_when_auth_passed(self, rest_client, exit_exceptio
 
         _, kwargs = rest_client._client_session.request.call_args_list[0]
         assert kwargs["headers"][rest._AUTHORIZATION_HEADER] == "ooga booga"
-        rest_client._bucket_manager.acquire_bucket.assert_called_once_with(route, "ooga booga")
+        rest_client._bucket_manager.acquire_bucket.assert_called_once_with(
+            route, "ooga booga", rest_api.RequestPriority.NORMAL
+        )
         rest_client._bucket_manager.acquire_bucket.return_value.assert_used_once()
 
     @hikari_test_helpers.timeout()
@@ -1848,6 +2152,28 @@ async def read(self):
 
         assert (await rest_client._perform_request(route)) == {"something": None}
 
+    @hikari_test_helpers.timeout()
+    async def test_perform_request_when_response_is_APPLICATION_JSON_and_deserialize_item(self, rest_client):
+        class StubContent:
+            async def iter_any(self):
+                yield b'[{"id": "1"}, {"i'
+                yield b'd": "2"}]'
+
+        class StubResponse:
+            status = http.HTTPStatus.OK
+            content_type = rest._APPLICATION_JSON
+            reason = "cause why not"
+            headers = {"HEADER": "value"}
+            content = StubContent()
+
+        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
+        rest_client._client_session.request.return_value = StubResponse()
+        rest_client._parse_ratelimits = mock.AsyncMock(return_value=None)
+
+        result = await rest_client._perform_request(route, deserialize_item=lambda item: int(item["id"]))
+
+        assert result == [1, 2]
+
     @hikari_test_helpers.timeout()
     async def test_perform_request_when_response_is_not_JSON(self, rest_client):
         class StubResponse:
@@ -1940,6 +2266,66 @@ async def test_perform_request_when_connection_error_will_retry_until_exhausted(
         exponential_backoff.assert_called_once_with(maximum=16)
         asyncio_sleep.assert_has_awaits([mock.call(1), mock.call(2), mock.call(3)])
 
+    @hikari_test_helpers.timeout()
+    async def test_perform_request_reports_metrics(self, rest_client):
+        class StubResponse:
+            status = http.HTTPStatus.OK
+            content_type = rest._APPLICATION_JSON
+            reason = "cause why not"
+            headers = {}
+
+            async def read(self):
+                return '{"something": null}'
+
+        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
+        rest_client._client_session.request.return_value = StubResponse()
+        rest_client._parse_ratelimits = mock.AsyncMock(side_effect=[0.5, None])
+        rest_client._http_settings.metrics_hook = mock.Mock()
+        rest_client._bucket_manager.acquire_bucket.return_value = hikari_test_helpers.AsyncContextManagerMock(0.25)
+
+        with mock.patch.object(asyncio, "sleep"):
+            assert (await rest_client._perform_request(route)) == {"something": None}
+
+        rest_client._http_settings.metrics_hook.on_request.assert_called_once()
+        metrics = rest_client._http_settings.metrics_hook.on_request.call_args.args[0]
+        assert metrics.route is route.route
+        assert metrics.status == 200
+        assert metrics.global_wait == 0.5
+        assert metrics.rate_limits == 1
+        assert metrics.retries == 0
+        assert metrics.network_time >= 0
+        assert metrics.deserialize_time >= 0
+
+    @hikari_test_helpers.timeout()
+    async def test_perform_request_reports_metrics_when_request_fails(self, rest_client):
+        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
+        rest_client._client_session = mock.AsyncMock(request=mock.AsyncMock(side_effect=asyncio.TimeoutError))
+        rest_client._max_retries = 2
+        rest_client._http_settings.metrics_hook = mock.Mock()
+
+        with mock.patch.object(asyncio, "sleep"):
+            with pytest.raises(errors.HTTPError):
+                await rest_client._perform_request(route)
+
+        metrics = rest_client._http_settings.metrics_hook.on_request.call_args.args[0]
+        assert metrics.status is None
+        assert metrics.retries == 2
+
+    @hikari_test_helpers.timeout()
+    async def test_perform_request_when_metrics_hook_raises(self, rest_client):
+        class StubResponse:
+            status = http.HTTPStatus.NO_CONTENT
+
+        route = routes.Route("GET", "/something/{channel}/somewhere").compile(channel=123)
+        rest_client._client_session.request.return_value = StubResponse()
+        rest_client._parse_ratelimits = mock.AsyncMock(return_value=None)
+        rest_client._http_settings.metrics_hook = mock.Mock(on_request=mock.Mock(side_effect=RuntimeError("ok")))
+
+        with mock.patch.object(rest, "_LOGGER", isEnabledFor=mock.Mock(return_value=False)) as logger:
+            assert (await rest_client._perform_request(route)) is None
+
+        logger.exception.assert_called_once_with("an error occurred in the REST metrics hook")
+
     @pytest.mark.parametrize("enabled", [True, False])
     @hikari_test_helpers.timeout()
     async def test_perform_request_logger(self, rest_client, enabled):
@@ -2495,7 +2881,9 @@ async def test_create_message_when_form(self, rest_client):
             b'{"testing":"ensure_in_test","message_reference":{"message_id":"987654321","fail_if_not_exists":false}}',
             content_type="application/json",
         )
-        rest_client._request.assert_awaited_once_with(expected_route, form_builder=mock_form)
+        rest_client._request.assert_awaited_once_with(
+            expected_route, form_builder=mock_form, priority=rest_api.RequestPriority.NORMAL
+        )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
     async def test_create_message_when_no_form(self, rest_client):
@@ -2555,6 +2943,7 @@ async def test_create_message_when_no_form(self, rest_client):
                 "testing": "ensure_in_test",
                 "message_reference": {"message_id": "987654321", "fail_if_not_exists": False},
             },
+            priority=rest_api.RequestPriority.NORMAL,
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
@@ -3092,7 +3481,11 @@ async def test_execute_webhook_when_form(self, rest_client, webhook, avatar_url)
             content_type="application/json",
         )
         rest_client._request.assert_awaited_once_with(
-            expected_route, form_builder=mock_form, query={"wait": "true"}, auth=None
+            expected_route,
+            form_builder=mock_form,
+            query={"wait": "true"},
+            auth=None,
+            priority=rest_api.RequestPriority.NORMAL,
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
@@ -3127,7 +3520,11 @@ async def test_execute_webhook_when_form_and_thread(self, rest_client):
             "payload_json", b'{"testing":"ensure_in_test"}', content_type="application/json"
         )
         rest_client._request.assert_awaited_once_with(
-            expected_route, form_builder=mock_form, query={"wait": "true", "thread_id": "1234543123"}, auth=None
+            expected_route,
+            form_builder=mock_form,
+            query={"wait": "true", "thread_id": "1234543123"},
+            auth=None,
+            priority=rest_api.RequestPriority.NORMAL,
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
@@ -3162,6 +3559,7 @@ async def test_execute_webhook_when_no_form(self, rest_client):
             json={"testing": "ensure_in_test"},
             query={"wait": "true", "thread_id": "2134312123"},
             auth=None,
+            priority=rest_api.RequestPriority.NORMAL,
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
@@ -3217,6 +3615,7 @@ async def test_execute_webhook_when_thread_and_no_form(self, rest_client):
             json={"testing": "ensure_in_test", "username": "davfsa", "avatar_url": "https://website.com/davfsa_logo"},
             query={"wait": "true"},
             auth=None,
+            priority=rest_api.RequestPriority.NORMAL,
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
@@ -3294,7 +3693,9 @@ async def test_edit_webhook_message_when_form(self, rest_client, webhook):
         mock_form.add_field.assert_called_once_with(
             "payload_json", b'{"testing":"ensure_in_test"}', content_type="application/json"
         )
-        rest_client._request.assert_awaited_once_with(expected_route, form_builder=mock_form, query={}, auth=None)
+        rest_client._request.assert_awaited_once_with(
+            expected_route, form_builder=mock_form, query={}, auth=None, priority=rest_api.RequestPriority.NORMAL
+        )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
     async def test_edit_webhook_message_when_form_and_thread(self, rest_client):
@@ -3327,7 +3728,11 @@ async def test_edit_webhook_message_when_form_and_thread(self, rest_client):
             "payload_json", b'{"testing":"ensure_in_test"}', content_type="application/json"
         )
         rest_client._request.assert_awaited_once_with(
-            expected_route, form_builder=mock_form, query={"thread_id": "123543123"}, auth=None
+            expected_route,
+            form_builder=mock_form,
+            query={"thread_id": "123543123"},
+            auth=None,
+            priority=rest_api.RequestPriority.NORMAL,
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
@@ -3375,7 +3780,11 @@ async def test_edit_webhook_message_when_no_form(self, rest_client: rest_api.RES
             edit=True,
         )
         rest_client._request.assert_awaited_once_with(
-            expected_route, json={"testing": "ensure_in_test"}, query={}, auth=None
+            expected_route,
+            json={"testing": "ensure_in_test"},
+            query={},
+            auth=None,
+            priority=rest_api.RequestPriority.NORMAL,
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
@@ -3405,7 +3814,11 @@ async def test_edit_webhook_message_when_thread_and_no_form(self, rest_client: r
             edit=True,
         )
         rest_client._request.assert_awaited_once_with(
-            expected_route, json={"testing": "ensure_in_test"}, query={"thread_id": "2346523432"}, auth=None
+            expected_route,
+            json={"testing": "ensure_in_test"},
+            query={"thread_id": "2346523432"},
+            auth=None,
+            priority=rest_api.RequestPriority.NORMAL,
         )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
@@ -4856,7 +5269,9 @@ async def test_edit_member(self, rest_client):
         rest_client._entity_factory.deserialize_member.assert_called_once_with(
             rest_client._request.return_value, guild_id=123
         )
-        rest_client._request.assert_awaited_once_with(expected_route, json=expected_json, reason="because i can")
+        rest_client._request.assert_awaited_once_with(
+            expected_route, json=expected_json, reason="because i can", priority=rest_api.RequestPriority.NORMAL
+        )
 
     async def test_edit_member_when_voice_channel_is_None(self, rest_client):
         expected_route = routes.PATCH_GUILD_MEMBER.compile(guild=123, user=456)
@@ -4878,7 +5293,9 @@ async def test_edit_member_when_voice_channel_is_None(self, rest_client):
         rest_client._entity_factory.deserialize_member.assert_called_once_with(
             rest_client._request.return_value, guild_id=123
         )
-        rest_client._request.assert_awaited_once_with(expected_route, json=expected_json, reason="because i can")
+        rest_client._request.assert_awaited_once_with(
+            expected_route, json=expected_json, reason="because i can", priority=rest_api.RequestPriority.NORMAL
+        )
 
     async def test_edit_member_when_communication_disabled_until_is_None(self, rest_client):
         expected_route = routes.PATCH_GUILD_MEMBER.compile(guild=123, user=456)
@@ -4893,7 +5310,9 @@ async def test_edit_member_when_communication_disabled_until_is_None(self, rest_
         rest_client._entity_factory.deserialize_member.assert_called_once_with(
             rest_client._request.return_value, guild_id=123
         )
-        rest_client._request.assert_awaited_once_with(expected_route, json=expected_json, reason="because i can")
+        rest_client._request.assert_awaited_once_with(
+            expected_route, json=expected_json, reason="because i can", priority=rest_api.RequestPriority.NORMAL
+        )
 
     async def test_edit_member_without_optionals(self, rest_client):
         expected_route = routes.PATCH_GUILD_MEMBER.compile(guild=123, user=456)
@@ -4905,7 +5324,9 @@ async def test_edit_member_without_optionals(self, rest_client):
         rest_client._entity_factory.deserialize_member.assert_called_once_with(
             rest_client._request.return_value, guild_id=123
         )
-        rest_client._request.assert_awaited_once_with(expected_route, json={}, reason=undefined.UNDEFINED)
+        rest_client._request.assert_awaited_once_with(
+            expected_route, json={}, reason=undefined.UNDEFINED, priority=rest_api.RequestPriority.NORMAL
+        )
 
     async def test_my_edit_member(self, rest_client):
         expected_route = routes.PATCH_MY_GUILD_MEMBER.compile(guild=123)
@@ -4938,7 +5359,19 @@ async def test_add_role_to_member(self, rest_client):
 
         await rest_client.add_role_to_member(StubModel(123), StubModel(456), StubModel(789), reason="because i can")
 
-        rest_client._request.assert_awaited_once_with(expected_route, reason="because i can")
+        rest_client._request.assert_awaited_once_with(
+            expected_route, reason="because i can", priority=rest_api.RequestPriority.NORMAL
+        )
+
+    async def test_add_role_to_member_with_priority(self, rest_client):
+        expected_route = routes.PUT_GUILD_MEMBER_ROLE.compile(guild=123, user=456, role=789)
+        rest_client._request = mock.AsyncMock()
+
+        await rest_client.add_role_to_member(123, 456, 789, priority=rest_api.RequestPriority.LOW)
+
+        rest_client._request.assert_awaited_once_with(
+            expected_route, reason=undefined.UNDEFINED, priority=rest_api.RequestPriority.LOW
+        )
 
     async def test_remove_role_from_member(self, rest_client):
         expected_route = routes.DELETE_GUILD_MEMBER_ROLE.compile(guild=123, user=456, role=789)
@@ -4948,7 +5381,9 @@ async def test_remove_role_from_member(self, rest_client):
             StubModel(123), StubModel(456), StubModel(789), reason="because i can"
         )
 
-        rest_client._request.assert_awaited_once_with(expected_route, reason="because i can")
+        rest_client._request.assert_awaited_once_with(
+            expected_route, reason="because i can", priority=rest_api.RequestPriority.NORMAL
+        )
 
     async def test_kick_user(self, rest_client):
         expected_route = routes.DELETE_GUILD_MEMBER.compile(guild=123, user=456)
@@ -5467,22 +5902,30 @@ async def test_fetch_application_command_without_guild(self, rest_client):
 
     async def test_fetch_application_commands_with_guild(self, rest_client):
         expected_route = routes.GET_APPLICATION_GUILD_COMMANDS.compile(application=54123, guild=7623423)
-        rest_client._request = mock.AsyncMock(return_value=[{"id": "34512312"}])
+        rest_client._request = mock.AsyncMock(
+            side_effect=lambda route, query, deserialize_item: [deserialize_item({"id": "34512312"})]
+        )
 
         result = await rest_client.fetch_application_commands(StubModel(54123), StubModel(7623423))
 
         assert result == [rest_client._entity_factory.deserialize_command.return_value]
-        rest_client._request.assert_awaited_once_with(expected_route, query={"with_localizations": "true"})
+        rest_client._request.assert_awaited_once_with(
+            expected_route, query={"with_localizations": "true"}, deserialize_item=mock.ANY
+        )
         rest_client._entity_factory.deserialize_command.assert_called_once_with({"id": "34512312"}, guild_id=7623423)
 
     async def test_fetch_application_commands_without_guild(self, rest_client):
         expected_route = routes.GET_APPLICATION_COMMANDS.compile(application=54123)
-        rest_client._request = mock.AsyncMock(return_value=[{"id": "34512312"}])
+        rest_client._request = mock.AsyncMock(
+            side_effect=lambda route, query, deserialize_item: [deserialize_item({"id": "34512312"})]
+        )
 
         result = await rest_client.fetch_application_commands(StubModel(54123))
 
         assert result == [rest_client._entity_factory.deserialize_command.return_value]
-        rest_client._request.assert_awaited_once_with(expected_route, query={"with_localizations": "true"})
+        rest_client._request.assert_awaited_once_with(
+            expected_route, query={"with_localizations": "true"}, deserialize_item=mock.ANY
+        )
         rest_client._entity_factory.deserialize_command.assert_called_once_with({"id": "34512312"}, guild_id=None)
 
     async def test_fetch_application_commands_ignores_unknown_command_types(self, rest_client):
@@ -5492,12 +5935,19 @@ async def test_fetch_application_commands_ignores_unknown_command_types(self, re
             errors.UnrecognisedEntityError("eep"),
             mock_command,
         ]
-        rest_client._request = mock.AsyncMock(return_value=[{"id": "541234"}, {"id": "553234"}])
+        rest_client._request = mock.AsyncMock(
+            side_effect=lambda route, query, deserialize_item: [
+                deserialize_item({"id": "541234"}),
+                deserialize_item({"id": "553234"}),
+            ]
+        )
 
         result = await rest_client.fetch_application_commands(StubModel(54123), StubModel(432234))
 
         assert result == [mock_command]
-        rest_client._request.assert_awaited_once_with(expected_route, query={"with_localizations": "true"})
+        rest_client._request.assert_awaited_once_with(
+            expected_route, query={"with_localizations": "true"}, deserialize_item=mock.ANY
+        )
         rest_client._entity_factory.deserialize_command.assert_has_calls(
             [mock.call({"id": "541234"}, guild_id=432234), mock.call({"id": "553234"}, guild_id=432234)]
         )
@@ -5956,7 +6406,9 @@ async def test_edit_interaction_response_when_form(self, rest_client):
         mock_form.add_field.assert_called_once_with(
             "payload_json", b'{"testing":"ensure_in_test"}', content_type="application/json"
         )
-        rest_client._request.assert_awaited_once_with(expected_route, form_builder=mock_form, auth=None)
+        rest_client._request.assert_awaited_once_with(
+            expected_route, form_builder=mock_form, auth=None, priority=rest_api.RequestPriority.NORMAL
+        )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
     async def test_edit_interaction_response_when_no_form(self, rest_client):
@@ -6001,7 +6453,9 @@ async def test_edit_interaction_response_when_no_form(self, rest_client):
             role_mentions=[1234],
             edit=True,
         )
-        rest_client._request.assert_awaited_once_with(expected_route, json={"testing": "ensure_in_test"}, auth=None)
+        rest_client._request.assert_awaited_once_with(
+            expected_route, json={"testing": "ensure_in_test"}, auth=None, priority=rest_api.RequestPriority.NORMAL
+        )
         rest_client._entity_factory.deserialize_message.assert_called_once_with({"message_id": 123})
 
     async def test_delete_interaction_response(self, rest_client):
@@ -6010,7 +6464,9 @@ async def test_delete_interaction_response(self, rest_client):
 
         await rest_client.delete_interaction_response(StubModel(1235431), "go homo now")
 
-        rest_client._request.assert_awaited_once_with(expected_route, auth=None)
+        rest_client._request.assert_awaited_once_with(
+            expected_route, auth=None, priority=rest_api.RequestPriority.NORMAL
+        )
 
     async def test_create_autocomplete_response(self, rest_client):
         expected_route = routes.POST_INTERACTION_RESPONSE.compile(interaction=1235431, token="snek")
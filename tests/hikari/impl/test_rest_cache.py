@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from hikari import intents
+from hikari.events import channel_events
+from hikari.events import guild_events
+from hikari.events import member_events
+from hikari.events import role_events
+from hikari.impl import rest_cache
+from hikari.internal import routes
+from hikari.internal import time
+
+
+def _put(cache, route, response, **kwargs):
+    compiled_route = route.compile(**kwargs)
+    cache.put(compiled_route, compiled_route, response)
+    return compiled_route
+
+
+class TestRESTResponseCacheImpl:
+    @pytest.fixture
+    def cache(self):
+        return rest_cache.RESTResponseCacheImpl()
+
+    def test_get_when_cached(self, cache):
+        route = _put(cache, routes.GET_CHANNEL_WEBHOOKS, [{"id": "1"}], channel=123)
+
+        assert cache.get(route, route) == [{"id": "1"}]
+        assert cache.hits == 1
+
+    def test_get_when_not_cached(self, cache):
+        route = routes.GET_CHANNEL_WEBHOOKS.compile(channel=123)
+
+        assert cache.get(route, route) is None
+        assert cache.misses == 1
+
+    def test_get_when_route_not_cacheable(self, cache):
+        route = _put(cache, routes.GET_CHANNEL_MESSAGES, [], channel=123)
+
+        assert cache.get(route, route) is None
+        assert cache.misses == 0
+
+    def test_get_when_expired(self, cache):
+        with mock.patch.object(time, "monotonic", return_value=100):
+            route = _put(cache, routes.GET_CHANNEL_WEBHOOKS, [], channel=123)
+
+        with mock.patch.object(time, "monotonic", return_value=100 + rest_cache.DEFAULT_RESPONSE_TTLS[route.route]):
+            assert cache.get(route, route) is None
+
+        assert cache._groups == {}
+
+    def test_put_evicts_least_recently_used(self):
+        cache = rest_cache.RESTResponseCacheImpl(max_size=2)
+        route_1 = _put(cache, routes.GET_CHANNEL_WEBHOOKS, [], channel=1)
+        route_2 = _put(cache, routes.GET_CHANNEL_WEBHOOKS, [], channel=2)
+        cache.get(route_1, route_1)
+
+        route_3 = _put(cache, routes.GET_CHANNEL_WEBHOOKS, [], channel=3)
+
+        assert cache.get(route_2, route_2) is None
+        assert cache.get(route_1, route_1) == []
+        assert cache.get(route_3, route_3) == []
+        assert set(cache._groups) == {"/channels/1", "/channels/3"}
+
+    def test_invalidate(self, cache):
+        webhooks = _put(cache, routes.GET_CHANNEL_WEBHOOKS, [], channel=123)
+        invites = _put(cache, routes.GET_CHANNEL_INVITES, [], channel=123)
+        other = _put(cache, routes.GET_CHANNEL_WEBHOOKS, [], channel=1234)
+
+        cache.invalidate("/channels/123")
+
+        assert cache.get(webhooks, webhooks) is None
+        assert cache.get(invites, invites) is None
+        assert cache.get(other, other) == []
+
+    def test_invalidate_without_descendants(self, cache):
+        commands = _put(cache, routes.GET_APPLICATION_COMMANDS, [], application=1)
+        command = _put(cache, routes.GET_APPLICATION_COMMAND, {}, application=1, command=2)
+
+        cache.invalidate("/applications/1/commands", descendants=False)
+
+        assert cache.get(commands, commands) is None
+        assert cache.get(command, command) == {}
+
+    def test_invalidate_top_level_path(self, cache):
+        webhook_1 = _put(cache, routes.GET_WEBHOOK, {}, webhook=1)
+        webhook_2 = _put(cache, routes.GET_WEBHOOK_WITH_TOKEN, {}, webhook=2, token="abc")
+        channel_webhooks = _put(cache, routes.GET_CHANNEL_WEBHOOKS, [], channel=123)
+
+        cache.invalidate("/webhooks")
+
+        assert cache.get(webhook_1, webhook_1) is None
+        assert cache.get(webhook_2, webhook_2) is None
+        assert cache.get(channel_webhooks, channel_webhooks) == []
+        assert set(cache._groups) == {"/channels/123"}
+
+    def test_clear(self, cache):
+        route = _put(cache, routes.GET_CHANNEL_WEBHOOKS, [], channel=123)
+
+        cache.clear()
+
+        assert cache.get(route, route) is None
+        assert cache._groups == {}
+
+
+class TestSubscribeInvalidation:
+    def test_only_subscribes_to_events_for_intents(self):
+        event_manager = mock.Mock()
+
+        rest_cache.subscribe_invalidation(mock.Mock(cacheable_routes=None), event_manager, intents.Intents.GUILDS)
+
+        subscribed = {call.args[0] for call in event_manager.subscribe.call_args_list}
+        assert guild_events.GuildUpdateEvent in subscribed
+        assert role_events.RoleEvent in subscribed
+        assert channel_events.InviteEvent not in subscribed
+
+    def test_only_subscribes_to_events_for_cacheable_routes(self):
+        event_manager = mock.Mock()
+
+        rest_cache.subscribe_invalidation(rest_cache.RESTResponseCacheImpl(), event_manager, intents.Intents.ALL)
+
+        subscribed = {call.args[0] for call in event_manager.subscribe.call_args_list}
+        assert member_events.MemberEvent not in subscribed
+        assert role_events.RoleEvent not in subscribed
+        assert channel_events.WebhookUpdateEvent in subscribed
+        assert channel_events.InviteEvent in subscribed
+
+    def test_subscribes_to_events_for_routes_under_invalidated_path(self):
+        event_manager = mock.Mock()
+        response_cache = rest_cache.RESTResponseCacheImpl({routes.GET_GUILD_ROLES: 10})
+
+        rest_cache.subscribe_invalidation(response_cache, event_manager, intents.Intents.ALL)
+
+        subscribed = {call.args[0] for call in event_manager.subscribe.call_args_list}
+        assert subscribed == {guild_events.GuildUpdateEvent, guild_events.GuildLeaveEvent, role_events.RoleEvent}
+
+    @pytest.mark.asyncio
+    async def test_invalidator(self):
+        event_manager = mock.Mock()
+        response_cache = mock.Mock(cacheable_routes=None)
+        rest_cache.subscribe_invalidation(response_cache, event_manager, intents.Intents.ALL)
+        callbacks = {call.args[0]: call.args[1] for call in event_manager.subscribe.call_args_list}
+        event = mock.Mock(channel_id=123, guild_id=456)
+
+        await callbacks[channel_events.WebhookUpdateEvent](event)
+
+        assert response_cache.invalidate.call_args_list == [
+            mock.call("/channels/123/webhooks"),
+            mock.call("/guilds/456/webhooks"),
+            mock.call("/webhooks"),
+        ]
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from hikari.impl import rest_metrics
+from hikari.internal import routes
+
+
+class TestHistogram:
+    def test_observe(self):
+        histogram = rest_metrics.Histogram([0.1, 1.0])
+
+        for value in (0.05, 0.1, 0.5, 2.0, 3.0):
+            histogram.observe(value)
+
+        assert histogram.count == 5
+        assert histogram.sum == pytest.approx(5.65)
+        assert histogram.cumulative_counts() == [2, 3, 5]
+
+    def test_buckets(self):
+        assert rest_metrics.Histogram().buckets == tuple(rest_metrics.DEFAULT_LATENCY_BUCKETS)
+
+
+class TestRESTMetricsAggregator:
+    @pytest.fixture
+    def aggregator(self):
+        return rest_metrics.RESTMetricsAggregator([0.1, 1.0])
+
+    def test_on_request(self, aggregator):
+        aggregator.on_request(
+            rest_metrics.RequestMetrics(
+                route=routes.GET_CHANNEL, status=200, queue_wait=0.5, network_time=0.05, retries=1, rate_limits=2
+            )
+        )
+        aggregator.on_request(rest_metrics.RequestMetrics(route=routes.GET_CHANNEL, status=None))
+
+        assert aggregator.known_routes == [routes.GET_CHANNEL]
+        assert aggregator.get_status_counts(routes.GET_CHANNEL) == {200: 1, None: 1}
+        queue_wait = aggregator.get_histogram(routes.GET_CHANNEL, "queue_wait")
+        assert queue_wait.cumulative_counts() == [1, 2, 2]
+        assert queue_wait.sum == 0.5
+
+    def test_get_histogram_when_no_requests(self, aggregator):
+        assert aggregator.get_histogram(routes.GET_CHANNEL, "network_time") is None
+        assert aggregator.get_status_counts(routes.GET_CHANNEL) == {}
+
+    def test_get_histogram_when_unknown_timing(self, aggregator):
+        with pytest.raises(KeyError):
+            aggregator.get_histogram(routes.GET_CHANNEL, "nyaa")
+
+    def test_clear(self, aggregator):
+        aggregator.on_request(rest_metrics.RequestMetrics(route=routes.GET_CHANNEL, status=200))
+
+        aggregator.clear()
+
+        assert aggregator.known_routes == []
+
+    def test_to_prometheus(self, aggregator):
+        aggregator.on_request(
+            rest_metrics.RequestMetrics(route=routes.GET_CHANNEL, status=200, network_time=0.5, retries=1)
+        )
+        aggregator.on_request(rest_metrics.RequestMetrics(route=routes.GET_CHANNEL, status=None, rate_limits=2))
+
+        lines = aggregator.to_prometheus(prefix="bot").splitlines()
+
+        labels = 'method="GET",route="/channels/{channel}"'
+        assert "# TYPE bot_network_time_seconds histogram" in lines
+        assert f'bot_network_time_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+        assert f'bot_network_time_seconds_bucket{{{labels},le="1.0"}} 2' in lines
+        assert f'bot_network_time_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+        assert f"bot_network_time_seconds_sum{{{labels}}} 0.5" in lines
+        assert f"bot_network_time_seconds_count{{{labels}}} 2" in lines
+        assert "# TYPE bot_requests_total counter" in lines
+        assert f'bot_requests_total{{{labels},status="200"}} 1' in lines
+        assert f'bot_requests_total{{{labels},status="none"}} 1' in lines
+        assert f"bot_retries_total{{{labels}}} 1" in lines
+        assert f"bot_rate_limits_total{{{labels}}} 2" in lines
+
+    def test_to_prometheus_escapes_labels(self, aggregator):
+        aggregator.on_request(rest_metrics.RequestMetrics(route=routes.Route("GET", '/a"b\\c'), status=200))
+
+        assert 'route="/a\\"b\\\\c"' in aggregator.to_prometheus()
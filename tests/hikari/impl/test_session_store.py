@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+
+import pytest
+
+from hikari import snowflakes
+from hikari.impl import session_store
+
+
+@pytest.fixture
+def session():
+    return session_store.ShardSession(
+        shard_id=1,
+        shard_count=2,
+        intents=513,
+        session_id="some session",
+        seq=123,
+        resume_gateway_url="wss://resume.discord.gg",
+        user_id=snowflakes.Snowflake(456),
+    )
+
+
+@pytest.mark.asyncio
+class TestFileSessionStore:
+    async def test_save_and_load(self, tmp_path, session):
+        store = session_store.FileSessionStore(tmp_path / "sessions.json")
+
+        await store.save([session])
+
+        assert await session_store.FileSessionStore(store.path).load() == [session]
+        assert not os.path.exists(store.path + ".tmp")
+
+    @pytest.mark.skipif(os.name != "posix", reason="File permissions are only enforced on POSIX")
+    async def test_save_is_only_readable_by_owner(self, tmp_path, session):
+        store = session_store.FileSessionStore(tmp_path / "sessions.json")
+
+        await store.save([session])
+
+        assert os.stat(store.path).st_mode & 0o077 == 0
+
+    async def test_save_replaces_sessions(self, tmp_path, session):
+        store = session_store.FileSessionStore(tmp_path / "sessions.json")
+        await store.save([session])
+
+        await store.save(())
+
+        assert await store.load() == []
+
+    async def test_load_when_file_does_not_exist(self, tmp_path):
+        store = session_store.FileSessionStore(tmp_path / "sessions.json")
+
+        assert await store.load() == []
+
+    @pytest.mark.parametrize("content", [b"not json", b"{}", b'[{"shard_id": 1}]'])
+    async def test_load_when_file_is_invalid(self, tmp_path, content):
+        path = tmp_path / "sessions.json"
+        path.write_bytes(content)
+
+        assert await session_store.FileSessionStore(path).load() == []
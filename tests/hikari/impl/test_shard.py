@@ -24,6 +24,7 @@
 import datetime
 import platform
 import re
+import sys
 
 import aiohttp
 import mock
@@ -33,10 +34,14 @@
 from hikari import errors
 from hikari import intents
 from hikari import presences
+from hikari import snowflakes
 from hikari import urls
+from hikari.api import shard as shard_api
 from hikari.impl import config
+from hikari.impl import session_store
 from hikari.impl import shard
 from hikari.internal import aio
+from hikari.internal import etf
 from hikari.internal import net
 from hikari.internal import time
 from hikari.internal import ux
@@ -52,6 +57,27 @@ def test_log_filterer():
     )
 
 
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        (b'{"t":"MESSAGE_CREATE","s":123,"op":0,"d":{"t":"NOT_THIS"}}', ("MESSAGE_CREATE", 123)),
+        (b'{"t":"PRESENCE_UPDATE","s":5,"op":0,"d":{"s":1}}', ("PRESENCE_UPDATE", 5)),
+        (b'{"op": 0, "t": "PRESENCE_UPDATE", "s": 5, "d": {}}', None),
+        (b'{"t":"MESSAGE_CREATE","s":1x,"op":0,"d":{}}', None),
+        (b'{"t":"MESSAGE_CREATE"}', None),
+        (b'{"t":null,"s":null,"op":11,"d":null}', None),
+        (b'{"op":1,"d":123}', None),
+        (b'{"d":{},"t":"MESSAGE_CREATE","s":123,"op":0}', None),
+        (b'{"t":"MESSAGE_CREATE","s":123,"op":1,"d":{}}', None),
+        (b'{"t":123,"s":"MESSAGE_CREATE","op":0,"d":{}}', None),
+        (b'[{"t":"MESSAGE_CREATE","s":123,"op":0,"d":{}}]', None),
+        (b"", None),
+    ],
+)
+def test__sniff_dispatch(payload, expected):
+    assert shard._sniff_dispatch(payload) == expected
+
+
 def test__serialize_activity_when_activity_is_None():
     assert shard._serialize_activity(None) is None
 
@@ -119,7 +145,8 @@ def transport_impl(self):
             log_filterer=mock.Mock(),
             loads=mock.Mock(),
             dumps=mock.Mock(),
-            transport_compression=True,
+            transport_compression=shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM,
+            binary=False,
         )
 
     def test_init_when_transport_compression(self):
@@ -130,10 +157,29 @@ def test_init_when_transport_compression(self):
             log_filterer=mock.Mock(),
             loads=mock.Mock(),
             dumps=mock.Mock(),
-            transport_compression=True,
+            transport_compression=shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM,
+            binary=False,
         )
 
         assert transport._receive_and_check == transport._receive_and_check_zlib
+        assert transport._zstd is None
+
+    def test_init_when_zstd_transport_compression(self):
+        with mock.patch.object(shard, "_create_zstd_decompressobj") as create_zstd_decompressobj:
+            transport = shard._GatewayTransport(
+                ws=mock.Mock(),
+                exit_stack=mock.AsyncMock(),
+                logger=mock.Mock(),
+                log_filterer=mock.Mock(),
+                loads=mock.Mock(),
+                dumps=mock.Mock(),
+                transport_compression=shard_api.GatewayCompression.TRANSPORT_ZSTD_STREAM,
+                binary=False,
+            )
+
+        assert transport._receive_and_check == transport._receive_and_check_zstd
+        assert transport._zstd is create_zstd_decompressobj.return_value
+        create_zstd_decompressobj.assert_called_once_with()
 
     def test_init_when_no_transport_compression(self):
         transport = shard._GatewayTransport(
@@ -143,11 +189,26 @@ def test_init_when_no_transport_compression(self):
             log_filterer=mock.Mock(),
             loads=mock.Mock(),
             dumps=mock.Mock(),
-            transport_compression=False,
+            transport_compression=None,
+            binary=False,
         )
 
         assert transport._receive_and_check == transport._receive_and_check_text
 
+    def test_init_when_binary_and_no_transport_compression(self):
+        transport = shard._GatewayTransport(
+            ws=mock.Mock(),
+            exit_stack=mock.AsyncMock(),
+            logger=mock.Mock(),
+            log_filterer=mock.Mock(),
+            loads=mock.Mock(),
+            dumps=mock.Mock(),
+            transport_compression=None,
+            binary=True,
+        )
+
+        assert transport._receive_and_check == transport._receive_and_check_binary
+
     @pytest.mark.asyncio
     async def test_send_close(self, transport_impl):
         transport_impl._sent_close = False
@@ -193,6 +254,30 @@ async def test_receive_json(self, transport_impl, trace):
         transport_impl._receive_and_check.assert_awaited_once_with()
         transport_impl._loads.assert_called_once_with(transport_impl._receive_and_check.return_value)
 
+    @pytest.mark.asyncio
+    async def test_receive_json_when_skip_dispatch(self, transport_impl):
+        skipped = b'{"t":"PRESENCE_UPDATE","s":1,"op":0,"d":{}}'
+        wanted = b'{"t":"MESSAGE_CREATE","s":2,"op":0,"d":{}}'
+        transport_impl._receive_and_check = mock.AsyncMock(side_effect=[skipped, wanted])
+        transport_impl._logger = mock.Mock(isEnabledFor=mock.Mock(return_value=False))
+        skip_dispatch = mock.Mock(side_effect=[True, False])
+
+        assert await transport_impl.receive_json(skip_dispatch=skip_dispatch) == transport_impl._loads.return_value
+
+        assert skip_dispatch.call_args_list == [mock.call("PRESENCE_UPDATE", 1), mock.call("MESSAGE_CREATE", 2)]
+        transport_impl._loads.assert_called_once_with(wanted)
+
+    @pytest.mark.asyncio
+    async def test_receive_json_when_skip_dispatch_and_not_dispatch(self, transport_impl):
+        transport_impl._receive_and_check = mock.AsyncMock(return_value=b'{"op":11,"d":null}')
+        transport_impl._logger = mock.Mock(isEnabledFor=mock.Mock(return_value=False))
+        skip_dispatch = mock.Mock()
+
+        assert await transport_impl.receive_json(skip_dispatch=skip_dispatch) == transport_impl._loads.return_value
+
+        skip_dispatch.assert_not_called()
+        transport_impl._loads.assert_called_once_with(b'{"op":11,"d":null}')
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("trace", [True, False])
     async def test_send_json(self, transport_impl, trace):
@@ -284,6 +369,26 @@ async def test__receive_and_check_text(self, transport_impl):
 
         transport_impl._ws.receive.assert_awaited_once_with()
 
+    @pytest.mark.asyncio
+    async def test__receive_and_check_binary(self, transport_impl):
+        transport_impl._ws.receive = mock.AsyncMock(
+            return_value=StubResponse(type=aiohttp.WSMsgType.BINARY, data=b"\x83some binary")
+        )
+
+        assert await transport_impl._receive_and_check_binary() == b"\x83some binary"
+
+        transport_impl._ws.receive.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_binary_when_message_type_is_unknown(self, transport_impl):
+        transport_impl._ws.receive = mock.AsyncMock(return_value=StubResponse(type=aiohttp.WSMsgType.TEXT))
+
+        with pytest.raises(
+            errors.GatewayTransportError,
+            match="Gateway transport error: Unexpected message type received TEXT, expected BINARY",
+        ):
+            await transport_impl._receive_and_check_binary()
+
     @pytest.mark.asyncio
     async def test__receive_and_check_text_when_message_type_is_unknown(self, transport_impl):
         transport_impl._ws.receive = mock.AsyncMock(return_value=StubResponse(type=aiohttp.WSMsgType.BINARY))
@@ -339,9 +444,48 @@ async def test__receive_and_check_zlib_when_issue_during_reception_of_multiple_f
         ):
             await transport_impl._receive_and_check_zlib()
 
-    @pytest.mark.parametrize("transport_compression", [True, False])
     @pytest.mark.asyncio
-    async def test_connect(self, http_settings, proxy_settings, transport_compression):
+    async def test__receive_and_check_zstd(self, transport_impl):
+        zstd = pytest.importorskip("zstandard")
+        compressor = zstd.ZstdCompressor().compressobj()
+        data1 = compressor.compress(b"Hello ") + compressor.flush(zstd.COMPRESSOBJ_FLUSH_BLOCK)
+        data2 = compressor.compress(b"world!") + compressor.flush(zstd.COMPRESSOBJ_FLUSH_BLOCK)
+        transport_impl._zstd = zstd.ZstdDecompressor().decompressobj()
+        transport_impl._ws.receive = mock.AsyncMock(
+            side_effect=[
+                StubResponse(type=aiohttp.WSMsgType.BINARY, data=data1),
+                StubResponse(type=aiohttp.WSMsgType.BINARY, data=data2),
+            ]
+        )
+
+        assert await transport_impl._receive_and_check_zstd() == b"Hello "
+        assert await transport_impl._receive_and_check_zstd() == b"world!"
+
+    @pytest.mark.asyncio
+    async def test__receive_and_check_zstd_when_message_type_is_unknown(self, transport_impl):
+        transport_impl._ws.receive = mock.AsyncMock(return_value=StubResponse(type=aiohttp.WSMsgType.TEXT))
+
+        with pytest.raises(
+            errors.GatewayTransportError,
+            match="Gateway transport error: Unexpected message type received TEXT, expected BINARY",
+        ):
+            await transport_impl._receive_and_check_zstd()
+
+    def test__create_zstd_decompressobj_when_zstandard_not_installed(self):
+        with mock.patch.dict(sys.modules, {"zstandard": None}):
+            with pytest.raises(RuntimeError, match="You must install the optional `zstandard` dependency"):
+                shard._create_zstd_decompressobj()
+
+    @pytest.mark.parametrize(
+        ("transport_compression", "receive_and_check"),
+        [
+            (shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM, "_receive_and_check_zlib"),
+            (shard_api.GatewayCompression.TRANSPORT_ZSTD_STREAM, "_receive_and_check_zstd"),
+            (None, "_receive_and_check_text"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_connect(self, http_settings, proxy_settings, transport_compression, receive_and_check):
         logger = mock.Mock()
         log_filterer = mock.Mock()
         client_session = mock.Mock()
@@ -355,6 +499,7 @@ async def test_connect(self, http_settings, proxy_settings, transport_compressio
         create_tcp_connector = stack.enter_context(mock.patch.object(net, "create_tcp_connector"))
         create_client_session = stack.enter_context(mock.patch.object(net, "create_client_session"))
         stack.enter_context(mock.patch.object(contextlib, "AsyncExitStack", return_value=exit_stack))
+        stack.enter_context(mock.patch.object(shard, "_create_zstd_decompressobj"))
 
         with stack:
             ws = await shard._GatewayTransport.connect(
@@ -366,6 +511,7 @@ async def test_connect(self, http_settings, proxy_settings, transport_compressio
                 loads=loads,
                 dumps=dumps,
                 transport_compression=transport_compression,
+                binary=False,
             )
 
         assert isinstance(ws, shard._GatewayTransport)
@@ -376,10 +522,7 @@ async def test_connect(self, http_settings, proxy_settings, transport_compressio
         assert ws._loads is loads
         assert ws._dumps is dumps
 
-        if transport_compression:
-            assert ws._receive_and_check == ws._receive_and_check_zlib
-        else:
-            assert ws._receive_and_check == ws._receive_and_check_text
+        assert ws._receive_and_check == getattr(ws, receive_and_check)
 
         assert exit_stack.enter_async_context.call_count == 2
         exit_stack.enter_async_context.assert_has_calls(
@@ -427,7 +570,8 @@ async def test_connect_when_error_while_connecting(self, http_settings, proxy_se
                 log_filterer=log_filterer,
                 loads=object(),
                 dumps=object(),
-                transport_compression=True,
+                transport_compression=shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM,
+                binary=False,
             )
 
         exit_stack.aclose.assert_awaited_once_with()
@@ -468,7 +612,8 @@ async def test_connect_when_expected_error_while_connecting(self, http_settings,
                 logger=logger,
                 url="https://some.url",
                 log_filterer=log_filterer,
-                transport_compression=True,
+                transport_compression=shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM,
+                binary=False,
                 loads=object(),
                 dumps=object(),
             )
@@ -505,8 +650,36 @@ def test__init__when_unsupported_compression_format(self):
                 token="12345",
             )
 
-    def test_using_etf_is_unsupported(self, http_settings, proxy_settings):
-        with pytest.raises(NotImplementedError, match="Unsupported gateway data format: etf"):
+    def test__init__when_zstd_compression(self, http_settings, proxy_settings):
+        client = shard.GatewayShardImpl(
+            event_manager=mock.Mock(),
+            event_factory=mock.Mock(),
+            http_settings=http_settings,
+            proxy_settings=proxy_settings,
+            intents=intents.Intents.ALL,
+            url="wss://gaytewhuy.discord.meh",
+            compression=shard_api.GatewayCompression.TRANSPORT_ZSTD_STREAM,
+            token="12345",
+        )
+
+        assert client._transport_compression == shard_api.GatewayCompression.TRANSPORT_ZSTD_STREAM
+
+    def test__init__when_zstd_compression_and_zstandard_not_installed(self, http_settings, proxy_settings):
+        with mock.patch.dict(sys.modules, {"zstandard": None}):
+            with pytest.raises(RuntimeError, match="You must install the optional `zstandard` dependency"):
+                shard.GatewayShardImpl(
+                    event_manager=mock.Mock(),
+                    event_factory=mock.Mock(),
+                    http_settings=http_settings,
+                    proxy_settings=proxy_settings,
+                    intents=intents.Intents.ALL,
+                    url="wss://gaytewhuy.discord.meh",
+                    compression=shard_api.GatewayCompression.TRANSPORT_ZSTD_STREAM,
+                    token="12345",
+                )
+
+    def test__init__when_unsupported_data_format(self, http_settings, proxy_settings):
+        with pytest.raises(NotImplementedError, match="Unsupported gateway data format: xml"):
             shard.GatewayShardImpl(
                 event_manager=mock.Mock(),
                 event_factory=mock.Mock(),
@@ -515,10 +688,54 @@ def test_using_etf_is_unsupported(self, http_settings, proxy_settings):
                 token=mock.Mock(),
                 url="wss://erlpack-is-broken-lol.discord.meh",
                 intents=intents.Intents.ALL,
-                data_format="etf",
-                compression="testing",
+                data_format="xml",
             )
 
+    def test__init__when_etf_data_format(self, http_settings, proxy_settings):
+        client = shard.GatewayShardImpl(
+            event_manager=mock.Mock(),
+            event_factory=mock.Mock(),
+            http_settings=http_settings,
+            proxy_settings=proxy_settings,
+            token=mock.Mock(),
+            url="wss://erlpack-is-broken-lol.discord.meh",
+            intents=intents.Intents.ALL,
+            data_format=shard_api.GatewayDataFormat.ETF,
+            dumps=mock.Mock(),
+            loads=mock.Mock(),
+        )
+
+        assert client._data_format == shard_api.GatewayDataFormat.ETF
+        assert client._dumps is etf.dumps
+        assert client._loads is etf.loads
+
+    def test__init__with_session(self, http_settings, proxy_settings):
+        session = session_store.ShardSession(
+            shard_id=0,
+            shard_count=1,
+            intents=int(intents.Intents.ALL),
+            session_id="some session",
+            seq=123,
+            resume_gateway_url="wss://resume.discord.gg",
+            user_id=snowflakes.Snowflake(456),
+        )
+
+        client = shard.GatewayShardImpl(
+            event_manager=mock.Mock(),
+            event_factory=mock.Mock(),
+            http_settings=http_settings,
+            proxy_settings=proxy_settings,
+            intents=intents.Intents.ALL,
+            url="wss://gateway.discord.gg",
+            token="12345",
+            session=session,
+        )
+
+        assert client._session_id == "some session"
+        assert client._seq == 123
+        assert client._resume_gateway_url == "wss://resume.discord.gg"
+        assert client._user_id == 456
+
     def test_heartbeat_latency_property(self, client):
         client._heartbeat_latency = 420
         assert client.heartbeat_latency == 420
@@ -634,6 +851,61 @@ def test_get_user_id(self, client):
 
         check_if_alive.assert_called_once_with()
 
+    def test_get_session(self, client):
+        client._shard_id = 2
+        client._shard_count = 4
+        client._session_id = "some session"
+        client._seq = 123
+        client._resume_gateway_url = "wss://resume.discord.gg"
+        client._user_id = snowflakes.Snowflake(456)
+
+        assert client.get_session() == session_store.ShardSession(
+            shard_id=2,
+            shard_count=4,
+            intents=int(intents.Intents.ALL),
+            session_id="some session",
+            seq=123,
+            resume_gateway_url="wss://resume.discord.gg",
+            user_id=snowflakes.Snowflake(456),
+        )
+
+    @pytest.mark.parametrize("attribute", ["_session_id", "_seq", "_resume_gateway_url", "_user_id"])
+    def test_get_session_when_no_session(self, client, attribute):
+        client._session_id = "some session"
+        client._seq = 123
+        client._resume_gateway_url = "wss://resume.discord.gg"
+        client._user_id = snowflakes.Snowflake(456)
+        setattr(client, attribute, None)
+
+        assert client.get_session() is None
+
+    @pytest.mark.parametrize("name", ["READY", "RESUMED"])
+    def test__skip_dispatch_when_handshake_dispatch(self, client, name):
+        client._seq = 10
+        client._event_manager.is_raw_event_enabled.return_value = False
+
+        assert client._skip_dispatch(name, 11) is False
+
+        assert client._seq == 10
+
+    def test__skip_dispatch_when_enabled(self, client):
+        client._seq = 10
+        client._event_manager.is_raw_event_enabled.return_value = True
+
+        assert client._skip_dispatch("PRESENCE_UPDATE", 11) is False
+
+        assert client._seq == 10
+        client._event_manager.is_raw_event_enabled.assert_called_once_with("PRESENCE_UPDATE")
+
+    def test__skip_dispatch_when_not_enabled(self, client):
+        client._seq = 10
+        client._event_manager.is_raw_event_enabled.return_value = False
+
+        assert client._skip_dispatch("PRESENCE_UPDATE", 11) is True
+
+        assert client._seq == 11
+        client._event_manager.is_raw_event_enabled.assert_called_once_with("PRESENCE_UPDATE")
+
 
 @pytest.mark.asyncio
 class TestGatewayShardImplAsync:
@@ -688,6 +960,26 @@ def assert_awaited_once(self):
         client._non_priority_rate_limit.close.assert_called_once_with()
         client._total_rate_limit.close.assert_called_once_with()
 
+    @pytest.mark.parametrize("keep_session", [True, False])
+    async def test_close_sets_keep_session_while_closing(self, client, keep_session):
+        kept_sessions = []
+
+        async def keep_alive():
+            try:
+                await asyncio.sleep(10)
+            finally:
+                kept_sessions.append(client._keep_session)
+
+        client._keep_alive_task = asyncio.create_task(keep_alive())
+        client._non_priority_rate_limit = mock.Mock()
+        client._total_rate_limit = mock.Mock()
+        await asyncio.sleep(0)
+
+        await client.close(keep_session=keep_session)
+
+        assert kept_sessions == [keep_session]
+        assert client._keep_session is False
+
     async def test_join_when_not_alive(self, client):
         client._keep_alive_task = None
 
@@ -927,7 +1219,7 @@ async def test__connect_when_ws(self, client):
     async def test__connect_when_not_reconnecting(self, client, http_settings, proxy_settings):
         ws = mock.AsyncMock()
         ws.receive_json.return_value = {"op": 10, "d": {"heartbeat_interval": 10}}
-        client._transport_compression = False
+        client._transport_compression = None
         client._shard_id = 20
         client._shard_count = 100
         client._gateway_url = "wss://somewhere.com?somewhere=true"
@@ -977,7 +1269,8 @@ async def test__connect_when_not_reconnecting(self, client, http_settings, proxy
             log_filterer=log_filterer.return_value,
             logger=client._logger,
             proxy_settings=proxy_settings,
-            transport_compression=False,
+            transport_compression=None,
+            binary=False,
             loads=client._loads,
             dumps=client._dumps,
             url="wss://somewhere.com?somewhere=true&v=400&encoding=json",
@@ -1018,10 +1311,23 @@ async def test__connect_when_not_reconnecting(self, client, http_settings, proxy
             client._handshake_event.wait.return_value, shielded_heartbeat_task, shielded_poll_events_task
         )
 
-    async def test__connect_when_reconnecting(self, client, http_settings, proxy_settings):
+    @pytest.mark.parametrize(
+        ("compression", "compress_query"),
+        [
+            (shard_api.GatewayCompression.TRANSPORT_ZLIB_STREAM, "zlib-stream"),
+            (shard_api.GatewayCompression.TRANSPORT_ZSTD_STREAM, "zstd-stream"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        ("data_format", "binary"), [(shard_api.GatewayDataFormat.JSON, False), (shard_api.GatewayDataFormat.ETF, True)]
+    )
+    async def test__connect_when_reconnecting(
+        self, client, http_settings, proxy_settings, compression, compress_query, data_format, binary
+    ):
         ws = mock.AsyncMock()
         ws.receive_json.return_value = {"op": 10, "d": {"heartbeat_interval": 10}}
-        client._transport_compression = True
+        client._transport_compression = compression
+        client._data_format = data_format
         client._shard_id = 20
         client._gateway_url = "wss://somewhere.com?somewhere=false"
         client._resume_gateway_url = "wss://notsomewhere.com?somewhere=true"
@@ -1064,8 +1370,9 @@ async def test__connect_when_reconnecting(self, client, http_settings, proxy_set
             proxy_settings=proxy_settings,
             loads=client._loads,
             dumps=client._dumps,
-            transport_compression=True,
-            url="wss://notsomewhere.com?somewhere=true&v=400&encoding=json&compress=zlib-stream",
+            transport_compression=compression,
+            binary=binary,
+            url=f"wss://notsomewhere.com?somewhere=true&v=400&encoding={data_format}&compress={compress_query}",
         )
 
         assert create_task.call_count == 2
@@ -1108,6 +1415,43 @@ async def test__connect_when_op_received_is_not_HELLO(self, client):
             code=1002, message=b"Expected HELLO op"
         )
 
+    async def test__connect_when_new_session_acquires_identify_rate_limiter(self, client):
+        ws = mock.AsyncMock()
+        ws.receive_json.return_value = {"op": 0, "d": {"not": "hello"}}
+        client._gateway_url = "somewhere.com"
+        client._logger = mock.Mock()
+        client._handshake_event = object()
+        client._shard_id = 7
+        client._seq = None
+        client._identify_rate_limiter = mock.Mock(acquire=mock.AsyncMock())
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(pytest.raises(errors.GatewayError))
+        stack.enter_context(mock.patch.object(shard._GatewayTransport, "connect", return_value=ws))
+
+        with stack:
+            await client._connect()
+
+        client._identify_rate_limiter.acquire.assert_awaited_once_with(7)
+
+    async def test__connect_when_resuming_does_not_acquire_identify_rate_limiter(self, client):
+        ws = mock.AsyncMock()
+        ws.receive_json.return_value = {"op": 0, "d": {"not": "hello"}}
+        client._gateway_url = "somewhere.com"
+        client._logger = mock.Mock()
+        client._handshake_event = object()
+        client._seq = 10
+        client._identify_rate_limiter = mock.Mock(acquire=mock.AsyncMock())
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(pytest.raises(errors.GatewayError))
+        stack.enter_context(mock.patch.object(shard._GatewayTransport, "connect", return_value=ws))
+
+        with stack:
+            await client._connect()
+
+        client._identify_rate_limiter.acquire.assert_not_called()
+
     @pytest.mark.skip("TODO")
     async def test__keep_alive(self, client): ...
 
@@ -1138,6 +1482,25 @@ async def test__poll_events_on_dispatch(self, client):
         client._event_manager.consume_raw_event.assert_called_once_with("SOMETHING", client, {"some": "test"})
         client._handshake_event.set.assert_not_called()
 
+    async def test__poll_events_skips_dispatches_when_json(self, client):
+        client._ws = mock.Mock(receive_json=mock.AsyncMock(side_effect=[RuntimeError]))
+        client._handshake_event = mock.Mock()
+
+        with pytest.raises(RuntimeError):
+            await client._poll_events()
+
+        client._ws.receive_json.assert_awaited_once_with(skip_dispatch=client._skip_dispatch)
+
+    async def test__poll_events_does_not_skip_dispatches_when_etf(self, client):
+        client._data_format = "etf"
+        client._ws = mock.Mock(receive_json=mock.AsyncMock(side_effect=[RuntimeError]))
+        client._handshake_event = mock.Mock()
+
+        with pytest.raises(RuntimeError):
+            await client._poll_events()
+
+        client._ws.receive_json.assert_awaited_once_with(skip_dispatch=None)
+
     async def test__poll_events_on_dispatch_when_READY(self, client):
         data = {
             "v": 10,
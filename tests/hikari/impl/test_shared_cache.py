@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import attrs
+import mock
+import pytest
+
+from hikari import channels
+from hikari import guilds
+from hikari import permissions
+from hikari import snowflakes
+from hikari.impl import config
+from hikari.impl import shared_cache
+
+
+def _make_guild(app, guild_id):
+    fields = {field.name: None for field in attrs.fields(guilds.GatewayGuild) if field.init}
+    fields.update(app=app, id=snowflakes.Snowflake(guild_id), name=f"guild {guild_id}", features=[])
+    return guilds.GatewayGuild(**fields)
+
+
+def _make_channel(app, channel_id, guild_id, position):
+    return channels.GuildTextChannel(
+        app=app,
+        id=snowflakes.Snowflake(channel_id),
+        name=f"channel {channel_id}",
+        type=channels.ChannelType.GUILD_TEXT,
+        guild_id=snowflakes.Snowflake(guild_id),
+        parent_id=None,
+        position=position,
+        is_nsfw=False,
+        permission_overwrites={},
+        topic=None,
+        last_message_id=None,
+        rate_limit_per_user=0,
+        last_pin_timestamp=None,
+        default_auto_archive_duration=60,
+    )
+
+
+def _make_role(app, role_id, guild_id):
+    return guilds.Role(
+        app=app,
+        id=snowflakes.Snowflake(role_id),
+        name=f"role {role_id}",
+        color=0,
+        guild_id=snowflakes.Snowflake(guild_id),
+        is_hoisted=False,
+        icon_hash=None,
+        unicode_emoji=None,
+        is_managed=False,
+        is_mentionable=True,
+        permissions=permissions.Permissions.CONNECT,
+        position=1,
+        bot_id=None,
+        integration_id=None,
+        is_premium_subscriber_role=False,
+        is_guild_linked_role=False,
+        subscription_listing_id=None,
+        is_available_for_purchase=False,
+    )
+
+
+class TestSharedCache:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return tmp_path / "cache.store"
+
+    @pytest.fixture
+    def writer_app(self):
+        return mock.Mock()
+
+    @pytest.fixture
+    def reader_app(self):
+        return mock.Mock()
+
+    @pytest.fixture
+    def writer(self, writer_app, path):
+        cache = shared_cache.SharedCacheImpl(writer_app, config.CacheSettings(), path)
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def reader(self, writer, reader_app, path):
+        cache = shared_cache.SharedCacheReader(reader_app, path)
+        yield cache
+        cache.close()
+
+    def test_reader_settings(self, reader):
+        assert reader.settings.components == shared_cache.SHARED_COMPONENTS
+
+    def test_set_guild(self, writer, reader, writer_app, reader_app):
+        guild = _make_guild(writer_app, 123)
+        writer.set_guild(guild)
+
+        result = reader.get_guild(123)
+
+        assert result == guild
+        assert result is not guild
+        assert result.name == "guild 123"
+        assert result.app is reader_app
+        assert reader.get_available_guild(123) == guild
+        assert reader.get_unavailable_guild(123) is None
+        assert list(reader.get_guilds_view()) == [123]
+        assert list(reader.get_available_guilds_view()) == [123]
+        assert list(reader.get_unavailable_guilds_view()) == []
+
+    def test_set_guild_availability(self, writer, reader, writer_app):
+        writer.set_guild(_make_guild(writer_app, 123))
+        writer.set_guild_availability(123, False)
+
+        assert reader.get_available_guild(123) is None
+        assert reader.get_unavailable_guild(123).id == 123
+        assert list(reader.get_unavailable_guilds_view()) == [123]
+
+    def test_delete_guild(self, writer, reader, writer_app):
+        writer.set_guild(_make_guild(writer_app, 123))
+        writer.set_guild(_make_guild(writer_app, 456))
+
+        writer.delete_guild(123)
+
+        assert reader.get_guild(123) is None
+        assert reader.get_guild(456).id == 456
+
+    def test_clear_guilds(self, writer, reader, writer_app):
+        writer.set_guild(_make_guild(writer_app, 123))
+        writer.set_guild(_make_guild(writer_app, 456))
+
+        writer.clear_guilds()
+
+        assert reader.get_guilds_view() == {}
+
+    def test_guild_channels(self, writer, reader, writer_app, reader_app):
+        writer.set_guild_channel(_make_channel(writer_app, 1, 123, position=2))
+        writer.set_guild_channel(_make_channel(writer_app, 2, 123, position=1))
+        writer.set_guild_channel(_make_channel(writer_app, 3, 456, position=1))
+
+        result = reader.get_guild_channel(1)
+
+        assert result.name == "channel 1"
+        assert result.app is reader_app
+        assert list(reader.get_guild_channels_view()) == [1, 2, 3]
+        assert list(reader.get_guild_channels_view_for_guild(123)) == [2, 1]
+        assert reader.get_guild_channels_view_for_guild(789) == {}
+
+        writer.delete_guild_channel(2)
+        writer.clear_guild_channels_for_guild(456)
+
+        assert list(reader.get_guild_channels_view()) == [1]
+
+        writer.clear_guild_channels()
+
+        assert reader.get_guild_channel(1) is None
+
+    def test_roles(self, writer, reader, writer_app, reader_app):
+        writer.set_role(_make_role(writer_app, 1, 123))
+        writer.set_role(_make_role(writer_app, 2, 123))
+        writer.set_role(_make_role(writer_app, 3, 456))
+
+        result = reader.get_role(1)
+
+        assert result.name == "role 1"
+        assert result.app is reader_app
+        assert list(reader.get_roles_view()) == [1, 2, 3]
+        assert list(reader.get_roles_view_for_guild(123)) == [1, 2]
+        assert reader.get_roles_view()[2].app is reader_app
+        assert reader.get_roles_view().get_item_at(2).id == 3
+
+        writer.delete_role(1)
+        writer.clear_roles_for_guild(456)
+
+        assert list(reader.get_roles_view()) == [2]
+
+        writer.clear_roles()
+
+        assert reader.get_role(2) is None
+
+    def test_view_is_not_affected_by_later_writes(self, writer, reader, writer_app):
+        writer.set_role(_make_role(writer_app, 1, 123))
+        view = reader.get_roles_view()
+
+        writer.delete_role(1)
+
+        assert view[1].name == "role 1"
+
+    def test_clear(self, writer, reader, writer_app):
+        writer.set_guild(_make_guild(writer_app, 123))
+        writer.set_role(_make_role(writer_app, 1, 123))
+
+        writer.clear()
+
+        assert reader.get_guilds_view() == {}
+        assert reader.get_roles_view() == {}
+
+    @pytest.mark.asyncio
+    async def test_load_publishes_snapshot(self, writer, reader, writer_app, tmp_path):
+        snapshot_path = tmp_path / "cache.snapshot"
+        writer.set_guild(_make_guild(writer_app, 123))
+        writer.set_guild_channel(_make_channel(writer_app, 456, 123, 0))
+        writer.set_role(_make_role(writer_app, 1, 123))
+        await writer.dump(snapshot_path)
+        writer.clear()
+        writer.set_guild(_make_guild(writer_app, 321))
+
+        await writer.load(snapshot_path)
+
+        assert list(reader.get_guilds_view()) == [123]
+        assert list(reader.get_guild_channels_view()) == [456]
+        assert list(reader.get_roles_view()) == [1]
+
+    def test_reader_when_store_missing(self, reader_app, path):
+        with pytest.raises(FileNotFoundError):
+            shared_cache.SharedCacheReader(reader_app, path)
+
+    def test_reader_returns_nothing_for_unshared_resources(self, reader):
+        assert reader.get_member(123, 456) is None
+        assert reader.get_user(123) is None
+        assert reader.get_me() is None
+        assert reader.get_members_view() == {}
+        assert reader.get_messages_view() == {}
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
 import typing
 
 import mock
@@ -436,6 +437,151 @@ async def test_aiter_when_empty_chunk(self, newest_first: bool):
         mock_request.assert_awaited_once_with(compiled_route=expected_route, query=query)
 
 
+class TestMemberIterator:
+    @pytest.mark.asyncio
+    async def test_aiter(self):
+        member_1 = mock.Mock(user=mock.Mock(id=snowflakes.Snowflake(111)))
+        member_2 = mock.Mock(user=mock.Mock(id=snowflakes.Snowflake(222)))
+        mock_entity_factory = mock.Mock()
+        mock_entity_factory.deserialize_member.side_effect = [member_1, member_2]
+        payloads = iter([[{"user": {"id": "111"}}, {"user": {"id": "222"}}], []])
+
+        async def request_call(compiled_route, query, deserialize_item):
+            return [deserialize_item(payload) for payload in next(payloads)]
+
+        mock_request = mock.AsyncMock(side_effect=request_call)
+        iterator = special_endpoints.MemberIterator(mock_entity_factory, mock_request, 123)
+
+        result = await iterator
+
+        assert result == [member_1, member_2]
+        mock_entity_factory.deserialize_member.assert_has_calls(
+            [
+                mock.call({"user": {"id": "111"}}, guild_id=snowflakes.Snowflake(123)),
+                mock.call({"user": {"id": "222"}}, guild_id=snowflakes.Snowflake(123)),
+            ]
+        )
+        expected_route = routes.GET_GUILD_MEMBERS.compile(guild=123)
+        mock_request.assert_has_awaits(
+            [
+                mock.call(compiled_route=expected_route, query={"limit": "1000"}, deserialize_item=mock.ANY),
+                mock.call(
+                    compiled_route=expected_route, query={"after": "222", "limit": "1000"}, deserialize_item=mock.ANY
+                ),
+            ]
+        )
+
+
+class TestSlicedMessageIterator:
+    @staticmethod
+    def _make_request(history: typing.Sequence[int]) -> mock.AsyncMock:
+        async def request(compiled_route: routes.CompiledRoute, query: typing.Mapping[str, str]):
+            after = int(query["after"])
+            page = [message_id for message_id in history if message_id > after][: int(query["limit"])]
+            return [{"id": str(message_id)} for message_id in reversed(page)]
+
+        return mock.AsyncMock(side_effect=request)
+
+    @pytest.mark.parametrize("slices", [1, 3, 7])
+    @pytest.mark.parametrize("max_buffered_pages", [1, 16])
+    @pytest.mark.asyncio
+    async def test_aiter(self, slices: int, max_buffered_pages: int):
+        history = list(range(1000, 11000, 20))
+        mock_entity_factory = mock.Mock()
+        mock_entity_factory.deserialize_message.side_effect = lambda payload: int(payload["id"])
+        mock_request = self._make_request(history)
+        iterator = special_endpoints.SlicedMessageIterator(
+            mock_entity_factory,
+            mock_request,
+            123,
+            snowflakes.Snowflake(1500),
+            snowflakes.Snowflake(9500),
+            slices=slices,
+            max_buffered_pages=max_buffered_pages,
+        )
+
+        result = await iterator
+
+        assert result == [message_id for message_id in history if 1500 < message_id < 9500]
+        expected_route = routes.GET_CHANNEL_MESSAGES.compile(channel=123)
+        for call in mock_request.await_args_list:
+            assert call.kwargs["compiled_route"] == expected_route
+
+    @pytest.mark.asyncio
+    async def test_aiter_deserializes_in_executor(self):
+        mock_entity_factory = mock.Mock()
+        mock_entity_factory.deserialize_message.side_effect = lambda payload: int(payload["id"])
+        mock_executor = mock.Mock()
+        iterator = special_endpoints.SlicedMessageIterator(
+            mock_entity_factory,
+            self._make_request([10, 20, 30]),
+            123,
+            snowflakes.Snowflake(0),
+            snowflakes.Snowflake(100),
+            slices=2,
+            max_buffered_pages=4,
+            executor=mock_executor,
+        )
+
+        with mock.patch.object(asyncio, "get_running_loop") as get_running_loop:
+            get_running_loop.return_value.run_in_executor = mock.AsyncMock(side_effect=lambda _, call, arg: call(arg))
+
+            result = await iterator
+
+        assert result == [10, 20, 30]
+        get_running_loop.return_value.run_in_executor.assert_has_awaits(
+            [mock.call(mock_executor, mock.ANY, [{"id": "10"}, {"id": "20"}, {"id": "30"}])]
+        )
+
+    @pytest.mark.asyncio
+    async def test_aiter_when_empty_range(self):
+        mock_request = mock.AsyncMock()
+        iterator = special_endpoints.SlicedMessageIterator(
+            mock.Mock(),
+            mock_request,
+            123,
+            snowflakes.Snowflake(100),
+            snowflakes.Snowflake(101),
+            slices=4,
+            max_buffered_pages=4,
+        )
+
+        assert await iterator == []
+        mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aiter_when_request_fails(self):
+        error = RuntimeError("blep")
+        mock_request = mock.AsyncMock(side_effect=error)
+        iterator = special_endpoints.SlicedMessageIterator(
+            mock.Mock(),
+            mock_request,
+            123,
+            snowflakes.Snowflake(0),
+            snowflakes.Snowflake(1000),
+            slices=4,
+            max_buffered_pages=4,
+        )
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await iterator
+
+        assert exc_info.value is error
+
+    @pytest.mark.parametrize(("slices", "max_buffered_pages"), [(0, 1), (1, 0)])
+    def test_init_with_invalid_arguments(self, slices: int, max_buffered_pages: int):
+        with pytest.raises(ValueError, match="must be greater than 0"):
+            special_endpoints.SlicedMessageIterator(
+                mock.Mock(),
+                mock.AsyncMock(),
+                123,
+                snowflakes.Snowflake(0),
+                snowflakes.Snowflake(1000),
+                slices=slices,
+                max_buffered_pages=max_buffered_pages,
+            )
+
+
 @pytest.mark.asyncio
 class TestGuildThreadIterator:
     @pytest.mark.parametrize("before_is_timestamp", [True, False])
@@ -20,11 +20,17 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import copy
+import datetime
+import typing
 
 import mock
+import pytest
 
+from hikari import guilds
 from hikari import snowflakes
 from hikari import stickers
+from hikari import undefined
+from hikari import users
 from hikari.internal import cache
 
 
@@ -73,3 +79,283 @@ def test_from_entity_when_user_not_passed(self) -> None:
         assert data.user is refcell.return_value
         mock_copy.assert_called_once_with(mock_user)
         refcell.assert_called_once_with(mock_copy.return_value)
+
+
+class TestCompactMemberStore:
+    @staticmethod
+    def _make_member(
+        user_id: int,
+        *,
+        role_ids: typing.Sequence[int] = (),
+        nickname: typing.Optional[str] = None,
+        joined_at: typing.Optional[datetime.datetime] = None,
+        is_deaf: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
+        is_mute: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
+        is_pending: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
+    ) -> typing.Tuple[guilds.Member, cache.RefCell[users.User]]:
+        user = mock.Mock(users.User, id=snowflakes.Snowflake(user_id))
+        member = guilds.Member(
+            guild_id=snowflakes.Snowflake(123),
+            user=user,
+            nickname=nickname,
+            guild_avatar_hash=None,
+            role_ids=[snowflakes.Snowflake(role_id) for role_id in role_ids],
+            joined_at=joined_at,
+            premium_since=None,
+            is_deaf=is_deaf,
+            is_mute=is_mute,
+            is_pending=is_pending,
+            raw_communication_disabled_until=None,
+        )
+        return member, cache.RefCell(user)
+
+    def test_set_and_build_member(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        user = mock.Mock(users.User, id=snowflakes.Snowflake(456))
+        user_cell = cache.RefCell(user)
+        member = guilds.Member(
+            guild_id=snowflakes.Snowflake(123),
+            user=user,
+            nickname="a nick",
+            guild_avatar_hash="hash",
+            role_ids=[snowflakes.Snowflake(1), snowflakes.Snowflake(2)],
+            joined_at=datetime.datetime(2020, 7, 15, 23, 30, 59, 501602, tzinfo=datetime.timezone.utc),
+            premium_since=datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+            is_deaf=True,
+            is_mute=False,
+            is_pending=undefined.UNDEFINED,
+            raw_communication_disabled_until=datetime.datetime(1960, 5, 4, 3, 2, 1, 1, tzinfo=datetime.timezone.utc),
+        )
+
+        store.set(member, user_cell)
+        result = store.build_member(snowflakes.Snowflake(456))
+
+        assert len(store) == 1
+        assert 456 in store
+        assert list(store) == [456]
+        assert store.get_user(snowflakes.Snowflake(456)) is user_cell
+        assert result.guild_id == 123
+        assert result.nickname == "a nick"
+        assert result.guild_avatar_hash == "hash"
+        assert result.role_ids == (1, 2)
+        assert isinstance(result.role_ids[0], snowflakes.Snowflake)
+        assert result.joined_at == member.joined_at
+        assert result.premium_since == member.premium_since
+        assert result.raw_communication_disabled_until == member.raw_communication_disabled_until
+        assert result.is_deaf is True
+        assert result.is_mute is False
+        assert result.is_pending is undefined.UNDEFINED
+        with mock.patch.object(copy, "copy") as mock_copy:
+            assert store.build_member(snowflakes.Snowflake(456)).user is mock_copy.return_value
+
+        mock_copy.assert_called_once_with(user)
+
+    def test_build_member_with_missing_timestamps(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        store.set(*self._make_member(456))
+
+        result = store.build_member(snowflakes.Snowflake(456))
+
+        assert result.joined_at is None
+        assert result.premium_since is None
+        assert result.raw_communication_disabled_until is None
+
+    def test_build_member_for_unknown_member(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+
+        with pytest.raises(KeyError):
+            store.build_member(snowflakes.Snowflake(456))
+
+    def test_set_with_user_id(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        member, _ = self._make_member(456, nickname="nick")
+        user_cell = cache.RefCell(None)
+
+        store.set(member, user_cell, user_id=snowflakes.Snowflake(456))
+
+        assert store.get_user(snowflakes.Snowflake(456)) is user_cell
+
+    def test_build_member_data(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        member, user_cell = self._make_member(456, role_ids=[1, 2], nickname="nick", is_deaf=True)
+        store.set(member, user_cell)
+
+        result = store.build_member_data(snowflakes.Snowflake(456))
+
+        assert result == cache.MemberData.build_from_entity(member, user=user_cell)
+        assert result.user is user_cell
+
+    def test_copy(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        store.set(*self._make_member(1, role_ids=[1, 2], nickname="one"))
+        store.set(*self._make_member(2, role_ids=[3]))
+
+        result = store.copy()
+        store.set(*self._make_member(1, role_ids=[4], nickname="changed"))
+        store.delete(snowflakes.Snowflake(2))
+
+        assert list(result) == [1, 2]
+        assert result.build_member(snowflakes.Snowflake(1)).nickname == "one"
+        assert result.build_member(snowflakes.Snowflake(1)).role_ids == (1, 2)
+        assert result.build_member(snowflakes.Snowflake(2)).role_ids == (3,)
+
+    def test_set_interns_nicknames(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        store.set(*self._make_member(1, nickname="".join(["ni", "ck"])))
+        store.set(*self._make_member(2, nickname="".join(["ni", "ck"])))
+
+        assert (
+            store.build_member(snowflakes.Snowflake(1)).nickname is store.build_member(snowflakes.Snowflake(2)).nickname
+        )
+
+    def test_set_updates_existing_member(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        store.set(*self._make_member(1, role_ids=[1, 2, 3], nickname="old", is_mute=False))
+        store.set(*self._make_member(2, role_ids=[4]))
+        member, user_cell = self._make_member(1, role_ids=[5], nickname="new", is_mute=True)
+
+        store.set(member, user_cell)
+
+        assert len(store) == 2
+        assert store.get_user(snowflakes.Snowflake(1)) is user_cell
+        result = store.build_member(snowflakes.Snowflake(1))
+        assert result.nickname == "new"
+        assert result.role_ids == (5,)
+        assert result.is_mute is True
+        assert store.build_member(snowflakes.Snowflake(2)).role_ids == (4,)
+
+    def test_set_updates_existing_member_with_more_roles(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        store.set(*self._make_member(1, role_ids=[1]))
+        store.set(*self._make_member(2, role_ids=[2]))
+
+        store.set(*self._make_member(1, role_ids=[3, 4, 5]))
+
+        assert store.build_member(snowflakes.Snowflake(1)).role_ids == (3, 4, 5)
+        assert store.build_member(snowflakes.Snowflake(2)).role_ids == (2,)
+
+    def test_delete(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        _, user_cell = member_1 = self._make_member(1, role_ids=[1, 2], nickname="one")
+        store.set(*member_1)
+        store.set(*self._make_member(2, role_ids=[3], nickname="two"))
+        store.set(*self._make_member(3, role_ids=[4, 5, 6], nickname="three"))
+
+        assert store.delete(snowflakes.Snowflake(1)) is user_cell
+
+        assert len(store) == 2
+        assert 1 not in store
+        assert store.get_user(snowflakes.Snowflake(1)) is None
+        assert store.build_member(snowflakes.Snowflake(2)).nickname == "two"
+        assert store.build_member(snowflakes.Snowflake(2)).role_ids == (3,)
+        assert store.build_member(snowflakes.Snowflake(3)).nickname == "three"
+        assert store.build_member(snowflakes.Snowflake(3)).role_ids == (4, 5, 6)
+
+    def test_delete_last_member(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        store.set(*self._make_member(1))
+        store.set(*self._make_member(2, nickname="two"))
+
+        store.delete(snowflakes.Snowflake(2))
+
+        assert list(store) == [1]
+        assert store.build_member(snowflakes.Snowflake(1)).nickname is None
+
+    def test_delete_for_unknown_member(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+
+        assert store.delete(snowflakes.Snowflake(1)) is None
+
+    def test_roles_are_compacted(self) -> None:
+        store = cache.CompactMemberStore(snowflakes.Snowflake(123))
+        for user_id in range(1, 601):
+            store.set(*self._make_member(user_id, role_ids=[user_id, user_id + 1]))
+
+        for user_id in range(1, 512):
+            store.delete(snowflakes.Snowflake(user_id))
+
+        assert len(store._roles) == 1200
+
+        store.delete(snowflakes.Snowflake(512))
+
+        assert len(store._roles) == 176
+        assert store._unused_roles == 0
+        assert store.build_member(snowflakes.Snowflake(600)).role_ids == (600, 601)
+        assert store.build_member(snowflakes.Snowflake(513)).role_ids == (513, 514)
+
+
+class TestBorrowedCacheMappingView:
+    def test___getitem___returns_stored_value(self) -> None:
+        value = object()
+        view = cache.BorrowedCacheMappingView({1: value})
+
+        assert view[1] is value
+        assert list(view.values()) == [value]
+
+    def test___getitem___with_builder(self) -> None:
+        builder = mock.Mock()
+        view = cache.BorrowedCacheMappingView({1: "data"}, builder=builder)
+
+        assert view[1] is builder.return_value
+        builder.assert_called_once_with("data")
+
+
+def test_borrow_ref_cell() -> None:
+    value = object()
+
+    assert cache.borrow_ref_cell(cache.RefCell(value)) is value
+
+
+class TestMemberData:
+    @pytest.fixture
+    def member_data(self) -> cache.MemberData:
+        return cache.MemberData(
+            user=cache.RefCell(mock.Mock(users.User)),
+            guild_id=snowflakes.Snowflake(123),
+            nickname="nick",
+            guild_avatar_hash=None,
+            role_ids=(snowflakes.Snowflake(1),),
+            joined_at=None,
+            premium_since=None,
+            is_deaf=False,
+            is_mute=False,
+            is_pending=False,
+            raw_communication_disabled_until=None,
+        )
+
+    def test_build_entity_copies_user(self, member_data: cache.MemberData) -> None:
+        with mock.patch.object(copy, "copy") as mock_copy:
+            member = member_data.build_entity(mock.Mock())
+
+        assert member.user is mock_copy.return_value
+        assert member.nickname == "nick"
+        assert member.role_ids == (1,)
+
+    def test_build_borrowed_entity(self, member_data: cache.MemberData) -> None:
+        member = member_data.build_borrowed_entity(mock.Mock())
+
+        assert member.user is member_data.user.object
+        assert member.nickname == "nick"
+        assert member_data.build_borrowed_entity(mock.Mock()) is member
+
+    def test_build_borrowed_entity_after_user_change(self, member_data: cache.MemberData) -> None:
+        member = member_data.build_borrowed_entity(mock.Mock())
+        member_data.user.object = mock.Mock(users.User)
+
+        result = member_data.build_borrowed_entity(mock.Mock())
+
+        assert result is not member
+        assert result.user is member_data.user.object
+        assert member_data.build_borrowed_entity(mock.Mock()) is result
+
+    def test_pickle_state_excludes_borrowed_member(self, member_data: cache.MemberData) -> None:
+        member_data.build_borrowed_entity(mock.Mock())
+
+        state = member_data.__getstate__()
+        result = cache.MemberData.__new__(cache.MemberData)
+        result.__setstate__(state)
+
+        assert "_borrowed" not in state
+        assert result == member_data
+        assert result._borrowed is None
+        assert result.build_borrowed_entity(mock.Mock()).user is member_data.user.object
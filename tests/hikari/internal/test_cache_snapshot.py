@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import datetime
+import io
+import pickle  # noqa: S403 - only the snapshots written by the tests are unpickled
+import re
+
+import mock
+import pytest
+
+from hikari import _about as about
+from hikari import snowflakes
+from hikari.internal import cache_snapshot
+
+
+class TestSnapshotDecoder:
+    def test_decode_frame(self):
+        app = mock.Mock()
+        encoded = cache_snapshot.SnapshotEncoder(app, mock.Mock()).encode(cache_snapshot.ME, {"app": app, "value": 1})
+
+        kind, payload = cache_snapshot.read_frame(io.BytesIO(encoded))
+
+        assert kind == cache_snapshot.ME
+        assert cache_snapshot.SnapshotDecoder(app).decode(kind, payload) == {"app": app, "value": 1}
+
+    def test_decode_when_unknown_persistent_id(self):
+        class Pickler(pickle.Pickler):
+            def persistent_id(self, obj):
+                return "nope" if obj == "value" else None
+
+        buffer = io.BytesIO()
+        Pickler(buffer).dump(["value"])
+
+        with pytest.raises(pickle.UnpicklingError, match="Unknown persistent ID 'nope'"):
+            cache_snapshot.SnapshotDecoder(mock.Mock()).decode(cache_snapshot.ME, buffer.getvalue())
+
+    def test_decode_entity(self):
+        app = mock.Mock()
+        value = {"user_id": snowflakes.Snowflake(123), "at": datetime.datetime.now(tz=datetime.timezone.utc)}
+        encoded = cache_snapshot.SnapshotEncoder(app, mock.Mock()).encode(cache_snapshot.ME, value)
+
+        assert cache_snapshot.SnapshotDecoder(app).read(io.BytesIO(encoded)) == (cache_snapshot.ME, value)
+
+    @pytest.mark.parametrize(
+        ("module", "name"),
+        [
+            ("os", "system"),
+            ("hikari.internal.ux", "os"),
+            ("hikari.snowflakes", "Snowflake.from_data"),
+            ("hikari.impl.cache", "CacheImpl"),
+            ("hikari.not_a_module", "Nope"),
+        ],
+    )
+    def test_decode_when_global_not_allowed(self, module, name):
+        buffer = io.BytesIO()
+        buffer.write(pickle.PROTO + bytes((4,)))
+        buffer.write(pickle.GLOBAL + f"{module}\n{name}\n".encode())
+        buffer.write(pickle.STOP)
+
+        with pytest.raises(pickle.UnpicklingError, match=f"Global {module}.{name} is not allowed in a snapshot"):
+            cache_snapshot.SnapshotDecoder(mock.Mock()).decode(cache_snapshot.ME, buffer.getvalue())
+
+    def test_decode_when_after_end(self):
+        decoder = cache_snapshot.SnapshotDecoder(mock.Mock())
+        decoder.decode(cache_snapshot.END, b"")
+
+        with pytest.raises(ValueError, match="Snapshot has frames after its end"):
+            decoder.decode(cache_snapshot.ME, b"")
+
+    def test_decode_end_when_references_missing(self):
+        decoder = cache_snapshot.SnapshotDecoder(mock.Mock())
+        decoder.get_cell(("user", 123))
+
+        with pytest.raises(ValueError, match="Snapshot is missing 1 referenced entities"):
+            decoder.decode(cache_snapshot.END, b"")
+
+        assert decoder.is_complete is False
+
+
+def test_read_header():
+    file = io.BytesIO(cache_snapshot.HEADER + b"frames")
+
+    cache_snapshot.read_header(file)
+
+    assert file.read() == b"frames"
+
+
+@pytest.mark.parametrize("data", [b"", b"not a snapshot", b"HKCACHE\x01\x05"])
+def test_read_header_when_not_a_snapshot(data):
+    with pytest.raises(ValueError, match="File is not a cache snapshot"):
+        cache_snapshot.read_header(io.BytesIO(data))
+
+
+def test_read_header_when_written_by_another_version():
+    expected = f"Snapshot was written by hikari 1.2.3, not {about.__version__}"
+
+    with pytest.raises(ValueError, match=re.escape(expected)):
+        cache_snapshot.read_header(io.BytesIO(cache_snapshot._MAGIC + b"\x051.2.3"))
+
+
+@pytest.mark.parametrize("data", [b"", b"\x01\x00", b"\x01\x10\x00\x00\x00abc"])
+def test_read_frame_when_truncated(data):
+    with pytest.raises(ValueError, match="Snapshot is truncated"):
+        cache_snapshot.read_frame(io.BytesIO(data))
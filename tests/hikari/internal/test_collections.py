@@ -160,6 +160,275 @@ def test___setitem___when_limit_reached_and_expire_callback_set(self):
         mock_map.update({"shinji": "ikari"})
         expire_callback.assert_has_calls((mock.call("no"), mock.call("lslsl")))
 
+    def test_does_not_count_statistics(self):
+        mock_map = collections.LimitedCapacityCacheMap(limit=2)
+
+        assert not hasattr(mock_map, "hits")
+        assert not hasattr(mock_map, "misses")
+        assert not hasattr(mock_map, "evictions")
+
+
+class TestLRUCacheMap:
+    def test___init___with_source(self):
+        mock_map = collections.LRUCacheMap({"voo": "doo", "blam": "blast", "foo": "bye"}, limit=2)
+
+        assert mock_map == {"blam": "blast", "foo": "bye"}
+
+    def test_copy(self):
+        mock_map = collections.LRUCacheMap({"o": "n", "b": "a"}, limit=42)
+        result = mock_map.copy()
+
+        assert result is not mock_map
+        assert isinstance(result, collections.LRUCacheMap)
+        assert list(result.items()) == [("o", "n"), ("b", "a")]
+
+    def test_freeze(self):
+        mock_map = collections.LRUCacheMap({"o": "n", "b": "a"}, limit=42)
+        result = mock_map.freeze()
+
+        assert type(result) is dict
+        assert result == {"o": "n", "b": "a"}
+
+    def test_statistics(self):
+        mock_map = collections.LRUCacheMap(limit=2)
+        mock_map.update({"a": 1, "b": 2, "c": 3})
+
+        assert mock_map.get("a") is None
+        assert mock_map["b"] == 2
+        assert "c" in mock_map
+        assert dict(mock_map.items()) == {"c": 3, "b": 2}
+
+        assert mock_map.hits == 1
+        assert mock_map.misses == 1
+        assert mock_map.evictions == 1
+
+    def test___getitem___marks_entry_as_used(self):
+        expire_callback = mock.Mock()
+        mock_map = collections.LRUCacheMap(limit=3, on_expire=expire_callback)
+        mock_map.update({"a": 1, "b": 2, "c": 3})
+
+        assert mock_map["a"] == 1
+        mock_map["d"] = 4
+
+        assert list(mock_map) == ["c", "a", "d"]
+        expire_callback.assert_called_once_with(2)
+        assert mock_map.hits == 1
+        assert mock_map.evictions == 1
+
+    def test___getitem___for_non_existing_entry(self):
+        mock_map = collections.LRUCacheMap(limit=3)
+
+        with pytest.raises(KeyError):
+            mock_map["a"]
+
+        assert mock_map.misses == 1
+
+    def test___setitem___marks_entry_as_used(self):
+        mock_map = collections.LRUCacheMap(limit=3)
+        mock_map.update({"a": 1, "b": 2, "c": 3})
+
+        mock_map["a"] = 5
+        mock_map["d"] = 4
+
+        assert mock_map == {"c": 3, "a": 5, "d": 4}
+
+    def test_iterating_does_not_mark_entries_as_used(self):
+        mock_map = collections.LRUCacheMap(limit=3)
+        mock_map.update({"a": 1, "b": 2, "c": 3})
+
+        assert list(mock_map.values()) == [1, 2, 3]
+        assert list(mock_map) == ["a", "b", "c"]
+        assert mock_map.hits == 0
+
+
+class TestTTLCacheMap:
+    @pytest.fixture
+    def monotonic(self):
+        with mock.patch.object(collections.time, "monotonic", return_value=100.0) as monotonic:
+            yield monotonic
+
+    def test___init___with_source(self, monotonic):
+        mock_map = collections.TTLCacheMap({"voo": "doo", "blam": "blast", "foo": "bye"}, limit=2, ttl=10)
+
+        assert mock_map == {"blam": "blast", "foo": "bye"}
+
+    def test_entries_expire(self, monotonic):
+        expire_callback = mock.Mock()
+        mock_map = collections.TTLCacheMap(limit=5, ttl=10, on_expire=expire_callback)
+        mock_map["a"] = 1
+        monotonic.return_value = 105.0
+        mock_map["b"] = 2
+        monotonic.return_value = 110.0
+
+        assert "a" not in mock_map
+        assert mock_map.get("a") is None
+        assert mock_map["b"] == 2
+        assert len(mock_map) == 1
+        expire_callback.assert_called_once_with(1)
+        assert mock_map.hits == 1
+        assert mock_map.misses == 1
+        assert mock_map.evictions == 1
+
+    def test_setting_entry_resets_expiry(self, monotonic):
+        mock_map = collections.TTLCacheMap(limit=5, ttl=10)
+        mock_map["a"] = 1
+        mock_map["b"] = 2
+        monotonic.return_value = 105.0
+        mock_map["a"] = 3
+        monotonic.return_value = 112.0
+
+        assert mock_map.freeze() == {"a": 3}
+        assert list(mock_map) == ["a"]
+
+    def test_views_drop_expired_entries(self, monotonic):
+        mock_map = collections.TTLCacheMap(limit=5, ttl=10)
+        mock_map["a"] = 1
+        monotonic.return_value = 111.0
+
+        assert list(mock_map.items()) == []
+        assert list(mock_map.values()) == []
+
+    def test___setitem___when_limit_reached(self, monotonic):
+        expire_callback = mock.Mock()
+        mock_map = collections.TTLCacheMap(limit=2, ttl=10, on_expire=expire_callback)
+        mock_map.update({"a": 1, "b": 2, "c": 3})
+
+        assert mock_map == {"b": 2, "c": 3}
+        expire_callback.assert_called_once_with(1)
+
+    def test___delitem__(self, monotonic):
+        mock_map = collections.TTLCacheMap(limit=2, ttl=10)
+        mock_map["a"] = 1
+
+        del mock_map["a"]
+
+        assert "a" not in mock_map
+        assert not mock_map._expiries
+
+    def test_copy(self, monotonic):
+        mock_map = collections.TTLCacheMap(limit=2, ttl=10)
+        mock_map["a"] = 1
+        monotonic.return_value = 105.0
+        result = mock_map.copy()
+        monotonic.return_value = 110.0
+
+        assert isinstance(result, collections.TTLCacheMap)
+        assert "a" not in result
+
+    def test_clear(self, monotonic):
+        mock_map = collections.TTLCacheMap(limit=2, ttl=10)
+        mock_map["a"] = 1
+
+        mock_map.clear()
+
+        assert not mock_map._data
+        assert not mock_map._expiries
+
+
+class TestTinyLFUCacheMap:
+    def test___init___with_source(self):
+        mock_map = collections.TinyLFUCacheMap({"a": 1, "b": 2}, limit=10)
+
+        assert mock_map == {"a": 1, "b": 2}
+
+    def test_keeps_frequently_used_entries(self):
+        expire_callback = mock.Mock()
+        mock_map = collections.TinyLFUCacheMap(limit=100, on_expire=expire_callback)
+        for key in range(50):
+            mock_map[key] = key
+
+        for _ in range(5):
+            for key in range(50):
+                assert mock_map[key] == key
+
+        # A scan of entries which are only used once
+        for key in range(1000, 2000):
+            mock_map[key] = key
+
+        assert all(key in mock_map for key in range(50))
+        assert len(mock_map) == 100
+        assert mock_map.evictions == 950
+        assert expire_callback.call_count == 950
+        assert mock_map.hits == 250
+
+    def test_admits_entries_used_more_than_the_victim(self):
+        mock_map = collections.TinyLFUCacheMap(limit=10)
+        for key in range(10):
+            mock_map[key] = key
+
+        for _ in range(3):
+            mock_map.get("hot")
+
+        mock_map["hot"] = "value"
+        mock_map["other"] = "value"
+
+        assert "hot" in mock_map
+        assert mock_map.misses == 3
+
+    def test_when_limit_is_zero(self):
+        expire_callback = mock.Mock()
+        mock_map = collections.TinyLFUCacheMap(limit=0, on_expire=expire_callback)
+
+        mock_map["a"] = 1
+
+        assert len(mock_map) == 0
+        expire_callback.assert_called_once_with(1)
+
+    def test___delitem__(self):
+        mock_map = collections.TinyLFUCacheMap(limit=100)
+        for key in range(5):
+            mock_map[key] = key
+
+        mock_map[1]
+        del mock_map[0]
+        del mock_map[1]
+        del mock_map[4]
+
+        assert mock_map == {2: 2, 3: 3}
+        assert list(mock_map._window) == []
+        assert list(mock_map._probation) == [2, 3]
+        assert list(mock_map._protected) == []
+
+        with pytest.raises(KeyError):
+            del mock_map[0]
+
+    def test_copy(self):
+        mock_map = collections.TinyLFUCacheMap(limit=100)
+        for key in range(5):
+            mock_map[key] = key
+
+        result = mock_map.copy()
+        result[6] = 6
+
+        assert isinstance(result, collections.TinyLFUCacheMap)
+        assert 6 not in mock_map
+        assert result == {0: 0, 1: 1, 2: 2, 3: 3, 4: 4, 6: 6}
+
+    def test_clear(self):
+        mock_map = collections.TinyLFUCacheMap(limit=100)
+        mock_map.update({"a": 1, "b": 2})
+        mock_map["a"]
+
+        mock_map.clear()
+
+        assert len(mock_map) == 0
+        assert not mock_map._window
+        assert not mock_map._probation
+        assert mock_map._sketch.frequency("a") == 0
+        assert mock_map._sketch._additions == 0
+
+    def test_frequency_sketch_ages_counts(self):
+        sketch = collections._FrequencySketch(16)
+        for _ in range(10):
+            sketch.increment("a")
+
+        assert sketch.frequency("a") == 10
+
+        for _ in range(sketch._sample_size - 10):
+            sketch.increment("b")
+
+        assert sketch.frequency("a") == 5
+
 
 class TestSnowflakeSet:
     def test_init_creates_empty_array(self):
@@ -104,6 +104,60 @@ async def test_build(self, form_builder):
         )
 
 
+class TestJSONArrayParser:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+    def test_feed(self, chunk_size):
+        payload = b' [{"id": "1", "name": "a\\"b,]"}, [1, {"x": []}], "}", 2.5, null] '
+        parser = data_binding.JSONArrayParser()
+        elements = []
+
+        for index in range(0, len(payload), chunk_size):
+            elements.extend(parser.feed(payload[index : index + chunk_size]))  # noqa: E203 - Whitespace before ":"
+
+        parser.close()
+        assert elements == [{"id": "1", "name": 'a"b,]'}, [1, {"x": []}], "}", 2.5, None]
+
+    def test_feed_decodes_each_element_when_complete(self):
+        loads = mock.Mock(side_effect=lambda element: element)
+        parser = data_binding.JSONArrayParser(loads)
+
+        assert parser.feed(b'[{"a": 1}, {"b"') == [b'{"a": 1}']
+        assert parser.feed(b": 2}]") == [b'{"b": 2}']
+        loads.assert_has_calls([mock.call(b'{"a": 1}'), mock.call(b'{"b": 2}')])
+
+    def test_feed_when_empty_array(self):
+        parser = data_binding.JSONArrayParser()
+
+        assert parser.feed(b"[ ]") == []
+        parser.close()
+
+    @pytest.mark.parametrize("payload", [b"{}", b"[1,]", b"[,1]", b"[1,,2]", b"[1}", b"[1] [2]"])
+    def test_feed_when_invalid(self, payload):
+        parser = data_binding.JSONArrayParser()
+
+        with pytest.raises(ValueError, match="JSON array"):
+            parser.feed(payload)
+
+    @pytest.mark.parametrize("payload", [b"", b"1", b"[1, 2", b'["abc', b"[1] 2"])
+    def test_close_when_incomplete(self, payload):
+        parser = data_binding.JSONArrayParser()
+        parser.feed(payload)
+
+        with pytest.raises(ValueError, match="Incomplete JSON array"):
+            parser.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_json_array():
+    async def iter_any():
+        yield b'[{"id": "1"}, {"i'
+        yield b'd": "2"}]'
+
+    stream = mock.Mock(iter_any=iter_any)
+
+    assert [element async for element in data_binding.stream_json_array(stream)] == [{"id": "1"}, {"id": "2"}]
+
+
 class TestStringMapBuilder:
     def test_is_mapping(self):
         assert isinstance(data_binding.StringMapBuilder(), typing.Mapping)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import struct
+import zlib
+
+import pytest
+
+from hikari.internal import etf
+
+
+class TestLoads:
+    def test_map_with_atom_keys(self):
+        payload = b"\x83t\x00\x00\x00\x02w\x02opa\x00d\x00\x01dw\x03nil"
+
+        assert etf.loads(payload) == {"op": 0, "d": None}
+
+    def test_binary(self):
+        assert etf.loads(b"\x83m\x00\x00\x00\x06h\xc3\xa9llo") == "héllo"
+
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            (b"\x83a\xff", 255),
+            (b"\x83b\xff\xff\xff\xfe", -2),
+            (b"\x83n\x08\x00" + (1234567890123456789).to_bytes(8, "little"), 1234567890123456789),
+            (b"\x83n\x01\x01\x05", -5),
+            (b"\x83o\x00\x00\x00\x01\x00\x07", 7),
+        ],
+    )
+    def test_integers(self, payload, expected):
+        assert etf.loads(payload) == expected
+
+    def test_new_float(self):
+        assert etf.loads(b"\x83F" + struct.pack(">d", 1.5)) == 1.5
+
+    def test_old_float(self):
+        assert etf.loads(b"\x83c" + b"1.50000000000000000000e+00".ljust(31, b"\x00")) == 1.5
+
+    @pytest.mark.parametrize(("atom", "expected"), [(b"true", True), (b"false", False), (b"nil", None)])
+    def test_special_atoms(self, atom, expected):
+        assert etf.loads(b"\x83s" + bytes((len(atom),)) + atom) is expected
+
+    def test_other_atoms_are_interned_strings(self):
+        first = etf.loads(b"\x83v\x00\x0bMESSAGE_ABC")
+        second = etf.loads(b"\x83w\x0bMESSAGE_ABC")
+
+        assert first == "MESSAGE_ABC"
+        assert first is second
+
+    def test_list(self):
+        assert etf.loads(b"\x83l\x00\x00\x00\x02m\x00\x00\x00\x01am\x00\x00\x00\x01bj") == ["a", "b"]
+
+    def test_nil_is_empty_list(self):
+        assert etf.loads(b"\x83j") == []
+
+    def test_string_is_list_of_small_integers(self):
+        assert etf.loads(b"\x83k\x00\x03\x01\x02\x03") == [1, 2, 3]
+
+    def test_tuples_are_lists(self):
+        assert etf.loads(b"\x83h\x02a\x01a\x02") == [1, 2]
+        assert etf.loads(b"\x83i\x00\x00\x00\x01a\x01") == [1]
+
+    def test_compressed(self):
+        body = b"t\x00\x00\x00\x01m\x00\x00\x00\x01am\x00\x00\x00\x03abc"
+
+        assert etf.loads(b"\x83P" + struct.pack(">I", len(body)) + zlib.compress(body)) == {"a": "abc"}
+
+    def test_when_str(self):
+        with pytest.raises(TypeError, match="ETF payloads must be bytes"):
+            etf.loads("\x83j")
+
+    def test_when_wrong_version(self):
+        with pytest.raises(ValueError, match="unsupported ETF version 130"):
+            etf.loads(b"\x82j")
+
+    def test_when_unsupported_tag(self):
+        with pytest.raises(ValueError, match="unsupported ETF tag 90"):
+            etf.loads(b"\x83Z")
+
+    def test_when_improper_list(self):
+        with pytest.raises(ValueError, match="improper lists are not supported"):
+            etf.loads(b"\x83l\x00\x00\x00\x01a\x01a\x02")
+
+    def test_when_truncated(self):
+        with pytest.raises(ValueError, match="malformed ETF payload"):
+            etf.loads(b"\x83m\x00\x00")
+
+    def test_when_trailing_data(self):
+        with pytest.raises(ValueError, match="trailing data after ETF term"):
+            etf.loads(b"\x83jj")
+
+
+class TestDumps:
+    def test_round_trip(self):
+        payload = {
+            "op": 2,
+            "d": {
+                "token": "tōken",
+                "id": 1234567890123456789,
+                "negative": -12,
+                "int32": 70_000,
+                "huge_negative": -(2**70),
+                "float": 0.5,
+                "none": None,
+                "flags": [True, False],
+                "empty": [],
+                "tuple": (1, 2),
+                "raw": b"\x00\x01",
+            },
+        }
+
+        result = etf.loads(etf.dumps(payload))
+
+        assert result == {**payload, "d": {**payload["d"], "tuple": [1, 2], "raw": "\x00\x01"}}
+
+    def test_encodes_strings_as_binaries_and_constants_as_atoms(self):
+        assert etf.dumps({"a": None, "b": True}) == (
+            b"\x83t\x00\x00\x00\x02m\x00\x00\x00\x01aw\x03nilm\x00\x00\x00\x01bw\x04true"
+        )
+
+    def test_when_unsupported_type(self):
+        with pytest.raises(TypeError, match="cannot encode object of type object to ETF"):
+            etf.dumps({"a": object()})
+
+    def test_when_integer_too_large(self):
+        with pytest.raises(ValueError, match="integer is too large to be encoded"):
+            etf.dumps(2**2048)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021-present davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from hikari.internal import shared_store
+
+
+class TestSharedRecordStore:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return tmp_path / "cache.store"
+
+    @pytest.fixture
+    def writer(self, path):
+        store = shared_store.SharedRecordStore.create(path, capacity=256)
+        yield store
+        store.close()
+
+    @pytest.fixture
+    def reader(self, writer, path):
+        store = shared_store.SharedRecordStore.open(path)
+        yield store
+        store.close()
+
+    def test_is_writer(self, writer, reader):
+        assert writer.is_writer is True
+        assert reader.is_writer is False
+
+    def test_open_when_not_a_store(self, path):
+        path.write_bytes(b"\0" * 128)
+
+        with pytest.raises(ValueError, match="is not a shared record store"):
+            shared_store.SharedRecordStore.open(path)
+
+    def test_open_when_missing(self, path):
+        with pytest.raises(FileNotFoundError):
+            shared_store.SharedRecordStore.open(path)
+
+    def test_put_is_visible_to_reader(self, writer, reader):
+        writer.put(1, 123, b"foo", group=6)
+        writer.put(1, 456, b"bar", group=6)
+        writer.put(2, 123, b"baz")
+
+        assert reader.get(1, 123) == b"foo"
+        assert reader.get(2, 123) == b"baz"
+        assert reader.get(1, 789) is None
+        assert reader.get_group(1, 123) == 6
+        assert reader.get_group(3, 123) is None
+        assert reader.keys(1) == [123, 456]
+        assert reader.keys(1, group=6) == [123, 456]
+        assert reader.keys(1, group=7) == []
+
+    def test_put_replaces_record(self, writer, reader):
+        writer.put(1, 123, b"foo", group=6)
+        writer.put(1, 123, b"foobar", group=7)
+
+        assert reader.get(1, 123) == b"foobar"
+        assert reader.keys(1, group=6) == []
+        assert reader.keys(1, group=7) == [123]
+
+    def test_delete(self, writer, reader):
+        writer.put(1, 123, b"foo", group=6)
+        writer.delete(1, 123)
+        writer.delete(1, 456)
+
+        assert reader.get(1, 123) is None
+        assert reader.keys(1) == []
+        assert reader.keys(1, group=6) == []
+
+    def test_clear(self, writer, reader):
+        writer.put(1, 123, b"foo")
+        writer.put(2, 456, b"bar")
+        assert reader.keys(1) == [123]
+
+        writer.clear()
+
+        assert reader.keys(1) == []
+        assert reader.get(2, 456) is None
+        writer.put(1, 789, b"baz")
+        assert reader.get(1, 789) == b"baz"
+
+    def test_write_past_capacity_compacts_file(self, writer, reader):
+        for i in range(50):
+            writer.put(1, i % 5, str(i).encode(), group=i % 2)
+
+        writer.put(2, 1, b"x" * 1024)
+
+        assert reader.keys(1) == [0, 1, 2, 3, 4]
+        assert [reader.get(1, i) for i in range(5)] == [b"45", b"46", b"47", b"48", b"49"]
+        assert reader.keys(1, group=1) == [0, 2, 4]
+        assert reader.get(2, 1) == b"x" * 1024
+
+    def test_create_replaces_existing_store(self, writer, reader, path):
+        writer.put(1, 123, b"foo")
+        writer.close()
+
+        new_writer = shared_store.SharedRecordStore.create(path)
+        try:
+            assert reader.get(1, 123) is None
+            new_writer.put(1, 456, b"bar")
+            assert reader.keys(1) == [456]
+
+        finally:
+            new_writer.close()
+
+    @pytest.mark.parametrize(("method", "args"), [("put", (1, 123, b"foo")), ("delete", (1, 123)), ("clear", ())])
+    def test_write_when_reader(self, reader, method, args):
+        with pytest.raises(RuntimeError, match="This store was not opened for writing"):
+            getattr(reader, method)(*args)
@@ -108,6 +108,83 @@ async def test_context_manager(self):
         assert context_manager.file is None
 
 
+class TestMemoryMappedFileReader:
+    @pytest.mark.asyncio
+    async def test_aiter(self):
+        data = bytes(range(256)) * 10000
+        reader = files.MemoryMappedFileReader("meow.txt", None, None, mock.Mock(), data)
+
+        with mock.patch.object(files, "_MAPPED_CHUNK_SIZE", 1000000):
+            chunks = [chunk async for chunk in reader]
+
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+        assert [len(chunk) for chunk in chunks] == [1000000, 1000000, 560000]
+        assert b"".join(chunks) == data
+
+    @pytest.mark.asyncio
+    async def test_aiter_when_empty(self):
+        reader = files.MemoryMappedFileReader("meow.txt", None, None, mock.Mock(), None)
+
+        assert [chunk async for chunk in reader] == []
+        assert await reader.read() == b""
+
+    @pytest.mark.asyncio
+    async def test_read(self):
+        reader = files.MemoryMappedFileReader("meow.txt", None, None, mock.Mock(), b"meow meow")
+
+        assert await reader.read() == b"meow meow"
+
+
+class TestMemoryMappedFileReaderContextManagerImpl:
+    @pytest.mark.asyncio
+    async def test_context_manager(self, tmp_path: pathlib.Path):
+        path = tmp_path / "meow.txt"
+        path.write_bytes(b"meow" * 1000)
+        context_manager = files._MemoryMappedFileReaderContextManagerImpl(None, "meow.txt", path)
+
+        async with context_manager as reader:
+            assert isinstance(reader, files.MemoryMappedFileReader)
+            assert reader.filename == "meow.txt"
+            assert await reader.read() == b"meow" * 1000
+            mapping = context_manager.mapping
+
+        assert context_manager.file is None
+        assert context_manager.mapping is None
+        assert mapping.closed
+
+    @pytest.mark.asyncio
+    async def test_context_manager_when_chunk_still_referenced(self, tmp_path: pathlib.Path):
+        path = tmp_path / "meow.txt"
+        path.write_bytes(b"meow")
+
+        async with files._MemoryMappedFileReaderContextManagerImpl(None, "meow.txt", path) as reader:
+            chunks = [chunk async for chunk in reader]
+
+        assert bytes(chunks[0]) == b"meow"
+
+    @pytest.mark.asyncio
+    async def test_context_manager_when_empty_file(self, tmp_path: pathlib.Path):
+        path = tmp_path / "meow.txt"
+        path.touch()
+
+        async with files._MemoryMappedFileReaderContextManagerImpl(None, "meow.txt", path) as reader:
+            assert [chunk async for chunk in reader] == []
+
+    @pytest.mark.asyncio
+    async def test_enter_dunder_method_when_already_open(self):
+        manager = files._MemoryMappedFileReaderContextManagerImpl(mock.Mock(), "ea", pathlib.Path("ea"))
+        manager.file = mock.Mock()
+        with pytest.raises(RuntimeError, match="File is already open"):
+            await manager.__aenter__()
+
+    @pytest.mark.asyncio
+    async def test_exit_dunder_method_when_not_open(self):
+        manager = files._MemoryMappedFileReaderContextManagerImpl(mock.Mock(), "ea", pathlib.Path("ea"))
+
+        with pytest.raises(RuntimeError, match="File isn't open"):
+            await manager.__aexit__(None, None, None)
+
+
 class TestToWritePath:
     def test_when_dir(self):
         mock_path = mock.Mock(is_dir=mock.Mock(return_value=True))
@@ -213,6 +290,23 @@ class TestFile:
     def file_obj(self):
         return files.File("one/path/something.txt")
 
+    @pytest.mark.parametrize(
+        ("memory_map", "expected_type"),
+        [(False, files._ThreadedFileReaderContextManagerImpl), (True, files._MemoryMappedFileReaderContextManagerImpl)],
+    )
+    def test_stream(self, memory_map, expected_type):
+        file_obj = files.File("one/path/something.txt", memory_map=memory_map)
+
+        context_manager = file_obj.stream()
+
+        assert isinstance(context_manager, expected_type)
+        assert context_manager.filename == "something.txt"
+        assert context_manager.path == pathlib.Path("one/path/something.txt")
+
+    def test_stream_when_not_thread_pool_executor(self, file_obj):
+        with pytest.raises(TypeError, match="ThreadPoolExecutor"):
+            file_obj.stream(executor=mock.Mock())
+
     @pytest.mark.asyncio
     async def test_save(self, file_obj):
         mock_executor = object()
@@ -19,6 +19,8 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import asyncio
+
 import pytest
 
 from hikari import iterators
@@ -39,3 +41,83 @@ async def test_flatten(self):
         iterator = iterators.FlatLazyIterator([[123, 321, 4352, 123], [], [12343123, 4234432], [543123123]])
 
         assert await iterator.flatten() == [123, 321, 4352, 123, 12343123, 4234432, 543123123]
+
+    def test_prefetch(self, lazy_iterator):
+        assert lazy_iterator.prefetch(2) is lazy_iterator
+
+    def test_prefetch_when_negative(self, lazy_iterator):
+        with pytest.raises(ValueError, match="'depth' must be greater than or equal to 0"):
+            lazy_iterator.prefetch(-1)
+
+
+class _PagedIterator(iterators.BufferedLazyIterator[int]):
+    def __init__(self, pages, *, delay=0.0):
+        super().__init__()
+        self.pages = list(pages)
+        self.delay = delay
+        self.requested = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _next_chunk(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        self.requested += 1
+        if not self.pages:
+            return None
+
+        page = self.pages.pop(0)
+        if isinstance(page, Exception):
+            raise page
+
+        return (item for item in page)
+
+
+class TestBufferedLazyIterator:
+    @pytest.mark.asyncio
+    async def test_iterates_all_pages(self):
+        iterator = _PagedIterator([[1, 2], [3], [4, 5]])
+
+        assert await iterator == [1, 2, 3, 4, 5]
+        assert iterator.requested == 4
+
+    @pytest.mark.asyncio
+    async def test_prefetch_iterates_all_pages_in_order(self):
+        iterator = _PagedIterator([[1, 2], [3], [4, 5]], delay=0.001).prefetch(2)
+
+        assert await iterator == [1, 2, 3, 4, 5]
+        assert iterator.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_requests_next_page_before_needed(self):
+        iterator = _PagedIterator([[1], [2], [3], [4]]).prefetch(2)
+
+        assert await iterator.next() == 1
+        await asyncio.sleep(0.01)
+
+        assert iterator.requested == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_stops_requesting_after_last_page(self):
+        iterator = _PagedIterator([[1]]).prefetch(3)
+
+        assert await iterator == [1]
+        await asyncio.sleep(0.01)
+
+        assert iterator.requested == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_propagates_errors(self):
+        iterator = _PagedIterator([[1], RuntimeError("oops"), [3]]).prefetch(2)
+
+        assert await iterator.next() == 1
+        with pytest.raises(RuntimeError, match="oops"):
+            await iterator.next()
+
+        await asyncio.sleep(0.01)
+        assert iterator.requested == 2